@@ -290,6 +290,42 @@ def instrument_data(ditype: 'DataInstrumentationType',
             yield instrumenter
 
 
+@contextmanager
+def profile_transformations(filename: Optional[str] = None):
+    """
+    Context manager that profiles pattern-matching transformations. For every transformation type, the profiler
+    records the number of candidate matches that were checked, rejected, and applied, as well as the time spent in
+    matching, ``can_be_applied``, ``apply``, memlet propagation, and validation.
+
+    Example usage:
+
+    .. code-block:: python
+
+        with dace.profile_transformations() as profile:
+            sdfg.simplify()
+            auto_optimize(sdfg, dace.DeviceType.CPU)
+
+        print(profile)  # Prints a table of all transformations, sorted by total time
+        print(profile['MapFusion'].rejected)
+
+
+    :param filename: If given, saves the profile as a JSON file at this path upon exit, which can be printed with
+                     ``daceprof -i``.
+    :note: Candidates checked in parallel worker processes (see ``optimizer.match_processes``) are not recorded.
+    """
+    from dace.transformation import profiling
+
+    profile = profiling.TransformationProfile()
+    profiling._ACTIVE_PROFILES.append(profile)
+    try:
+        yield profile
+    finally:
+        profiling._ACTIVE_PROFILES.remove(profile)
+
+    if filename is not None:
+        profile.save(filename)
+
+
 def cli_optimize_on_call(sdfg: 'SDFG'):
     """
     Calls a command-line interface for interactive SDFG transformations
@@ -14,6 +14,7 @@ import warnings
 
 import dace
 from dace.codegen.instrumentation.report import InstrumentationReport
+from dace.transformation.profiling import TransformationProfile
 from dace import dtypes
 
 ExitCode = Union[int, str]
@@ -41,6 +42,9 @@ with a Python executable module:
 
 or to print an existing report:
   daceprof [ARGUMENTS] -i profile.json
+
+The time spent in pattern-matching transformations (e.g., simplification and
+auto-optimization) can be profiled as well, with the --transformations flag.
 ''')
 
     parser.add_argument('file', help='Path to the script or module', nargs='?')
@@ -75,6 +79,10 @@ or to print an existing report:
                        'types from the following: map, tasklet, state, sdfg',
                        default='map')
     group.add_argument('--sequential', help='Disable CPU multi-threading in code generation', action='store_true')
+    group.add_argument('--transformations',
+                       '-x',
+                       help='Profile matching and applying pattern-matching transformations, per transformation type',
+                       action='store_true')
 
     # Data instrumentation
     group = parser.add_argument_group('data instrumentation arguments')
@@ -143,12 +151,14 @@ def _nop(*args, **kwargs):
     yield
 
 
-def run_script_or_module(args: argparse.Namespace) -> Tuple[Optional[InstrumentationReport], Optional[str], ExitCode]:
+def run_script_or_module(
+        args: argparse.Namespace) -> Tuple[Optional[InstrumentationReport], ExitCode, Optional[TransformationProfile]]:
     """
     Runs the script or module and returns the report file.
 
     :param args: The arguments with which ``daceprof`` was called.
-    :return: A tuple of (report file name if created, exit code of original program)
+    :return: A tuple of (report file name if created, exit code of original program, transformation profile if
+             transformations were profiled)
     """
     # Modify argument list
     file = args.file
@@ -182,18 +192,22 @@ def run_script_or_module(args: argparse.Namespace) -> Tuple[Optional[Instrumenta
     else:
         data_instrumenter = _nop()
 
-    with data_instrumenter:
-        with profile_ctx as profiler:
-            try:
-                if args.module:
-                    runpy.run_module(file, run_name='__main__')
-                else:
-                    runpy.run_path(file, run_name='__main__')
-            except SystemExit as ex:
-                # Skip internal exits
-                if ex.code is not None and ex.code != 0:
-                    print('daceprof: Application returned error code', ex.code)
-                    errcode = ex.code
+    # Transformation profiling
+    xform_profiler = dace.profile_transformations() if args.transformations else _nop()
+
+    with xform_profiler as xform_profile:
+        with data_instrumenter:
+            with profile_ctx as profiler:
+                try:
+                    if args.module:
+                        runpy.run_module(file, run_name='__main__')
+                    else:
+                        runpy.run_path(file, run_name='__main__')
+                except SystemExit as ex:
+                    # Skip internal exits
+                    if ex.code is not None and ex.code != 0:
+                        print('daceprof: Application returned error code', ex.code)
+                        errcode = ex.code
 
     # Unregister hooks
     for hook in hooks:
@@ -210,7 +224,7 @@ def run_script_or_module(args: argparse.Namespace) -> Tuple[Optional[Instrumenta
         if profiler.report.events:
             retval = profiler.report
 
-    return retval, errcode
+    return retval, errcode, xform_profile
 
 
 def enable_hooks(args: argparse.Namespace) -> List[int]:
@@ -259,6 +273,22 @@ def save_as_csv(args: argparse.Namespace, report: InstrumentationReport):
             print(counters)
 
 
+def print_transformation_profile(args: argparse.Namespace, profile: TransformationProfile):
+    if args.output and not args.input:  # Save profile
+        if args.csv:
+            filename = args.output + '.transformations.csv'
+            with open(filename, 'w') as fp:
+                fp.write(profile.as_csv())
+        else:
+            filename = args.output + '.transformations.json'
+            profile.save(filename)
+        print(f'Transformation profile saved to {filename}')
+    elif args.csv:
+        print(profile.as_csv())
+    else:
+        print(profile.table(args.ascending))
+
+
 def print_report(args: argparse.Namespace, reportfile: Union[str, InstrumentationReport]):
     if isinstance(reportfile, str):
         path = os.path.abspath(reportfile)
@@ -266,6 +296,10 @@ def print_report(args: argparse.Namespace, reportfile: Union[str, Instrumentatio
             print(path, 'does not exist, aborting.')
             exit(1)
 
+        if TransformationProfile.is_profile_file(path):
+            print_transformation_profile(args, TransformationProfile.load(path))
+            return
+
         report = InstrumentationReport(path)
     else:
         report = reportfile
@@ -291,10 +325,10 @@ def main():
 
     # Execute program or module
     if not args.input:
-        report, errcode = run_script_or_module(args)
+        report, errcode, xform_profile = run_script_or_module(args)
 
         if report is None:
-            if not args.save_data and not args.restore_data:
+            if not args.save_data and not args.restore_data and not args.transformations:
                 print('daceprof: No DaCe program calls detected or no report file generated.')
         else:
             if args.output:  # Save report
@@ -307,6 +341,12 @@ def main():
                     print('daceprof: Report file saved at', os.path.abspath(report.filepath))
                 print_report(args, report)
 
+        if xform_profile is not None:
+            if xform_profile:
+                print_transformation_profile(args, xform_profile)
+            else:
+                print('daceprof: No pattern-matching transformations were matched.')
+
         # Forward error code from internal application
         if errcode:
             exit(errcode)
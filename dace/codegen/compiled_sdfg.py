@@ -165,6 +165,12 @@ def _array_interface_ptr(array: Any, array_type: dt.Array) -> int:
     return array.__array_interface__['data'][0]
 
 
+# Scalar types that can be passed to a specialized argument marshaller without conversion checks
+_MARSHALLABLE_TYPES = frozenset({
+    np.bool_, np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64, np.float32, np.float64
+})
+
+
 class CompiledSDFG(object):
     """ A compiled SDFG object that can be called through Python. """
 
@@ -197,6 +203,11 @@ class CompiledSDFG(object):
         self._free_symbols = self._sdfg.free_symbols
         self.argnames = argnames
 
+        # Specialized argument marshaller and typed entry point (created on first call)
+        self._marshaller: Optional[Callable[[Dict[str, Any]], Optional[Tuple[Tuple[Any], Tuple[Any]]]]] = None
+        self._marshaller_created = False
+        self._typed_cfunc = None
+
     def get_exported_function(self, name: str, restype=None) -> Optional[Callable[..., Any]]:
         """
         Tries to find a symbol by name in the compiled SDFG, and convert it to a callable function
@@ -298,28 +309,81 @@ class CompiledSDFG(object):
             self._exit(self._libhandle)
             self._initialized = False
 
+    def construct_arguments(self, *args, **kwargs) -> Tuple[Tuple[Any], Tuple[Any]]:
+        """
+        Converts Python arguments to the arguments of the compiled SDFG, which can then be passed repeatedly to
+        ``fast_call``.
+
+        :param args: Arguments to call SDFG with.
+        :param kwargs: Keyword arguments to call SDFG with.
+        :return: A 2-tuple of (SDFG call arguments, initialization arguments).
+        :note: Return value arrays are created here and reused by every subsequent ``fast_call``.
+        """
+        if len(args) > 0 and self.argnames is not None:
+            kwargs.update({aname: arg for aname, arg in zip(self.argnames, args)})
+        return self._construct_args(kwargs)
+
+    def fast_call(self, callargs: Tuple[Any], initargs: Tuple[Any]) -> Any:
+        """
+        Calls the compiled SDFG directly with pre-constructed arguments, bypassing argument construction, type
+        checking, and call hooks. This is a trusted entry point for calling the same program repeatedly in a tight
+        loop; it is the caller's responsibility to ensure that the arguments are valid.
+
+        :param callargs: Arguments to the SDFG in signature order. Arrays are given as pointers (``ctypes.c_void_p``
+                         or integer addresses) and scalars as ctypes objects (or Python numbers, if the signature
+                         could be specialized).
+        :param initargs: Arguments to the SDFG initialization function (used only on the first call).
+        :return: The return values of the SDFG, if any.
+        :note: Use ``construct_arguments`` to obtain both argument tuples from Python arguments.
+        """
+        try:
+            # Call initializer function if necessary, then SDFG
+            if self._initialized is False:
+                self._lib.load()
+                self._initialize(initargs)
+
+            if self.do_not_execute is False:
+                if self._typed_cfunc is not None:
+                    self._typed_cfunc(self._libhandle, *callargs)
+                else:
+                    self._cfunc(self._libhandle, *callargs)
+
+            return self._convert_return_values()
+        except (RuntimeError, TypeError, UnboundLocalError, KeyError, cgx.DuplicateDLLError, ReferenceError):
+            self._unload_uninitialized()
+            raise
+
     def __call__(self, *args, **kwargs):
         # Update arguments from ordered list
         if len(args) > 0 and self.argnames is not None:
             kwargs.update({aname: arg for aname, arg in zip(self.argnames, args)})
 
-        try:
-            argtuple, initargtuple = self._construct_args(kwargs)
+        # Invalid arguments raise before the library is loaded or called
+        argtuple, initargtuple = self._construct_args(kwargs)
 
+        try:
             # Call initializer function if necessary, then SDFG
             if self._initialized is False:
                 self._lib.load()
                 self._initialize(initargtuple)
-            
+
             with hooks.invoke_compiled_sdfg_call_hooks(self, argtuple):
                 if self.do_not_execute is False:
                     self._cfunc(self._libhandle, *argtuple)
 
             return self._convert_return_values()
         except (RuntimeError, TypeError, UnboundLocalError, KeyError, cgx.DuplicateDLLError, ReferenceError):
-            self._lib.unload()
+            self._unload_uninitialized()
             raise
 
+    def _unload_uninitialized(self):
+        """
+        Unloads the library after a failed call, unless the SDFG was initialized. An initialized library stays loaded,
+        since its state is still used by subsequent calls and by ``finalize``.
+        """
+        if not self._initialized:
+            self._lib.unload()
+
     def __del__(self):
         if self._initialized is True:
             self.finalize()
@@ -327,6 +391,72 @@ class CompiledSDFG(object):
             self._libhandle = ctypes.c_void_p(0)
         self._lib.unload()
 
+    def _create_marshaller(self) -> Optional[Callable[[Dict[str, Any]], Optional[Tuple[Tuple[Any], Tuple[Any]]]]]:
+        """
+        Creates an argument marshaller that is specialized to the signature of the SDFG. The marshaller converts
+        the common case (NumPy arrays of the expected data type and scalars of the expected type) directly to
+        C arguments, and returns None if any argument requires checks or conversions, in which case the generic
+        path in ``_construct_args`` is used.
+
+        :return: A marshaller function, or None if the signature cannot be specialized (e.g., if it contains
+                 callbacks, strings, structures, or GPU scalars).
+        """
+        specs = []
+        arg_ctypes = []
+        for aname in self._sig:
+            atype = self._typedict[aname]
+            if type(atype.dtype) is not dtypes.typeclass or atype.dtype.type not in _MARSHALLABLE_TYPES:
+                return None
+            if isinstance(atype, dt.Array):
+                specs.append((aname, True, atype.dtype.as_numpy_dtype(), '__return' in aname))
+                arg_ctypes.append(ctypes.c_void_p)
+            elif isinstance(atype, dt.Scalar) and atype.storage != dtypes.StorageType.GPU_Global:
+                accepted = {atype.dtype.type}
+                int_range = None
+                if atype.dtype.type is np.int64:
+                    accepted.add(int)
+                elif atype.dtype.type is np.float64:
+                    accepted.add(float)
+                elif atype.dtype.type is np.int32:
+                    int_range = (-(1 << 31) + 1, (1 << 31) - 1)
+                elif atype.dtype.type is np.uint32:
+                    int_range = (0, (1 << 32) - 1)
+                actype = atype.dtype.as_ctypes()
+                specs.append((aname, False, (frozenset(accepted), int_range), actype))
+                arg_ctypes.append(actype)
+            else:
+                return None
+
+        init_indices = tuple(i for i, aname in enumerate(self._sig) if aname in self._free_symbols)
+        ndarray = np.ndarray
+
+        def marshal(kwargs: Dict[str, Any]) -> Optional[Tuple[Tuple[Any], Tuple[Any]]]:
+            callargs = []
+            for aname, is_array, expected, extra in specs:
+                try:
+                    arg = kwargs[aname]
+                except KeyError:
+                    return None
+                if is_array:
+                    if type(arg) is not ndarray or arg.dtype != expected:
+                        return None
+                    if arg.base is not None and not extra and not Config.get_bool('compiler', 'allow_view_arguments'):
+                        return None
+                    callargs.append(ctypes.c_void_p(arg.__array_interface__['data'][0]))
+                else:
+                    accepted, int_range = expected
+                    if type(arg) not in accepted:
+                        if (int_range is None or type(arg) is not int or arg < int_range[0] or arg > int_range[1]):
+                            return None
+                    callargs.append(extra(arg))
+            return tuple(callargs), tuple(callargs[i] for i in init_indices)
+
+        # Create a typed entry point, which converts raw pointers and scalars without going through ctypes objects
+        address = ctypes.cast(self._cfunc, ctypes.c_void_p).value
+        self._typed_cfunc = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, *arg_ctypes)(address)
+
+        return marshal
+
     def _construct_args(self, kwargs) -> Tuple[Tuple[Any], Tuple[Any]]:
         """ Main function that controls argument construction for calling
             the C prototype of the SDFG.
@@ -339,6 +469,16 @@ class CompiledSDFG(object):
         for desc, arr in zip(self._retarray_shapes, self._return_arrays):
             kwargs[desc[0]] = arr
 
+        # Specialized argument marshalling for the common case
+        if not self._marshaller_created:
+            self._marshaller = self._create_marshaller()
+            self._marshaller_created = True
+        if self._marshaller is not None and len(kwargs) > 0:
+            result = self._marshaller(kwargs)
+            if result is not None:
+                self._lastargs = result
+                return result
+
         # Argument construction
         sig = self._sig
         typedict = self._typedict
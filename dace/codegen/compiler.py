@@ -6,13 +6,20 @@
 from __future__ import print_function
 
 import collections
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
 import os
 import six
 import shutil
 import shlex
 import subprocess
 import re
-from typing import Any, Callable, Dict, List, Set, Tuple, TypeVar, Union
+import sys
+import tempfile
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union
 
 import dace
 from dace.config import Config
@@ -24,6 +31,11 @@ from dace.codegen.targets.target import make_absolute
 
 T = TypeVar('T')
 
+#: Merged build requirements of a set of library environments
+EnvironmentInfo = collections.namedtuple(
+    'EnvironmentInfo',
+    ['minimum_version', 'variables', 'packages', 'includes', 'libraries', 'compile_flags', 'link_flags', 'files'])
+
 
 def generate_program_folder(sdfg, code_objects: List[CodeObject], out_path: str, config=None):
     """ Writes all files required to configure and compile the DaCe program
@@ -139,6 +151,23 @@ def configure_and_compile(program_folder, program_name=None, output_stream=None)
         files.append(path)
         targets[target_name] = next(k for k, v in TargetCodeGenerator.extensions().items() if v['name'] == target_name)
 
+    # Get required environments
+    with open(os.path.join(program_folder, "dace_environments.csv"), "r") as f:
+        environments = set(l.strip() for l in f)
+
+    environments = dace.library.get_environments_and_dependencies(environments)
+    environment_info = get_environment_info(environments)
+
+    # Bypass CMake if requested and the program can be built without it
+    backend = Config.get('compiler', 'build_backend').lower()
+    if backend == 'direct':
+        if direct_build_supported(files, targets, environment_info):
+            return direct_compile(program_folder, program_name, files, environment_info, output_stream)
+        if Config.get_bool('debugprint'):
+            print(f'Program {program_name} cannot be built without CMake, falling back to CMake build.')
+    elif backend != 'cmake':
+        raise cgx.CompilerConfigurationError(f'Unknown build backend "{backend}" (must be CMake or Direct)')
+
     # Windows-only workaround: Override Visual C++'s linker to use
     # Multi-Threaded (MT) mode. This fixes linkage in CUDA applications where
     # CMake fails to do so.
@@ -159,13 +188,8 @@ def configure_and_compile(program_folder, program_name=None, output_stream=None)
         "-DDACE_PROGRAM_NAME={}".format(program_name),
     ]
 
-    # Get required environments are retrieve the CMake information
-    with open(os.path.join(program_folder, "dace_environments.csv"), "r") as f:
-        environments = set(l.strip() for l in f)
-
-    environments = dace.library.get_environments_and_dependencies(environments)
-
-    environment_flags, cmake_link_flags = get_environment_flags(environments)
+    # Retrieve the CMake information from the required environments
+    environment_flags, cmake_link_flags = _environment_cmake_flags(environment_info)
     cmake_command += sorted(environment_flags)
 
     cmake_command += shlex.split(Config.get('compiler', 'extra_cmake_args'))
@@ -246,6 +270,365 @@ def configure_and_compile(program_folder, program_name=None, output_stream=None)
     return shared_library_path
 
 
+def compile_many(sdfgs: List['dace.SDFG'],
+                 validate: bool = True,
+                 processes: Optional[int] = None) -> List[Union[csd.CompiledSDFG, Exception]]:
+    """
+    Compiles multiple SDFGs in parallel, running code generation and
+    compilation in a pool of processes. Behaves like calling ``SDFG.compile``
+    on each SDFG, except that SDFGs whose names clash with each other (or with
+    an already-loaded program) are renamed and built in separate folders.
+
+    :param sdfgs: The SDFGs to compile.
+    :param validate: If True, validates the SDFGs prior to generating code.
+    :param processes: Number of worker processes. If None, uses the number of
+                      processors. If 1, compiles in the current process.
+    :return: A list with, for each input SDFG in order, either a callable
+             ``CompiledSDFG`` object or the exception raised while compiling it.
+    """
+    results: List[Union[csd.CompiledSDFG, Exception, None]] = [None] * len(sdfgs)
+    jobs: Dict[int, Tuple[Optional[Dict[str, Any]], str, str]] = {}
+    used_names = set()
+    used_folders = set()
+
+    for i, sdfg in enumerate(sdfgs):
+        build_folder = os.path.abspath(sdfg.build_folder)
+        if not sdfg._recompile or Config.get_bool('compiler', 'use_cache'):
+            # Try to see if a cached version of the binary exists
+            binary_filename = get_binary_name(build_folder, sdfg.name)
+            if os.path.isfile(binary_filename):
+                try:
+                    results[i] = load_from_file(sdfg, binary_filename)
+                except Exception as ex:
+                    results[i] = ex
+                used_names.add(sdfg.name)
+                used_folders.add(build_folder)
+                continue
+
+        if not sdfg._regenerate_code and os.path.isdir(build_folder) and build_folder not in used_folders:
+            # The code was already generated, only compile the program folder
+            jobs[i] = (None, sdfg.name, build_folder)
+            used_names.add(sdfg.name)
+            used_folders.add(build_folder)
+            continue
+
+        # Rename SDFG to avoid runtime issues with clashing names, both within
+        # the batch and with programs that are already loaded
+        name = sdfg.name
+        index = 0
+        while name in used_names or csd.ReloadableDLL(get_binary_name(build_folder, name), name).is_loaded():
+            name = f'{sdfg.name}_{index}'
+            index += 1
+        if name != sdfg.name:
+            warnings.warn(f'SDFG "{sdfg.name}" is already loaded or compiled in the same batch, '
+                          f'compiling under the name "{name}".')
+        folder = build_folder
+        index = 0
+        while folder in used_folders:
+            folder = f'{build_folder}_{index}'
+            index += 1
+        used_names.add(name)
+        used_folders.add(folder)
+
+        try:
+            jobs[i] = (sdfg.to_json(), name, folder)
+        except Exception as ex:
+            results[i] = ex
+
+    # Generate code and compile in parallel
+    libraries: Dict[int, Union[str, Exception]] = {}
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1 or len(jobs) <= 1:
+        for i, (sdfg_json, name, folder) in jobs.items():
+            try:
+                libraries[i] = _compile_many_worker(sdfg_json, name, folder, validate)
+            except Exception as ex:
+                libraries[i] = ex
+    else:
+        context = multiprocessing.get_context('spawn')
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(processes, len(jobs)),
+                                                    mp_context=context,
+                                                    initializer=_compile_many_initializer,
+                                                    initargs=(Config._config, )) as pool:
+            futures = {
+                i: pool.submit(_compile_many_worker, sdfg_json, name, folder, validate)
+                for i, (sdfg_json, name, folder) in jobs.items()
+            }
+            for i, future in futures.items():
+                try:
+                    libraries[i] = future.result()
+                except Exception as ex:
+                    libraries[i] = ex
+
+    # Load the compiled programs in the current process
+    for i, library in libraries.items():
+        if isinstance(library, Exception):
+            results[i] = library
+            continue
+        sdfg_json, _, folder = jobs[i]
+        try:
+            if sdfg_json is None:
+                sdfg = sdfgs[i]
+            else:
+                # Use the SDFG as it was saved after code generation
+                sdfg = dace.SDFG.from_file(os.path.join(folder, 'program.sdfg'))
+                sdfg.build_folder = folder
+            results[i] = get_program_handle(library, sdfg)
+        except Exception as ex:
+            results[i] = ex
+
+    return results
+
+
+def _compile_many_initializer(config: Dict[str, Any]):
+    Config._config = config
+
+
+def _compile_many_worker(sdfg_json: Optional[Dict[str, Any]], name: str, build_folder: str, validate: bool) -> str:
+    """ Generates code for and compiles a single SDFG of ``compile_many``, returning the shared library path. """
+    if sdfg_json is not None:
+        # Importing outside creates an import loop
+        from dace.codegen import codegen
+
+        sdfg = dace.SDFG.from_json(sdfg_json)
+        sdfg._name = name
+        sdfg.build_folder = build_folder
+        sdfg.fill_scope_connectors()
+        program_objects = codegen.generate_code(sdfg, validate=validate)
+        generate_program_folder(sdfg, program_objects, build_folder)
+
+    return configure_and_compile(build_folder, name)
+
+
+#: Flags that CMake appends to the compiler flags in each build configuration
+_BUILD_TYPE_FLAGS = {
+    'debug': ['-g'],
+    'release': ['-O3', '-DNDEBUG'],
+    'relwithdebinfo': ['-O2', '-g', '-DNDEBUG'],
+    'minsizerel': ['-Os', '-DNDEBUG'],
+}
+
+_CPP_EXTENSIONS = ('.cpp', '.cc', '.cxx')
+
+
+def direct_build_supported(files: List[str], targets: Dict[str, Any], environment_info: EnvironmentInfo) -> bool:
+    """
+    Returns True if a program can be built by invoking the C++ compiler
+    directly, i.e., without configuring a CMake project. This is the case for
+    programs that only consist of CPU code and whose environments do not rely on
+    CMake packages, scripts, or variables.
+
+    :param files: Source files of the program, relative to its ``src`` folder.
+    :param targets: Dictionary mapping target names to code generator classes.
+    :param environment_info: Merged requirements of the program environments.
+    :return: True if the direct build backend can compile the program.
+    """
+    if os.name == 'nt' or sys.platform == 'darwin':
+        return False
+    if any(name != 'cpu' for name in targets):
+        return False
+    if not all(f.endswith(_CPP_EXTENSIONS) for f in files):
+        return False
+    if environment_info.variables or environment_info.packages or environment_info.files:
+        return False
+    if Config.get('compiler', 'extra_cmake_args').strip():
+        return False
+
+    # Flags that rely on CMake variable expansion cannot be passed on as-is
+    flags = (environment_info.includes | environment_info.libraries | environment_info.compile_flags
+             | environment_info.link_flags | unique_flags(Config.get('compiler', 'cpu', 'libs')))
+    return not any('$' in flag for flag in flags)
+
+
+def direct_compile(program_folder: str,
+                   program_name: str,
+                   files: List[str],
+                   environment_info: EnvironmentInfo,
+                   output_stream=None) -> str:
+    """
+    Compiles and links a DaCe program by invoking the C++ compiler directly,
+    using the same flags that the CMake build would use. Object files are
+    cached by content (see ``compiler.object_cache_folder``) and all
+    translation units, including the loader stub, are compiled in parallel.
+
+    :param program_folder: Absolute path to the program folder.
+    :param program_name: Name of the program (and resulting library).
+    :param files: Source files of the program, relative to its ``src`` folder.
+    :param environment_info: Merged requirements of the program environments.
+    :param output_stream: Additional output stream to write to.
+    :return: Path to the compiled shared library file.
+    """
+    src_folder = os.path.join(program_folder, "src")
+    build_folder = os.path.join(program_folder, "build")
+    dace_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    library_extension = Config.get('compiler', 'library_extension')
+
+    cache_folder = Config.get('compiler', 'object_cache_folder') or os.path.join(Config.get('default_build_folder'),
+                                                                                 '.objcache')
+    cache_folder = os.path.abspath(cache_folder)
+    os.makedirs(cache_folder, exist_ok=True)
+
+    try:
+        compiler = Config.get('compiler', 'cpu', 'executable')
+        compiler = make_absolute(compiler) if compiler else os.environ.get('CXX', 'c++')
+    except ValueError as ex:  # Cannot find compiler executable
+        raise cgx.CompilerConfigurationError(str(ex))
+
+    # Same order as in CMake: target flags, OpenMP, environments, build type
+    cxx_flags = shlex.split(Config.get('compiler', 'cpu', 'args') or '')
+    cxx_flags += ['-fopenmp', '-pthread']
+    for flags in sorted(environment_info.compile_flags):
+        cxx_flags += shlex.split(flags)
+    cxx_flags += _BUILD_TYPE_FLAGS.get(Config.get('compiler', 'build_type').lower(), [])
+
+    program_command = [compiler] + cxx_flags + [f'-DDACE_BINARY_DIR="{build_folder}"']
+    program_command += ['-I' + os.path.join(dace_path, 'runtime', 'include')]
+    program_command += ['-I' + include for include in sorted(environment_info.includes)]
+    stub_command = [compiler] + cxx_flags
+
+    compile_jobs = [(os.path.join(src_folder, f), program_command) for f in files]
+    compile_jobs.append((os.path.join(dace_path, 'codegen', 'tools', 'dacestub.cpp'), stub_command))
+
+    # Compile all objects in parallel
+    num_jobs = min(Config.get('compiler', 'build_jobs') or os.cpu_count() or 1, len(compile_jobs))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_jobs) as pool:
+        futures = [
+            pool.submit(_compile_object, cache_folder, source, command, output_stream)
+            for source, command in compile_jobs
+        ]
+        objects = [future.result() for future in futures]
+    program_objects, stub_object = objects[:-1], objects[-1]
+
+    # Link program and stub libraries
+    libraries = sorted(unique_flags(Config.get('compiler', 'cpu', 'libs')) | environment_info.libraries)
+    link_flags = [_library_flag(lib) for lib in libraries]
+    for flags in sorted(environment_info.link_flags):
+        link_flags += shlex.split(flags)
+    link_flags += shlex.split(Config.get('compiler', 'linker', 'args') or '')
+
+    shared_library_path = os.path.join(build_folder, f'lib{program_name}.{library_extension}')
+    stub_library_path = os.path.join(build_folder, f'libdacestub_{program_name}.{library_extension}')
+    _link_library([compiler] + cxx_flags, program_objects, link_flags, shared_library_path, output_stream)
+    _link_library([compiler] + cxx_flags, [stub_object], [], stub_library_path, output_stream)
+
+    return shared_library_path
+
+
+def _library_flag(library: str) -> str:
+    """ Converts a CMake ``target_link_libraries`` entry to a linker flag. """
+    if library.startswith('-') or os.path.sep in library or '.' in os.path.basename(library):
+        return library
+    return '-l' + library
+
+
+def _compile_object(cache_folder: str, source: str, command: List[str], output_stream=None) -> str:
+    """
+    Compiles a single source file to an object file in the object cache, or
+    reuses a cached object file. Objects are keyed by the source contents and
+    compiler command, and are only reused if none of the headers the source
+    included (as reported by the compiler) were modified since.
+
+    :return: Path to the object file.
+    """
+    source = os.path.abspath(source)
+    with open(source, 'rb') as fp:
+        contents = fp.read()
+    key = hashlib.sha256()
+    key.update('\0'.join([dace.__version__, source] + command).encode('utf-8'))
+    key.update(contents)
+    digest = key.hexdigest()
+
+    object_path = os.path.join(cache_folder, digest + '.o')
+    manifest_path = os.path.join(cache_folder, digest + '.deps')
+    if _cached_object_valid(object_path, manifest_path):
+        return object_path
+
+    fd, tmp_object = tempfile.mkstemp(suffix='.o', dir=cache_folder)
+    os.close(fd)
+    tmp_depfile = tmp_object[:-2] + '.d'
+    full_command = command + ['-MMD', '-MF', tmp_depfile, '-c', source, '-o', tmp_object]
+    if Config.get('debugprint') == 'verbose':
+        print(f'Compiling: {" ".join(shlex.quote(c) for c in full_command)}')
+    try:
+        _run_liveoutput(full_command, cwd=cache_folder, output_stream=output_stream)
+        dependencies = _read_dependency_file(tmp_depfile)
+    except subprocess.CalledProcessError as ex:
+        if os.path.isfile(tmp_object):
+            os.unlink(tmp_object)
+        if Config.get_bool('debugprint'):
+            raise cgx.CompilationError('Compiler failure')
+        else:
+            raise cgx.CompilationError('Compiler failure:\n' + ex.output)
+    finally:
+        if os.path.isfile(tmp_depfile):
+            os.unlink(tmp_depfile)
+
+    # The source itself is part of the key, only its includes need to be tracked
+    manifest = {dep: _file_signature(dep) for dep in dependencies if os.path.abspath(dep) != source}
+    os.replace(tmp_object, object_path)
+    fd, tmp_manifest = tempfile.mkstemp(suffix='.deps', dir=cache_folder)
+    with os.fdopen(fd, 'w') as fp:
+        json.dump(manifest, fp)
+    os.replace(tmp_manifest, manifest_path)
+
+    return object_path
+
+
+def _file_signature(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _cached_object_valid(object_path: str, manifest_path: str) -> bool:
+    if not os.path.isfile(object_path):
+        return False
+    try:
+        with open(manifest_path, 'r') as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return False
+    return all(_file_signature(dep) == signature for dep, signature in manifest.items())
+
+
+def _read_dependency_file(path: str) -> List[str]:
+    """ Reads the prerequisites of a Makefile rule written by ``-MMD``. """
+    with open(path, 'r') as fp:
+        contents = fp.read().replace('\\\n', ' ')
+    _, _, prerequisites = contents.partition(':')
+    return [dep.replace('\\ ', ' ') for dep in re.split(r'(?<!\\)\s+', prerequisites.strip()) if dep]
+
+
+def _link_library(command: List[str], objects: List[str], link_flags: List[str], output_path: str, output_stream=None):
+    """ Links objects to a shared library, skipping the step if the inputs did not change. """
+    full_command = command + ['-shared'] + objects + link_flags
+    command_string = ' '.join(shlex.quote(c) for c in full_command + ['-o', output_path])
+    command_file = output_path + '.link.sh'
+    if os.path.isfile(output_path) and identical_file_exists(command_file, command_string):
+        return
+
+    # Link into a temporary file first to avoid overwriting a library in use
+    tmp_output = output_path + '.tmp'
+    if Config.get('debugprint') == 'verbose':
+        print(f'Linking: {command_string}')
+    try:
+        _run_liveoutput(full_command + ['-o', tmp_output],
+                        cwd=os.path.dirname(output_path),
+                        output_stream=output_stream)
+    except subprocess.CalledProcessError as ex:
+        if Config.get_bool('debugprint'):
+            raise cgx.CompilationError('Linker failure')
+        else:
+            raise cgx.CompilationError('Linker failure:\n' + ex.output)
+    os.replace(tmp_output, output_path)
+
+    with open(command_file, 'w') as fp:
+        fp.write(command_string)
+
+
 def _get_or_eval(value_or_function: Union[T, Callable[[], T]]) -> T:
     """
     Returns a stored value or lazily evaluates it. Used in environments
@@ -256,14 +639,15 @@ def _get_or_eval(value_or_function: Union[T, Callable[[], T]]) -> T:
     return value_or_function
 
 
-def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
+def get_environment_info(environments) -> EnvironmentInfo:
     """
-    Returns the CMake environment and linkage flags associated with the
-    given input environments/libraries.
-    
+    Collects the build requirements (CMake variables, packages, include
+    directories, libraries, and flags) of the given input
+    environments/libraries.
+
     :param environments: A list of ``@dace.library.environment``-decorated
                          classes.
-    :return: A 2-tuple of (environment CMake flags, linkage CMake flags)
+    :return: An ``EnvironmentInfo`` tuple with the merged requirements.
     """
     cmake_minimum_version = [0]
     cmake_variables = collections.OrderedDict()
@@ -273,7 +657,6 @@ def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
     cmake_compile_flags = set()
     cmake_link_flags = set()
     cmake_files = set()
-    cmake_module_paths = set()
     for env in environments:
         if (env.cmake_minimum_version is not None and len(env.cmake_minimum_version) > 0):
             version_list = list(map(int, env.cmake_minimum_version.split(".")))
@@ -319,22 +702,39 @@ def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
                     cmake_includes.add(env_dir)
                     break
 
+    return EnvironmentInfo(cmake_minimum_version, cmake_variables, cmake_packages, cmake_includes, cmake_libraries,
+                           cmake_compile_flags, cmake_link_flags, cmake_files)
+
+
+def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
+    """
+    Returns the CMake environment and linkage flags associated with the
+    given input environments/libraries.
+
+    :param environments: A list of ``@dace.library.environment``-decorated
+                         classes.
+    :return: A 2-tuple of (environment CMake flags, linkage CMake flags)
+    """
+    return _environment_cmake_flags(get_environment_info(environments))
+
+
+def _environment_cmake_flags(info: EnvironmentInfo) -> Tuple[List[str], Set[str]]:
     environment_flags = [
-        "-DDACE_ENV_MINIMUM_VERSION={}".format(".".join(map(str, cmake_minimum_version))),
+        "-DDACE_ENV_MINIMUM_VERSION={}".format(".".join(map(str, info.minimum_version))),
         # Make CMake list of key-value pairs
-        "-DDACE_ENV_VAR_KEYS=\"{}\"".format(";".join(cmake_variables.keys())),
-        "-DDACE_ENV_VAR_VALUES=\"{}\"".format(";".join(cmake_variables.values())),
-        "-DDACE_ENV_PACKAGES=\"{}\"".format(" ".join(sorted(cmake_packages))),
-        "-DDACE_ENV_INCLUDES=\"{}\"".format(" ".join(sorted(cmake_includes))),
-        "-DDACE_ENV_LIBRARIES=\"{}\"".format(" ".join(sorted(cmake_libraries))),
-        "-DDACE_ENV_COMPILE_FLAGS=\"{}\"".format(" ".join(cmake_compile_flags)),
-        # "-DDACE_ENV_LINK_FLAGS=\"{}\"".format(" ".join(cmake_link_flags)),
-        "-DDACE_ENV_CMAKE_FILES=\"{}\"".format(";".join(sorted(cmake_files))),
+        "-DDACE_ENV_VAR_KEYS=\"{}\"".format(";".join(info.variables.keys())),
+        "-DDACE_ENV_VAR_VALUES=\"{}\"".format(";".join(info.variables.values())),
+        "-DDACE_ENV_PACKAGES=\"{}\"".format(" ".join(sorted(info.packages))),
+        "-DDACE_ENV_INCLUDES=\"{}\"".format(" ".join(sorted(info.includes))),
+        "-DDACE_ENV_LIBRARIES=\"{}\"".format(" ".join(sorted(info.libraries))),
+        "-DDACE_ENV_COMPILE_FLAGS=\"{}\"".format(" ".join(info.compile_flags)),
+        # "-DDACE_ENV_LINK_FLAGS=\"{}\"".format(" ".join(info.link_flags)),
+        "-DDACE_ENV_CMAKE_FILES=\"{}\"".format(";".join(sorted(info.files))),
     ]
     # Escape variable expansions to defer their evaluation
     environment_flags = [cmd.replace("$", "_DACE_CMAKE_EXPAND") for cmd in sorted(environment_flags)]
 
-    return environment_flags, cmake_link_flags
+    return environment_flags, info.link_flags
 
 
 def unique_flags(flags):
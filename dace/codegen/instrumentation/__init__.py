@@ -1,11 +1,27 @@
-# Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import importlib
+
 from .provider import InstrumentationProvider
 from .report import InstrumentationReport
 
-from .papi import PAPIInstrumentation
-from .likwid import LIKWIDInstrumentationCPU, LIKWIDInstrumentationGPU
-from .timer import TimerProvider
-from .gpu_events import GPUEventProvider
-from .fpga import FPGAInstrumentationProvider
+# Instrumentation providers are imported on demand, i.e., when the provider registry is first queried or when
+# the provider class is accessed through this module
+_PROVIDERS = {
+    'PAPIInstrumentation': 'papi',
+    'LIKWIDInstrumentationCPU': 'likwid',
+    'LIKWIDInstrumentationGPU': 'likwid',
+    'TimerProvider': 'timer',
+    'GPUEventProvider': 'gpu_events',
+    'FPGAInstrumentationProvider': 'fpga',
+    'SaveProvider': 'data.data_dump',
+    'RestoreProvider': 'data.data_dump',
+}
+
+for _module in dict.fromkeys(_PROVIDERS.values()):
+    InstrumentationProvider.register_lazy(f'{__name__}.{_module}')
+
 
-from .data.data_dump import SaveProvider, RestoreProvider
+def __getattr__(name: str):
+    if name in _PROVIDERS:
+        return getattr(importlib.import_module(f'{__name__}.{_PROVIDERS[name]}'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,11 +1,28 @@
-# Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
-from .cpu import CPUCodeGen
-from .cuda import CUDACodeGen
-from .intel_fpga import IntelFPGACodeGen
-from .mpi import MPICodeGen
-from .xilinx import XilinxCodeGen
-from .rtl import RTLCodeGen
-from .unroller import UnrollCodeGen
-from .mlir.mlir import MLIRCodeGen
-from .sve.codegen import SVECodeGen
-from .snitch import SnitchCodeGen
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import importlib
+
+from .target import TargetCodeGenerator
+
+# Code generation targets are imported on demand, i.e., when the target registry is first queried or when
+# the target class is accessed through this module
+_TARGETS = {
+    'CPUCodeGen': 'cpu',
+    'CUDACodeGen': 'cuda',
+    'IntelFPGACodeGen': 'intel_fpga',
+    'MPICodeGen': 'mpi',
+    'XilinxCodeGen': 'xilinx',
+    'RTLCodeGen': 'rtl',
+    'UnrollCodeGen': 'unroller',
+    'MLIRCodeGen': 'mlir.mlir',
+    'SVECodeGen': 'sve.codegen',
+    'SnitchCodeGen': 'snitch',
+}
+
+for _module in _TARGETS.values():
+    TargetCodeGenerator.register_lazy(f'{__name__}.{_module}')
+
+
+def __getattr__(name: str):
+    if name in _TARGETS:
+        return getattr(importlib.import_module(f'{__name__}.{_TARGETS[name]}'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
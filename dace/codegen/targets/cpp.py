@@ -438,9 +438,9 @@ def ndcopy_to_strided_copy(
     dst_copylen = last_dst_index - first_dst_index + 1
 
     # Make expressions symbolic and simplify
-    copy_length = symbolic.pystr_to_symbolic(copy_length).simplify()
-    src_copylen = symbolic.pystr_to_symbolic(src_copylen).simplify()
-    dst_copylen = symbolic.pystr_to_symbolic(dst_copylen).simplify()
+    copy_length = symbolic.simplify(symbolic.pystr_to_symbolic(copy_length))
+    src_copylen = symbolic.simplify(symbolic.pystr_to_symbolic(src_copylen))
+    dst_copylen = symbolic.simplify(symbolic.pystr_to_symbolic(dst_copylen))
 
     # Detect 1D copies. The first condition is the general one, whereas the
     # second one applies when the arrays are completely equivalent in strides
@@ -1,6 +1,7 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 from copy import deepcopy
 from dace.sdfg.state import SDFGState
+import collections
 import functools
 import itertools
 import warnings
@@ -15,11 +16,11 @@ from dace.codegen.common import codeblock_to_cpp, sym2cpp, update_persistent_des
 from dace.codegen.targets.target import TargetCodeGenerator, make_absolute
 from dace.codegen.dispatcher import DefinedType, TargetDispatcher
 from dace.frontend import operations
-from dace.sdfg import nodes, utils as sdutils
+from dace.sdfg import nodes, graph as gr, utils as sdutils
 from dace.sdfg import (ScopeSubgraphView, SDFG, scope_contains_scope, is_array_stream_view, NodeNotExpandedError,
                        dynamic_map_inputs, local_transients)
 from dace.sdfg.scope import is_devicelevel_gpu, is_devicelevel_fpga
-from typing import Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 from dace.codegen.targets import fpga
 
 
@@ -52,6 +53,11 @@ class CPUCodeGen(TargetCodeGenerator):
         # Keep track of traversed nodes
         self._generated_nodes = set()
 
+        # Outputs of multicore maps with privatized write-conflict resolution (map entry -> [(data name, offset)]),
+        # and the IDs of the memlets that write to the per-thread buffers without atomics
+        self._privatized_wcr: Dict[nodes.MapEntry, List[Tuple[str, str]]] = {}
+        self._nonatomic_wcr: Set[int] = set()
+
         # Keep track of generated NestedSDG, and the name of the assigned function
         self._generated_nested_sdfg = dict()
 
@@ -368,15 +374,29 @@ class CPUCodeGen(TargetCodeGenerator):
                                       Config.get("compiler", "max_stack_array_size")))
 
             ctypedef = dtypes.pointer(nodedesc.dtype).ctype
+            zeroed = False
 
             if not declared:
                 declaration_stream.write(f'{nodedesc.dtype.ctype} *{name};\n', sdfg, state_id, node)
-            allocation_stream.write(
-                "%s = new %s DACE_ALIGN(64)[%s];\n" % (alloc_name, nodedesc.dtype.ctype, cpp.sym2cpp(arrsize)), sdfg,
-                state_id, node)
+            arena_pointer = self._frame.arena_pointer(sdfg, node.data)
+            if arena_pointer is not None:
+                allocation_stream.write(f'{alloc_name} = reinterpret_cast<{ctypedef}>({arena_pointer});\n', sdfg,
+                                        state_id, node)
+            elif self._allocation_policy(nodedesc) == 'pool':
+                self._frame.uses_memory_pool = True
+                allocation_stream.write(
+                    f'{alloc_name} = __state->memory_pool.allocate<{nodedesc.dtype.ctype}>({cpp.sym2cpp(arrsize)});\n',
+                    sdfg, state_id, node)
+            else:
+                allocation_stream.write(
+                    "%s = new %s DACE_ALIGN(64)[%s];\n" % (alloc_name, nodedesc.dtype.ctype, cpp.sym2cpp(arrsize)),
+                    sdfg, state_id, node)
+                if self._allocation_policy(nodedesc) == 'first_touch':
+                    zeroed = self._generate_first_touch(sdfg, node.data, nodedesc, alloc_name, allocation_stream,
+                                                        state_id, node)
             define_var(name, DefinedType.Pointer, ctypedef)
 
-            if node.setzero:
+            if node.setzero and not zeroed:
                 allocation_stream.write("memset(%s, 0, sizeof(%s)*%s);" %
                                         (alloc_name, nodedesc.dtype.ctype, cpp.sym2cpp(arrsize)))
             if nodedesc.start_offset != 0:
@@ -442,6 +462,112 @@ class CPUCodeGen(TargetCodeGenerator):
         else:
             raise NotImplementedError("Unimplemented storage type " + str(nodedesc.storage))
 
+    def _allocation_policy(self, nodedesc: data.Data) -> str:
+        """
+        Returns the allocation policy of a heap-allocated array (see the ``compiler.cpu.allocation_policy``
+        configuration entry, which can be overridden by the ``pool`` and ``first_touch`` properties of arrays):
+
+            * ``new``: The array is allocated separately.
+            * ``pool``: The array is allocated from the memory pool of the program state, which caches freed blocks
+              across calls.
+            * ``first_touch``: The array is initialized in parallel upon allocation, in order to place its pages on
+              the NUMA nodes of the threads that write to it.
+        """
+        policy = Config.get('compiler', 'cpu', 'allocation_policy')
+        if policy not in ('new', 'pool', 'first_touch'):
+            raise ValueError(f'Unknown allocation policy "{policy}"')
+        if nodedesc.storage != dtypes.StorageType.CPU_Heap or isinstance(nodedesc.dtype, dtypes.opaque):
+            return 'new'
+
+        # Arrays that are allocated once do not benefit from pooling
+        persistent = nodedesc.lifetime in (dtypes.AllocationLifetime.Persistent, dtypes.AllocationLifetime.Global)
+        if nodedesc.pool and not persistent:
+            return 'pool'
+        if nodedesc.first_touch:
+            return 'first_touch'
+        if policy == 'pool' and persistent:
+            return 'new'
+        return policy
+
+    @staticmethod
+    def _first_multicore_writer(sdfg: SDFG, name: str) -> Optional[Tuple[SDFGState, gr.MultiConnectorEdge]]:
+        """
+        Returns the first edge (in state order) that writes to the given data container from a multicore map, outside
+        of any other scope, or None if no such edge exists.
+        """
+        for state in sdfg.topological_sort():
+            sdict = state.scope_dict()
+            for anode in state.data_nodes():
+                if anode.data != name or sdict[anode] is not None:
+                    continue
+                for edge in state.in_edges(anode):
+                    if (isinstance(edge.src, nodes.MapExit)
+                            and edge.src.map.schedule == dtypes.ScheduleType.CPU_Multicore):
+                        return state, edge
+        return None
+
+    def _generate_first_touch(self, sdfg: SDFG, name: str, nodedesc: data.Array, alloc_name: str, stream: CodeIOStream,
+                              state_id: int, node: nodes.AccessNode) -> bool:
+        """
+        Writes a parallel loop that zeroes a newly allocated array, such that its pages are placed on the NUMA nodes of
+        the threads that write to them (first-touch placement). The loop uses the OpenMP clauses of the first
+        multicore map that writes to the array. If every iteration of the outermost map parameter writes to one row of
+        the array, the loop touches the same rows in the same iterations. Otherwise, pages are distributed evenly.
+
+        :return: True if the entire array was zeroed, or False if it was partially initialized (i.e., the map does not
+                 write to every row) or no multicore map writes to it.
+        """
+        writer = self._first_multicore_writer(sdfg, name)
+        if writer is None:
+            return False
+        wstate, edge = writer
+        omap: nodes.Map = edge.src.map
+        ctype = nodedesc.dtype.ctype
+        clauses = self._omp_clauses(omap)
+
+        # Find the outermost (contiguous) dimension of the array, and the index written by each map iteration
+        index = None
+        param = symbolic.pystr_to_symbolic(omap.params[0])
+        available = self._frame.symbols_and_constants(sdfg)
+        innermost = wstate.memlet_path(edge)[0].data
+        subset = innermost.subset if innermost.data == name else innermost.other_subset
+        dims = [
+            d for d in range(len(nodedesc.shape))
+            if symbolic.simplify(nodedesc.strides[d] * nodedesc.shape[d] - nodedesc.total_size) == 0
+        ]
+        if dims and subset is not None and subset.dims() == len(nodedesc.shape):
+            begin, end, _ = subset.ndrange()[dims[0]]
+            if (begin == end and len((begin - param).free_symbols) == 0
+                    and all(str(s) in available for r in omap.range[0] for s in symbolic.symlist(r))):
+                index = begin
+
+        stream.write(f'// First-touch initialization, matching the schedule of map "{omap.label}"\n{{', sdfg, state_id,
+                     node)
+        zeroed = True
+        if index is not None:
+            rbegin, rend, rstep = omap.range[0]
+            stride = cpp.sym2cpp(nodedesc.strides[dims[0]])
+            stream.write(
+                f'''#pragma omp parallel for{clauses}
+for (auto {param} = {cpp.sym2cpp(rbegin)}; {param} < {cpp.sym2cpp(rend + 1)}; {param} += {cpp.sym2cpp(rstep)}) {{
+    memset({alloc_name} + ({cpp.sym2cpp(index)}) * ({stride}), 0, sizeof({ctype}) * ({stride}));
+}}''', sdfg, state_id, node)
+            # The loop zeroes every row only if the map iterates over all of them
+            zeroed = (symbolic.simplify(index - param) == 0 and rbegin == 0 and rstep == 1
+                      and symbolic.simplify(rend + 1 - nodedesc.shape[dims[0]]) == 0)
+        else:
+            stream.write(
+                f'''const size_t __dace_ft_bytes = sizeof({ctype}) * ({cpp.sym2cpp(nodedesc.total_size)});
+const size_t __dace_ft_page = dace::numa::page_size();
+#pragma omp parallel for{clauses}
+for (size_t __dace_ft_offset = 0; __dace_ft_offset < __dace_ft_bytes; __dace_ft_offset += __dace_ft_page) {{
+    size_t __dace_ft_remaining = __dace_ft_bytes - __dace_ft_offset;
+    memset(reinterpret_cast<char *>({alloc_name}) + __dace_ft_offset, 0,
+           __dace_ft_remaining < __dace_ft_page ? __dace_ft_remaining : __dace_ft_page);
+}}''', sdfg, state_id, node)
+        stream.write('}', sdfg, state_id, node)
+        return zeroed
+
     def deallocate_array(self, sdfg, dfg, state_id, node, nodedesc, function_stream, callsite_stream):
         arrsize = nodedesc.total_size
         alloc_name = cpp.ptr(node.data, nodedesc, sdfg, self._frame)
@@ -454,6 +580,12 @@ class CPUCodeGen(TargetCodeGenerator):
 
         if isinstance(nodedesc, (data.Scalar, data.View, data.Stream, data.Reference)):
             return
+        elif self._frame.arena_pointer(sdfg, node.data) is not None:
+            # Memory is part of the arena, which is freed upon finalization
+            return
+        elif self._allocation_policy(nodedesc) == 'pool':
+            callsite_stream.write(f'__state->memory_pool.deallocate({alloc_name}, {cpp.sym2cpp(arrsize)});\n', sdfg,
+                                  state_id, node)
         elif (nodedesc.storage == dtypes.StorageType.CPU_Heap
               or (nodedesc.storage == dtypes.StorageType.Register and symbolic.issymbolic(arrsize, sdfg.constants))):
             callsite_stream.write("delete[] %s;\n" % alloc_name, sdfg, state_id, node)
@@ -805,7 +937,7 @@ class CPUCodeGen(TargetCodeGenerator):
         """
 
         redtype = operations.detect_reduction_type(memlet.wcr)
-        atomic = "_atomic" if not nc else ""
+        atomic = "_atomic" if not nc and id(memlet) not in self._nonatomic_wcr else ""
         ptrname = cpp.ptr(memlet.data, sdfg.arrays[memlet.data], sdfg, self._frame)
         defined_type, _ = self._dispatcher.defined_vars.get(ptrname)
         if isinstance(indices, str):
@@ -1670,6 +1802,191 @@ class CPUCodeGen(TargetCodeGenerator):
 
         self._dispatcher.defined_vars.exit_scope(sdfg)
 
+    @staticmethod
+    def _omp_clauses(map: nodes.Map) -> str:
+        """ Returns the OpenMP schedule, thread count, and thread affinity clauses of a multicore map. """
+        clauses = ""
+        if map.omp_schedule != dtypes.OMPScheduleType.Default:
+            schedule = " schedule("
+            if map.omp_schedule == dtypes.OMPScheduleType.Static:
+                schedule += "static"
+            elif map.omp_schedule == dtypes.OMPScheduleType.Dynamic:
+                schedule += "dynamic"
+            elif map.omp_schedule == dtypes.OMPScheduleType.Guided:
+                schedule += "guided"
+            else:
+                raise ValueError("Unknown OpenMP schedule type")
+            if map.omp_chunk_size > 0:
+                schedule += f", {map.omp_chunk_size}"
+            schedule += ")"
+            clauses += schedule
+        if map.omp_num_threads > 0:
+            clauses += f" num_threads({map.omp_num_threads})"
+        if map.omp_proc_bind != dtypes.OMPProcBindType.Default:
+            clauses += f" proc_bind({map.omp_proc_bind.name.lower()})"
+        return clauses
+
+    @staticmethod
+    def _infer_collapse(map: nodes.Map) -> int:
+        """
+        Returns the number of outer dimensions of a map that can be collapsed into one parallel loop, i.e., the longest
+        prefix of dimensions whose ranges do not depend on parameters of the map (a rectangular iteration space).
+        """
+        params = set(map.params)
+        collapse = 1
+        for rng in map.range[1:]:
+            if any(s in params for s in symbolic.symlist(rng)):
+                break
+            collapse += 1
+        return collapse
+
+    def _is_simd_map(self, sdfg: SDFG, state: SDFGState, entry: nodes.MapEntry) -> bool:
+        """
+        Returns True if the innermost dimension of a map can be vectorized with ``#pragma omp simd``. This is the case
+        if the map only contains Python tasklets and register-allocated scalars, every memlet accesses one element and
+        depends on the innermost parameter only with unit stride (or not at all), and iterations do not conflict,
+        i.e., there is no write-conflict resolution, every iteration writes to different elements, and data that is
+        written is only read at the same element.
+        """
+        param = symbolic.pystr_to_symbolic(entry.map.params[-1])
+        exit_node = state.exit_node(entry)
+        local_scalars = {node.data for _, _, node, _, _, _ in self._frame.to_allocate[entry]}
+        for node in state.scope_children()[entry]:
+            if node is exit_node:
+                continue
+            if isinstance(node, nodes.AccessNode):
+                desc = node.desc(sdfg)
+                if (node.data not in local_scalars or desc.storage != dtypes.StorageType.Register
+                        or desc.total_size != 1):
+                    return False
+            elif not isinstance(node, nodes.Tasklet) or node.language != dtypes.Language.Python:
+                return False
+
+        reads: Dict[str, Set[str]] = collections.defaultdict(set)
+        writes: Dict[str, Set[str]] = collections.defaultdict(set)
+        for edge in itertools.chain(state.out_edges(entry), state.in_edges(exit_node)):
+            memlet = edge.data
+            if memlet.is_empty():
+                continue
+            desc = sdfg.arrays[memlet.data]
+            if (not isinstance(desc, (data.Scalar, data.Array)) or memlet.wcr is not None or memlet.dynamic
+                    or memlet.subset.num_elements() != 1):
+                return False
+
+            # The innermost parameter may only index the contiguous dimension, with unit stride
+            indices = [idx for idx, _, _ in memlet.subset.ndrange()]
+            dims = [i for i, idx in enumerate(indices) if param.name in symbolic.symlist(idx)]
+            if len(dims) > 1:
+                return False
+            if dims:
+                idx = indices[dims[0]]
+                if desc.strides[dims[0]] != 1 or param.name in symbolic.symlist(idx - param):
+                    return False
+
+            if edge.dst is exit_node:
+                # All iterations would write to the same element
+                if not dims:
+                    return False
+                writes[memlet.data].add(str(memlet.subset))
+            else:
+                reads[memlet.data].add(str(memlet.subset))
+
+        for name, written in writes.items():
+            if len(written) > 1 or not reads[name] <= written:
+                return False
+        return True
+
+    def _privatized_wcr_outputs(self, sdfg: SDFG, state: SDFGState,
+                                entry: nodes.MapEntry) -> List[Tuple[gr.MultiConnectorEdge, int]]:
+        """
+        Returns the outputs of a multicore map whose write-conflict resolution is privatized, i.e., every thread
+        resolves conflicts on its own buffer, and the buffers are combined when the map completes (instead of using
+        atomics). An output is privatized if:
+
+            * Its conflicts are resolved with a reduction type that has a known identity;
+            * It is written only by tasklets in the map, and not otherwise accessed in it;
+            * The written region is contiguous and contains at most ``compiler.cpu.wcr_privatization_max_elements``
+              elements; and
+            * The estimated number of updates per element is at least ``compiler.cpu.wcr_privatization_min_updates``
+              (a symbolic number of updates is assumed to be large).
+
+        :return: A list of tuples of (outer memlet edge, number of elements in the written region).
+        """
+        max_elements = Config.get('compiler', 'cpu', 'wcr_privatization_max_elements')
+        min_updates = Config.get('compiler', 'cpu', 'wcr_privatization_min_updates')
+        if max_elements <= 0 or state.scope_dict()[entry] is not None:
+            return []
+
+        exit_node = state.exit_node(entry)
+        scope = state.scope_subgraph(entry)
+        outputs = [e for e in state.out_edges(exit_node) if not e.data.is_empty()]
+        result = []
+        for edge in outputs:
+            memlet = edge.data
+            name = memlet.data
+            if memlet.wcr is None or not isinstance(edge.dst, nodes.AccessNode):
+                continue
+            if sum(1 for e in outputs if e.data.data == name) != 1:
+                continue
+            desc = sdfg.arrays[name]
+            if (type(desc) is not data.Array or type(desc.dtype) is not dtypes.typeclass or desc.storage
+                    not in (dtypes.StorageType.Default, dtypes.StorageType.CPU_Heap, dtypes.StorageType.CPU_Pinned)):
+                continue
+
+            # The data must be accessible through a pointer that can be replaced within the map
+            if cpp.ptr(name, desc, sdfg, self._frame) != name:
+                continue
+            try:
+                defined_type, _ = self._dispatcher.defined_vars.get(name)
+            except KeyError:
+                continue
+            if defined_type != DefinedType.Pointer:
+                continue
+
+            redtype = operations.detect_reduction_type(memlet.wcr)
+            try:
+                if dtypes.reduction_identity(desc.dtype, redtype) is None:
+                    continue
+            except TypeError:
+                continue
+
+            tree = state.memlet_tree(edge)
+            tree_edges = set(tree)
+            leaves = tree.leaves()
+            if any(not isinstance(e.src, nodes.Tasklet) for e in leaves):
+                continue
+            if any(e.data.wcr is None or operations.detect_reduction_type(e.data.wcr) != redtype for e in tree_edges):
+                continue
+            if any(isinstance(n, nodes.AccessNode) and n.data == name for n in scope.nodes()):
+                continue
+            if any(e.data.data == name and e not in tree_edges
+                   for e in itertools.chain(scope.edges(), state.in_edges(entry))):
+                continue
+            if not any(cpp.is_write_conflicted(state, e, sdfg_schedule=self._toplevel_schedule) for e in leaves):
+                continue
+
+            # Size and contiguity of the written region
+            size = memlet.subset.num_elements()
+            if symbolic.issymbolic(size, sdfg.constants):
+                continue
+            size = int(symbolic.evaluate(size, sdfg.constants))
+            if size > max_elements:
+                continue
+            ranges = memlet.subset.ndrange()
+            if any(b != e and s != 1 for b, e, s in ranges):
+                continue
+            span = sum((e - b) * stride for (b, e, _), stride in zip(ranges, desc.strides)) + 1
+            if symbolic.simplify(span - size) != 0:
+                continue
+
+            # Estimated number of updates per element
+            if not memlet.dynamic and not symbolic.issymbolic(memlet.volume, sdfg.constants):
+                if int(symbolic.evaluate(memlet.volume, sdfg.constants)) < min_updates * size:
+                    continue
+
+            result.append((edge, size))
+        return result
+
     def _generate_MapEntry(
         self,
         sdfg,
@@ -1707,26 +2024,42 @@ class CPUCodeGen(TargetCodeGenerator):
 
         # TODO: Refactor to generate_scope_preamble once a general code
         #  generator (that CPU inherits from) is implemented
+        # Infer loop clauses from the iteration space and memory access patterns
+        collapse = node.map.collapse
+        simd = False
+        if Config.get_bool('compiler', 'cpu', 'infer_omp_clauses') and not node.map.unroll:
+            simd = self._is_simd_map(sdfg, state_dfg, node)
+            if node.map.schedule == dtypes.ScheduleType.CPU_Multicore and collapse == 1:
+                collapse = self._infer_collapse(node.map)
+                # Keep the innermost dimension as a separate loop for vectorization
+                if simd and collapse == len(map_params) and collapse > 1:
+                    collapse -= 1
+
+            # Vectorization hints are only given to sequential loops
+            if node.map.schedule == dtypes.ScheduleType.CPU_Multicore and collapse >= len(map_params):
+                simd = False
+
+        # Privatize write-conflict resolution: Allocate per-thread buffers and use them within the map
+        if node.map.schedule == dtypes.ScheduleType.CPU_Multicore:
+            privatized = []
+            for edge, size in self._privatized_wcr_outputs(sdfg, state_dfg, node):
+                name = edge.data.data
+                desc = sdfg.arrays[name]
+                redtype = operations.detect_reduction_type(edge.data.wcr)
+                credtype = "dace::ReductionType::" + str(redtype)[str(redtype).find(".") + 1:]
+                result.write(
+                    f'dace::privatized_wcr<{credtype}, {desc.dtype.ctype}> __dace_wcr_{name}({size}, '
+                    f'{node.map.omp_num_threads});', sdfg, state_id, node)
+                privatized.append((name, cpp.cpp_offset_expr(desc, edge.data.subset)))
+                self._nonatomic_wcr.update(id(e.data) for e in state_dfg.memlet_tree(edge))
+            if privatized:
+                self._privatized_wcr[node] = privatized
+
         if node.map.schedule == dtypes.ScheduleType.CPU_Multicore:
             map_header += "#pragma omp parallel for"
-            if node.map.omp_schedule != dtypes.OMPScheduleType.Default:
-                schedule = " schedule("
-                if node.map.omp_schedule == dtypes.OMPScheduleType.Static:
-                    schedule += "static"
-                elif node.map.omp_schedule == dtypes.OMPScheduleType.Dynamic:
-                    schedule += "dynamic"
-                elif node.map.omp_schedule == dtypes.OMPScheduleType.Guided:
-                    schedule += "guided"
-                else:
-                    raise ValueError("Unknown OpenMP schedule type")
-                if node.map.omp_chunk_size > 0:
-                    schedule += f", {node.map.omp_chunk_size}"
-                schedule += ")"
-                map_header += schedule
-            if node.map.omp_num_threads > 0:
-                map_header += f" num_threads({node.map.omp_num_threads})"
-            if node.map.collapse > 1:
-                map_header += ' collapse(%d)' % node.map.collapse
+            map_header += self._omp_clauses(node.map)
+            if collapse > 1:
+                map_header += ' collapse(%d)' % collapse
             # Loop over outputs, add OpenMP reduction clauses to detected cases
             # TODO: set up register outside loop
             # exit_node = dfg.exit_node(node)
@@ -1759,6 +2092,8 @@ class CPUCodeGen(TargetCodeGenerator):
 
             if node.map.unroll:
                 result.write("#pragma unroll", sdfg, state_id, node)
+            elif simd and i == len(map_params) - 1:
+                result.write("#pragma omp simd", sdfg, state_id, node)
 
             result.write(
                 "for (auto %s = %s; %s < %s; %s += %s) {\n" %
@@ -1768,6 +2103,11 @@ class CPUCodeGen(TargetCodeGenerator):
                 node,
             )
 
+        # Redirect conflicting writes to the buffer of the current thread
+        for name, offset in self._privatized_wcr.get(node, []):
+            result.write(f'{sdfg.arrays[name].dtype.ctype} *{name} = __dace_wcr_{name}.local() - ({offset});', sdfg,
+                         state_id, node)
+
         callsite_stream.write(inner_stream.getvalue())
 
         # Emit internal transient array allocation
@@ -1801,6 +2141,10 @@ class CPUCodeGen(TargetCodeGenerator):
 
         result.write(outer_stream.getvalue())
 
+        # Combine per-thread buffers of privatized write-conflict resolution
+        for name, offset in self._privatized_wcr.pop(map_node, []):
+            result.write(f'__dace_wcr_{name}.combine({name} + ({offset}));', sdfg, state_id, node)
+
         callsite_stream.write('}', sdfg, state_id, node)
 
     def _generate_ConsumeEntry(
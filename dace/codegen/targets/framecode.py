@@ -9,7 +9,7 @@ import networkx as nx
 import numpy as np
 
 import dace
-from dace import config, data, dtypes
+from dace import config, data, dtypes, symbolic
 from dace.cli import progress
 from dace.codegen import control_flow as cflow
 from dace.codegen import dispatcher as disp
@@ -22,6 +22,7 @@ from dace.sdfg import scope as sdscope
 from dace.sdfg import utils
 from dace.sdfg.infer_types import set_default_schedule_and_storage_types
 from dace.transformation.passes.analysis import StateReachability
+from dace.transformation.passes.memory_planning import ArenaPlan, ArenaPlanner
 
 
 def _get_or_eval_sdfg_first_arg(func, sdfg):
@@ -46,6 +47,8 @@ class DaCeCodeGenerator(object):
         self.to_allocate: DefaultDict[Union[SDFG, SDFGState, nodes.EntryNode],
                                       List[Tuple[int, int, nodes.AccessNode]]] = collections.defaultdict(list)
         self.where_allocated: Dict[Tuple[SDFG, str], SDFG] = {}
+        self.arena_plan: Optional[ArenaPlan] = None
+        self.uses_memory_pool = False
         self.fsyms: Dict[int, Set[str]] = {}
         self._symbols_and_constants: Dict[int, Set[str]] = {}
         fsyms = self.free_symbols(sdfg)
@@ -198,6 +201,10 @@ struct {sdfg.name}_t {{
         for env in self.environments:
             self.statestruct.extend(env.state_fields)
 
+        # Memory pool for heap-allocated transients
+        if self.uses_memory_pool:
+            self.statestruct.append('dace::MemoryPool memory_pool;')
+
         # Instrumentation preamble
         if len(self._dispatcher.instrumentation) > 2:
             self.statestruct.append('dace::perf::Report report;')
@@ -227,6 +234,10 @@ struct {sdfg.name}_t {{
             if instr is not None:
                 instr.on_sdfg_end(sdfg, callsite_stream, global_stream)
 
+        # Report memory pool statistics
+        if self.uses_memory_pool and len(self._dispatcher.instrumentation) > 2:
+            callsite_stream.write('__state->memory_pool.report(__state->report);', sdfg)
+
         # Instrumentation saving
         if (config.Config.get_bool('instrumentation', 'report_each_invocation')
                 and len(self._dispatcher.instrumentation) > 2):
@@ -349,7 +360,13 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
 
         components = dace.sdfg.concurrent_subgraphs(state)
 
-        if len(components) <= 1:
+        if self._use_openmp_tasks(sdfg):
+            # Every component runs as a task, ordered by the data it reads and writes
+            for c in components:
+                callsite_stream.write(f"#pragma omp task{self._task_dependencies(sdfg, state, c)}\n{{")
+                self._dispatcher.dispatch_subgraph(sdfg, c, sid, global_stream, callsite_stream, skip_entry_node=False)
+                callsite_stream.write("} // End omp task")
+        elif len(components) <= 1:
             self._dispatcher.dispatch_subgraph(sdfg, state, sid, global_stream, callsite_stream, skip_entry_node=False)
         else:
             if sdfg.openmp_sections:
@@ -367,6 +384,9 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
         # Write state footer
 
         if generate_state_footer:
+            if self._use_openmp_tasks(sdfg) and self._requires_taskwait(sdfg, state):
+                callsite_stream.write("#pragma omp taskwait")
+
             # Emit internal transient array deallocation
             self.deallocate_arrays_in_scope(sdfg, state, global_stream, callsite_stream)
 
@@ -375,6 +395,57 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
                 if instr is not None:
                     instr.on_state_end(sdfg, state, callsite_stream, global_stream)
 
+    @staticmethod
+    def _use_openmp_tasks(sdfg: SDFG) -> bool:
+        """
+        Returns True if the states of the given SDFG are executed as OpenMP tasks (see the
+        ``compiler.cpu.openmp_tasks`` configuration entry). Only applies to top-level SDFGs.
+        """
+        return sdfg.parent is None and config.Config.get_bool('compiler', 'cpu', 'openmp_tasks')
+
+    def _task_dependencies(self, sdfg: SDFG, state: SDFGState, component: ScopeSubgraphView) -> str:
+        """
+        Returns the OpenMP ``depend`` clauses of a task that executes a connected component of a state, based on the
+        data containers that the component reads and writes outside of scopes. Views are omitted, as the data they
+        view is accessed in the same component.
+        """
+        from dace.codegen.targets import cpp  # Avoid import loop
+
+        reads, writes = component.read_and_write_sets()
+        sdict = state.scope_dict()
+        toplevel = {n.data for n in component.data_nodes() if sdict[n] is None}
+
+        def lvalues(names: Set[str]) -> List[str]:
+            return sorted(
+                cpp.ptr(name, sdfg.arrays[name], sdfg, self) for name in names & toplevel
+                if not isinstance(sdfg.arrays[name], (data.View, data.Reference)))
+
+        result = ''
+        inputs = lvalues(reads - writes)
+        if inputs:
+            result += f' depend(in: {", ".join(inputs)})'
+        outputs = lvalues(writes)
+        if outputs:
+            result += f' depend(inout: {", ".join(outputs)})'
+        return result
+
+    def _requires_taskwait(self, sdfg: SDFG, state: SDFGState) -> bool:
+        """
+        Returns True if the tasks of a state must complete before the state ends, i.e., unless the state is followed
+        by exactly one state (which has no other predecessors) through an unconditional edge without assignments, and
+        nothing is deallocated or instrumented at the end of the state. In that case, the tasks of the following state
+        can start as soon as their dependencies are satisfied.
+        """
+        if state.instrument != dtypes.InstrumentationType.No_Instrumentation:
+            return True
+        if any(deallocate for _, _, _, _, _, deallocate in self.to_allocate[state]):
+            return True
+        out_edges = sdfg.out_edges(state)
+        if len(out_edges) != 1:
+            return True
+        edge = out_edges[0]
+        return not edge.data.is_unconditional() or len(edge.data.assignments) > 0 or sdfg.in_degree(edge.dst) != 1
+
     def generate_states(self, sdfg, global_stream, callsite_stream):
         states_generated = set()
 
@@ -406,6 +477,10 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
                                      [cflow.SingleState(dispatch_state, s, s is last) for s in states_topological], [],
                                      [], [], [], False)
 
+        # One thread creates the tasks of all states, which are executed by the threads of the team
+        if self._use_openmp_tasks(sdfg):
+            callsite_stream.write('#pragma omp parallel\n#pragma omp single\n{', sdfg)
+
         callsite_stream.write(cft.as_cpp(self, sdfg.symbols), sdfg)
 
         opbar.done()
@@ -413,6 +488,9 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
         # Write exit label
         callsite_stream.write(f'__state_exit_{sdfg.sdfg_id}:;', sdfg)
 
+        if self._use_openmp_tasks(sdfg):
+            callsite_stream.write('} // End omp single', sdfg)
+
         return states_generated
 
     def _get_schedule(self, scope: Union[nodes.EntryNode, SDFGState, SDFG]) -> dtypes.ScheduleType:
@@ -709,6 +787,52 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
             else:
                 self.where_allocated[(sdfg, name)] = cursdfg
 
+    def plan_arena_allocation(self, top_sdfg: SDFG, callsite_stream: CodeIOStream):
+        """
+        Plans heap-allocated transients into a memory arena (if enabled in the configuration), which is allocated
+        upon initialization. Planned transients are then pointers into the arena (see ``arena_pointer``). If the size
+        of the arena depends on symbols, it is grown at the beginning of every call that requires more memory.
+
+        :param top_sdfg: The top-level SDFG to plan for.
+        :param callsite_stream: Stream to write to (at the beginning of the program function).
+        """
+        if not config.Config.get_bool('compiler', 'cpu', 'arena_allocation'):
+            return
+        plan = ArenaPlanner().apply_pass(top_sdfg, {})
+        if not plan:
+            return
+        self.arena_plan = plan
+
+        self.statestruct.append('char *__dace_arena;')
+        self._initcode.write(f'__state->__dace_arena = new char DACE_ALIGN(64)[{sym2cpp(plan.size)}];\n', top_sdfg)
+        self._exitcode.write('delete[] __state->__dace_arena;\n', top_sdfg)
+        if symbolic.issymbolic(plan.size):
+            self.statestruct.append('size_t __dace_arena_size;')
+            self._initcode.write(f'__state->__dace_arena_size = {sym2cpp(plan.size)};\n', top_sdfg)
+            callsite_stream.write(
+                f'''if ({sym2cpp(plan.size)} > __state->__dace_arena_size) {{
+    delete[] __state->__dace_arena;
+    __state->__dace_arena_size = {sym2cpp(plan.size)};
+    __state->__dace_arena = new char DACE_ALIGN(64)[__state->__dace_arena_size];
+}}''', top_sdfg)
+        for (sdfg_id, name), offset in plan.offsets.items():
+            # Symbolic offsets are computed once per call, since the symbols may not be defined in nested SDFGs
+            if symbolic.issymbolic(offset):
+                self.statestruct.append(f'size_t __dace_arena_offset_{sdfg_id}_{name};')
+                callsite_stream.write(f'__state->__dace_arena_offset_{sdfg_id}_{name} = {sym2cpp(offset)};\n', top_sdfg)
+
+    def arena_pointer(self, sdfg: SDFG, name: str) -> Optional[str]:
+        """
+        Returns an expression of the pointer to a transient in the memory arena, or None if the transient is allocated
+        separately.
+        """
+        if self.arena_plan is None or (sdfg.sdfg_id, name) not in self.arena_plan:
+            return None
+        offset = self.arena_plan.offsets[(sdfg.sdfg_id, name)]
+        if symbolic.issymbolic(offset):
+            return f'__state->__dace_arena + __state->__dace_arena_offset_{sdfg.sdfg_id}_{name}'
+        return f'__state->__dace_arena + {sym2cpp(offset)}'
+
     def allocate_arrays_in_scope(self, sdfg: SDFG, scope: Union[nodes.EntryNode, SDFGState, SDFG],
                                  function_stream: CodeIOStream, callsite_stream: CodeIOStream):
         """ Dispatches allocation of all arrays in the given scope. """
@@ -765,6 +889,7 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
         # Analyze allocation lifetime of SDFG and all nested SDFGs
         if is_top_level:
             self.determine_allocation_lifetime(sdfg)
+            self.plan_arena_allocation(sdfg, callsite_stream)
 
         # Generate code
         ###########################
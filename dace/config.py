@@ -7,6 +7,9 @@ from typing import Any, Dict
 import yaml
 import warnings
 
+# Use the (much faster) C implementation of the YAML loader if available
+_YAMLLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @contextlib.contextmanager
 def set_temporary(*path, value):
@@ -23,8 +26,10 @@ def set_temporary(*path, value):
     """
     old_value = Config.get(*path)
     Config.set(*path, value=value)
-    yield
-    Config.set(*path, value=old_value)
+    try:
+        yield
+    finally:
+        Config.set(*path, value=old_value)
 
 
 @contextlib.contextmanager
@@ -41,8 +46,10 @@ def temporary_config():
     """
     with tempfile.NamedTemporaryFile() as fp:
         Config.save(fp.name)
-        yield
-        Config.load(fp.name)
+        try:
+            yield
+        finally:
+            Config.load(fp.name)
 
 
 def _env2bool(envval):
@@ -169,7 +176,7 @@ class Config(object):
 
         # Read configuration file
         with open(filename, 'r') as f:
-            Config._config = yaml.load(f.read(), Loader=yaml.SafeLoader)
+            Config._config = yaml.load(f.read(), Loader=_YAMLLoader)
 
         if Config._config is None:
             Config._config = {}
@@ -188,7 +195,7 @@ class Config(object):
         if filename is None:
             filename = Config._metadata_filename
         with open(filename, 'r') as f:
-            Config._config_metadata = yaml.load(f.read(), Loader=yaml.SafeLoader)
+            Config._config_metadata = yaml.load(f.read(), Loader=_YAMLLoader)
 
     @staticmethod
     def save(path=None, all: bool = False):
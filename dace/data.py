@@ -402,6 +402,10 @@ class Scalar(Data):
     def pool(self) -> bool:
         return False
 
+    @property
+    def first_touch(self) -> bool:
+        return False
+
     @property
     def may_alias(self) -> bool:
         return False
@@ -527,6 +531,10 @@ class Array(Data):
                         'If False, the array must not be None. If option is not set, '
                         'it is inferred by other properties and the OptionalArrayInference pass.')
     pool = Property(dtype=bool, default=False, desc='Hint to the allocator that using a memory pool is preferred')
+    first_touch = Property(dtype=bool,
+                           default=False,
+                           desc='Hint to the allocator that the array should be initialized in parallel upon '
+                           'allocation, placing its pages on the NUMA nodes of the threads that first write to them')
 
     def __init__(self,
                  dtype,
@@ -544,7 +552,8 @@ class Array(Data):
                  total_size=None,
                  start_offset=None,
                  optional=None,
-                 pool=False):
+                 pool=False,
+                 first_touch=False):
 
         super(Array, self).__init__(dtype, shape, transient, storage, location, lifetime, debuginfo)
 
@@ -558,6 +567,7 @@ class Array(Data):
         if optional is None and self.transient:
             self.optional = False
         self.pool = pool
+        self.first_touch = first_touch
 
         if strides is not None:
             self.strides = cp.copy(strides)
@@ -582,7 +592,7 @@ class Array(Data):
     def clone(self):
         return type(self)(self.dtype, self.shape, self.transient, self.allow_conflicts, self.storage, self.location,
                           self.strides, self.offset, self.may_alias, self.lifetime, self.alignment, self.debuginfo,
-                          self.total_size, self.start_offset, self.optional, self.pool)
+                          self.total_size, self.start_offset, self.optional, self.pool, self.first_touch)
 
     def to_json(self):
         attrs = serialize.all_properties_to_json(self)
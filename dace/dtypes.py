@@ -54,6 +54,16 @@ class OMPScheduleType(aenum.AutoNumberEnum):
     Guided = ()  #: Guided schedule
 
 
+@undefined_safe_enum
+@extensible_enum
+class OMPProcBindType(aenum.AutoNumberEnum):
+    """ Available OpenMP thread affinity (``proc_bind``) policies for Maps with CPU-Multicore schedule. """
+    Default = ()  #: OpenMP library default (see ``OMP_PROC_BIND``)
+    Master = ()  #: Threads are bound to the place of the primary thread
+    Close = ()  #: Threads are bound to places close to the primary thread
+    Spread = ()  #: Threads are spread evenly across places (e.g., sockets)
+
+
 @undefined_safe_enum
 @extensible_enum
 class ScheduleType(aenum.AutoNumberEnum):
@@ -2,14 +2,28 @@
 """ Precompiled DaCe program/method cache. """
 
 from collections import OrderedDict
+import contextlib
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Set, Tuple
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
 
 import dace
 from dace import config
-from dace import data as dt, hooks
+from dace import data as dt, dtypes, hooks
 from dace.sdfg.sdfg import SDFG
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 # Type hints
 ArgTypes = Dict[str, dt.Data]
 ConstantTypes = Dict[str, Any]
@@ -50,6 +64,31 @@ def _make_sortable(obj):
         return repr(obj)
 
 
+_SCALAR_TYPES = (int, float, complex, bool, str, type(None))
+
+
+def argument_fingerprint(arg: Any) -> Optional[Hashable]:
+    """
+    Returns a cheap, hashable fingerprint of a call-site argument, which uniquely determines the data descriptor
+    that would be created from it (data type, shape, strides, storage, or scalar type). Unlike
+    ``create_datadescriptor``, no descriptor objects are created.
+
+    :param arg: The argument to fingerprint.
+    :return: A hashable fingerprint, or None if the argument cannot be fingerprinted without creating a descriptor.
+    """
+    argtype = type(arg)
+    if argtype is np.ndarray:
+        return (argtype, arg.dtype, arg.shape, arg.strides, dtypes.StorageType.Default)
+    if argtype in _SCALAR_TYPES or isinstance(arg, (np.number, np.bool_)):
+        return (argtype, )
+    if hasattr(arg,
+               '__cuda_array_interface__') and not hasattr(arg, '__descriptor__') and not hasattr(arg, 'descriptor'):
+        interface = arg.__cuda_array_interface__
+        return (argtype, interface['typestr'], tuple(interface['shape']), interface['strides'],
+                dtypes.StorageType.GPU_Global)
+    return None
+
+
 @dataclass
 class ProgramCacheKey:
     """ A key object representing a single instance of a DaCe program. """
@@ -90,6 +129,20 @@ class ProgramCacheEntry:
     compiled_sdfg: 'dace.codegen.compiled_sdfg.CompiledSDFG'
 
 
+@dataclass
+class FastDispatchEntry:
+    """
+    A value object representing a fast-dispatch cache entry, which maps argument fingerprints directly to a
+    compiled program. Contains the information needed to validate the entry and call the compiled SDFG without
+    recreating data descriptors or the full program cache key.
+    """
+    entry: ProgramCacheEntry
+    closure_constants: Tuple[Tuple[str, Any], ...]
+    closure_arrays: Tuple[Tuple[str, Hashable], ...]
+    callback_mapping: Dict[str, str]
+    symbols: Dict[str, Any]
+
+
 class DaceProgramCache:
     def __init__(self, evaluate: EvalCallback, size: Optional[int] = None) -> None:
         """ 
@@ -102,10 +155,12 @@ class DaceProgramCache:
         self.eval_callback = evaluate
         self.size = size or config.Config.get('frontend', 'cache_size')
         self.cache: OrderedDict[ProgramCacheKey, ProgramCacheEntry] = LimitedSizeDict(size_limit=size)
+        self.fast_dispatch: OrderedDict[Tuple, FastDispatchEntry] = LimitedSizeDict(size_limit=self.size)
 
     def clear(self):
         """ Clears the program cache. """
         self.cache.clear()
+        self.fast_dispatch.clear()
 
     def _evaluate_constants(self, constants: Set[str], extra_constants: Dict[str, Any] = None) -> ConstantTypes:
         # Evaluate closure constants at call time
@@ -129,6 +184,37 @@ class DaceProgramCache:
         key = ProgramCacheKey(argtypes, adescs, cvals, specified_args)
         return key
 
+    def make_fast_key(self, args: Tuple[Any], kwargs: Dict[str, Any], methodobj: Any = None) -> Optional[Tuple]:
+        """
+        Creates a fast-dispatch key from call-site arguments, based on their fingerprints
+        (see ``argument_fingerprint``).
+
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+        :param methodobj: The object whose method is being called, if any.
+        :return: A hashable key, or None if one of the arguments cannot be fingerprinted.
+        """
+        fingerprints = []
+        for arg in args:
+            fp = argument_fingerprint(arg)
+            if fp is None:
+                return None
+            fingerprints.append(fp)
+        for k, arg in sorted(kwargs.items()):
+            fp = argument_fingerprint(arg)
+            if fp is None:
+                return None
+            fingerprints.append((k, fp))
+        return (tuple(fingerprints), len(args), id(methodobj), tuple(id(hook) for hook in hooks._SDFG_CALL_HOOKS))
+
+    def add_fast(self, key: Tuple, entry: FastDispatchEntry) -> None:
+        """ Adds a new entry to the fast-dispatch cache. """
+        self.fast_dispatch[key] = entry
+
+    def get_fast(self, key: Tuple) -> Optional[FastDispatchEntry]:
+        """ Returns an existing fast-dispatch entry, or None if it does not exist. """
+        return self.fast_dispatch.get(key, None)
+
     def add(self, key: ProgramCacheKey, sdfg: SDFG, compiled_sdfg: 'dace.codegen.compiled_sdfg.CompiledSDFG') -> None:
         """ Adds a new entry to the program cache. """
         self.cache[key] = ProgramCacheEntry(sdfg, compiled_sdfg)
@@ -149,3 +235,220 @@ class DaceProgramCache:
     def pop(self) -> None:
         """ Remove the first entry from the cache. """
         self.cache.popitem(last=False)
+        self.fast_dispatch.clear()
+
+
+class PersistentProgramCache:
+    """
+    A content-addressed program cache on disk, which can be shared between processes. Each entry is stored in a
+    folder named after a hash of the program contents (see ``make_digest``), and contains the compiled SDFG
+    (``program.sdfg``) and its shared library (in ``build``). The cache is limited in size, evicting least recently
+    used entries first.
+
+    Concurrent access is coordinated with per-entry file locks, and entries are written to a temporary folder and
+    atomically renamed into place, so that other processes never observe partially-written entries. Loaded programs
+    are copied out of the cache, so entries are never modified after they are stored.
+    """
+
+    def __init__(self, folder: Optional[str] = None, size_limit: Optional[int] = None) -> None:
+        """
+        Initializes a persistent program cache.
+
+        :param folder: The cache folder (if not given, uses the default value from the configuration).
+        :param size_limit: The cache size limit in megabytes (if not given, uses the default value from the
+                           configuration).
+        """
+        self.folder = os.path.abspath(folder or config.Config.get('frontend', 'persistent_cache_folder')
+                                      or os.path.join(config.Config.get('default_build_folder'), '.persistent'))
+        if size_limit is None:
+            size_limit = config.Config.get('frontend', 'persistent_cache_size')
+        self.size_limit = size_limit * 1024 * 1024
+        os.makedirs(self.folder, exist_ok=True)
+
+    @staticmethod
+    def make_digest(program: 'dace.frontend.python.parser.DaceProgram', key: ProgramCacheKey) -> Optional[str]:
+        """
+        Computes a content hash of a DaCe program instance, made of the function source code (and the source of
+        called programs in its closure), the argument and closure types, the closure constants, and the current
+        configuration.
+
+        :param program: The DaCe program.
+        :param key: The program cache key of the current call (see ``DaceProgramCache.make_key``).
+        :return: A hexadecimal digest, or None if the program cannot be content-addressed (e.g., if its source
+                 code is unavailable).
+        """
+        try:
+            sources = [_function_source(program.f)]
+            if program.resolver is not None:
+                for _, (qualname, obj) in program.resolver.closure_sdfgs.items():
+                    if isinstance(obj, SDFG):
+                        sources.append((qualname, obj.hash_sdfg()))
+                    elif hasattr(obj, 'f'):
+                        sources.append((qualname, _function_source(obj.f)))
+                    else:
+                        return None
+        except (OSError, TypeError):
+            return None
+
+        contents = (
+            dace.__version__,
+            program.name,
+            sources,
+            key._tuple[:-1],  # Hook identifiers are process-specific
+            json.dumps(config.Config._config, sort_keys=True, default=str),
+        )
+        return hashlib.sha256(repr(contents).encode('utf-8')).hexdigest()
+
+    def _entry_folder(self, digest: str) -> str:
+        return os.path.join(self.folder, digest)
+
+    @contextlib.contextmanager
+    def lock(self, digest: str, blocking: bool = True):
+        """
+        Returns a context manager that holds an exclusive, inter-process lock on the given cache entry. Processes
+        that build the same program wait for each other instead of compiling it concurrently.
+
+        :param digest: The content hash of the program.
+        :param blocking: If False, does not wait for the lock if it is held by another process.
+        :return: A context manager that yields True if the lock was acquired, or False otherwise.
+        """
+        if fcntl is None:
+            yield True
+            return
+
+        lockpath = os.path.join(self.folder, digest + '.lock')
+        while True:
+            lockfile = open(lockpath, 'a')
+            try:
+                fcntl.flock(lockfile, fcntl.LOCK_EX if blocking else (fcntl.LOCK_EX | fcntl.LOCK_NB))
+            except BlockingIOError:
+                lockfile.close()
+                yield False
+                return
+            # The lock file is removed on release, so the lock is only valid if the file was not removed (or
+            # replaced) while waiting for it
+            try:
+                if os.path.samestat(os.fstat(lockfile.fileno()), os.stat(lockpath)):
+                    break
+            except FileNotFoundError:
+                pass
+            lockfile.close()
+
+        try:
+            yield True
+        finally:
+            os.remove(lockpath)
+            lockfile.close()
+
+    def load(self, digest: str) -> Optional['dace.codegen.compiled_sdfg.CompiledSDFG']:
+        """
+        Loads a compiled program from the cache.
+
+        :param digest: The content hash of the program (see ``make_digest``).
+        :return: The compiled SDFG, or None if the entry does not exist.
+        """
+        from dace.codegen import compiled_sdfg as csd  # Avoid import loops
+
+        folder = self._entry_folder(digest)
+        sdfg_path = os.path.join(folder, 'program.sdfg')
+        if not os.path.isfile(sdfg_path):
+            return None
+
+        sdfg = SDFG.from_file(sdfg_path)
+        suffix = config.Config.get('compiler', 'library_extension')
+        filenames = [f'lib{sdfg.name}.{suffix}', f'libdacestub_{sdfg.name}.{suffix}']
+        if not all(os.path.isfile(os.path.join(folder, 'build', f)) for f in filenames):
+            return None
+
+        # Copy the program to the build folder of the SDFG, such that rebuilding or reloading it does not modify the
+        # cache entry. If a program with the same name is already loaded from there, use a new folder instead.
+        if sdfg.is_loaded():
+            sdfg.build_folder = tempfile.mkdtemp(prefix=f'{sdfg.name}_', dir=config.Config.get('default_build_folder'))
+        build_folder = os.path.join(sdfg.build_folder, 'build')
+        os.makedirs(build_folder, exist_ok=True)
+        for filename in filenames:
+            # Copy and rename, since previously loaded libraries may still be mapped to the original files
+            tmppath = os.path.join(build_folder, f'.{filename}.{os.getpid()}')
+            shutil.copyfile(os.path.join(folder, 'build', filename), tmppath)
+            os.replace(tmppath, os.path.join(build_folder, filename))
+
+        # Mark entry as recently used
+        os.utime(folder)
+
+        return csd.CompiledSDFG(sdfg, csd.ReloadableDLL(os.path.join(build_folder, filenames[0]), sdfg.name),
+                                sdfg.arg_names)
+
+    def store(self, digest: str, compiled_sdfg: 'dace.codegen.compiled_sdfg.CompiledSDFG') -> None:
+        """
+        Stores a compiled program in the cache, then evicts least recently used entries if the cache exceeds its
+        size limit.
+
+        :param digest: The content hash of the program (see ``make_digest``).
+        :param compiled_sdfg: The compiled SDFG to store.
+        """
+        folder = self._entry_folder(digest)
+        if os.path.isdir(folder):
+            return
+
+        sdfg = compiled_sdfg.sdfg
+        libpath = compiled_sdfg.filename
+        suffix = config.Config.get('compiler', 'library_extension')
+        stubpath = os.path.join(os.path.dirname(libpath), f'libdacestub_{sdfg.name}.{suffix}')
+
+        # Write to a temporary folder, then atomically move it into place
+        tmpfolder = tempfile.mkdtemp(prefix='.tmp-', dir=self.folder)
+        try:
+            os.makedirs(os.path.join(tmpfolder, 'build'))
+            shutil.copyfile(libpath, os.path.join(tmpfolder, 'build', f'lib{sdfg.name}.{suffix}'))
+            shutil.copyfile(stubpath, os.path.join(tmpfolder, 'build', os.path.basename(stubpath)))
+            sdfg.save(os.path.join(tmpfolder, 'program.sdfg'))
+            os.replace(tmpfolder, folder)
+        except OSError:
+            return
+        finally:
+            # Removes the temporary folder if it was not moved into place
+            shutil.rmtree(tmpfolder, ignore_errors=True)
+
+        self.evict(keep=digest)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Removes least recently used entries until the cache fits within its size limit. Entries that are locked by
+        other processes are skipped.
+
+        :param keep: An optional entry digest that should not be evicted.
+        """
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.folder):
+            path = os.path.join(self.folder, name)
+            if name.startswith('.') or name == keep or not os.path.isdir(path):
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(path) for f in files
+                if os.path.isfile(os.path.join(root, f)))
+            entries.append((os.path.getmtime(path), size, name))
+            total_size += size
+
+        for _, size, name in sorted(entries):
+            if total_size <= self.size_limit:
+                break
+            with self.lock(name, blocking=False) as acquired:
+                if not acquired:
+                    continue
+                shutil.rmtree(self._entry_folder(name), ignore_errors=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """ Removes all entries from the cache. """
+        shutil.rmtree(self.folder, ignore_errors=True)
+        os.makedirs(self.folder, exist_ok=True)
+
+
+def _function_source(f: Callable) -> str:
+    """ Returns the source code of a function, falling back to its bytecode if the source is unavailable. """
+    try:
+        return inspect.getsource(f)
+    except OSError:
+        code = f.__code__
+        return repr((code.co_code, code.co_consts, code.co_names))
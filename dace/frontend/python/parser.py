@@ -1,18 +1,20 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 """ DaCe Python parsing functionality and entry point to Python frontend. """
 import ast
+import concurrent.futures
 from dataclasses import dataclass
 import inspect
 import itertools
 import copy
 import os
 import sympy
+import threading
 from typing import Any, Callable, Dict, List, Optional, Set, Sequence, Tuple, Union
 import warnings
 
 from dace import data, dtypes, hooks, symbolic
 from dace.config import Config
-from dace.frontend.python import (newast, common as pycommon, cached_program, preprocessing)
+from dace.frontend.python import (common as pycommon, cached_program, preprocessing)
 from dace.sdfg import SDFG
 from dace.data import create_datadescriptor, Data
 
@@ -23,6 +25,29 @@ except ImportError:
 
 ArgTypes = Dict[str, Data]
 
+# Sentinel for closure constants that could not be evaluated
+_UNEVALUATED = object()
+
+# Sentinel for calls that run the original Python function in tiered execution mode
+_RUN_IN_PYTHON = object()
+
+
+@dataclass
+class _TieredJob:
+    """ Returned for calls in tiered execution mode that must wait for a running background compilation. """
+    future: concurrent.futures.Future
+
+
+# Background thread that compiles programs in tiered execution mode
+_tiered_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def _get_tiered_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _tiered_executor
+    if _tiered_executor is None:
+        _tiered_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='dace_tiered')
+    return _tiered_executor
+
 
 def _get_argnames(f) -> List[str]:
     """ Returns a Python function's argument names. """
@@ -189,11 +214,22 @@ class DaceProgram(pycommon.SDFGConvertible):
         self.constant_args = set(pname for pname, pval in self.signature.parameters.items()
                                  if pval.annotation is dtypes.compiletime)
 
+        # Variable-length arguments are renamed on every call, which disables fast dispatch
+        self._has_varargs = any(pval.kind in (pval.VAR_POSITIONAL, pval.VAR_KEYWORD)
+                                for pval in self.signature.parameters.values())
+        self._closure_code: Dict[str, Any] = {}
+
+        # Background compilations in tiered execution mode (the lock guards the program state while parsing)
+        self._tiered_lock = threading.Lock()
+        self._tiered_jobs: Dict[cached_program.ProgramCacheKey, concurrent.futures.Future] = {}
+        self._python_compatible: Optional[bool] = None
+
         if self.argnames is None:
             self.argnames = []
 
         # Cache SDFGs with last used arguments
         self._cache = cached_program.DaceProgramCache(self._eval_closure)
+        self._persistent_cache: Optional[cached_program.PersistentProgramCache] = None
         # These sets fill up after the first parsing of the program and stay
         # the same unless the argument types change
         self.closure_array_keys: Set[str] = set()
@@ -210,6 +246,10 @@ class DaceProgram(pycommon.SDFGConvertible):
                 setattr(result, k, v)
             elif k == 'global_vars':
                 setattr(result, k, copy.copy(v))
+            elif k == '_tiered_lock':
+                setattr(result, k, threading.Lock())
+            elif k == '_tiered_jobs':
+                setattr(result, k, {})
             else:
                 setattr(result, k, copy.deepcopy(v, memo))
         return result
@@ -378,7 +418,8 @@ class DaceProgram(pycommon.SDFGConvertible):
             return self.closure_arg_mapping[arg]()
         return eval(arg, self.global_vars, extra_constants)
 
-    def _create_sdfg_args(self, sdfg: SDFG, args: Tuple[Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    def _collect_sdfg_args(self, callback_mapping: Dict[str, str], args: Tuple[Any], kwargs: Dict[str, Any],
+                           closure: Dict[str, Any]) -> Dict[str, Any]:
         # Start with default arguments, then add other arguments
         result = {**self.default_args}
         # Reconstruct keyword arguments
@@ -386,21 +427,162 @@ class DaceProgram(pycommon.SDFGConvertible):
         result.update(kwargs)
 
         # Add closure arguments to the call
-        result.update(self.__sdfg_closure__())
+        result.update(closure)
 
         # Update closure with respect to callback mapping
-        result.update({k: result[v] for k, v in sdfg.callback_mapping.items()})
+        result.update({k: result[v] for k, v in callback_mapping.items()})
+        return result
+
+    def _infer_sdfg_symbols(self, sdfg: SDFG, sdfg_args: Dict[str, Any]) -> Dict[str, Any]:
+        # Infer symbols in data shapes
+        return infer_symbols_from_datadescriptor(sdfg, {
+            k: create_datadescriptor(v)
+            for k, v in sdfg_args.items() if k not in self.constant_args
+        })
+
+    def _create_sdfg_args(self, sdfg: SDFG, args: Tuple[Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        result = self._collect_sdfg_args(sdfg.callback_mapping, args, kwargs, self.__sdfg_closure__())
 
         # Update arguments with symbols in data shapes
-        result.update(
-            infer_symbols_from_datadescriptor(
-                sdfg, {k: create_datadescriptor(v)
-                       for k, v in result.items() if k not in self.constant_args}))
+        result.update(self._infer_sdfg_symbols(sdfg, result))
         return result
 
+    def _eval_closure_constant(self, name: str) -> Any:
+        """
+        Evaluates a closure constant against the live global variables of the function, without copying them.
+        Used for validating fast-dispatch cache entries.
+        """
+        code = self._closure_code.get(name, None)
+        if code is None:
+            code = compile(name, '<closure>', 'eval')
+            self._closure_code[name] = code
+        local_vars = {}
+        if self.f.__closure__ is not None:
+            local_vars.update({
+                k: _get_cell_contents_or_none(v)
+                for k, v in zip(self.f.__code__.co_freevars, self.f.__closure__)
+            })
+        if self.methodobj is not None:
+            local_vars[self.objname] = self.methodobj
+        try:
+            return eval(code, self.f.__globals__, local_vars)
+        except Exception:
+            # The closure changed in a way that cannot be evaluated (e.g., a removed global)
+            return _UNEVALUATED
+
+    def _fast_dispatch_key(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Returns a fast-dispatch key for the given call-site arguments, or None if the call is not eligible for fast
+        dispatch (e.g., compile-time constant arguments, variable-length arguments, or given symbol values).
+        """
+        if self.constant_args or self._has_varargs:
+            return None
+        if kwargs and any(k in self.symbols for k in kwargs):
+            return None
+        return self._cache.make_fast_key(args, kwargs, self.methodobj)
+
+    def _closure_fingerprints(self, closure: Dict[str, Any], names: Set[str]) -> Optional[Tuple]:
+        result = []
+        for k in sorted(names):
+            fp = cached_program.argument_fingerprint(closure.get(k, None))
+            if fp is None:
+                return None
+            result.append((k, fp))
+        return tuple(result)
+
+    def _register_fast_dispatch(self, fastkey: Optional[Tuple], entry: cached_program.ProgramCacheEntry,
+                                closure: Dict[str, Any], symbols: Dict[str, Any]):
+        """ Adds a fast-dispatch entry for a compiled program that was called through the full dispatch path. """
+        if fastkey is None or entry.compiled_sdfg is None:
+            return
+        closure_arrays = self._closure_fingerprints(closure, self.closure_array_keys)
+        if closure_arrays is None:
+            return
+        constants = tuple((k, cached_program._make_hashable(self._eval_closure_constant(k)))
+                          for k in sorted(self.closure_constant_keys))
+        self._cache.add_fast(
+            fastkey,
+            cached_program.FastDispatchEntry(entry, constants, closure_arrays, dict(entry.sdfg.callback_mapping),
+                                             symbols))
+
+    def _try_fast_dispatch(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> Tuple[Optional[Tuple], bool, Any]:
+        """
+        Tries to call a compiled program through the fast-dispatch cache.
+
+        :return: A 3-tuple of (fast-dispatch key or None if not eligible, was a compiled program called, return value).
+        """
+        if not Config.get_bool('frontend', 'fast_dispatch'):
+            return None, False, None
+        fastkey = self._fast_dispatch_key(args, kwargs)
+        if fastkey is not None:
+            fast_entry = self._cache.get_fast(fastkey)
+            if fast_entry is not None:
+                called, result = self._fast_dispatch(fast_entry, args, kwargs)
+                return fastkey, called, result
+        return fastkey, False, None
+
+    def _fast_dispatch(self, fast_entry: cached_program.FastDispatchEntry, args: Tuple[Any],
+                       kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Tries to call a compiled program directly through a fast-dispatch cache entry.
+
+        :return: A 2-tuple of (was the entry valid and called, return value).
+        """
+        # Validate closure constants and arrays
+        for k, v in fast_entry.closure_constants:
+            if cached_program._make_hashable(self._eval_closure_constant(k)) != v:
+                return False, None
+        closure = self.__sdfg_closure__()
+        if fast_entry.closure_arrays:
+            for k, fp in fast_entry.closure_arrays:
+                if cached_program.argument_fingerprint(closure.get(k, None)) != fp:
+                    return False, None
+
+        sdfg_args = self._collect_sdfg_args(fast_entry.callback_mapping, args, kwargs, closure)
+        sdfg_args.update(fast_entry.symbols)
+
+        csdfg = fast_entry.entry.compiled_sdfg
+        csdfg.clear_return_values()
+        return True, csdfg(**sdfg_args)
+
     def __call__(self, *args, **kwargs):
         """ Convenience function that parses, compiles, and runs a DaCe 
             program. """
+        # Fast path: dispatch directly to a compiled program based on argument fingerprints. Fast dispatch does not
+        # modify the program state, so it does not wait for programs that are parsed in the background.
+        fastkey, called, result = self._try_fast_dispatch(args, kwargs)
+        if called:
+            return result
+
+        if not Config.get_bool('frontend', 'tiered_execution'):
+            return self._call(args, kwargs, fastkey)
+
+        # In tiered execution mode, programs run in Python until compiled in the background
+        while True:
+            if not self._tiered_lock.acquire(blocking=False):
+                # The program is being parsed in the background
+                if self._runs_in_python(args, kwargs):
+                    return self._run_in_python(args, kwargs)
+                self._tiered_lock.acquire()
+            try:
+                result = self._call(args, kwargs, fastkey, tiered=True)
+            finally:
+                self._tiered_lock.release()
+            if result is _RUN_IN_PYTHON:
+                return self._run_in_python(args, kwargs)
+            if isinstance(result, _TieredJob):
+                # The program cannot run in Python, wait for the background compilation to finish
+                concurrent.futures.wait([result.future])
+                continue
+            return result
+
+    def _update_globals(self, args: Tuple[Any],
+                        kwargs: Dict[str, Any]) -> Tuple[ArgTypes, Dict[str, Any], Dict[str, Any], Set[str]]:
+        """
+        Updates the global variables of the program from its current closure and the given arguments.
+
+        :return: The type annotations of the arguments (see ``_get_type_annotations``).
+        """
         # Update global variables with current closure
         self.global_vars = _get_locals_and_globals(self.f)
 
@@ -412,6 +594,22 @@ class DaceProgram(pycommon.SDFGConvertible):
 
         # Add constant arguments to globals for caching
         self.global_vars.update(constant_args)
+        return argtypes, arg_mapping, constant_args, specified
+
+    def _call(self,
+              args: Tuple[Any],
+              kwargs: Dict[str, Any],
+              fastkey: Optional[Tuple] = None,
+              tiered: bool = False) -> Any:
+        """
+        Parses, compiles (if necessary), and runs the program. Assumes that fast dispatch was already attempted.
+
+        :param fastkey: The fast-dispatch key of the call, if eligible.
+        :param tiered: If True, instead of compiling the program, starts a background compilation job and returns
+                       ``_RUN_IN_PYTHON`` when the program should run in Python for this call, or the running job
+                       if the program cannot run in Python.
+        """
+        argtypes, arg_mapping, constant_args, specified = self._update_globals(args, kwargs)
 
         # Cache key
         cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys,
@@ -422,24 +620,43 @@ class DaceProgram(pycommon.SDFGConvertible):
             # If the cache does not just contain a parsed SDFG
             if entry.compiled_sdfg is not None:
                 kwargs.update(arg_mapping)
+                sdfg_args, closure, symbols = self._make_call_args(entry.sdfg, args, kwargs)
+                self._register_fast_dispatch(fastkey, entry, closure, symbols)
                 entry.compiled_sdfg.clear_return_values()
-                return entry.compiled_sdfg(**self._create_sdfg_args(entry.sdfg, args, kwargs))
+                return entry.compiled_sdfg(**sdfg_args)
 
         # Clear cache to enforce deletion and closure of compiled program
         # self._cache.pop()
 
-        # Parse SDFG
-        sdfg = self._parse(args, kwargs)
+        if tiered and not any(hook is not None for hook in hooks._SDFG_CALL_HOOKS):
+            job = self._tiered_jobs.get(cachekey)
+            if job is None:
+                if self._runs_in_python(args, kwargs):
+                    self._tiered_jobs[cachekey] = _get_tiered_executor().submit(self._tiered_compile, cachekey, args,
+                                                                                kwargs)
+                    return _RUN_IN_PYTHON
+            elif not job.done():
+                return _RUN_IN_PYTHON if self._runs_in_python(args, kwargs) else _TieredJob(job)
+            else:
+                # The background compilation failed, compile synchronously (raising the error)
+                del self._tiered_jobs[cachekey]
 
-        # Add named arguments to the call
-        kwargs.update(arg_mapping)
-        sdfg_args = self._create_sdfg_args(sdfg, args, kwargs)
+        # Try to load the compiled program from the persistent (cross-process) program cache
+        persistent_cache, digest = self._get_persistent_cache_entry(args, kwargs)
+        if persistent_cache is not None:
+            binaryobj = self._compile_persistent(persistent_cache, digest,
+                                                 lambda: self._parse_for_call(args, kwargs, arg_mapping)[0])
+            kwargs.update(arg_mapping)
+            sdfg_args, closure, symbols = self._make_call_args(binaryobj.sdfg, args, kwargs)
 
-        if self.recreate_sdfg:
-            # Invoke auto-optimization as necessary
-            if Config.get_bool('optimizer', 'autooptimize') or self.autoopt:
-                sdfg = self.auto_optimize(sdfg, symbols=sdfg_args)
-                sdfg.simplify()
+            cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys,
+                                            constant_args)
+            self._cache.add(cachekey, binaryobj.sdfg, binaryobj)
+            self._register_fast_dispatch(fastkey, self._cache.get(cachekey), closure, symbols)
+            return binaryobj(**sdfg_args)
+
+        # Parse SDFG
+        sdfg, sdfg_args, closure, symbols = self._parse_for_call(args, kwargs, arg_mapping)
 
         with hooks.invoke_sdfg_call_hooks(sdfg) as sdfg:
             # Compile SDFG (note: this is done after symbol inference due to shape
@@ -450,12 +667,163 @@ class DaceProgram(pycommon.SDFGConvertible):
             cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys,
                                             constant_args)
             self._cache.add(cachekey, sdfg, binaryobj)
+            self._register_fast_dispatch(fastkey, self._cache.get(cachekey), closure, symbols)
 
             # Call SDFG
             result = binaryobj(**sdfg_args)
 
         return result
 
+    def _compile_persistent(self, persistent_cache: cached_program.PersistentProgramCache, digest: str,
+                            parse: Callable[[], SDFG]) -> 'CompiledSDFG':
+        """
+        Loads a compiled program from the persistent program cache, or compiles the SDFG returned by ``parse`` and
+        stores it in the cache. The cache entry is locked, such that concurrent processes compile the program once.
+        """
+        with persistent_cache.lock(digest):
+            binaryobj = persistent_cache.load(digest)
+            if binaryobj is None:
+                binaryobj = parse().compile(validate=self.validate)
+                persistent_cache.store(digest, binaryobj)
+        return binaryobj
+
+    def _is_python_compatible(self) -> bool:
+        """
+        Returns False if the original Python function uses DaCe constructs that cannot run in plain Python, namely
+        explicit dataflow (maps, consume scopes, and tasklets) or symbols without a value.
+        """
+        if self._python_compatible is None:
+            from dace.frontend.python import astutils, interface  # Avoid import loop
+
+            def resolve(node: ast.AST) -> Any:
+                if isinstance(node, ast.Name):
+                    return self.global_vars.get(node.id, None)
+                if isinstance(node, ast.Attribute):
+                    return getattr(resolve(node.value), node.attr, None)
+                return None
+
+            try:
+                fdef: ast.FunctionDef = astutils.function_to_ast(self.f)[0].body[0]
+            except TypeError:  # Source code is unavailable
+                self._python_compatible = False
+                return False
+            dace_only = (interface.map, interface.consume, interface.tasklet)
+            self._python_compatible = True
+            # Argument annotations (which may contain symbols) are not evaluated, only the function body is checked
+            for node in itertools.chain.from_iterable(ast.walk(stmt) for stmt in fdef.body):
+                if isinstance(node, (ast.Name, ast.Attribute)):
+                    obj = resolve(node)
+                    if any(obj is c for c in dace_only) or isinstance(obj, symbolic.symbol):
+                        self._python_compatible = False
+                        break
+        return self._python_compatible
+
+    def _runs_in_python(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> bool:
+        """ Returns True if the original Python function can be called with the given arguments. """
+        if not self._is_python_compatible():
+            return False
+        try:
+            if self.methodobj is not None:
+                self.signature.bind(self.methodobj, *args, **kwargs)
+            else:
+                self.signature.bind(*args, **kwargs)
+        except TypeError:  # E.g., symbol values given as keyword arguments
+            return False
+        return True
+
+    def _run_in_python(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> Any:
+        """ Runs the original Python function, used in tiered execution until the program is compiled. """
+        if self.methodobj is not None:
+            return self.f(self.methodobj, *args, **kwargs)
+        return self.f(*args, **kwargs)
+
+    def _tiered_compile(self, key: cached_program.ProgramCacheKey, args: Tuple[Any], kwargs: Dict[str, Any]):
+        """
+        Parses and compiles the program for the given arguments on a background thread, and adds the result to the
+        program cache, such that subsequent calls dispatch to the compiled program.
+
+        :param key: The cache key of the call that started the compilation.
+        """
+        kwargs = dict(kwargs)
+        with self._tiered_lock:
+            argtypes, arg_mapping, constant_args, specified = self._update_globals(args, kwargs)
+            persistent_cache, digest = self._get_persistent_cache_entry(args, kwargs)
+
+        def parse() -> SDFG:
+            with self._tiered_lock:
+                self._update_globals(args, kwargs)
+                return self._parse_for_call(args, kwargs, arg_mapping)[0]
+
+        # Compilation does not access the program state
+        if persistent_cache is not None:
+            binaryobj = self._compile_persistent(persistent_cache, digest, parse)
+        else:
+            binaryobj = parse().compile(validate=self.validate)
+
+        with self._tiered_lock:
+            cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys,
+                                            constant_args)
+            self._cache.add(cachekey, binaryobj.sdfg, binaryobj)
+            del self._tiered_jobs[key]
+
+    def _make_call_args(self, sdfg: SDFG, args: Tuple[Any],
+                        kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Creates the arguments to call a compiled SDFG with.
+
+        :return: A 3-tuple of (SDFG arguments, closure arguments, inferred symbols).
+        """
+        closure = self.__sdfg_closure__()
+        sdfg_args = self._collect_sdfg_args(sdfg.callback_mapping, args, kwargs, closure)
+        symbols = self._infer_sdfg_symbols(sdfg, sdfg_args)
+        sdfg_args.update(symbols)
+        return sdfg_args, closure, symbols
+
+    def _parse_for_call(self, args: Tuple[Any], kwargs: Dict[str, Any],
+                        arg_mapping: Dict[str, Any]) -> Tuple[SDFG, Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Parses (and optionally auto-optimizes) the program for calling it with the given arguments.
+
+        :return: A 4-tuple of (SDFG, SDFG arguments, closure arguments, inferred symbols).
+        """
+        sdfg = self._parse(args, kwargs)
+
+        # Add named arguments to the call
+        kwargs.update(arg_mapping)
+        sdfg_args, closure, symbols = self._make_call_args(sdfg, args, kwargs)
+
+        if self.recreate_sdfg:
+            # Invoke auto-optimization as necessary
+            if Config.get_bool('optimizer', 'autooptimize') or self.autoopt:
+                sdfg = self.auto_optimize(sdfg, symbols=sdfg_args)
+                sdfg.simplify()
+
+        return sdfg, sdfg_args, closure, symbols
+
+    def _get_persistent_cache_entry(
+            self, args: Tuple[Any],
+            kwargs: Dict[str, Any]) -> Tuple[Optional[cached_program.PersistentProgramCache], Optional[str]]:
+        """
+        Returns the persistent program cache and the content hash of the program for the given arguments, or
+        (None, None) if the persistent cache is disabled or cannot be used for this program.
+        """
+        if not Config.get_bool('frontend', 'persistent_cache'):
+            return None, None
+        # Programs with custom build policies or call hooks (which may modify the SDFG) are not cached on disk
+        if not self.recreate_sdfg or not self.regenerate_code or not self.recompile:
+            return None, None
+        if any(hook is not None for hook in hooks._SDFG_CALL_HOOKS):
+            return None, None
+
+        # Resolve the closure to obtain a key that includes closure types and constants
+        _, key = self._load_sdfg(None, *args, **kwargs)
+        digest = cached_program.PersistentProgramCache.make_digest(self, key)
+        if digest is None:
+            return None, None
+        if self._persistent_cache is None:
+            self._persistent_cache = cached_program.PersistentProgramCache()
+        return self._persistent_cache, digest
+
     def _parse(self, args, kwargs, simplify=None, save=False, validate=False) -> SDFG:
         """ 
         Try to parse a DaceProgram object and return the `dace.SDFG` object
@@ -880,6 +1248,9 @@ class DaceProgram(pycommon.SDFGConvertible):
         else:
             cached = False
 
+            # The Python frontend is imported on demand to reduce import time
+            from dace.frontend.python import newast
+
             try:
                 sdfg = newast.parse_dace_program(self.name,
                                                  parsed_ast,
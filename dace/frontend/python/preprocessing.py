@@ -1463,6 +1463,9 @@ def preprocess_dace_program(f: Callable[..., Any],
     :param default_args: If not None, defines a list of unspecified default arguments.
     :return: A 2-tuple of the AST and its reduced (used) closure.
     """
+    # Register the built-in function replacements, which are queried during preprocessing
+    from dace.frontend.python import replacements  # Imported on demand to reduce import time
+
     src_ast, src_file, src_line, src = astutils.function_to_ast(f)
 
     # Resolve data structures
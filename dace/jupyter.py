@@ -2,11 +2,12 @@
 """ Jupyter Notebook support for DaCe. """
 
 import os
-import urllib.request
-import urllib.error
 
 
 def _connected():
+    # Imported here since urllib is slow to import and only needed in notebooks
+    import urllib.request
+    import urllib.error
     try:
         urllib.request.urlopen('https://spcl.github.io/dace/webclient2/dist/sdfv.js', timeout=1)
         return True
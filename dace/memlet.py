@@ -542,7 +542,7 @@ class Memlet(object):
         next = curr.subs(param, param + map.range[dim][2])
 
         # The stride is the difference between both
-        return (next - curr).simplify()
+        return symbolic.simplify(next - curr)
 
     def __label__(self, sdfg, state):
         """ Returns a string representation of the memlet for display in a
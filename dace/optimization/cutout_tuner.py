@@ -5,11 +5,12 @@ import math
 import dace
 import json
 
-from typing import Dict, Generator, Any, List, Tuple
+from typing import Dict, Generator, Any, List, Optional, Tuple
 from dace.optimization import auto_tuner
 from dace.optimization import utils as optim_utils
 from dace.sdfg.sdfg import SDFG
 from dace.sdfg.state import SDFGState
+from dace.transformation.estimator import cost_model
 
 try:
     from tqdm import tqdm
@@ -77,6 +78,17 @@ class CutoutTuner(auto_tuner.AutoTuner):
     def evaluate(self, **kwargs) -> float:
         raise NotImplementedError
 
+    def estimate(self, config: Any, cutout: SDFG, **kwargs) -> Optional[float]:
+        """
+        Statically estimates the runtime of a configuration on a cutout without compiling it (e.g., using
+        ``dace.transformation.estimator.cost_model``). Used to prune the search space before measuring.
+
+        :param config: The configuration (a point in the search space).
+        :param cutout: The cutout to tune.
+        :return: The estimated cost (lower is better), or None if the configuration cannot be estimated.
+        """
+        return None
+
     def config_from_key(self, key: str, cutout: dace.SDFG, **kwargs) -> Any:
         raise NotImplementedError
 
@@ -123,13 +135,27 @@ class CutoutTuner(auto_tuner.AutoTuner):
 
         return tuning_report
 
-    def search(self, cutout: SDFG, measurements: int,
-               **kwargs) -> Dict[str, float]:
+    def search(self, cutout: SDFG, measurements: int, top_k: Optional[int] = None, **kwargs) -> Dict[str, float]:
+        """
+        Measures the configurations in the search space of a cutout.
+
+        :param cutout: The cutout to tune.
+        :param measurements: The number of measurements per configuration.
+        :param top_k: If given, only measures the ``top_k`` configurations with the lowest estimated cost (see
+                      ``estimate``). Pruned configurations are reported with an infinite runtime.
+        :return: A dictionary mapping configuration keys to runtimes.
+        """
         kwargs = self.pre_evaluate(cutout=cutout, measurements=measurements, **kwargs)
 
         results = {}
         key = kwargs["key"]
-        for config in tqdm(list(self.space(**(kwargs["space_kwargs"])))):
+        configs = list(self.space(**(kwargs["space_kwargs"])))
+        if top_k is not None:
+            configs, pruned = cost_model.prune(configs, lambda config: self.estimate(config, cutout), top_k)
+            for config in pruned:
+                results[key(config)] = math.inf
+
+        for config in tqdm(configs):
             kwargs["config"] = config
             runtime = self.evaluate(**kwargs)
             results[key(config)] = runtime
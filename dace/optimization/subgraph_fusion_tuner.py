@@ -4,7 +4,7 @@ import pickle
 import math
 import copy
 
-from typing import Generator, Dict, List, Tuple
+from typing import Generator, Dict, List, Optional, Tuple
 from collections import Counter
 
 from dace import SDFG, dtypes
@@ -12,7 +12,7 @@ from dace.optimization import cutout_tuner
 from dace.sdfg.analysis.cutout import SDFGCutout
 
 from dace.transformation import subgraph as sg
-from dace.transformation.estimator import enumeration as en
+from dace.transformation.estimator import cost_model, enumeration as en
 from dace.transformation.subgraph import helpers
 from dace.transformation import helpers as xfh
 from dace.optimization import utils as optim_utils
@@ -93,6 +93,20 @@ class SubgraphFusionTuner(cutout_tuner.CutoutTuner):
         }
         return new_kwargs
 
+    def estimate(self, config: Tuple[int, List[int]], cutout: dace.SDFG, **kwargs) -> Optional[float]:
+        state = cutout.start_state
+        baseline = cost_model.estimate(state).runtime()
+        if config[0] == 0:
+            return baseline
+
+        map_ids = config[1]
+        if len(map_ids) < 2:
+            return math.inf
+
+        maps_ = list(map(state.node, map_ids))
+        subgraph = helpers.subgraph_from_maps(sdfg=cutout, graph=state, map_entries=maps_)
+        return baseline - cost_model.fusion_benefit(cutout, state, subgraph)
+
     def evaluate(self, config, cutout, measurements: int, **kwargs) -> float:
         dreport = self._sdfg.get_instrumented_data()
 
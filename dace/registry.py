@@ -3,18 +3,23 @@
     subclasses and values can be registered externally. """
 
 import aenum
+import importlib
 from typing import Dict, Type
 
 
 def make_registry(cls: Type):
     """
-    Decorator that turns a class into a user-extensible class with three
-    class methods: ``register``, ``unregister``, and ``extensions``.
+    Decorator that turns a class into a user-extensible class with four
+    class methods: ``register``, ``unregister``, ``register_lazy``, and
+    ``extensions``.
 
     The first method accepts one class parameter and registers it into the
     extensions, the second method removes the class parameter from the
-    registry, and the third method returns a list of currently-registered
-    extensions.
+    registry, and the fourth method returns a list of currently-registered
+    extensions. ``register_lazy`` accepts a module name, which is imported
+    (registering the extensions it defines) only once the extensions are
+    first queried. Extensions from lazily-registered modules are ordered by
+    the order of their ``register_lazy`` calls, before any other extensions.
     """
 
     def _register(cls: Type, subclass: Type, kwargs: Dict):
@@ -23,10 +28,30 @@ def make_registry(cls: Type):
     def _unregister(cls: Type, subclass: Type):
         del cls._registry_[subclass]
 
+    def _register_lazy(cls: Type, module: str):
+        cls._lazy_modules_.append(module)
+
+    def _extensions(cls: Type):
+        if len(cls._lazy_modules_) > len(cls._loaded_modules_):
+            for module in cls._lazy_modules_:
+                if module not in cls._loaded_modules_:
+                    importlib.import_module(module)
+                    cls._loaded_modules_.add(module)
+
+            # Restore the order in which the modules were registered
+            order = {module: i for i, module in enumerate(cls._lazy_modules_)}
+            entries = sorted(cls._registry_.items(), key=lambda entry: order.get(entry[0].__module__, len(order)))
+            cls._registry_.clear()
+            cls._registry_.update(entries)
+        return cls._registry_
+
     cls._registry_ = {}
+    cls._lazy_modules_ = []
+    cls._loaded_modules_ = set()
     cls.register = lambda subclass, **kwargs: _register(cls, subclass, kwargs)
     cls.unregister = lambda subclass: _unregister(cls, subclass)
-    cls.extensions = lambda: cls._registry_
+    cls.register_lazy = lambda module: _register_lazy(cls, module)
+    cls.extensions = lambda: _extensions(cls)
 
     return cls
 
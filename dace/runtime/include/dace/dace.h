@@ -21,7 +21,9 @@
 #include "copy.h"
 #include "stream.h"
 #include "os.h"
+#include "numa.h"
 #include "perf/reporting.h"
+#include "pool.h"
 #include "comm.h"
 #include "serialization.h"
 
@@ -0,0 +1,72 @@
+// Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+#ifndef __DACE_NUMA_H
+#define __DACE_NUMA_H
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+#ifdef __linux__
+#include <unistd.h>
+#include <sys/syscall.h>
+#endif
+
+namespace dace {
+namespace numa {
+
+    /**
+     * Returns the size of a memory page in bytes.
+     */
+    static inline size_t page_size() {
+#ifdef __linux__
+        return static_cast<size_t>(sysconf(_SC_PAGESIZE));
+#else
+        return 4096;
+#endif
+    }
+
+    /**
+     * Queries the NUMA node of every page in a memory region (using ``move_pages(2)`` without moving pages).
+     * @param ptr: Start address of the region.
+     * @param bytes: Size of the region in bytes.
+     * @param nodes: Resulting node of each page, or a negative error code (e.g., ``-ENOENT`` if the page was not
+     *               touched yet).
+     * @return True if the query succeeded, or false if it is not supported on this system.
+     */
+    static inline bool page_nodes(const void *ptr, size_t bytes, std::vector<int>& nodes) {
+        const size_t psize = page_size();
+        const uintptr_t start = reinterpret_cast<uintptr_t>(ptr) / psize * psize;
+        const uintptr_t end = reinterpret_cast<uintptr_t>(ptr) + bytes;
+        std::vector<void *> pages;
+        for (uintptr_t page = start; page < end; page += psize)
+            pages.push_back(reinterpret_cast<void *>(page));
+        nodes.assign(pages.size(), -1);
+#if defined(__linux__) && defined(SYS_move_pages)
+        long result = syscall(SYS_move_pages, 0, static_cast<unsigned long>(pages.size()), pages.data(), nullptr,
+                              nodes.data(), 0);
+        return result == 0;
+#else
+        return false;
+#endif
+    }
+
+    /**
+     * Returns the number of pages of a memory region that reside on the given NUMA node, or on any node if ``node``
+     * is negative (i.e., the number of pages that were touched). Returns -1 if the query is not supported.
+     */
+    static inline long pages_on_node(const void *ptr, size_t bytes, int node = -1) {
+        std::vector<int> nodes;
+        if (!page_nodes(ptr, bytes, nodes))
+            return -1;
+        long count = 0;
+        for (int n : nodes) {
+            if ((node < 0 && n >= 0) || (node >= 0 && n == node))
+                ++count;
+        }
+        return count;
+    }
+
+}  // namespace numa
+}  // namespace dace
+
+#endif  // __DACE_NUMA_H
@@ -0,0 +1,188 @@
+// Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+#ifndef __DACE_POOL_H
+#define __DACE_POOL_H
+
+#include <cstdlib>
+#include <cstddef>
+#include <mutex>
+#include <new>
+#include <vector>
+
+#ifdef _WIN32
+#include <malloc.h>
+#endif
+
+#include "perf/reporting.h"
+
+// Alignment (in bytes) of every block allocated by the pool
+#define DACE_POOL_ALIGNMENT     64
+// log2 of the smallest block size
+#define DACE_POOL_MIN_EXPONENT  6
+// Number of size classes between two consecutive powers of two
+#define DACE_POOL_SUBCLASSES    4
+#define DACE_POOL_NUM_CLASSES   ((64 - DACE_POOL_MIN_EXPONENT) * DACE_POOL_SUBCLASSES + 1)
+
+namespace dace {
+
+    /**
+     * A thread-safe memory pool that caches freed blocks by size class. Requested sizes are rounded up to one of
+     * four size classes between consecutive powers of two (i.e., at most 25% overhead), and freed blocks are kept
+     * in per-class free lists to be reused by subsequent allocations of the same class. Since the pool is part of
+     * the SDFG state struct, cached blocks survive across calls of the same program, and are only returned to the
+     * system when the state is destroyed (or upon ``release``).
+     *
+     * Allocated memory is uninitialized and aligned to DACE_POOL_ALIGNMENT bytes.
+     */
+    class MemoryPool {
+    public:
+        struct Statistics {
+            unsigned long int allocations = 0;  // Number of allocation requests
+            unsigned long int hits = 0;  // Allocations served from a cached block
+            unsigned long int misses = 0;  // Allocations served by the system allocator
+            unsigned long int bytes_in_use = 0;  // Bytes currently allocated (in size-class granularity)
+            unsigned long int peak_bytes_in_use = 0;  // Maximal number of bytes allocated at the same time
+            unsigned long int bytes_cached = 0;  // Bytes cached in free lists
+        };
+
+    protected:
+        std::mutex _mutex;
+        std::vector<void *> _free_lists[DACE_POOL_NUM_CLASSES];
+        Statistics _stats;
+
+        /**
+         * Returns the size class of an allocation, and the size of blocks in that class.
+         */
+        static size_t size_class(size_t bytes, size_t& class_bytes) {
+            const size_t min_bytes = size_t(1) << DACE_POOL_MIN_EXPONENT;
+            if (bytes <= min_bytes) {
+                class_bytes = min_bytes;
+                return 0;
+            }
+            // Find the power of two `base`, such that base < bytes <= 2 * base
+            int exponent = DACE_POOL_MIN_EXPONENT;
+            while ((size_t(1) << (exponent + 1)) < bytes)
+                ++exponent;
+            size_t base = size_t(1) << exponent;
+            size_t step = base / DACE_POOL_SUBCLASSES;
+            size_t subclass = (bytes - base + step - 1) / step;
+            class_bytes = base + subclass * step;
+            return (exponent - DACE_POOL_MIN_EXPONENT) * DACE_POOL_SUBCLASSES + subclass;
+        }
+
+        static void *system_allocate(size_t bytes) {
+            void *ptr = nullptr;
+#ifdef _WIN32
+            ptr = _aligned_malloc(bytes, DACE_POOL_ALIGNMENT);
+#else
+            if (posix_memalign(&ptr, DACE_POOL_ALIGNMENT, bytes) != 0)
+                ptr = nullptr;
+#endif
+            if (ptr == nullptr)
+                throw std::bad_alloc();
+            return ptr;
+        }
+
+        static void system_free(void *ptr) {
+#ifdef _WIN32
+            _aligned_free(ptr);
+#else
+            free(ptr);
+#endif
+        }
+
+    public:
+        MemoryPool() = default;
+        MemoryPool(const MemoryPool&) = delete;
+        MemoryPool& operator=(const MemoryPool&) = delete;
+
+        ~MemoryPool() {
+            release();
+        }
+
+        /**
+         * Allocates an array from the pool.
+         * @param count: Number of elements.
+         * @return A pointer to uninitialized memory.
+         */
+        template <typename T>
+        T *allocate(size_t count) {
+            size_t class_bytes;
+            size_t sc = size_class(count * sizeof(T), class_bytes);
+            void *ptr = nullptr;
+            {
+                std::lock_guard<std::mutex> guard(_mutex);
+                _stats.allocations++;
+                _stats.bytes_in_use += class_bytes;
+                if (_stats.bytes_in_use > _stats.peak_bytes_in_use)
+                    _stats.peak_bytes_in_use = _stats.bytes_in_use;
+                if (!_free_lists[sc].empty()) {
+                    ptr = _free_lists[sc].back();
+                    _free_lists[sc].pop_back();
+                    _stats.hits++;
+                    _stats.bytes_cached -= class_bytes;
+                    return static_cast<T *>(ptr);
+                }
+                _stats.misses++;
+            }
+            return static_cast<T *>(system_allocate(class_bytes));
+        }
+
+        /**
+         * Returns an array to the pool, caching it for subsequent allocations.
+         * @param ptr: A pointer returned by ``allocate``.
+         * @param count: Number of elements given upon allocation.
+         */
+        template <typename T>
+        void deallocate(T *ptr, size_t count) {
+            if (ptr == nullptr)
+                return;
+            size_t class_bytes;
+            size_t sc = size_class(count * sizeof(T), class_bytes);
+            std::lock_guard<std::mutex> guard(_mutex);
+            _free_lists[sc].push_back(static_cast<void *>(ptr));
+            _stats.bytes_in_use -= class_bytes;
+            _stats.bytes_cached += class_bytes;
+        }
+
+        /**
+         * Returns all cached blocks to the system.
+         */
+        void release() {
+            std::lock_guard<std::mutex> guard(_mutex);
+            for (auto& free_list : _free_lists) {
+                for (void *ptr : free_list)
+                    system_free(ptr);
+                free_list.clear();
+            }
+            _stats.bytes_cached = 0;
+        }
+
+        Statistics statistics() {
+            std::lock_guard<std::mutex> guard(_mutex);
+            return _stats;
+        }
+
+        /**
+         * Adds the pool statistics as counters to an instrumentation report.
+         * @param report: The report to add to.
+         * @param sdfg_id: SDFG ID to associate the counters with.
+         */
+        void report(perf::Report& report, int sdfg_id = 0) {
+            Statistics stats = statistics();
+            const char *name = "Memory pool";
+            report.add_counter(name, "pool", "allocations", stats.allocations, 0, sdfg_id, -1, -1);
+            report.add_counter(name, "pool", "hits", stats.hits, 0, sdfg_id, -1, -1);
+            report.add_counter(name, "pool", "misses", stats.misses, 0, sdfg_id, -1, -1);
+            report.add_counter(name, "pool", "peak_bytes_in_use", stats.peak_bytes_in_use, 0, sdfg_id, -1, -1);
+            report.add_counter(name, "pool", "bytes_cached", stats.bytes_cached, 0, sdfg_id, -1, -1);
+        }
+    };
+
+}  // namespace dace
+
+#undef DACE_POOL_ALIGNMENT
+#undef DACE_POOL_MIN_EXPONENT
+#undef DACE_POOL_SUBCLASSES
+#undef DACE_POOL_NUM_CLASSES
+
+#endif  // __DACE_POOL_H
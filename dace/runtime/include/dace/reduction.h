@@ -3,11 +3,16 @@
 #define __DACE_REDUCTION_H
 
 #include <cstdint>
+#include <limits>
 
 #include "types.h"
 #include "vector.h"
 #include "math.h"  // for ::min, ::max
 
+#ifdef _OPENMP
+    #include <omp.h>
+#endif
+
 #ifdef __CUDACC__
     #include "../../../external/cub/cub/device/device_segmented_reduce.cuh"
     #include "../../../external/cub/cub/device/device_reduce.cuh"
@@ -569,6 +574,127 @@ namespace dace {
         }
     };
 
+    /**
+     * Identity values of reduction types, used to initialize partial results.
+     */
+    template <ReductionType REDTYPE, typename T>
+    struct wcr_identity;
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Sum, T> {
+        static T value() { return T(0); }
+    };
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Product, T> {
+        static T value() { return T(1); }
+    };
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Min, T> {
+        static T value() { return std::numeric_limits<T>::max(); }
+    };
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Max, T> {
+        static T value() { return std::numeric_limits<T>::lowest(); }
+    };
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Logical_And, T> {
+        static T value() { return T(true); }
+    };
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Logical_Or, T> {
+        static T value() { return T(false); }
+    };
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Bitwise_And, T> {
+        static T value() { return ~T(0); }
+    };
+
+    template <typename T>
+    struct wcr_identity<ReductionType::Bitwise_Or, T> {
+        static T value() { return T(0); }
+    };
+
+    /**
+     * Per-thread partial buffers for write-conflict resolution in parallel
+     * loops on the host. Instead of resolving every conflicting write with
+     * atomics, each thread accumulates into its own buffer (initialized to
+     * the identity of the reduction), and the buffers are combined with a
+     * parallel tree reduction once the loop is done.
+     */
+    template <ReductionType REDTYPE, typename T>
+    class privatized_wcr {
+    protected:
+        T *_buffers;
+        int _num_buffers;
+        long long _size;
+
+    public:
+        /**
+         * Allocates the buffers and initializes them to the identity of the
+         * reduction.
+         * @param size: Number of (contiguous) elements in the output region.
+         * @param num_threads: Number of threads writing to the buffers, or
+         *                     zero for the maximal number of OpenMP threads.
+         */
+        privatized_wcr(long long size, int num_threads = 0) : _size(size) {
+#ifdef _OPENMP
+            _num_buffers = (num_threads > 0) ? num_threads : omp_get_max_threads();
+#else
+            _num_buffers = 1;
+#endif
+            _buffers = new T[_num_buffers * _size];
+            const T identity = wcr_identity<REDTYPE, T>::value();
+            #pragma omp parallel for
+            for (long long i = 0; i < _num_buffers * _size; ++i)
+                _buffers[i] = identity;
+        }
+
+        privatized_wcr(const privatized_wcr&) = delete;
+        privatized_wcr& operator=(const privatized_wcr&) = delete;
+
+        ~privatized_wcr() {
+            delete[] _buffers;
+        }
+
+        /**
+         * Returns the buffer of the calling thread.
+         */
+        inline T *local() {
+#ifdef _OPENMP
+            return _buffers + omp_get_thread_num() * _size;
+#else
+            return _buffers;
+#endif
+        }
+
+        /**
+         * Combines the buffers of all threads and resolves the result into
+         * the output region. Must be called outside of a parallel region.
+         * @param out: Pointer to the first element of the output region.
+         */
+        void combine(T *out) {
+            // Pairwise (tree) reduction of the buffers into the first buffer
+            for (int stride = 1; stride < _num_buffers; stride *= 2) {
+                const int pairs = (_num_buffers - stride + 2 * stride - 1) / (2 * stride);
+                #pragma omp parallel for collapse(2)
+                for (int p = 0; p < pairs; ++p) {
+                    for (long long i = 0; i < _size; ++i) {
+                        T *dst = _buffers + 2LL * stride * p * _size + i;
+                        *dst = _wcr_fixed<REDTYPE, T>()(*dst, dst[stride * _size]);
+                    }
+                }
+            }
+            #pragma omp parallel for
+            for (long long i = 0; i < _size; ++i)
+                out[i] = _wcr_fixed<REDTYPE, T>()(out[i], _buffers[i]);
+        }
+    };
 
 #ifdef __CUDACC__
     struct StridedIteratorHelper {
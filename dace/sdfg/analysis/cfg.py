@@ -80,6 +80,8 @@ def state_parent_tree(sdfg: SDFG) -> Dict[SDFGState, SDFGState]:
              if the root (start) state.
     """
     idom = nx.immediate_dominators(sdfg.nx, sdfg.start_state)
+    # Newer versions of networkx do not include the start state in the immediate dominators
+    idom.setdefault(sdfg.start_state, sdfg.start_state)
     alldoms = all_dominators(sdfg, idom)
     loopexits: Dict[SDFGState, SDFGState] = defaultdict(lambda: None)
 
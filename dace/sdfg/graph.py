@@ -616,6 +616,11 @@ class MultiDiConnectorGraph(MultiDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
 class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
     """ Directed graph where nodes and edges are returned in the order they
         were added. """
+
+    #: Number of structural modifications (added or removed nodes and edges) made to the graph. Can be used to
+    #: detect whether information derived from the graph structure is outdated.
+    _mutation_count = 0
+
     def __init__(self):
         self._nx = nx.DiGraph()
         # {node: ({in edge: None}, {out edges: None})}
@@ -656,6 +661,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
             raise RuntimeError("Duplicate node added")
         self._nodes[node] = (OrderedDict(), OrderedDict())
         self._nx.add_node(node)
+        self._mutation_count += 1
 
     def add_edge(self, src: NodeT, dst: NodeT, data: EdgeT = None):
         t = (src, dst)
@@ -670,6 +676,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._nodes[src][1][t] = edge
         self._nodes[dst][0][t] = edge
         self._nx.add_edge(src, dst, data=data)
+        self._mutation_count += 1
         return edge
 
     def remove_node(self, node: NodeT):
@@ -678,6 +685,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
                 self.remove_edge(edge)
             del self._nodes[node]
             self._nx.remove_node(node)
+            self._mutation_count += 1
         except KeyError:
             pass
 
@@ -689,6 +697,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         del self._nodes[src][1][t]
         del self._nodes[dst][0][t]
         del self._edges[t]
+        self._mutation_count += 1
 
     def in_degree(self, node):
         return self._nx.in_degree(node)
@@ -749,6 +758,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._nodes[src][1][edge] = edge
         self._nodes[dst][0][edge] = edge
         self._edges[edge] = edge
+        self._mutation_count += 1
         return edge
 
     def remove_edge(self, edge: MultiEdge[EdgeT]):
@@ -756,6 +766,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         del self._nodes[edge.src][1][edge]
         del self._nodes[edge.dst][0][edge]
         self._nx.remove_edge(edge.src, edge.dst, edge.key)
+        self._mutation_count += 1
 
     def in_edges(self, node) -> List[MultiEdge[EdgeT]]:
         return super().in_edges(node)
@@ -772,6 +783,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
             e.reverse()
         for n, (in_edges, out_edges) in self._nodes.items():
             self._nodes[n] = (out_edges, in_edges)
+        self._mutation_count += 1
 
     def is_multigraph(self) -> bool:
         return True
@@ -793,6 +805,7 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
         self._nodes[src][1][edge] = edge
         self._nodes[dst][0][edge] = edge
         self._edges[edge] = edge
+        self._mutation_count += 1
         return edge
 
     def add_nedge(self, src: NodeT, dst: NodeT, data: EdgeT) -> MultiConnectorEdge[EdgeT]:
@@ -804,6 +817,7 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
         del self._nodes[edge.src][1][edge]
         del self._nodes[edge.dst][0][edge]
         self._nx.remove_edge(edge.src, edge.dst, edge.key)
+        self._mutation_count += 1
 
     def reverse(self) -> None:
         self._nx.reverse(False)
@@ -811,6 +825,7 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
             e.reverse()
         for n, (in_edges, out_edges) in self._nodes.items():
             self._nodes[n] = (out_edges, in_edges)
+        self._mutation_count += 1
 
     def in_edges(self, node) -> List[MultiConnectorEdge[EdgeT]]:
         return super().in_edges(node)
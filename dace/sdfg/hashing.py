@@ -0,0 +1,222 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Incremental structural hashing of SDFGs.
+
+The hash of an SDFG is computed from digests of its elements (nodes, memlets, interstate edges, data descriptors,
+states, and the SDFG itself). Each element digest is computed from the JSON representation of the element's
+properties and cached per element, along with the property values. Reassigned properties are detected by identity,
+and only values that can be modified in place (e.g., containers, subsets, and code) are compared through a lightweight
+snapshot, so rehashing an SDFG only serializes the elements that changed since the last hash. Digests only depend on
+element contents, which makes hashes stable across processes.
+"""
+import ast
+import enum
+import hashlib
+import json
+import weakref
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+import numpy as np
+import sympy
+
+import dace
+from dace import data, dtypes, properties, serialize, subsets
+
+#: Keys that never contribute to a hash (in addition to metadata keys, which start with ``_meta_``)
+ALWAYS_IGNORED = frozenset(('hash', 'orig_sdfg', 'transformation_hist', 'sdfg_list_id'))
+#: Keys that do not contribute to the structural hash returned by ``SDFG.hash_sdfg``
+STRUCTURAL_IGNORED = ALWAYS_IGNORED | frozenset(('name', 'instrument'))
+
+# Properties of elements that are hashed as separate elements
+_CHILD_PROPERTIES = {
+    'SDFG': frozenset(('_arrays', 'constants_prop')),
+    'NestedSDFG': frozenset(('sdfg', )),
+}
+
+# Types of property values that cannot be modified in place, and are thus only compared by identity
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None), enum.Enum, sympy.Basic)
+
+# Cached digests: maps object IDs to a weak reference to the object, its hashed property values, the snapshot of the
+# values that can be modified in place, and its digests for each set of ignored keys. Caches are kept outside of the
+# objects so that they are not copied or pickled
+_digest_cache: Dict[int, Tuple[weakref.ref, Tuple[Any, ...], Tuple[Any, ...], Dict[FrozenSet[str], bytes]]] = {}
+
+# Hashed properties of each element type, as tuples of the property name, the name of the attribute that stores the
+# value, and the property
+_hashed_properties: Dict[type, List[Tuple[str, str, properties.Property]]] = {}
+
+
+def _is_ignored(key: Any, ignored: FrozenSet[str]) -> bool:
+    return isinstance(key, str) and (key in ignored or key.startswith('_meta_'))
+
+
+def _clean(json_obj: Any, ignored: FrozenSet[str]) -> Any:
+    """ Returns a copy of the JSON object without the ignored keys (at any depth). """
+    if isinstance(json_obj, dict):
+        return {k: _clean(v, ignored) for k, v in json_obj.items() if not _is_ignored(k, ignored)}
+    if isinstance(json_obj, (list, tuple)):
+        return [_clean(v, ignored) for v in json_obj]
+    return json_obj
+
+
+def _snapshot(value: Any) -> Any:
+    """
+    Returns a lightweight snapshot of a property value, which compares equal to a later snapshot of the same value
+    if and only if the value was not modified (neither reassigned nor modified in place) in the meantime.
+    """
+    t = type(value)
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return t, value
+    if isinstance(value, dict):
+        return t, tuple((k, _snapshot(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return t, tuple(_snapshot(v) for v in value)
+    if isinstance(value, subsets.Range):
+        return t, tuple(value.ranges), tuple(value.tile_sizes)
+    if isinstance(value, subsets.Indices):
+        return t, tuple(value.indices)
+    if isinstance(value, properties.CodeBlock):
+        code = value.code
+        if code is not None and not isinstance(code, str):
+            # Python ASTs are modified in place (e.g., by symbol replacement)
+            code = tuple(ast.dump(stmt) if isinstance(stmt, ast.AST) else stmt for stmt in code)
+        return t, value.language, code
+    if isinstance(value, dtypes.DebugInfo):
+        return t, value.start_line, value.start_column, value.end_line, value.end_column, value.filename
+    if isinstance(value, np.ndarray):
+        return t, value.dtype.str, value.shape, _array_digest(value)
+    if isinstance(value, dace.SDFG):
+        # Nested SDFGs are hashed separately
+        return t, id(value)
+    if hasattr(value, '__properties__'):
+        return t, tuple(_snapshot(v) for p, v in value.properties() if not _is_ignored(p.attr_name, ALWAYS_IGNORED))
+    return t, value
+
+
+def _array_digest(value: np.ndarray) -> bytes:
+    return hashlib.sha256(np.ascontiguousarray(value).view(np.uint8).data).digest()
+
+
+def _json_digest(*json_objs: Any) -> bytes:
+    hsh = hashlib.sha256()
+    for json_obj in json_objs:
+        hsh.update(json.dumps(json_obj, default=serialize.to_json).encode('utf-8'))
+    return hsh.digest()
+
+
+def element_digest(obj: Any, ignored: FrozenSet[str] = STRUCTURAL_IGNORED) -> bytes:
+    """
+    Returns the (cached) digest of an object with properties, e.g., a node, a memlet, an interstate edge, or a data
+    descriptor. Properties that contain other hashed elements (such as the SDFG of a nested SDFG node) are not part
+    of the digest.
+
+    :param obj: The object to hash.
+    :param ignored: Property names (and keys at any depth of the property values) that are not hashed.
+    :return: A SHA-256 digest.
+    """
+    props = _hashed_properties.get(type(obj))
+    if props is None:
+        excluded = _CHILD_PROPERTIES.get(type(obj).__name__, frozenset())
+        props = [(name, '_' + name, prop) for name, prop in type(obj).__properties__.items()
+                 if name not in excluded and not _is_ignored(name, ALWAYS_IGNORED)]
+        _hashed_properties[type(obj)] = props
+    # Same lookup as in ``properties._property_generator``
+    values = tuple(getattr(obj, attr) if hasattr(obj, attr) else getattr(obj, name) for name, attr, _ in props)
+    snapshot = tuple(None if isinstance(v, _IMMUTABLE_TYPES) else _snapshot(v) for v in values)
+
+    key = id(obj)
+    cache = _digest_cache.get(key)
+    if (cache is None or cache[0]() is not obj or len(cache[1]) != len(values)
+            or any(a is not b for a, b in zip(cache[1], values)) or cache[2] != snapshot):
+        cache = (weakref.ref(obj, lambda _: _digest_cache.pop(key, None)), values, snapshot, {})
+        _digest_cache[key] = cache
+    elif ignored in cache[3]:
+        return cache[3][ignored]
+
+    attributes = {}
+    for (_, _, prop), value in zip(props, values):
+        if _is_ignored(prop.attr_name, ignored):
+            continue
+        if prop.optional and not prop.optional_condition(obj):
+            continue
+        attributes[prop.attr_name] = prop.to_json(value)
+        if isinstance(prop, properties.SetProperty) and attributes[prop.attr_name] is not None:
+            # Set iteration order differs across processes
+            attributes[prop.attr_name] = sorted(attributes[prop.attr_name], key=str)
+
+    digest = _json_digest(f'{type(obj).__module__}.{type(obj).__qualname__}', _clean(attributes, ignored))
+    cache[3][ignored] = digest
+    return digest
+
+
+def state_digest(state: 'dace.SDFGState',
+                 ignored: FrozenSet[str] = STRUCTURAL_IGNORED,
+                 recursive: bool = True) -> bytes:
+    """
+    Returns the digest of an SDFG state, combining the digests of the state properties, nodes and edges.
+
+    :param state: The state to hash.
+    :param ignored: Property names that are not hashed.
+    :param recursive: If False, the contents of nested SDFGs are not hashed (only the nested SDFG nodes).
+    :return: A SHA-256 digest.
+    """
+    from dace.sdfg import nodes  # Avoid import loop
+
+    hsh = hashlib.sha256(element_digest(state, ignored))
+    node_ids = {}
+    for i, node in enumerate(state.nodes()):
+        node_ids[node] = i
+        hsh.update(element_digest(node, ignored))
+        if recursive and isinstance(node, nodes.NestedSDFG):
+            hsh.update(sdfg_digest(node.sdfg, ignored))
+    # Same edge order as in the serialized state
+    for edge in sorted(state.edges(), key=lambda e: (e.src_conn or '', e.dst_conn or '')):
+        hsh.update(f'{node_ids[edge.src]},{edge.src_conn},{node_ids[edge.dst]},{edge.dst_conn}'.encode('utf-8'))
+        hsh.update(element_digest(edge.data, ignored))
+    return hsh.digest()
+
+
+def sdfg_digest(sdfg: 'dace.SDFG', ignored: FrozenSet[str] = STRUCTURAL_IGNORED, recursive: bool = True) -> bytes:
+    """
+    Returns the digest of an SDFG, combining the digests of the SDFG properties, data descriptors, constants, states
+    and interstate edges.
+
+    :param sdfg: The SDFG to hash.
+    :param ignored: Property names that are not hashed.
+    :param recursive: If False, the contents of nested SDFGs are not hashed (only the nested SDFG nodes).
+    :return: A SHA-256 digest.
+    """
+    hsh = hashlib.sha256(element_digest(sdfg, ignored))
+    for name, desc in sdfg.arrays.items():
+        hsh.update(name.encode('utf-8'))
+        hsh.update(element_digest(desc, ignored))
+    for name, (desc, value) in sdfg.constants_prop.items():
+        hsh.update(name.encode('utf-8'))
+        hsh.update(element_digest(desc, ignored) if isinstance(desc, data.Data) else _json_digest(desc))
+        if isinstance(value, np.ndarray):
+            hsh.update(value.dtype.str.encode('utf-8'))
+            hsh.update(str(value.shape).encode('utf-8'))
+            hsh.update(_array_digest(value))
+        else:
+            hsh.update(_json_digest(value))
+
+    state_ids = {}
+    for i, state in enumerate(sdfg.nodes()):
+        state_ids[state] = i
+        hsh.update(state_digest(state, ignored, recursive))
+    for edge in sdfg.edges():
+        hsh.update(f'{state_ids[edge.src]},{state_ids[edge.dst]}'.encode('utf-8'))
+        hsh.update(element_digest(edge.data, ignored))
+    hsh.update(f'{sdfg._start_state},{dace.__version__}'.encode('utf-8'))
+    return hsh.digest()
+
+
+def hash_sdfg(sdfg: 'dace.SDFG', ignored: FrozenSet[str] = STRUCTURAL_IGNORED) -> str:
+    """
+    Returns a structural hash of an SDFG. Only elements that were modified since the last call are serialized.
+
+    :param sdfg: The SDFG to hash.
+    :param ignored: Property names that are not hashed. By default, names and instrumentation are not considered.
+    :return: The hash (in SHA-256 hexadecimal format).
+    """
+    return sdfg_digest(sdfg, frozenset(ignored)).hex()
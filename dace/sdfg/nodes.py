@@ -21,6 +21,7 @@ from dace.symbolic import issymbolic, pystr_to_symbolic
 from dace import data, subsets as sbs, dtypes
 import pydoc
 import warnings
+import weakref
 
 # -----------------------------------------------------------------------------
 
@@ -215,13 +216,34 @@ class Node(object):
 # ------------------------------------------------------------------------------
 
 
+def _set_access_node_data(node: 'AccessNode', value: str):
+    if value is not None and not isinstance(value, str):
+        raise TypeError('Data for AccessNode must be a string')
+    old_value = node.__dict__.get('_data')
+    node._data = value
+    if old_value is not None and old_value != value:
+        # Invalidates the index of access nodes by data name of the state that contains the node (see
+        # ``SDFGState.data_nodes``), or of every state if the state is unknown
+        state = AccessNode._states.get(node)
+        state = state() if state is not None else None
+        if state is not None:
+            state._data_version += 1
+        else:
+            AccessNode._data_version += 1
+
+
 @make_properties
 class AccessNode(Node):
     """ A node that accesses data in the SDFG. Denoted by a circular shape. """
 
     setzero = Property(dtype=bool, desc="Initialize to zero", default=False)
     debuginfo = DebugInfoProperty()
-    data = DataProperty(desc="Data (array, stream, scalar) to access")
+    data = DataProperty(desc="Data (array, stream, scalar) to access", setter=_set_access_node_data)
+
+    # The states that contain access nodes (maintained by ``SDFGState``), and the number of times the data of an
+    # access node outside of a known state changed
+    _states: 'weakref.WeakKeyDictionary[AccessNode, weakref.ReferenceType]' = weakref.WeakKeyDictionary()
+    _data_version = 0
 
     instrument = EnumProperty(dtype=dtypes.DataInstrumentationType,
                               desc="Instrument data contents at this access",
@@ -841,6 +863,11 @@ class Map(object):
                               desc="OpenMP schedule chunk size",
                               optional=True,
                               optional_condition=lambda m: m.schedule == dtypes.ScheduleType.CPU_Multicore)
+    omp_proc_bind = EnumProperty(dtype=dtypes.OMPProcBindType,
+                                 default=dtypes.OMPProcBindType.Default,
+                                 desc="OpenMP thread affinity policy {master, close, spread}",
+                                 optional=True,
+                                 optional_condition=lambda m: m.schedule == dtypes.ScheduleType.CPU_Multicore)
 
     gpu_block_size = ListProperty(element_type=int,
                                   default=None,
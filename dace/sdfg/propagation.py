@@ -4,7 +4,7 @@ Functionality relating to Memlet propagation (deducing external memlets
 from internal memory accesses and scope ranges).
 """
 
-from collections import deque
+from collections import deque, OrderedDict
 import copy
 from dace.symbolic import issymbolic, pystr_to_symbolic, simplify
 import itertools
@@ -16,9 +16,10 @@ import warnings
 import networkx as nx
 
 from dace import registry, subsets, symbolic, dtypes, data
+from dace.config import Config
 from dace.memlet import Memlet
 from dace.sdfg import nodes, graph as gr
-from typing import List, Set
+from typing import Any, Iterable, List, Optional, Set, Tuple
 
 
 @registry.make_registry
@@ -914,6 +915,15 @@ def propagate_states(sdfg) -> None:
     if temp_exit_state is not None:
         sdfg.remove_node(temp_exit_state)
 
+    # Keep track of the state machine the annotations were computed for
+    sdfg._annotated_state_machine = _state_machine_version(sdfg)
+
+
+def _state_machine_version(sdfg) -> Tuple[Any, ...]:
+    """ Returns a tuple that changes whenever the states, interstate edges, or start state of an SDFG change. """
+    from dace.sdfg import hashing
+    return (sdfg._mutation_count, sdfg._start_state, tuple(hashing.element_digest(e.data) for e in sdfg.edges()))
+
 
 def propagate_memlets_nested_sdfg(parent_sdfg, parent_state, nsdfg_node):
     """
@@ -1167,17 +1177,76 @@ def propagate_memlets_state(sdfg, state):
     # First, propagate nested SDFGs in a bottom-up fashion
     for node in state.nodes():
         if isinstance(node, nodes.NestedSDFG):
-
-            # Propagate memlets inside the nested SDFG.
-            propagate_memlets_sdfg(node.sdfg)
-
-            # Propagate memlets out of the nested SDFG.
-            propagate_memlets_nested_sdfg(sdfg, state, node)
+            _propagate_nested_sdfg(sdfg, state, node)
 
     # Process scopes from the leaves upwards
     propagate_memlets_scope(sdfg, state, state.scope_leaves())
 
 
+def propagate_memlets_incremental(sdfg,
+                                  states: Iterable['dace.SDFGState'] = (),
+                                  scopes: Iterable[Tuple['dace.SDFGState', nodes.EntryNode]] = (),
+                                  propagate_parents: bool = True):
+    """
+    Propagates memlets upwards from the modified parts of an SDFG, instead of throughout the entire SDFG (as in
+    ``propagate_memlets_sdfg``). Modified states are propagated from their innermost scopes outwards, as are modified
+    scopes, and nested SDFGs in either are propagated entirely. The state (loop-related) annotations are only
+    recomputed if the state machine changed since they were last computed.
+
+    :param sdfg: The SDFG that was modified.
+    :param states: The modified states of the SDFG.
+    :param scopes: Pairs of states and entry nodes of modified scopes in the SDFG.
+    :param propagate_parents: If True, also propagates memlets out of the SDFG, through the nested SDFG nodes and the
+                              scopes that contain them in every parent SDFG.
+    :note: This is an in-place operation on the SDFG.
+    """
+    states = list(dict.fromkeys(states))
+    for state in states:
+        propagate_memlets_state(sdfg, state)
+
+    # Group modified scopes by state, skipping those in states that were already propagated
+    state_scopes = {}
+    for state, entry in scopes:
+        if state not in states:
+            state_scopes.setdefault(state, []).append(entry)
+    for state, entries in state_scopes.items():
+        scope_tree = state.scope_tree()
+        for entry in entries:
+            for node in state.scope_subgraph(entry).nodes():
+                if isinstance(node, nodes.NestedSDFG):
+                    _propagate_nested_sdfg(sdfg, state, node)
+        leaves = []
+        queue = [scope_tree[entry] for entry in entries]
+        while queue:
+            scope = queue.pop()
+            if scope.children:
+                queue.extend(scope.children)
+            else:
+                leaves.append(scope)
+        propagate_memlets_scope(sdfg, state, leaves)
+
+    if getattr(sdfg, '_annotated_state_machine', None) != _state_machine_version(sdfg):
+        propagate_states(sdfg)
+
+    if propagate_parents and sdfg.parent_nsdfg_node is not None:
+        parent_sdfg, parent_state, nsdfg_node = sdfg.parent_sdfg, sdfg.parent, sdfg.parent_nsdfg_node
+        propagate_memlets_nested_sdfg(parent_sdfg, parent_state, nsdfg_node)
+        entry = parent_state.entry_node(nsdfg_node)
+        if entry is not None:
+            propagate_memlets_scope(parent_sdfg, parent_state, parent_state.scope_tree()[entry])
+        propagate_memlets_incremental(parent_sdfg, propagate_parents=True)
+
+
+def _propagate_nested_sdfg(sdfg, state, nsdfg_node):
+    """ Propagates memlets throughout a nested SDFG and out of its node, in a bottom-up fashion. """
+    if Config.get_bool('optimizer', 'incremental_propagation'):
+        # Any state of the nested SDFG may have been modified, but unchanged state annotations are reused
+        propagate_memlets_incremental(nsdfg_node.sdfg, nsdfg_node.sdfg.nodes(), propagate_parents=False)
+    else:
+        propagate_memlets_sdfg(nsdfg_node.sdfg)
+    propagate_memlets_nested_sdfg(sdfg, state, nsdfg_node)
+
+
 def propagate_memlets_scope(sdfg, state, scopes, propagate_entry=True, propagate_exit=True):
     """ 
     Propagate memlets from the given scopes outwards. 
@@ -1387,6 +1456,19 @@ def propagate_subset(memlets: List[Memlet],
         defined_variables -= set(params)
         defined_variables = set(symbolic.pystr_to_symbolic(p) for p in defined_variables)
 
+    # Reuse the results of previous propagations with identical inputs
+    key = None
+    if Config.get_bool('optimizer', 'incremental_propagation'):
+        key = _propagate_subset_key(memlets, arr, params, rng, defined_variables, use_dst)
+        cached = _propagate_subset_cache.get(key) if key is not None else None
+        if cached is not None:
+            _propagate_subset_cache.move_to_end(key)
+            new_memlet = copy.copy(memlets[0])
+            new_memlet.subset = copy.deepcopy(cached[0])
+            new_memlet.other_subset = None
+            new_memlet.volume, new_memlet.dynamic = cached[1], cached[2]
+            return new_memlet
+
     # Propagate subset
     variable_context = [defined_variables, [symbolic.pystr_to_symbolic(p) for p in params]]
 
@@ -1396,14 +1478,7 @@ def propagate_subset(memlets: List[Memlet],
             continue
 
         tmp_subset = None
-
-        subset = None
-        if use_dst and md.dst_subset is not None:
-            subset = md.dst_subset
-        elif not use_dst and md.src_subset is not None:
-            subset = md.src_subset
-        else:
-            subset = md.subset
+        subset = _propagated_subset(md, use_dst)
 
         for pclass in MemletPattern.extensions():
             pattern = pclass()
@@ -1455,9 +1530,62 @@ def propagate_subset(memlets: List[Memlet],
         new_memlet.dynamic = True
         new_memlet.volume = 0
 
+    if key is not None:
+        _propagate_subset_cache[key] = (copy.deepcopy(new_subset), new_memlet.volume, new_memlet.dynamic)
+        if len(_propagate_subset_cache) > _PROPAGATE_SUBSET_CACHE_SIZE:
+            _propagate_subset_cache.popitem(last=False)
+
     return new_memlet
 
 
+#: Maximal number of memoized ``propagate_subset`` results
+_PROPAGATE_SUBSET_CACHE_SIZE = 4096
+_propagate_subset_cache: 'OrderedDict[Tuple[Any, ...], Tuple[subsets.Subset, Any, bool]]' = OrderedDict()
+
+
+def _propagated_subset(memlet: Memlet, use_dst: bool) -> subsets.Subset:
+    if use_dst and memlet.dst_subset is not None:
+        return memlet.dst_subset
+    elif not use_dst and memlet.src_subset is not None:
+        return memlet.src_subset
+    return memlet.subset
+
+
+def _subset_key(subset: subsets.Subset) -> Optional[Tuple[Any, ...]]:
+    if isinstance(subset, subsets.Range):
+        return ('range', tuple(subset.ranges), tuple(subset.tile_sizes))
+    elif isinstance(subset, subsets.Indices):
+        return ('indices', tuple(subset.indices))
+    return None
+
+
+def _propagate_subset_key(memlets: List[Memlet], arr: data.Data, params: List[str], rng: subsets.Subset,
+                          defined_variables: Set[symbolic.SymbolicType], use_dst: bool) -> Optional[Tuple[Any, ...]]:
+    """
+    Returns a hashable key of the inputs of ``propagate_subset``, or None if the inputs cannot be memoized. Only the
+    properties of the memlets and the array descriptor that the propagation depends on are part of the key.
+    """
+    memlet_keys = []
+    for md in memlets:
+        if md.is_empty():
+            subset_key = None
+        else:
+            subset_key = _subset_key(_propagated_subset(md, use_dst))
+            if subset_key is None:
+                return None
+        memlet_keys.append((subset_key, md.volume, md.dynamic))
+    rng_key = _subset_key(rng)
+    if rng_key is None:
+        return None
+    try:
+        key = (tuple(memlet_keys), tuple(arr.shape), tuple(arr.offset), tuple(params), rng_key,
+               frozenset(defined_variables), use_dst)
+        hash(key)
+    except TypeError:  # Unhashable elements
+        return None
+    return key
+
+
 def _freesyms(expr):
     """ 
     Helper function that either returns free symbols for sympy expressions
@@ -449,7 +449,7 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         for k, v in self.__dict__.items():
             # Skip derivative attributes
             if k in ('_cached_start_state', '_edges', '_nodes', '_parent', '_parent_sdfg', '_parent_nsdfg_node',
-                     '_sdfg_list', '_transformation_hist'):
+                     '_sdfg_list', '_transformation_hist', '_analysis_manager'):
                 continue
             setattr(result, k, copy.deepcopy(v, memo))
         # Copy edges and nodes
@@ -470,6 +470,12 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             result._sdfg_list = result.reset_sdfg_list()
         return result
 
+    def __getstate__(self):
+        # Cached analysis results are not pickled
+        state = self.__dict__.copy()
+        state.pop('_analysis_manager', None)
+        return state
+
     @property
     def sdfg_id(self):
         """
@@ -497,7 +503,7 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
         tmp['attributes']['name'] = self.name
         if hash:
-            tmp['attributes']['hash'] = self.hash_sdfg(tmp)
+            tmp['attributes']['hash'] = self.hash_sdfg()
 
         if int(self.sdfg_id) == 0:
             tmp['dace_version'] = dace.__version__
@@ -545,9 +551,16 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         """
         Returns a hash of the current SDFG, without considering IDs and attribute names.
 
+        Unless a JSON dictionary is given, the hash is structural and incremental: it is computed from cached digests
+        of the SDFG elements, and only elements that were modified since the last call are serialized
+        (see ``dace.sdfg.hashing``).
+
         :param jsondict: If not None, uses given JSON dictionary as input.
         :return: The hash (in SHA-256 format).
         """
+        if jsondict is None:
+            from dace.sdfg import hashing  # Avoid import loop
+            return hashing.hash_sdfg(self)
 
         def keyword_remover(json_obj: Any, last_keyword=""):
             # Makes non-unique in SDFG hierarchy v2
@@ -1004,8 +1017,9 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             return os.path.join(base_folder, 'single_cache')
         elif cache_config == 'hash':
             # Any change to the SDFG will result in a new cache folder
-            md5_hash = md5(str(self.to_json()).encode('utf-8')).hexdigest()
-            return os.path.join(base_folder, f'{self.name}_{md5_hash}')
+            from dace.sdfg import hashing  # Avoid import loop
+            sdfg_hash = hashing.hash_sdfg(self, ignored=hashing.ALWAYS_IGNORED)[:32]
+            return os.path.join(base_folder, f'{self.name}_{sdfg_hash}')
         elif cache_config == 'unique':
             # Base name on location in memory, so no caching is possible between
             # processes or subsequent invocations
@@ -1230,9 +1244,8 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         """ Iterate over this and all nested SDFGs. """
         yield self
         for state in self.nodes():
-            for node in state.nodes():
-                if isinstance(node, nd.NestedSDFG):
-                    yield from node.sdfg.all_sdfgs_recursive()
+            for node in state.nodes_of_type(nd.NestedSDFG):
+                yield from node.sdfg.all_sdfgs_recursive()
 
     def all_edges_recursive(self):
         """ Iterate over all edges in this SDFG, including state edges,
@@ -1473,7 +1486,13 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
         return dtypes.deduplicate(shared)
 
-    def save(self, filename: str, use_pickle=False, hash=None, exception=None, compress=False) -> Optional[str]:
+    def save(self,
+             filename: str,
+             use_pickle=False,
+             hash=None,
+             exception=None,
+             compress=False,
+             binary=False) -> Optional[str]:
         """ Save this SDFG to a file.
 
             :param filename: File name to save to.
@@ -1484,6 +1503,10 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             :param exception: If not None, stores error information along with
                               SDFG.
             :param compress: If True, uses gzip to compress the file upon saving.
+            :param binary: If True, uses the compact binary format (see
+                           ``dace.serialize.dump_binary``), which stores
+                           repeated strings once and numpy constants as raw
+                           buffers.
             :return: The hash of the SDFG, or None if failed/not requested.
         """
         if compress:
@@ -1501,6 +1524,17 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
                 symbolic.SympyAwarePickler(fp).dump(self)
             if hash is True:
                 return self.hash_sdfg()
+        elif binary:
+            sdfg_hash = self.hash_sdfg() if hash is True else None
+            with (gzip.open(filename, 'wb') if compress else open(filename, 'wb')) as fp:
+                with dace.serialize.raw_arrays():
+                    json_output = self.to_json()
+                    if sdfg_hash is not None:
+                        json_output['attributes']['hash'] = sdfg_hash
+                    if exception:
+                        json_output['error'] = exception.to_json()
+                    dace.serialize.dump_binary(json_output, fp)
+            return sdfg_hash
         else:
             hash = True if hash is None else hash
             with fileopen(filename, "w") as fp:
@@ -1524,11 +1558,15 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
     @staticmethod
     def _from_file(fp: BinaryIO) -> 'SDFG':
-        firstbyte = fp.read(1)
+        header = fp.read(len(dace.serialize.BINARY_MAGIC))
         fp.seek(0)
-        if firstbyte == b'{':  # JSON file
+        if header[:1] == b'{':  # JSON file
             sdfg_json = json.load(fp)
             sdfg = SDFG.from_json(sdfg_json)
+        elif header == dace.serialize.BINARY_MAGIC:  # Binary file
+            sdfg_json, arrays = dace.serialize.load_binary(fp)
+            with dace.serialize.raw_arrays(arrays):
+                sdfg = SDFG.from_json(sdfg_json)
         else:  # Pickle
             sdfg = symbolic.SympyAwareUnpickler(fp).load()
 
@@ -7,6 +7,7 @@ import copy
 import inspect
 import itertools
 import warnings
+import weakref
 from typing import Any, AnyStr, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, overload
 
 import dace
@@ -101,19 +102,30 @@ class StateGraphView(object):
             if isinstance(node, nd.NestedSDFG):
                 yield from node.sdfg.all_edges_recursive()
 
-    def data_nodes(self):
-        """ Returns all data_nodes (arrays) present in this state. """
-        return [n for n in self.nodes() if isinstance(n, nd.AccessNode)]
+    def data_nodes(self, data: Optional[str] = None) -> List[nd.AccessNode]:
+        """ Returns all data_nodes (arrays) present in this state.
+
+            :param data: If given, only returns the access nodes to the data
+                         container with this name.
+        """
+        if data is None:
+            return [n for n in self.nodes() if isinstance(n, nd.AccessNode)]
+        return [n for n in self.nodes() if isinstance(n, nd.AccessNode) and n.data == data]
+
+    def nodes_of_type(self, node_type: Union[type, Tuple[type, ...]]) -> List[nd.Node]:
+        """ Returns all nodes in this state that are instances of the given
+            node type (or tuple of types), in node order. """
+        return [n for n in self.nodes() if isinstance(n, node_type)]
 
     def entry_node(self, node: nd.Node) -> nd.EntryNode:
         """ Returns the entry node that wraps the current node, or None if
             it is top-level in a state. """
-        return self.scope_dict()[node]
+        return self._scope_parents()[node]
 
     def exit_node(self, entry_node: nd.EntryNode) -> nd.ExitNode:
         """ Returns the exit node leaving the context opened by
             the given entry node. """
-        node_to_children = self.scope_children()
+        node_to_children = self._scope_children()
         return next(v for v in node_to_children[entry_node] if isinstance(v, nd.ExitNode))
 
     ###################################################################
@@ -322,20 +334,12 @@ class StateGraphView(object):
         self._scope_leaves_cached = [scope for scope in st.values() if len(scope.children) == 0]
         return copy.copy(self._scope_leaves_cached)
 
-    def scope_dict(self, return_ids: bool = False, validate: bool = True) -> Dict[nd.Node, Optional[nd.Node]]:
-        """ Returns a dictionary that maps each SDFG node to its parent entry
-            node, or to None if the node is not in any scope.
+    def _scope_parents(self, validate: bool = True) -> Dict[nd.Node, Optional[nd.Node]]:
+        """ Returns the cached node-to-parent scope dictionary (computing it if
+            necessary). The result must not be modified. """
+        from dace.sdfg.scope import _scope_dict_inner
 
-            :param return_ids: Return node ID numbers instead of node objects.
-            :param validate: Ensure that the graph is not malformed when
-                             computing dictionary.
-            :return: The mapping from a node to its parent scope entry node.
-        """
-        from dace.sdfg.scope import _scope_dict_inner, _scope_dict_to_ids
-        result = None
-        result = copy.copy(self._scope_dict_toparent_cached)
-
-        if result is None:
+        if self._scope_dict_toparent_cached is None:
             result = {}
             node_queue = collections.deque(self.source_nodes())
             eq = _scope_dict_inner(self, node_queue, None, False, result)
@@ -356,30 +360,15 @@ class StateGraphView(object):
 
             # Cache result
             self._scope_dict_toparent_cached = result
-            result = copy.copy(result)
 
-        if return_ids:
-            return _scope_dict_to_ids(self, result)
-        return result
+        return self._scope_dict_toparent_cached
 
-    def scope_children(self,
-                       return_ids: bool = False,
-                       validate: bool = True) -> Dict[Optional[nd.EntryNode], List[nd.Node]]:
-        """ Returns a dictionary that maps each SDFG entry node to its children,
-            not including the children of children entry nodes. The key `None`
-            contains a list of top-level nodes (i.e., not in any scope).
+    def _scope_children(self, validate: bool = True) -> Dict[Optional[nd.EntryNode], List[nd.Node]]:
+        """ Returns the cached scope-to-children dictionary (computing it if
+            necessary). The result must not be modified. """
+        from dace.sdfg.scope import _scope_dict_inner
 
-            :param return_ids: Return node ID numbers instead of node objects.
-            :param validate: Ensure that the graph is not malformed when
-                             computing dictionary.
-            :return: The mapping from a node to a list of children nodes.
-        """
-        from dace.sdfg.scope import _scope_dict_inner, _scope_dict_to_ids
-        result = None
-        if self._scope_dict_tochildren_cached is not None:
-            result = copy.copy(self._scope_dict_tochildren_cached)
-
-        if result is None:
+        if self._scope_dict_tochildren_cached is None:
             result = {}
             node_queue = collections.deque(self.source_nodes())
             eq = _scope_dict_inner(self, node_queue, None, True, result)
@@ -400,8 +389,38 @@ class StateGraphView(object):
 
             # Cache result
             self._scope_dict_tochildren_cached = result
-            result = copy.copy(result)
 
+        return self._scope_dict_tochildren_cached
+
+    def scope_dict(self, return_ids: bool = False, validate: bool = True) -> Dict[nd.Node, Optional[nd.Node]]:
+        """ Returns a dictionary that maps each SDFG node to its parent entry
+            node, or to None if the node is not in any scope.
+
+            :param return_ids: Return node ID numbers instead of node objects.
+            :param validate: Ensure that the graph is not malformed when
+                             computing dictionary.
+            :return: The mapping from a node to its parent scope entry node.
+        """
+        from dace.sdfg.scope import _scope_dict_to_ids
+        result = copy.copy(self._scope_parents(validate))
+        if return_ids:
+            return _scope_dict_to_ids(self, result)
+        return result
+
+    def scope_children(self,
+                       return_ids: bool = False,
+                       validate: bool = True) -> Dict[Optional[nd.EntryNode], List[nd.Node]]:
+        """ Returns a dictionary that maps each SDFG entry node to its children,
+            not including the children of children entry nodes. The key `None`
+            contains a list of top-level nodes (i.e., not in any scope).
+
+            :param return_ids: Return node ID numbers instead of node objects.
+            :param validate: Ensure that the graph is not malformed when
+                             computing dictionary.
+            :return: The mapping from a node to a list of children nodes.
+        """
+        from dace.sdfg.scope import _scope_dict_to_ids
+        result = copy.copy(self._scope_children(validate))
         if return_ids:
             return _scope_dict_to_ids(self, result)
         return result
@@ -744,6 +763,9 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
                             value_type=symbolic.pystr_to_symbolic,
                             desc='Full storage location identifier (e.g., rank, GPU ID)')
 
+    #: Number of times the data of an access node in this state changed
+    _data_version = 0
+
     def __repr__(self) -> str:
         return f"SDFGState ({self.label})"
 
@@ -760,6 +782,8 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         self._parent: SDFG = sdfg
         self._graph = self  # Allowing MemletTrackingView mixin to work
         self._clear_scopedict_cache()
+        self._type_index: Dict[Union[type, Tuple[type, ...]], Dict[nd.Node, None]] = {}
+        self._data_index: Optional[Tuple[Tuple[int, int], Dict[str, Dict[nd.AccessNode, None]]]] = None
         self._debuginfo = debuginfo
         self.is_collapsed = False
         self.nosync = False
@@ -770,9 +794,14 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
+        # Nested SDFGs may traverse the state while it is being copied
+        result._type_index = {}
+        result._data_index = None
         for k, v in self.__dict__.items():
             setattr(result, k, copy.deepcopy(v, memo))
         for node in result.nodes():
+            if isinstance(node, nd.AccessNode):
+                nd.AccessNode._states[node] = weakref.ref(result)
             if isinstance(node, nd.NestedSDFG):
                 try:
                     node.sdfg.parent = result
@@ -840,12 +869,18 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
             node.sdfg.parent = self
             node.sdfg.parent_sdfg = self.parent
             node.sdfg.parent_nsdfg_node = node
-        self._clear_scopedict_cache()
-        return super(SDFGState, self).add_node(node)
+        result = super(SDFGState, self).add_node(node)
+        self._index_added_node(node)
+        return result
 
     def remove_node(self, node):
-        self._clear_scopedict_cache()
+        if node in self._nodes:
+            # Outgoing edges are removed first, so that the scopes of the successors are updated while the
+            # scope of the removed node is still known
+            for edge in self.out_edges(node):
+                self.remove_edge(edge)
         super(SDFGState, self).remove_node(node)
+        self._index_removed_node(node)
 
     def add_edge(self, u, u_connector, v, v_connector, memlet):
         if not isinstance(u, nd.Node):
@@ -864,23 +899,186 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         if v_connector and isinstance(v, nd.AccessNode) and v_connector not in v.in_connectors:
             v.add_in_connector(v_connector, force=True)
 
-        self._clear_scopedict_cache()
         result = super(SDFGState, self).add_edge(u, u_connector, v, v_connector, memlet)
+        self._index_added_edge(u, v)
         memlet.try_initialize(self.parent, self, result)
         return result
 
     def remove_edge(self, edge):
-        self._clear_scopedict_cache()
         super(SDFGState, self).remove_edge(edge)
+        self._index_removed_edge(edge.dst)
 
     def remove_edge_and_connectors(self, edge):
-        self._clear_scopedict_cache()
-        super(SDFGState, self).remove_edge(edge)
+        self.remove_edge(edge)
         if edge.src_conn in edge.src.out_connectors:
             edge.src.remove_out_connector(edge.src_conn)
         if edge.dst_conn in edge.dst.in_connectors:
             edge.dst.remove_in_connector(edge.dst_conn)
 
+    def reverse(self) -> None:
+        super().reverse()
+        self._clear_scopedict_cache()
+
+    ###################################################################
+    # Incrementally-maintained indexes
+
+    # The scope dictionaries (see ``scope_dict`` and ``scope_children``), access nodes by data name, and nodes by
+    # type are computed on first use and then updated on every graph mutation, rather than being recomputed from
+    # scratch. The scope of a node is determined by its predecessors, so most mutations only move a single node
+    # between scopes. If the scope of more than one node may change, the scope dictionaries are recomputed on the
+    # next query. Note that cycles created by adding edges are reported by validation, not by ``scope_dict``.
+
+    def _successor_scope(self, node: nd.Node) -> Optional[nd.EntryNode]:
+        """ Returns the scope of the nodes that directly succeed the given node. """
+        if isinstance(node, nd.EntryNode):
+            return node
+        parents = self._scope_dict_toparent_cached
+        if isinstance(node, nd.ExitNode):
+            return parents[parents[node]]
+        return parents[node]
+
+    def _move_to_scope(self, node: nd.Node, scope: Optional[nd.EntryNode]):
+        """ Moves a node without successors to another scope in the cached scope dictionaries. """
+        parents = self._scope_dict_toparent_cached
+        children = self._scope_dict_tochildren_cached
+        old_scope = parents[node]
+        if old_scope is scope:
+            return
+        parents[node] = scope
+        if children is not None:
+            # Children lists may be held by callers that iterate over them, so they are replaced rather than modified
+            children[old_scope] = [n for n in children[old_scope] if n is not node]
+            children[scope] = children[scope] + [node]
+
+    def _index_added_node(self, node: nd.Node):
+        self._scope_tree_cached = None
+        self._scope_leaves_cached = None
+        parents = self._scope_dict_toparent_cached
+        children = self._scope_dict_tochildren_cached
+        if parents is None:
+            self._scope_dict_tochildren_cached = None
+        else:
+            # New nodes are isolated, and thus at the top level of the state
+            parents[node] = None
+            if children is not None:
+                children[None] = children[None] + [node]
+                if isinstance(node, nd.EntryNode):
+                    children[node] = []
+
+        for node_type, index in self._type_index.items():
+            if isinstance(node, node_type):
+                index[node] = None
+        if isinstance(node, nd.AccessNode):
+            nd.AccessNode._states[node] = weakref.ref(self)
+            if self._data_index is not None and self._data_index[0] == self._data_index_version():
+                self._data_index[1].setdefault(node.data, {})[node] = None
+
+    def _index_removed_node(self, node: nd.Node):
+        self._scope_tree_cached = None
+        self._scope_leaves_cached = None
+        parents = self._scope_dict_toparent_cached
+        children = self._scope_dict_tochildren_cached
+        if parents is not None and node in parents:
+            scope = parents.pop(node)
+            if children is not None:
+                # Nodes that remain in the scope of a removed entry node change scopes
+                if scope not in children or children.pop(node, None):
+                    self._clear_scopedict_cache()
+                else:
+                    children[scope] = [n for n in children[scope] if n is not node]
+            elif isinstance(node, nd.EntryNode):
+                self._clear_scopedict_cache()
+        else:
+            self._clear_scopedict_cache()
+
+        for index in self._type_index.values():
+            index.pop(node, None)
+        if isinstance(node, nd.AccessNode):
+            owner = nd.AccessNode._states.get(node)
+            if owner is not None and owner() is self:
+                del nd.AccessNode._states[node]
+            if self._data_index is not None:
+                if self._data_index[0] != self._data_index_version():
+                    self._data_index = None
+                else:
+                    self._data_index[1].get(node.data, {}).pop(node, None)
+
+    def _index_added_edge(self, src: nd.Node, dst: nd.Node):
+        self._scope_tree_cached = None
+        self._scope_leaves_cached = None
+        if self._scope_dict_toparent_cached is None or src is dst:
+            self._clear_scopedict_cache()
+            return
+        try:
+            scope = self._successor_scope(src)
+            if self.in_degree(dst) > 1:
+                # The destination node was already reached from other nodes. Its scope stays the same if the new
+                # predecessor agrees with the existing ones
+                if self._scope_dict_toparent_cached[dst] is not scope:
+                    self._clear_scopedict_cache()
+            elif self.out_degree(dst) == 0:
+                self._move_to_scope(dst, scope)
+            elif scope is not None:
+                # A source node with successors moves into a scope, along with all the nodes it reaches
+                self._clear_scopedict_cache()
+        except KeyError:
+            self._clear_scopedict_cache()
+
+    def _index_removed_edge(self, dst: nd.Node):
+        self._scope_tree_cached = None
+        self._scope_leaves_cached = None
+        parents = self._scope_dict_toparent_cached
+        if parents is None:
+            self._clear_scopedict_cache()
+            return
+        try:
+            # The scope of the source node does not depend on its outgoing edges
+            if self.in_degree(dst) > 0:
+                if any(self._successor_scope(e.src) is not parents[dst] for e in self.in_edges(dst)):
+                    self._clear_scopedict_cache()
+            elif self.out_degree(dst) == 0:
+                self._move_to_scope(dst, None)
+            elif parents[dst] is not None:
+                # The destination node becomes a source node, moving it and its successors to the top level
+                self._clear_scopedict_cache()
+        except KeyError:
+            self._clear_scopedict_cache()
+
+    def _data_index_version(self) -> Tuple[int, int]:
+        """ Returns the version of the data of the access nodes in this state, which changes when they are renamed. """
+        return self._data_version, nd.AccessNode._data_version
+
+    def _access_node_index(self) -> Dict[str, Dict[nd.AccessNode, None]]:
+        """ Returns the (cached) mapping from data container names to the access nodes that refer to them. """
+        # Renaming data of an access node in this state invalidates the index
+        version = self._data_index_version()
+        if self._data_index is None or self._data_index[0] != version:
+            index = {}
+            for node in self.nodes_of_type(nd.AccessNode):
+                nd.AccessNode._states[node] = weakref.ref(self)
+                index.setdefault(node.data, {})[node] = None
+            self._data_index = (version, index)
+        return self._data_index[1]
+
+    def data_nodes(self, data: Optional[str] = None) -> List[nd.AccessNode]:
+        """ Returns all data_nodes (arrays) present in this state.
+
+            :param data: If given, only returns the access nodes to the data
+                         container with this name.
+        """
+        if data is None:
+            return self.nodes_of_type(nd.AccessNode)
+        return list(self._access_node_index().get(data, ()))
+
+    def nodes_of_type(self, node_type: Union[type, Tuple[type, ...]]) -> List[nd.Node]:
+        """ Returns all nodes in this state that are instances of the given
+            node type (or tuple of types), in node order. """
+        index = self._type_index.get(node_type)
+        if index is None:
+            index = {n: None for n in self.nodes() if isinstance(n, node_type)}
+            self._type_index[node_type] = index
+        return list(index)
+
     def to_json(self, parent=None):
         # Create scope dictionary with a failsafe
         try:
@@ -3,7 +3,7 @@
 import copy
 from dace.dtypes import DebugInfo, StorageType
 import os
-from typing import TYPE_CHECKING, Dict, Set, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Set, Tuple, Union
 import warnings
 from dace import dtypes, data as dt, subsets
 from dace import symbolic
@@ -35,9 +35,6 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
         Raises an InvalidSDFGError with the erroneous node/edge
         on failure.
     """
-    # Avoid import loop
-    from dace.codegen.targets import fpga
-
     references = references or set()
 
     # Reference check
@@ -60,46 +57,7 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
 
         # Validate data descriptors
         for name, desc in sdfg._arrays.items():
-            if id(desc) in references:
-                raise InvalidSDFGError(
-                    f'Duplicate data descriptor object detected: "{name}". Please copy objects '
-                    'rather than using multiple references to the same one', sdfg, None)
-            references.add(id(desc))
-
-            # Validate array names
-            if name is not None and not dtypes.validate_name(name):
-                raise InvalidSDFGError("Invalid array name %s" % name, sdfg, None)
-            # Allocation lifetime checks
-            if (desc.lifetime is dtypes.AllocationLifetime.Persistent and desc.storage is dtypes.StorageType.Register):
-                raise InvalidSDFGError(
-                    "Array %s cannot be both persistent and use Register as "
-                    "storage type. Please use a different storage location." % name, sdfg, None)
-
-            # Check for valid bank assignments
-            try:
-                bank_assignment = fpga.parse_location_bank(desc)
-            except ValueError as e:
-                raise InvalidSDFGError(str(e), sdfg, None)
-            if bank_assignment is not None:
-                if bank_assignment[0] == "DDR" or bank_assignment[0] == "HBM":
-                    try:
-                        tmp = subsets.Range.from_string(bank_assignment[1])
-                    except SyntaxError:
-                        raise InvalidSDFGError(
-                            "Memory bank specifier must be convertible to subsets.Range"
-                            f" for array {name}", sdfg, None)
-                    try:
-                        low, high = fpga.get_multibank_ranges_from_subset(bank_assignment[1], sdfg)
-                    except ValueError as e:
-                        raise InvalidSDFGError(str(e), sdfg, None)
-                    if (high - low < 1):
-                        raise InvalidSDFGError(
-                            "Memory bank specifier must at least define one bank to be used"
-                            f" for array {name}", sdfg, None)
-                    if (high - low > 1 and (high - low != desc.shape[0] or len(desc.shape) < 2)):
-                        raise InvalidSDFGError(
-                            "Arrays that use a multibank access pattern must have the size of the first dimension equal"
-                            f" the number of banks and have at least 2 dimensions for array {name}", sdfg, None)
+            _validate_data_descriptor(sdfg, name, desc, references)
 
         # Check every state separately
         start_state = sdfg.start_state
@@ -196,15 +154,66 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
         raise
 
 
+def _validate_data_descriptor(sdfg: 'dace.sdfg.SDFG', name: str, desc: dt.Data, references: Set[int]):
+    """ Verifies a single data descriptor of an SDFG. Raises an InvalidSDFGError on failure. """
+    # Avoid import loop
+    from dace.codegen.targets import fpga
+
+    if id(desc) in references:
+        raise InvalidSDFGError(
+            f'Duplicate data descriptor object detected: "{name}". Please copy objects '
+            'rather than using multiple references to the same one', sdfg, None)
+    references.add(id(desc))
+
+    # Validate array names
+    if name is not None and not dtypes.validate_name(name):
+        raise InvalidSDFGError("Invalid array name %s" % name, sdfg, None)
+    # Allocation lifetime checks
+    if (desc.lifetime is dtypes.AllocationLifetime.Persistent and desc.storage is dtypes.StorageType.Register):
+        raise InvalidSDFGError(
+            "Array %s cannot be both persistent and use Register as "
+            "storage type. Please use a different storage location." % name, sdfg, None)
+
+    # Check for valid bank assignments
+    try:
+        bank_assignment = fpga.parse_location_bank(desc)
+    except ValueError as e:
+        raise InvalidSDFGError(str(e), sdfg, None)
+    if bank_assignment is not None:
+        if bank_assignment[0] == "DDR" or bank_assignment[0] == "HBM":
+            try:
+                tmp = subsets.Range.from_string(bank_assignment[1])
+            except SyntaxError:
+                raise InvalidSDFGError(
+                    "Memory bank specifier must be convertible to subsets.Range"
+                    f" for array {name}", sdfg, None)
+            try:
+                low, high = fpga.get_multibank_ranges_from_subset(bank_assignment[1], sdfg)
+            except ValueError as e:
+                raise InvalidSDFGError(str(e), sdfg, None)
+            if (high - low < 1):
+                raise InvalidSDFGError(
+                    "Memory bank specifier must at least define one bank to be used"
+                    f" for array {name}", sdfg, None)
+            if (high - low > 1 and (high - low != desc.shape[0] or len(desc.shape) < 2)):
+                raise InvalidSDFGError(
+                    "Arrays that use a multibank access pattern must have the size of the first dimension equal"
+                    f" the number of banks and have at least 2 dimensions for array {name}", sdfg, None)
+
+
 def validate_state(state: 'dace.sdfg.SDFGState',
                    state_id: int = None,
                    sdfg: 'dace.sdfg.SDFG' = None,
                    symbols: Dict[str, dtypes.typeclass] = None,
                    initialized_transients: Set[str] = None,
-                   references: Set[int] = None):
+                   references: Set[int] = None,
+                   nodes: Optional[Set['dace.sdfg.nodes.Node']] = None):
     """ Verifies the correctness of an SDFG state by applying multiple
         tests. Raises an InvalidSDFGError with the erroneous node on
         failure.
+
+        :param nodes: If not None, only validates the given nodes of the
+                      state and the edges adjacent to them.
     """
     # Avoid import loops
     from dace import data as dt
@@ -246,6 +255,9 @@ def validate_state(state: 'dace.sdfg.SDFGState',
         raise InvalidSDFGError('State should be acyclic but contains cycles', sdfg, state_id)
 
     for nid, node in enumerate(state.nodes()):
+        if nodes is not None and node not in nodes:
+            continue
+
         # Reference check
         if id(node) in references:
             raise InvalidSDFGNodeError(
@@ -450,6 +462,9 @@ def validate_state(state: 'dace.sdfg.SDFGState',
 
     # Memlet checks
     for eid, e in enumerate(state.edges()):
+        if nodes is not None and e.src not in nodes and e.dst not in nodes:
+            continue
+
         # Reference check
         if id(e) in references:
             raise InvalidSDFGEdgeError(
@@ -615,6 +630,35 @@ def validate_state(state: 'dace.sdfg.SDFGState',
     ########################################
 
 
+def validate_nodes(state: 'dace.sdfg.SDFGState', nodes: Iterable['dace.sdfg.nodes.Node']):
+    """ Verifies the correctness of a part of an SDFG state, e.g., the nodes
+        modified by a transformation. Only the given nodes, the edges adjacent
+        to them, and the data descriptors they access are validated.
+        Raises an InvalidSDFGError with the erroneous node/edge on failure.
+
+        :param state: The state containing the nodes.
+        :param nodes: The nodes to verify.
+        :note: This does not replace a full validation via ``validate_sdfg``.
+    """
+    from dace.sdfg import nodes as nd
+
+    sdfg = state.parent
+    nodes = set(nodes)
+    try:
+        references = set()
+        data = {n.data for n in nodes if isinstance(n, nd.AccessNode)}
+        data.update(e.data.data for n in nodes for e in state.all_edges(n) if e.data.data is not None)
+        for name in sorted(data):
+            if name in sdfg.arrays:
+                _validate_data_descriptor(sdfg, name, sdfg.arrays[name], references)
+
+        validate_state(state, sdfg.node_id(state), sdfg, references=references, nodes=nodes)
+    except InvalidSDFGError as ex:
+        # If the SDFG is invalid, save it
+        sdfg.save(os.path.join('_dacegraphs', 'invalid.sdfg'), exception=ex)
+        raise
+
+
 ###########################################
 # Exception classes
 
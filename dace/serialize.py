@@ -1,8 +1,15 @@
-# Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
 import aenum
+import contextlib
+import io
 import json
+import mmap
 import numpy as np
+import pickle
+import struct
+import threading
 import warnings
+from typing import Any, BinaryIO, List, Optional, Tuple
 import dace.dtypes
 from dace import config
 
@@ -26,6 +33,37 @@ class SerializableObject(object):
         return SerializableObject(json_obj, typename)
 
 
+class _RawArrays(threading.local):
+    """ Arrays stored as raw buffers (rather than as lists) in the current binary serialization. """
+    arrays: Optional[List[np.ndarray]] = None
+
+
+_raw_arrays = _RawArrays()
+
+
+@contextlib.contextmanager
+def raw_arrays(arrays: Optional[List[np.ndarray]] = None):
+    """
+    Context manager within which numpy arrays are serialized as references to raw buffers, rather than as lists.
+    Used by the binary serialization format (see ``dump_binary``).
+
+    :param arrays: The list of arrays that references are resolved against (when loading). If None, an empty list
+                   is created and filled with the arrays serialized within the context.
+    :return: The list of referenced arrays.
+    """
+    if arrays is None and _raw_arrays.arrays is not None:
+        # Nested contexts share the same arrays
+        yield _raw_arrays.arrays
+        return
+
+    previous = _raw_arrays.arrays
+    _raw_arrays.arrays = [] if arrays is None else arrays
+    try:
+        yield _raw_arrays.arrays
+    finally:
+        _raw_arrays.arrays = previous
+
+
 class NumpySerializer:
     """ Helper class to load/store numpy arrays from JSON. """
 
@@ -36,6 +74,11 @@ class NumpySerializer:
         if json_obj['type'] != 'ndarray':
             raise TypeError('Object is not a numpy ndarray')
 
+        if 'buffer' in json_obj:
+            if _raw_arrays.arrays is None:
+                raise ValueError('Raw array buffers can only be loaded from a binary-serialized file')
+            return _raw_arrays.arrays[json_obj['buffer']]
+
         if 'dtype' in json_obj:
             return np.array(json_obj['data'], dtype=json_obj['dtype'])
 
@@ -51,6 +94,10 @@ class NumpySerializer:
         except KeyError:
             dtype_json = str(obj.dtype)
 
+        if _raw_arrays.arrays is not None:
+            _raw_arrays.arrays.append(obj)
+            return {'type': 'ndarray', 'buffer': len(_raw_arrays.arrays) - 1, 'dtype': dtype_json}
+
         return {'type': 'ndarray', 'data': obj.tolist(), 'dtype': dtype_json}
 
 
@@ -173,6 +220,150 @@ def dump(*args, **kwargs):
     return json.dump(*args, default=to_json, indent=2, **kwargs)
 
 
+#: Leading bytes of a binary-serialized file
+BINARY_MAGIC = b'DACESDFG'
+#: Version of the binary serialization format
+BINARY_VERSION = 1
+
+# Magic, version, number of raw buffers, offset of the object tree
+_BINARY_HEADER = struct.Struct('<8sIIQ')
+# Offset and size of each raw buffer
+_BINARY_BUFFER_ENTRY = struct.Struct('<QQ')
+# Raw buffers are aligned for vectorized access
+_BINARY_ALIGNMENT = 64
+
+
+def _to_plain_key(key, strings: dict) -> str:
+    # Follows the key conversion of the ``json`` module
+    if isinstance(key, str):
+        return strings.setdefault(key, key)
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return json.dumps(key)
+    raise TypeError(f'keys must be str, int, float, bool or None, not {type(key).__name__}')
+
+
+def _to_plain(obj, strings: dict):
+    # Converts an object to a tree of JSON-compatible types in the same way as ``json.dump``, using the same
+    # object for equal strings
+    if isinstance(obj, str):
+        return strings.setdefault(obj, str(obj))
+    if obj is None or obj is True or obj is False:
+        return obj
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(v, strings) for v in obj]
+    if isinstance(obj, dict):
+        return {_to_plain_key(k, strings): _to_plain(v, strings) for k, v in obj.items()}
+    return _to_plain(to_json(obj), strings)
+
+
+class _BinaryUnpickler(pickle.Unpickler):
+    """ Unpickler that only constructs plain objects and numpy arrays. """
+    _ALLOWED = {
+        ('numpy', 'dtype'),
+        ('numpy', 'ndarray'),
+        ('numpy.core.multiarray', '_reconstruct'),
+        ('numpy.core.numeric', '_frombuffer'),
+        ('numpy._core.multiarray', '_reconstruct'),
+        ('numpy._core.numeric', '_frombuffer'),
+    }
+
+    def find_class(self, module, name):
+        if (module, name) not in self._ALLOWED:
+            raise pickle.UnpicklingError(f'Unexpected object in binary-serialized file: {module}.{name}')
+        return super().find_class(module, name)
+
+
+def dump_binary(obj, fp: BinaryIO):
+    """
+    Serializes an object to a file in the compact binary format. The object is first converted to the same tree
+    as ``dump`` would write, where repeated strings are stored once. Numpy arrays are stored as aligned raw
+    buffers, which ``load_binary`` can map into memory without copying.
+
+    :param obj: The object to serialize.
+    :param fp: A binary file object to write to.
+    """
+    with raw_arrays() as arrays:
+        tree = _to_plain(obj, {})
+
+    buffers: List[pickle.PickleBuffer] = []
+    payload = pickle.dumps((tree, arrays), protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buf.raw() for buf in buffers]
+
+    # Lay out buffers after the header and the buffer table
+    offsets = []
+    offset = _BINARY_HEADER.size + _BINARY_BUFFER_ENTRY.size * len(raw_buffers)
+    for buf in raw_buffers:
+        offset += -offset % _BINARY_ALIGNMENT
+        offsets.append(offset)
+        offset += buf.nbytes
+
+    fp.write(_BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(raw_buffers), offset))
+    for buf, buf_offset in zip(raw_buffers, offsets):
+        fp.write(_BINARY_BUFFER_ENTRY.pack(buf_offset, buf.nbytes))
+    position = _BINARY_HEADER.size + _BINARY_BUFFER_ENTRY.size * len(raw_buffers)
+    for buf, buf_offset in zip(raw_buffers, offsets):
+        fp.write(bytes(buf_offset - position))
+        fp.write(buf)
+        position = buf_offset + buf.nbytes
+    fp.write(payload)
+
+
+def load_binary(fp: BinaryIO) -> Tuple[Any, List[np.ndarray]]:
+    """
+    Loads a file written by ``dump_binary``. The object tree is read incrementally from the file. If the file is a
+    regular (uncompressed) file, the raw array buffers are memory-mapped copy-on-write, i.e., they are neither read
+    nor copied until accessed. To deserialize the returned tree, call ``from_json`` within a ``raw_arrays`` context
+    with the returned arrays.
+
+    :param fp: A binary file object positioned at the beginning of the serialized data.
+    :return: A 2-tuple of the JSON-compatible object tree and the list of arrays it refers to.
+    """
+    magic, version, num_buffers, payload_offset = _BINARY_HEADER.unpack(fp.read(_BINARY_HEADER.size))
+    if magic != BINARY_MAGIC:
+        raise ValueError('File is not a binary-serialized DaCe file')
+    if version > BINARY_VERSION:
+        raise ValueError(f'Unsupported binary serialization version {version} (supported: {BINARY_VERSION})')
+    table = [_BINARY_BUFFER_ENTRY.unpack(fp.read(_BINARY_BUFFER_ENTRY.size)) for _ in range(num_buffers)]
+
+    buffers = []
+    if isinstance(fp, io.BufferedReader) and fp.seekable():
+        # Zero-copy path: map the file into memory
+        start = fp.tell() - _BINARY_HEADER.size - _BINARY_BUFFER_ENTRY.size * num_buffers
+        if num_buffers > 0:
+            mapped = memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_COPY))
+            buffers = [mapped[start + offset:start + offset + size] for offset, size in table]
+        fp.seek(start + payload_offset)
+    else:
+        # Streaming path (e.g., compressed files): read buffers in order
+        position = _BINARY_HEADER.size + _BINARY_BUFFER_ENTRY.size * num_buffers
+        for offset, size in table:
+            fp.read(offset - position)
+            buf = bytearray(size)
+            view, read = memoryview(buf), 0
+            while read < size:
+                chunk = fp.readinto(view[read:])
+                if not chunk:
+                    raise EOFError('Unexpected end of binary-serialized file')
+                read += chunk
+            buffers.append(buf)
+            position = offset + size
+        fp.read(payload_offset - position)
+
+    return _BinaryUnpickler(fp, buffers=buffers).load()
+
+
 def all_properties_to_json(object_with_properties):
     retdict = {}
     for x, v in object_with_properties.properties():
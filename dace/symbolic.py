@@ -1,5 +1,7 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import ast
+import collections
+import functools
 from functools import lru_cache
 import sympy
 import pickle
@@ -12,6 +14,7 @@ import sympy.abc
 import sympy.printing.str
 
 from dace import dtypes
+from dace.config import Config
 
 DEFAULT_SYMBOL_TYPE = dtypes.int32
 
@@ -285,6 +288,100 @@ class SymExpr(object):
 # Type hint for symbolic expressions
 SymbolicType = Union[sympy.Basic, SymExpr]
 
+#: Hit, miss, and size statistics of the symbolic memoization table (see ``symbolic_cache_info``)
+SymbolicCacheInfo = collections.namedtuple('SymbolicCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# Global least-recently-used table of memoized symbolic conversions and simplifications, keyed by function name and
+# canonical arguments, as well as per-function hit and miss counters
+_symbolic_cache: 'collections.OrderedDict[Tuple[str, Any], Any]' = collections.OrderedDict()
+_symbolic_cache_hits: Dict[str, int] = collections.defaultdict(int)
+_symbolic_cache_misses: Dict[str, int] = collections.defaultdict(int)
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _canonical_key(obj: Any) -> Any:
+    """
+    Returns a hashable canonical form of a memoized function argument. Values of different types that compare equal
+    (e.g., ``1`` and ``1.0``) receive different keys, and the types of DaCe symbols in symbolic expressions are part
+    of the key, since symbols with the same name and assumptions compare equal regardless of their type.
+
+    :raises _Uncacheable: If the argument cannot be memoized.
+    """
+    if obj is None or isinstance(obj, (str, bool, int, float, complex, numpy.number, numpy.bool_)):
+        return (type(obj), obj)
+    if isinstance(obj, sympy.Basic):
+        # SymPy already distinguishes symbols with different assumptions
+        return (obj, frozenset((s.name, s.dtype) for s in obj.free_symbols if isinstance(s, symbol)))
+    if isinstance(obj, SymExpr):
+        return (SymExpr, _canonical_key(obj.expr), _canonical_key(obj.approx))
+    if isinstance(obj, (tuple, list)):
+        return (type(obj), tuple(_canonical_key(o) for o in obj))
+    if isinstance(obj, (set, frozenset)):
+        return (type(obj), frozenset(_canonical_key(o) for o in obj))
+    if isinstance(obj, dict):
+        return (dict, frozenset((_canonical_key(k), _canonical_key(v)) for k, v in obj.items()))
+    raise _Uncacheable
+
+
+def _memoize(func: Callable) -> Callable:
+    """ Memoizes the results of a symbolic function in the global, size-bounded symbolic memoization table. """
+    # Private implementations are counted under the name of their public function
+    name = func.__name__.lstrip('_')
+
+    @functools.wraps(func)
+    def memoized(*args, **kwargs):
+        try:
+            key = (name, _canonical_key(args), _canonical_key(kwargs) if kwargs else None)
+        except _Uncacheable:
+            return func(*args, **kwargs)
+        try:
+            result = _symbolic_cache[key]
+            _symbolic_cache.move_to_end(key)
+            _symbolic_cache_hits[name] += 1
+            return result
+        except KeyError:
+            pass
+
+        _symbolic_cache_misses[name] += 1
+        result = func(*args, **kwargs)
+        maxsize = Config.get('symbolic_cache_size')
+        if maxsize > 0:
+            _symbolic_cache[key] = result
+            while len(_symbolic_cache) > maxsize:
+                _symbolic_cache.popitem(last=False)
+        return result
+
+    return memoized
+
+
+def symbolic_cache_info(function: Optional[str] = None) -> SymbolicCacheInfo:
+    """
+    Returns statistics of the global memoization table of symbolic conversions and simplifications (e.g.,
+    ``pystr_to_symbolic``, ``simplify``, or ``symstr``).
+
+    :param function: If given, only returns the statistics of the function with this name.
+    :return: A named tuple with the number of hits and misses, the maximal size, and the current size of the table.
+    """
+    if function is None:
+        hits = sum(_symbolic_cache_hits.values())
+        misses = sum(_symbolic_cache_misses.values())
+        size = len(_symbolic_cache)
+    else:
+        hits = _symbolic_cache_hits[function]
+        misses = _symbolic_cache_misses[function]
+        size = sum(1 for key in list(_symbolic_cache.keys()) if key[0] == function)
+    return SymbolicCacheInfo(hits, misses, Config.get('symbolic_cache_size'), size)
+
+
+def clear_symbolic_cache():
+    """ Clears the global memoization table of symbolic conversions and simplifications, and resets its statistics. """
+    _symbolic_cache.clear()
+    _symbolic_cache_hits.clear()
+    _symbolic_cache_misses.clear()
+
 
 def symvalue(val):
     """ Returns the symbol value if it is a symbol. """
@@ -359,6 +456,11 @@ def evaluate(expr: Union[sympy.Basic, int, float],
             sval.get() if isinstance(sval, symbol) else sval
             for sname, sval in symbols.items()}
 
+    return _evaluate_subs(expr, syms)
+
+
+@_memoize
+def _evaluate_subs(expr: sympy.Basic, syms: Dict[symbol, Union[int, float]]) -> Union[int, float, numpy.number]:
     return expr.subs(syms)
 
 
@@ -387,7 +489,7 @@ def overapproximate(expr):
     return _overapproximate(expr)
 
 
-@lru_cache(maxsize=2048)
+@_memoize
 def _overapproximate(expr):
     if isinstance(expr, SymExpr):
         if expr.expr != expr.approx:
@@ -700,6 +802,7 @@ class IsNot(sympy.Function):
     pass
 
 
+@_memoize
 def sympy_intdiv_fix(expr):
     """ Fix for SymPy printing out reciprocal values when they should be
         integral in "ceiling/floor" sympy functions.
@@ -815,6 +918,7 @@ def sympy_divide_fix(expr):
     return nexpr
 
 
+@_memoize
 def simplify_ext(expr):
     """
     An extended version of simplification with expression fixes for sympy.
@@ -994,13 +1098,17 @@ class BitwiseOpConverter(ast.NodeTransformer):
         return self.generic_visit(node)
 
 
-@lru_cache(maxsize=16384)
 def pystr_to_symbolic(expr, symbol_map=None, simplify=None) -> sympy.Basic:
     """ Takes a Python string and converts it into a symbolic expression. """
-    from dace.frontend.python.astutils import unparse  # Avoid import loops
-
     if isinstance(expr, (SymExpr, sympy.Basic)):
         return expr
+    return _pystr_to_symbolic(expr, symbol_map, simplify)
+
+
+@_memoize
+def _pystr_to_symbolic(expr, symbol_map, simplify) -> sympy.Basic:
+    from dace.frontend.python.astutils import unparse  # Avoid import loops
+
     if isinstance(expr, str):
         try:
             return sympy.Integer(int(expr))
@@ -1069,7 +1177,7 @@ def pystr_to_symbolic(expr, symbol_map=None, simplify=None) -> sympy.Basic:
         return sympy_to_dace(sympy.sympify(expr, locals, evaluate=simplify), symbol_map)
 
 
-@lru_cache(maxsize=2048)
+@_memoize
 def simplify(expr: SymbolicType) -> SymbolicType:
     return sympy.simplify(expr)
 
@@ -1161,7 +1269,7 @@ class DaceSympyPrinter(sympy.printing.str.StrPrinter):
                 return f'({self._print(expr.args[0])}) ** ({self._print(expr.args[1])})'
 
 
-@lru_cache(maxsize=16384)
+@_memoize
 def symstr(sym, arrayexprs: Optional[Set[str]] = None, cpp_mode=False) -> str:
     """ 
     Convert a symbolic expression to a compilable expression. 
@@ -1328,4 +1436,4 @@ def inequal_symbols(a: Union[sympy.Expr, Any], b: Union[sympy.Expr, Any]) -> boo
         # as `ceiling` and `floor`, if the symbol assumptions allow it.
         # We subtract and compare to zero according to the SymPy documentation
         # (https://docs.sympy.org/latest/tutorial/gotchas.html).
-        return (a - b).simplify() != 0
+        return simplify(a - b) != 0
@@ -24,6 +24,7 @@ from dace.transformation import helpers as xfh
 from dace.libraries.blas.environments import intel_mkl as mkl, openblas
 
 # Enumerator
+from dace.transformation.estimator import cost_model
 from dace.transformation.estimator.enumeration import GreedyEnumerator
 
 # FPGA AutoOpt
@@ -119,9 +120,16 @@ def greedy_fuse(graph_or_subgraph: GraphViewType,
 
         condition_function = lambda sdfg, subgraph: fusion_condition.can_be_applied(sdfg, subgraph)
         enumerator = GreedyEnumerator(sdfg, graph, subgraph, condition_function=condition_function)
+        use_cost_model = config.Config.get_bool('optimizer', 'cost_model_fusion')
         for map_entries in enumerator:
-            if len(map_entries) > 1:
+            fuse = len(map_entries) > 1
+            if fuse:
                 current_subgraph = xfsh.subgraph_from_maps(sdfg, graph, map_entries)
+                # Do not fuse maps if the static cost model estimates the fused map to be slower
+                if use_cost_model and cost_model.fusion_benefit(sdfg, graph, current_subgraph) < 0:
+                    fuse = False
+
+            if fuse:
                 cf = CompositeFusion()
                 cf.setup_match(current_subgraph)
                 # transfer settings
@@ -134,16 +142,15 @@ def greedy_fuse(graph_or_subgraph: GraphViewType,
                 applied_transformations += 1
 
             if recursive:
-                global_entry = cf._global_map_entry if len(map_entries) > 1 else map_entries[0]
-
-                greedy_fuse(graph.scope_subgraph(global_entry, include_entry=False, include_exit=False),
-                            validate_all=validate_all,
-                            device=device,
-                            recursive=recursive,
-                            stencil=stencil,
-                            stencil_tile=stencil_tile,
-                            permutations_only=permutations_only,
-                            expand_reductions=expand_reductions)
+                for global_entry in ([cf._global_map_entry] if fuse else map_entries):
+                    greedy_fuse(graph.scope_subgraph(global_entry, include_entry=False, include_exit=False),
+                                validate_all=validate_all,
+                                device=device,
+                                recursive=recursive,
+                                stencil=stencil,
+                                stencil_tile=stencil_tile,
+                                permutations_only=permutations_only,
+                                expand_reductions=expand_reductions)
 
         for node in graph_or_subgraph.nodes():
             if isinstance(node, nodes.NestedSDFG):
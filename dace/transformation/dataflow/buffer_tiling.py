@@ -65,7 +65,7 @@ class BufferTiling(transformation.SingleStateTransformation):
                 return False
 
             # Check that buffers occur only once in this state.
-            num_occurrences = len([n for n in graph.nodes() if isinstance(n, nodes.AccessNode) and n.data == buf])
+            num_occurrences = len(graph.data_nodes(buf))
             if num_occurrences > 1:
                 return False
         return True
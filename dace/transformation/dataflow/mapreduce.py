@@ -56,9 +56,7 @@ class MapReduceFusion(pm.SingleStateTransformation):
 
         # Make sure that the transient is not accessed anywhere else
         # in this state or other states
-        if not permissive and (
-                len([n for n in graph.nodes() if isinstance(n, nodes.AccessNode) and n.data == in_array.data]) > 1
-                or in_array.data in sdfg.shared_transients()):
+        if not permissive and (len(graph.data_nodes(in_array.data)) > 1 or in_array.data in sdfg.shared_transients()):
             return False
 
         # If memlet already has WCR and it is different from reduce node,
@@ -189,9 +187,7 @@ class MapWCRFusion(pm.SingleStateTransformation):
 
         # Make sure that the transient is not accessed anywhere else
         # in this state or other states
-        if not permissive and (
-                len([n for n in graph.nodes() if isinstance(n, nodes.AccessNode) and n.data == in_array.data]) > 1
-                or in_array.data in sdfg.shared_transients()):
+        if not permissive and (len(graph.data_nodes(in_array.data)) > 1 or in_array.data in sdfg.shared_transients()):
             return False
 
         # Verify that reduction ranges match tasklet map
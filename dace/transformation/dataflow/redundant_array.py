@@ -270,10 +270,7 @@ class RedundantArray(pm.SingleStateTransformation):
             # In non-permissive mode, check if the state has two or more access nodes
             # for the output array. Definitely one of them (out_array) is a
             # write access. Therefore, there might be a RW, WR, or WW dependency.
-            accesses = [
-                n for n in graph.nodes()
-                if isinstance(n, nodes.AccessNode) and n.data == true_out_array.data and n is not true_out_array
-            ]
+            accesses = [n for n in graph.data_nodes(true_out_array.data) if n is not true_out_array]
             if len(accesses) > 0:
                 # We need to ensure that a data race will not happen if we
                 # remove in_array.
@@ -370,8 +367,7 @@ class RedundantArray(pm.SingleStateTransformation):
         # Find occurrences in this and other states
         occurrences = []
         for state in sdfg.nodes():
-            occurrences.extend(
-                [n for n in state.nodes() if isinstance(n, nodes.AccessNode) and n.data == in_array.data])
+            occurrences.extend(state.data_nodes(in_array.data))
         for isedge in sdfg.edges():
             if in_array.data in isedge.data.free_symbols:
                 occurrences.append(isedge)
@@ -725,10 +721,7 @@ class RedundantSecondArray(pm.SingleStateTransformation):
             # Check if the state has two or more access nodes
             # for in_array and at least one of them is a write access. There
             # might be a RW, WR, or WW dependency.
-            accesses = [
-                n for n in graph.nodes()
-                if isinstance(n, nodes.AccessNode) and n.data == true_in_array.data and n is not true_in_array
-            ]
+            accesses = [n for n in graph.data_nodes(true_in_array.data) if n is not true_in_array]
             if len(accesses) > 0:
                 if (graph.in_degree(true_in_array) > 0 or any(graph.in_degree(a) > 0 for a in accesses)):
                     # We need to ensure that a data race will not happen if we
@@ -813,8 +806,7 @@ class RedundantSecondArray(pm.SingleStateTransformation):
         # Find occurrences in this and other states
         occurrences = []
         for state in sdfg.nodes():
-            occurrences.extend(
-                [n for n in state.nodes() if isinstance(n, nodes.AccessNode) and n.data == out_array.data])
+            occurrences.extend(state.data_nodes(out_array.data))
         for isedge in sdfg.edges():
             if out_array.data in isedge.data.free_symbols:
                 occurrences.append(isedge)
@@ -1,3 +1,3 @@
-#from .scoring import ScoringFunction, ExecutionScore, MemletScore, RegisterScore
+from .cost_model import CostEstimate, MachineModel, estimate, fusion_benefit, fusion_scoring_function
 from .enumeration import Enumerator
 from .enumeration import BruteForceEnumerator, ConnectedEnumerator, GreedyEnumerator
@@ -0,0 +1,360 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+A static, analytical cost model for SDFGs. Estimates the work (operations), the bytes moved (from memlet volumes), the
+data footprint, and the parallelism of maps, states, and SDFGs without compiling them, and combines them into a
+roofline-style runtime estimate. The estimates are meant for ranking and pruning transformation candidates (e.g., in
+auto-optimization and tuners) before any candidate is compiled, rather than for predicting absolute runtimes.
+
+Symbolic sizes are evaluated with the given symbol values and the constants of the SDFG. Remaining symbols are assumed
+to have the value ``DEFAULT_SYMBOL_VALUE``.
+"""
+import ast
+from dataclasses import dataclass, field
+import numbers
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from dace import data, dtypes, symbolic
+from dace.sdfg import SDFG, SDFGState, nodes
+from dace.sdfg.graph import SubgraphView
+
+#: Value assumed for symbols whose values are unknown
+DEFAULT_SYMBOL_VALUE = 128
+
+_CPP_OPERATIONS = re.compile(r'[-+*/%<>&|^!?]=?|\w+\s*\(')
+
+
+@dataclass
+class MachineModel:
+    """ Parameters of the target machine for runtime estimates. """
+    cores: int = field(default_factory=lambda: os.cpu_count() or 1)  #: Number of cores
+    operations_per_second: float = 4e9  #: Operations per second and core
+    memory_bandwidth: float = 2e10  #: Main memory bandwidth (in bytes per second)
+    cache_bandwidth: float = 2e11  #: Bandwidth of repeated accesses, which are assumed to hit the cache
+
+
+@dataclass
+class CostEstimate:
+    """
+    Static cost estimate of a map, state, SDFG, or subgraph thereof.
+    """
+    work: float = 0.0  #: Number of operations
+    bytes: float = 0.0  #: Number of bytes moved from and to data containers (sum of memlet volumes)
+    parallelism: float = 1.0  #: Maximal number of parallel map iterations
+    data_footprint: Dict[str, float] = field(default_factory=dict)  #: Bytes of each data container accessed
+
+    @property
+    def footprint(self) -> float:
+        """ Number of unique bytes accessed. """
+        return sum(self.data_footprint.values())
+
+    @property
+    def reuse(self) -> float:
+        """ Average number of times each accessed byte is moved. """
+        footprint = self.footprint
+        return self.bytes / footprint if footprint > 0 else 0.0
+
+    @property
+    def intensity(self) -> float:
+        """ Arithmetic intensity (operations per byte moved). """
+        return self.work / self.bytes if self.bytes > 0 else float('inf')
+
+    def __add__(self, other: 'CostEstimate') -> 'CostEstimate':
+        footprint = dict(self.data_footprint)
+        for name, size in other.data_footprint.items():
+            footprint[name] = max(footprint.get(name, 0.0), size)
+        parallelism = max(self.parallelism, other.parallelism)
+        return CostEstimate(self.work + other.work, self.bytes + other.bytes, parallelism, footprint)
+
+    def scaled(self, factor: float) -> 'CostEstimate':
+        """ Returns the estimate of executing this element ``factor`` times (sequentially). """
+        return CostEstimate(self.work * factor, self.bytes * factor, self.parallelism, dict(self.data_footprint))
+
+    def runtime(self, machine: Optional[MachineModel] = None) -> float:
+        """
+        Returns a roofline-style runtime estimate (in seconds): the maximum of the compute time over the usable cores
+        and the time to move the footprint from main memory, plus the time to move the remaining (reused) bytes
+        from cache.
+
+        :param machine: The machine model to use, or None for the default model.
+        """
+        machine = machine or MachineModel()
+        cores = max(1.0, min(self.parallelism, machine.cores))
+        compute = self.work / (machine.operations_per_second * cores)
+        memory = min(self.footprint, self.bytes) / machine.memory_bandwidth
+        return max(compute, memory) + max(self.bytes - self.footprint, 0.0) / machine.cache_bandwidth
+
+
+def _evaluate(expr: Any, symbols: Dict[str, Any]) -> float:
+    """ Evaluates a (symbolic) size to a number, using the default value for unknown symbols. """
+    if isinstance(expr, (int, float)):
+        return float(expr)
+    try:
+        free_symbols = expr.free_symbols
+    except AttributeError:
+        return float(expr)
+    if free_symbols:
+        expr = expr.subs({s: symbols.get(str(s), DEFAULT_SYMBOL_VALUE) for s in free_symbols})
+    try:
+        return float(expr)
+    except (TypeError, ValueError):
+        return float(DEFAULT_SYMBOL_VALUE)
+
+
+def _symbol_values(sdfg: SDFG, symbols: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    result = {k: v for k, v in sdfg.constants.items() if isinstance(v, numbers.Number)}
+    result.update(symbols or {})
+    return result
+
+
+def tasklet_work(tasklet: nodes.Tasklet) -> int:
+    """ Returns the number of operations (arithmetic, comparisons, and calls) of one execution of a tasklet. """
+    if tasklet.code.language == dtypes.Language.Python:
+        count = sum(
+            isinstance(node, (ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.Call)) for stmt in tasklet.code.code
+            for node in ast.walk(stmt))
+    else:
+        count = len(_CPP_OPERATIONS.findall(tasklet.code.as_string))
+    return max(count, 1)
+
+
+def _in_registers(desc: data.Data) -> bool:
+    """ Returns True if accesses to the data container are assumed not to move any data. """
+    return desc.storage == dtypes.StorageType.Register or (desc.transient and isinstance(desc, data.Scalar))
+
+
+class _StateAnalysis:
+    """ Number of iterations and parallelism of every scope in a state. """
+
+    def __init__(self, state: SDFGState, symbols: Dict[str, Any]):
+        self.state = state
+        self.symbols = symbols
+        self.scope_dict = state.scope_dict()
+        self._iterations: Dict[nodes.EntryNode, Tuple[float, float]] = {None: (1.0, 1.0)}
+
+    def scope(self, entry: Optional[nodes.EntryNode]) -> Tuple[float, float]:
+        """ Returns the number of times and the number of parallel instances the contents of a scope execute. """
+        result = self._iterations.get(entry)
+        if result is None:
+            iterations, parallelism = self.scope(self.scope_dict[entry])
+            if isinstance(entry, nodes.MapEntry):
+                size = _evaluate(entry.map.range.num_elements(), self.symbols)
+                iterations *= size
+                if entry.map.schedule != dtypes.ScheduleType.Sequential:
+                    parallelism *= size
+            result = (iterations, parallelism)
+            self._iterations[entry] = result
+        return result
+
+
+def estimate_state(state: SDFGState,
+                   symbols: Optional[Dict[str, Any]] = None,
+                   nodes_subset: Optional[Iterable[nodes.Node]] = None) -> CostEstimate:
+    """
+    Estimates the cost of one execution of an SDFG state, or of a subset of its nodes.
+
+    :param state: The state to estimate.
+    :param symbols: Optional values of symbols.
+    :param nodes_subset: If given, only estimates the cost of these nodes (and the edges from and to access nodes
+                         among them).
+    :return: The cost estimate.
+    """
+    sdfg = state.parent
+    symbols = _symbol_values(sdfg, symbols)
+    analysis = _StateAnalysis(state, symbols)
+    scope_dict = analysis.scope_dict
+    considered = set(nodes_subset) if nodes_subset is not None else None
+    result = CostEstimate()
+
+    for node in state.nodes():
+        if considered is not None and node not in considered:
+            continue
+        iterations, parallelism = analysis.scope(scope_dict[node])
+        if isinstance(node, nodes.MapEntry):
+            result.parallelism = max(result.parallelism, analysis.scope(node)[1])
+        elif isinstance(node, nodes.Tasklet):
+            result.work += tasklet_work(node) * iterations
+        elif isinstance(node, nodes.NestedSDFG):
+            nested = estimate_sdfg(node.sdfg, {
+                k: _evaluate(symbolic.pystr_to_symbolic(v), symbols)
+                for k, v in node.symbol_mapping.items()
+            })
+            result.work += nested.work * iterations
+            result.bytes += nested.bytes * iterations
+            result.parallelism = max(result.parallelism, parallelism * nested.parallelism)
+        elif isinstance(node, nodes.LibraryNode):
+            # Assume a number of operations proportional to the data the library node accesses
+            result.work += iterations * sum(
+                _evaluate(e.data.volume if e.data.volume != 0 else e.data.subset.num_elements(), symbols)
+                for e in state.all_edges(node) if not e.data.is_empty())
+        elif isinstance(node, nodes.AccessNode):
+            desc = node.desc(sdfg)
+            if _in_registers(desc):
+                continue
+            itemsize = desc.dtype.bytes
+            total_size = _evaluate(desc.total_size, symbols) * itemsize
+            top_level = scope_dict[node] is None
+            footprint = 0.0
+            for e in state.all_edges(node):
+                if e.data.is_empty():
+                    continue
+                if considered is not None and (e.src not in considered or e.dst not in considered):
+                    continue
+                volume = e.data.volume
+                if e.data.dynamic and volume == 0:
+                    volume = e.data.subset.num_elements()
+                moved = _evaluate(volume, symbols) * itemsize
+                result.bytes += moved * iterations
+                if top_level:
+                    subset = e.data.src_subset if e.src is node else e.data.dst_subset
+                    subset = subset or e.data.subset
+                    footprint += _evaluate(subset.num_elements(), symbols) * itemsize
+            if top_level and footprint > 0:
+                result.data_footprint[node.data] = min(total_size,
+                                                       max(result.data_footprint.get(node.data, 0.0), footprint))
+
+    return result
+
+
+def estimate_map(state: SDFGState, map_entry: nodes.MapEntry, symbols: Optional[Dict[str, Any]] = None) -> CostEstimate:
+    """
+    Estimates the cost of a map scope, including the access nodes that it reads from and writes to.
+
+    :param state: The state containing the map.
+    :param map_entry: The entry node of the map.
+    :param symbols: Optional values of symbols.
+    :return: The cost estimate.
+    """
+    subgraph = state.scope_subgraph(map_entry)
+    adjacent = set(e.src for e in state.in_edges(map_entry)) | set(e.dst
+                                                                   for e in state.out_edges(state.exit_node(map_entry)))
+    return estimate_state(state, symbols, set(subgraph.nodes()) | adjacent)
+
+
+def estimate_sdfg(sdfg: SDFG, symbols: Optional[Dict[str, Any]] = None) -> CostEstimate:
+    """
+    Estimates the cost of one execution of an SDFG. States are weighted by their number of executions, if state
+    annotations are available (see ``dace.sdfg.propagation.propagate_states``).
+
+    :param sdfg: The SDFG to estimate.
+    :param symbols: Optional values of symbols.
+    :return: The cost estimate.
+    """
+    symbols = _symbol_values(sdfg, symbols)
+    result = CostEstimate()
+    for state in sdfg.nodes():
+        executions = 1.0
+        if not state.dynamic_executions and state.executions != 0:
+            executions = max(_evaluate(state.executions, symbols), 1.0)
+        result = result + estimate_state(state, symbols).scaled(executions)
+    return result
+
+
+def estimate(graph: Union[SDFG, SDFGState, SubgraphView], symbols: Optional[Dict[str, Any]] = None) -> CostEstimate:
+    """
+    Estimates the cost of an SDFG, state, or a subgraph of a state.
+
+    :param graph: The SDFG, state, or state subgraph to estimate.
+    :param symbols: Optional values of symbols.
+    :return: The cost estimate.
+    """
+    if isinstance(graph, SDFG):
+        return estimate_sdfg(graph, symbols)
+    if isinstance(graph, SDFGState):
+        return estimate_state(graph, symbols)
+    return estimate_state(graph.graph, symbols, graph.nodes())
+
+
+def fusion_benefit(sdfg: SDFG,
+                   state: SDFGState,
+                   subgraph: SubgraphView,
+                   symbols: Optional[Dict[str, Any]] = None,
+                   machine: Optional[MachineModel] = None) -> float:
+    """
+    Estimates the runtime benefit (in seconds) of fusing the outermost maps of a subgraph into one map, e.g., with
+    ``SubgraphFusion``. Fusion removes the traffic to intermediate transients that are only accessed within the
+    subgraph, but limits the parallelism to that of the smallest map. The transformation is not applied.
+
+    :param sdfg: The SDFG containing the state.
+    :param state: The state containing the subgraph.
+    :param subgraph: The subgraph of maps (and intermediate access nodes) to fuse.
+    :param symbols: Optional values of symbols.
+    :param machine: The machine model to use, or None for the default model.
+    :return: The estimated reduction in runtime. Negative if fusion is estimated to be harmful.
+    """
+    machine = machine or MachineModel()
+    before = estimate(subgraph, symbols)
+
+    # Determine intermediate transients that fusion would remove
+    symbol_values = _symbol_values(sdfg, symbols)
+    scope_dict = state.scope_dict()
+    subgraph_nodes = set(subgraph.nodes())
+    outer_maps = [n for n in subgraph_nodes if isinstance(n, nodes.MapEntry) and scope_dict[n] is None]
+    exits = {state.exit_node(me) for me in outer_maps}
+    removed_bytes = 0.0
+    removed_data = set()
+    for node in subgraph_nodes:
+        if not isinstance(node, nodes.AccessNode) or scope_dict[node] is not None:
+            continue
+        desc = node.desc(sdfg)
+        if not desc.transient or _in_registers(desc):
+            continue
+        if (not all(e.src in exits for e in state.in_edges(node))
+                or not all(e.dst in outer_maps for e in state.out_edges(node))):
+            continue
+        if any(n is not node and n.data == node.data for st in sdfg.nodes() for n in st.data_nodes()):
+            continue
+        for e in state.all_edges(node):
+            if not e.data.is_empty():
+                removed_bytes += _evaluate(e.data.volume, symbol_values) * desc.dtype.bytes
+        removed_data.add(node.data)
+
+    after = CostEstimate(before.work, max(before.bytes - removed_bytes, 0.0), before.parallelism, {
+        k: v
+        for k, v in before.data_footprint.items() if k not in removed_data
+    })
+    if outer_maps:
+        after.parallelism = min(
+            _evaluate(me.map.range.num_elements(), symbol_values) if me.map.schedule !=
+            dtypes.ScheduleType.Sequential else 1.0 for me in outer_maps)
+
+    return before.runtime(machine) - after.runtime(machine)
+
+
+def fusion_scoring_function(sdfg: SDFG,
+                            state: SDFGState,
+                            symbols: Optional[Dict[str, Any]] = None,
+                            machine: Optional[MachineModel] = None) -> Callable[[SubgraphView], float]:
+    """
+    Returns a scoring function for map enumerators (see
+    ``dace.transformation.estimator.enumeration.MapScoringEnumerator``), which scores subgraphs by their estimated
+    fusion benefit (see ``fusion_benefit``).
+    """
+    return lambda subgraph: fusion_benefit(sdfg, state, subgraph, symbols, machine)
+
+
+def prune(candidates: Iterable[Any],
+          cost: Callable[[Any], Optional[float]],
+          keep: int,
+          always_keep: Optional[Iterable[Any]] = None) -> Tuple[List[Any], List[Any]]:
+    """
+    Ranks candidates (e.g., tuning configurations) by an estimated cost and keeps the most promising ones.
+
+    :param candidates: The candidates to rank.
+    :param cost: A function returning the estimated cost of a candidate (lower is better), or None if the candidate
+                 cannot be estimated. Candidates that cannot be estimated are always kept.
+    :param keep: The number of estimated candidates to keep.
+    :param always_keep: Optional candidates to keep regardless of their estimated cost (e.g., a baseline).
+    :return: A tuple of (kept candidates in their original order, pruned candidates).
+    """
+    candidates = list(candidates)
+    always_keep = list(always_keep or [])
+    costs = [cost(c) for c in candidates]
+    estimated = sorted((i for i, c in enumerate(costs) if c is not None), key=lambda i: costs[i])
+    kept_indices: Set[int] = set(estimated[:keep])
+    kept_indices.update(i for i, c in enumerate(costs) if c is None)
+    kept_indices.update(i for i, c in enumerate(candidates) if any(c is k or c == k for k in always_keep))
+    kept = [c for i, c in enumerate(candidates) if i in kept_indices]
+    pruned = [c for i, c in enumerate(candidates) if i not in kept_indices]
+    return kept, pruned
@@ -3,10 +3,12 @@
 API for SDFG analysis and manipulation Passes, as well as Pipelines that contain multiple dependent passes.
 """
 from dace import properties, serialize
-from dace.sdfg import SDFG, SDFGState, graph as gr, nodes, utils as sdutil
+from dace.config import Config
+from dace.sdfg import SDFG, SDFGState, graph as gr, hashing, nodes, utils as sdutil
 
+from contextlib import contextmanager
 from enum import Flag, auto
-from typing import Any, Dict, Iterator, List, Optional, Set, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
 from dataclasses import dataclass
 
 
@@ -90,6 +92,19 @@ class Pass:
         """
         raise NotImplementedError
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: Any) -> Optional[Set[SDFG]]:
+        """
+        In the context of a ``Pipeline``, queries which SDFGs the last application of this pass modified. This method
+        is called right after ``apply_pass`` returned a value other than None, and is used to reapply passes and
+        invalidate analysis results only on the modified SDFGs.
+
+        :param sdfg: The SDFG the pass was applied to.
+        :param pass_retval: The return value from applying this pass.
+        :return: The modified SDFGs (out of ``sdfg`` and its nested SDFGs), or None if any of them may have been
+                 modified.
+        """
+        return None
+
     def report(self, pass_retval: Any) -> Optional[str]:
         """
         Returns a user-readable string report based on the results of this pass.
@@ -307,6 +322,229 @@ class ScopePass(Pass):
         raise NotImplementedError
 
 
+#: Elements of an SDFG that passes may modify, as individual flags
+_MODIFIABLE_ELEMENTS = (Modifies.Descriptors, Modifies.Symbols, Modifies.States, Modifies.InterstateEdges,
+                        Modifies.AccessNodes, Modifies.Scopes, Modifies.Tasklets, Modifies.NestedSDFGs,
+                        Modifies.Memlets)
+
+
+def _with_parents(sdfgs: Iterable[SDFG]) -> Set[SDFG]:
+    """ Returns the given SDFGs along with all their parent SDFGs. """
+    result = set()
+    for sdfg in sdfgs:
+        while sdfg is not None and sdfg not in result:
+            result.add(sdfg)
+            sdfg = sdfg.parent_sdfg
+    return result
+
+
+@properties.make_properties
+class AnalysisPass(Pass):
+    """
+    A specialized Pass type that analyzes each SDFG (including nested SDFGs) separately, without modifying it. Such a
+    pass is realized by implementing the ``apply`` method, which accepts a single SDFG. The results of analysis passes
+    that run in a ``Pipeline`` are cached per SDFG and reused across pipelines (see ``AnalysisManager``).
+
+    :see: Pass
+    """
+
+    CATEGORY: str = 'Analysis'
+
+    def modifies(self) -> Modifies:
+        return Modifies.Nothing
+
+    def apply_pass(self, top_sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Dict[int, Any]:
+        """
+        Analyzes the given SDFG and its nested SDFGs by calling ``apply`` on each SDFG.
+
+        :param top_sdfg: The SDFG to analyze.
+        :param pipeline_results: If in the context of a ``Pipeline``, a dictionary that is populated with prior Pass
+                                 results as ``{Pass subclass name: returned object from pass}``. If not run in a
+                                 pipeline, an empty dictionary is expected.
+        :return: A dictionary of ``{SDFG ID: analysis result}`` for the given SDFG and all its nested SDFGs.
+        """
+        return {sdfg.sdfg_id: self.apply(sdfg, pipeline_results) for sdfg in top_sdfg.all_sdfgs_recursive()}
+
+    def apply(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Any:
+        """
+        Analyzes a single SDFG, without its nested SDFGs.
+
+        :param sdfg: The SDFG to analyze.
+        :param pipeline_results: If in the context of a ``Pipeline``, a dictionary that is populated with prior Pass
+                                 results as ``{Pass subclass name: returned object from pass}``. If not run in a
+                                 pipeline, an empty dictionary is expected.
+        :return: The analysis result.
+        """
+        raise NotImplementedError
+
+
+class AnalysisManager:
+    """
+    Caches the results of analysis passes on an SDFG and its nested SDFGs across pipelines. The manager of an SDFG is
+    obtained with ``AnalysisManager.get`` and is used by every ``Pipeline`` applied to that SDFG.
+
+    Cached results of an SDFG are invalidated when a pass in a pipeline modifies it, according to the ``Modifies``
+    flags the pass reports (see ``Pass.should_reapply``). Results of analyses that depend on an invalidated analysis
+    are invalidated as well. Modifications made outside of pipelines (e.g., by applying transformations directly) are
+    detected when the outermost pipeline starts, by comparing fingerprints of the elements that the cached analyses
+    depend on. Since pipelines trust the reported flags, passes must not modify elements other than those in
+    ``Pass.modifies``, and analysis passes must reapply on modifications of every element they read. Cached results
+    are shared between pipelines, so passes must not modify the results of the analyses they depend on.
+    """
+
+    def __init__(self):
+        # Cached results for each SDFG: maps a pass key to the pass object and its result on that SDFG
+        self._results: Dict[SDFG, Dict[Any, Tuple[AnalysisPass, Any]]] = {}
+        # The elements of each SDFG that cached results depend on, and their fingerprints when the last pipeline ended
+        self._fingerprints: Dict[SDFG, Tuple[Modifies, Dict[Modifies, Any]]] = {}
+        # Number of pipelines currently running
+        self._depth = 0
+
+    @staticmethod
+    def get(sdfg: SDFG) -> 'AnalysisManager':
+        """ Returns the analysis manager attached to the given SDFG, creating it if necessary. """
+        manager = getattr(sdfg, '_analysis_manager', None)
+        if manager is None:
+            manager = AnalysisManager()
+            sdfg._analysis_manager = manager
+        return manager
+
+    @staticmethod
+    def _key(p: AnalysisPass) -> Any:
+        return type(p), tuple((prop.attr_name, repr(value)) for prop, value in p.properties())
+
+    @staticmethod
+    def _fingerprint(sdfg: SDFG, elements: Modifies) -> Dict[Modifies, Any]:
+        """
+        Returns fingerprints of the given elements of an SDFG (without the contents of nested SDFGs), which change
+        whenever the respective elements are modified. Mutation counts also change when graph elements are replaced
+        by equivalent objects, which cached results may refer to.
+        """
+        result = {}
+        contents = None
+        for element in _MODIFIABLE_ELEMENTS:
+            if not (elements & element):
+                continue
+            if element == Modifies.Descriptors:
+                result[element] = tuple((name, hashing.element_digest(desc)) for name, desc in sdfg.arrays.items())
+            elif element == Modifies.Symbols:
+                result[element] = (tuple(
+                    (name, str(dtype)) for name, dtype in sdfg.symbols.items()), tuple(sdfg.constants_prop.keys()))
+            elif element == Modifies.States:
+                result[element] = (sdfg._mutation_count, sdfg._start_state)
+            elif element == Modifies.InterstateEdges:
+                result[element] = (sdfg._mutation_count, tuple(hashing.element_digest(e.data) for e in sdfg.edges()))
+            elif element == Modifies.AccessNodes:
+                result[element] = (tuple((state._mutation_count, state._data_version)
+                                         for state in sdfg.nodes()), nodes.AccessNode._data_version)
+            else:  # Contents of states
+                if contents is None:
+                    contents = tuple(
+                        (state._mutation_count, hashing.state_digest(state, recursive=False)) for state in sdfg.nodes())
+                result[element] = contents
+        return result
+
+    @contextmanager
+    def track(self, sdfg: SDFG):
+        """
+        Context manager within which a pipeline is applied to the given SDFG. When the outermost pipeline starts,
+        results of SDFGs that were modified since the last pipeline ended are invalidated.
+        """
+        if not Config.get_bool('optimizer', 'cache_analyses'):
+            self.clear()
+            yield self
+            return
+
+        if self._depth == 0:
+            self._synchronize(sdfg)
+        self._depth += 1
+        try:
+            yield self
+        except:
+            self.clear()
+            raise
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._record()
+
+    def _synchronize(self, sdfg: SDFG):
+        current = set(sdfg.all_sdfgs_recursive())
+        for nsdfg in list(self._results.keys()):
+            if nsdfg not in current or nsdfg not in self._fingerprints:
+                del self._results[nsdfg]
+                continue
+            elements, recorded = self._fingerprints[nsdfg]
+            modified = Modifies.Nothing
+            for element, fingerprint in self._fingerprint(nsdfg, elements).items():
+                if fingerprint != recorded[element]:
+                    modified |= element
+            if modified != Modifies.Nothing:
+                self._invalidate_results(self._results[nsdfg], modified)
+        self._fingerprints = {}
+
+    def _record(self):
+        for sdfg, cached in self._results.items():
+            elements = Modifies.Nothing
+            for p, _ in cached.values():
+                for element in _MODIFIABLE_ELEMENTS:
+                    if p.should_reapply(element):
+                        elements |= element
+            self._fingerprints[sdfg] = (elements, self._fingerprint(sdfg, elements))
+
+    def analyze(self, top_sdfg: SDFG, p: AnalysisPass, pipeline_results: Dict[str, Any]) -> Dict[int, Any]:
+        """
+        Returns the result of an analysis pass on an SDFG and its nested SDFGs (see ``AnalysisPass.apply_pass``),
+        only analyzing SDFGs without a valid cached result.
+        """
+        key = self._key(p)
+        result = {}
+        for sdfg in top_sdfg.all_sdfgs_recursive():
+            cached = self._results.setdefault(sdfg, {})
+            if key not in cached:
+                cached[key] = (p, p.apply(sdfg, pipeline_results))
+            result[sdfg.sdfg_id] = cached[key][1]
+        return result
+
+    def invalidate(self, modified: Modifies = Modifies.Everything, sdfgs: Optional[Iterable[SDFG]] = None):
+        """
+        Invalidates cached results after SDFGs were modified.
+
+        :param modified: The elements that were modified.
+        :param sdfgs: The modified SDFGs. Results of their parent SDFGs are invalidated as well. If None, invalidates
+                      the results of all SDFGs.
+        """
+        if sdfgs is None:
+            sdfgs = list(self._results.keys())
+        else:
+            sdfgs = _with_parents(sdfgs)
+
+        for sdfg in sdfgs:
+            if sdfg in self._results:
+                self._invalidate_results(self._results[sdfg], modified)
+
+    @staticmethod
+    def _invalidate_results(cached: Dict[Any, Tuple[AnalysisPass, Any]], modified: Modifies):
+        invalid = {type(p) for p, _ in cached.values() if p.should_reapply(modified)}
+        # Results that depend on invalidated results are also invalid
+        while True:
+            dependent = {
+                type(p)
+                for p, _ in cached.values() if type(p) not in invalid and any(
+                    (dep if isinstance(dep, type) else type(dep)) in invalid for dep in p.depends_on())
+            }
+            if not dependent:
+                break
+            invalid |= dependent
+        for key in [key for key, (p, _) in cached.items() if type(p) in invalid]:
+            del cached[key]
+
+    def clear(self):
+        """ Invalidates all cached results. """
+        self._results.clear()
+        self._fingerprints.clear()
+
+
 @dataclass
 @properties.make_properties
 class Pipeline(Pass):
@@ -351,6 +589,7 @@ class Pipeline(Pass):
 
         # Keep track of what is modified as the pipeline is executing
         self._modified: Modifies = Modifies.Nothing
+        self._modified_sdfgs: Optional[Iterable[SDFG]] = None
 
     def _add_dependencies(self, passes: List[Pass]):
         """
@@ -492,18 +731,36 @@ class Pipeline(Pass):
         :param state: The pipeline results state.
         :return: The pass return value.
         """
+        if isinstance(p, AnalysisPass) and Config.get_bool('optimizer', 'cache_analyses'):
+            return AnalysisManager.get(sdfg).analyze(sdfg, p, state)
         return p.apply_pass(sdfg, state)
 
+    def subpass_modified_sdfgs(self, sdfg: SDFG, p: Pass, retval: Any) -> Optional[Iterable[SDFG]]:
+        """
+        Returns the SDFGs that a pass from the pipeline modified (see ``Pass.modified_sdfgs``). This method is meant to
+        be overridden by subclasses that override ``apply_subpass``.
+
+        :param sdfg: The SDFG the pass was applied to.
+        :param p: The applied pass.
+        :param retval: The (non-None) pass return value.
+        :return: The modified SDFGs, or None if any SDFG may have been modified.
+        """
+        return p.modified_sdfgs(sdfg, retval)
+
     def apply_pass(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        state = pipeline_results
-        retval = {}
-        self._modified = Modifies.Nothing
-        for p in self.iterate_over_passes(sdfg):
-            r = self.apply_subpass(sdfg, p, state)
-            if r is not None:
-                state[type(p).__name__] = r
-                retval[type(p).__name__] = r
-                self._modified = p.modifies()
+        with AnalysisManager.get(sdfg).track(sdfg) as analyses:
+            state = pipeline_results
+            retval = {}
+            self._modified = Modifies.Nothing
+            for p in self.iterate_over_passes(sdfg):
+                r = self.apply_subpass(sdfg, p, state)
+                if r is not None:
+                    state[type(p).__name__] = r
+                    retval[type(p).__name__] = r
+                    self._modified = p.modifies()
+                    if self._modified != Modifies.Nothing:
+                        self._modified_sdfgs = self.subpass_modified_sdfgs(sdfg, p, r)
+                        analyses.invalidate(self._modified, self._modified_sdfgs)
 
         if retval:
             return retval
@@ -524,12 +781,68 @@ class FixedPointPipeline(Pipeline):
     """
     A special type of Pipeline that applies its ``Pass`` objects in repeated succession until they all stop modifying
     the SDFG (i.e., by returning None).
+
+    If the ``optimizer.incremental_pipelines`` configuration entry is set, the pipeline keeps track of the SDFGs that
+    each pass modified (see ``Pass.modified_sdfgs``). After the first iteration, a pass is skipped if no SDFG was
+    modified (by any pass, including itself) since the pass was last applied, as applying it again would not modify the
+    SDFG. Subclasses that apply passes to each SDFG separately can restrict them to the modified SDFGs with
+    ``pending_sdfgs``.
     
     :see: Pipeline
     """
 
     CATEGORY: str = 'Helper'
 
+    def __init__(self, passes: List[Pass]):
+        super().__init__(passes)
+
+        # For each pass, the SDFGs it was applied to that were not modified since, if modifications are tracked
+        self._unmodified: Optional[Dict[Pass, Set[SDFG]]] = None
+
+    def pending_sdfgs(self, sdfg: SDFG, p: Pass) -> List[SDFG]:
+        """
+        Returns the SDFGs (out of the given SDFG and its nested SDFGs) that were modified since the given pass was
+        last applied to them, in the order of ``SDFG.all_sdfgs_recursive``.
+
+        :param sdfg: The SDFG the pipeline is applied to.
+        :param p: The pass to apply.
+        :return: A list of SDFGs the pass should be applied to.
+        """
+        if self._unmodified is None or p not in self._unmodified:
+            return list(sdfg.all_sdfgs_recursive())
+        unmodified = self._unmodified[p]
+        return [sd for sd in sdfg.all_sdfgs_recursive() if sd not in unmodified]
+
+    def iterate_over_passes(self, sdfg: SDFG) -> Iterator[Pass]:
+        for p in super().iterate_over_passes(sdfg):
+            if self._unmodified is None or isinstance(p, AnalysisPass):
+                yield p
+                continue
+
+            # Skip passes that were applied since the SDFG was last modified
+            pending = self.pending_sdfgs(sdfg, p)
+            if not pending:
+                continue
+            unmodified = self._unmodified.get(p, set())
+
+            yield p
+
+            self._unmodified[p] = unmodified.union(pending)
+            if self._modified == Modifies.Nothing:
+                continue
+
+            # Every pass is pending again on the modified SDFGs (``should_reapply`` only specifies which passes to
+            # rerun within one iteration, so it is not used here). Parents of modified SDFGs, which contain the
+            # modifications, and nested SDFGs, which depend on their parents, are also considered modified.
+            if self._modified_sdfgs is None:
+                self._unmodified.clear()
+                continue
+            modified = _with_parents(self._modified_sdfgs)
+            for sd in self._modified_sdfgs:
+                modified.update(sd.all_sdfgs_recursive())
+            for other in self._unmodified.values():
+                other -= modified
+
     def apply_pass(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Applies the pipeline to the SDFG in repeated succession until the SDFG is no longer modified.
@@ -543,16 +856,23 @@ class FixedPointPipeline(Pipeline):
         """
         state = pipeline_results
         retval = {}
-        while True:
-            newret = super().apply_pass(sdfg, state)
-            
-            # Remove dependencies from pipeline
-            if newret:
-                newret = {k: v for k, v in newret.items() if k in self._pass_names}
-
-            if not newret:
-                if retval:
-                    return retval
-                return None
-            state.update(newret)
-            retval.update(newret)
+        unmodified = self._unmodified
+        if Config.get_bool('optimizer', 'incremental_pipelines'):
+            self._unmodified = {}
+        try:
+            with AnalysisManager.get(sdfg).track(sdfg):
+                while True:
+                    newret = super().apply_pass(sdfg, state)
+
+                    # Remove dependencies from pipeline
+                    if newret:
+                        newret = {k: v for k, v in newret.items() if k in self._pass_names}
+
+                    if not newret:
+                        if retval:
+                            return retval
+                        return None
+                    state.update(newret)
+                    retval.update(newret)
+        finally:
+            self._unmodified = unmodified
@@ -15,154 +15,131 @@ WriteScopeDict = Dict[str, Dict[Optional[Tuple[SDFGState, nd.AccessNode]],
 SymbolScopeDict = Dict[str, Dict[Edge[InterstateEdge], Set[Union[Edge[InterstateEdge], SDFGState]]]]
 
 @properties.make_properties
-class StateReachability(ppl.Pass):
+class StateReachability(ppl.AnalysisPass):
     """
     Evaluates state reachability (which other states can be executed after each state).
     """
 
     CATEGORY: str = 'Analysis'
 
-    def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nothing
-
     def should_reapply(self, modified: ppl.Modifies) -> bool:
         # If anything was modified, reapply
         return modified & ppl.Modifies.States
 
-    def apply_pass(self, top_sdfg: SDFG, _) -> Dict[int, Dict[SDFGState, Set[SDFGState]]]:
+    def apply(self, sdfg: SDFG, _) -> Dict[SDFGState, Set[SDFGState]]:
         """
         :return: A dictionary mapping each state to its other reachable states.
         """
-        reachable: Dict[int, Dict[SDFGState, Set[SDFGState]]] = {}
-        for sdfg in top_sdfg.all_sdfgs_recursive():
-            reachable[sdfg.sdfg_id] = {}
-            tc: nx.DiGraph = nx.transitive_closure(sdfg.nx)
-            for state in sdfg.nodes():
-                reachable[sdfg.sdfg_id][state] = set(tc.successors(state))
+        reachable: Dict[SDFGState, Set[SDFGState]] = {}
+        tc: nx.DiGraph = nx.transitive_closure(sdfg.nx)
+        for state in sdfg.nodes():
+            reachable[state] = set(tc.successors(state))
         return reachable
 
 
 @properties.make_properties
-class SymbolAccessSets(ppl.Pass):
+class SymbolAccessSets(ppl.AnalysisPass):
     """
     Evaluates symbol access sets (which symbols are read/written in each state or interstate edge).
     """
 
     CATEGORY: str = 'Analysis'
 
-    def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nothing
-
     def should_reapply(self, modified: ppl.Modifies) -> bool:
         # If anything was modified, reapply
-        return modified & ppl.Modifies.States | ppl.Modifies.Edges | ppl.Modifies.Symbols | ppl.Modifies.Nodes
+        return modified & (ppl.Modifies.States | ppl.Modifies.Edges | ppl.Modifies.Symbols | ppl.Modifies.Nodes
+                           | ppl.Modifies.Descriptors)
 
-    def apply_pass(
-            self, top_sdfg: SDFG, _
-    ) -> Dict[int, Dict[Union[SDFGState, Edge[InterstateEdge]], Tuple[Set[str], Set[str]]]]:
+    def apply(self, sdfg: SDFG, _) -> Dict[Union[SDFGState, Edge[InterstateEdge]], Tuple[Set[str], Set[str]]]:
         """
         :return: A dictionary mapping each state to a tuple of its (read, written) data descriptors.
         """
-        top_result: Dict[int, Dict[SDFGState, Tuple[Set[str], Set[str]]]] = {}
-        for sdfg in top_sdfg.all_sdfgs_recursive():
-            adesc = set(sdfg.arrays.keys())
-            result: Dict[SDFGState, Tuple[Set[str], Set[str]]] = {}
-            for state in sdfg.nodes():
-                readset = state.free_symbols
-                # No symbols may be written to inside states.
-                result[state] = (readset, set())
-                for oedge in sdfg.out_edges(state):
-                    edge_readset = oedge.data.read_symbols() - adesc
-                    edge_writeset = set(oedge.data.assignments.keys())
-                    result[oedge] = (edge_readset, edge_writeset)
-            top_result[sdfg.sdfg_id] = result
-        return top_result
+        adesc = set(sdfg.arrays.keys())
+        result: Dict[SDFGState, Tuple[Set[str], Set[str]]] = {}
+        for state in sdfg.nodes():
+            readset = state.free_symbols
+            # No symbols may be written to inside states.
+            result[state] = (readset, set())
+            for oedge in sdfg.out_edges(state):
+                edge_readset = oedge.data.read_symbols() - adesc
+                edge_writeset = set(oedge.data.assignments.keys())
+                result[oedge] = (edge_readset, edge_writeset)
+        return result
 
 
 @properties.make_properties
-class AccessSets(ppl.Pass):
+class AccessSets(ppl.AnalysisPass):
     """
     Evaluates memory access sets (which arrays/data descriptors are read/written in each state).
     """
 
     CATEGORY: str = 'Analysis'
 
-    def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nothing
-
     def should_reapply(self, modified: ppl.Modifies) -> bool:
-        # If anything was modified, reapply
-        return modified & ppl.Modifies.AccessNodes
+        # Access nodes and their memlets, as well as arrays read on inter-state edges
+        return modified & (ppl.Modifies.States | ppl.Modifies.Edges | ppl.Modifies.AccessNodes
+                           | ppl.Modifies.Descriptors)
 
-    def apply_pass(self, top_sdfg: SDFG, _) -> Dict[int, Dict[SDFGState, Tuple[Set[str], Set[str]]]]:
+    def apply(self, sdfg: SDFG, _) -> Dict[SDFGState, Tuple[Set[str], Set[str]]]:
         """
         :return: A dictionary mapping each state to a tuple of its (read, written) data descriptors.
         """
-        top_result: Dict[int, Dict[SDFGState, Tuple[Set[str], Set[str]]]] = {}
-        for sdfg in top_sdfg.all_sdfgs_recursive():
-            result: Dict[SDFGState, Tuple[Set[str], Set[str]]] = {}
-            for state in sdfg.nodes():
-                readset, writeset = set(), set()
-                for anode in state.data_nodes():
-                    if state.in_degree(anode) > 0:
-                        writeset.add(anode.data)
-                    if state.out_degree(anode) > 0:
-                        readset.add(anode.data)
-
-                result[state] = (readset, writeset)
-
-            # Edges that read from arrays add to both ends' access sets
-            anames = sdfg.arrays.keys()
-            for e in sdfg.edges():
-                fsyms = e.data.free_symbols & anames
-                if fsyms:
-                    result[e.src][0].update(fsyms)
-                    result[e.dst][0].update(fsyms)
-
-            top_result[sdfg.sdfg_id] = result
-        return top_result
+        result: Dict[SDFGState, Tuple[Set[str], Set[str]]] = {}
+        for state in sdfg.nodes():
+            readset, writeset = set(), set()
+            for anode in state.data_nodes():
+                if state.in_degree(anode) > 0:
+                    writeset.add(anode.data)
+                if state.out_degree(anode) > 0:
+                    readset.add(anode.data)
+
+            result[state] = (readset, writeset)
+
+        # Edges that read from arrays add to both ends' access sets
+        anames = sdfg.arrays.keys()
+        for e in sdfg.edges():
+            fsyms = e.data.free_symbols & anames
+            if fsyms:
+                result[e.src][0].update(fsyms)
+                result[e.dst][0].update(fsyms)
+
+        return result
 
 
 @properties.make_properties
-class FindAccessStates(ppl.Pass):
+class FindAccessStates(ppl.AnalysisPass):
     """
     For each data descriptor, creates a set of states in which access nodes of that data are used.
     """
 
     CATEGORY: str = 'Analysis'
 
-    def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nothing
-
     def should_reapply(self, modified: ppl.Modifies) -> bool:
-        # If anything was modified, reapply
-        return modified & ppl.Modifies.AccessNodes
+        # Access nodes, as well as arrays read on inter-state edges
+        return modified & (ppl.Modifies.States | ppl.Modifies.InterstateEdges | ppl.Modifies.AccessNodes
+                           | ppl.Modifies.Descriptors)
 
-    def apply_pass(self, top_sdfg: SDFG, _) -> Dict[int, Dict[str, Set[SDFGState]]]:
+    def apply(self, sdfg: SDFG, _) -> Dict[str, Set[SDFGState]]:
         """
         :return: A dictionary mapping each data descriptor name to states where it can be found in.
         """
-        top_result: Dict[int, Dict[str, Set[SDFGState]]] = {}
+        result: Dict[str, Set[SDFGState]] = defaultdict(set)
+        for state in sdfg.nodes():
+            for anode in state.data_nodes():
+                result[anode.data].add(state)
 
-        for sdfg in top_sdfg.all_sdfgs_recursive():
-            result: Dict[str, Set[SDFGState]] = defaultdict(set)
-            for state in sdfg.nodes():
-                for anode in state.data_nodes():
-                    result[anode.data].add(state)
+        # Edges that read from arrays add to both ends' access sets
+        anames = sdfg.arrays.keys()
+        for e in sdfg.edges():
+            fsyms = e.data.free_symbols & anames
+            for access in fsyms:
+                result[access].update({e.src, e.dst})
 
-            # Edges that read from arrays add to both ends' access sets
-            anames = sdfg.arrays.keys()
-            for e in sdfg.edges():
-                fsyms = e.data.free_symbols & anames
-                for access in fsyms:
-                    result[access].update({e.src, e.dst})
-
-            top_result[sdfg.sdfg_id] = result
-        return top_result
+        return result
 
 
 @properties.make_properties
-class FindAccessNodes(ppl.Pass):
+class FindAccessNodes(ppl.AnalysisPass):
     """
     For each data descriptor, creates a dictionary mapping states to all read and write access nodes with the given
     data descriptor.
@@ -170,35 +147,30 @@ class FindAccessNodes(ppl.Pass):
 
     CATEGORY: str = 'Analysis'
 
-    def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nothing
-
     def should_reapply(self, modified: ppl.Modifies) -> bool:
-        return modified & ppl.Modifies.AccessNodes
+        # Access nodes and whether they are read or written by memlets
+        return modified & (ppl.Modifies.States | ppl.Modifies.Memlets | ppl.Modifies.AccessNodes)
 
-    def apply_pass(self, top_sdfg: SDFG,
-                   _) -> Dict[int, Dict[str, Dict[SDFGState, Tuple[Set[nd.AccessNode], Set[nd.AccessNode]]]]]:
+    def apply(self, sdfg: SDFG, _) -> Dict[str, Dict[SDFGState, Tuple[Set[nd.AccessNode], Set[nd.AccessNode]]]]:
         """
         :return: A dictionary mapping each data descriptor name to a dictionary keyed by states with all access nodes
                  that use that data descriptor.
         """
-        top_result: Dict[int, Dict[str, Set[nd.AccessNode]]] = dict()
-
-        for sdfg in top_sdfg.all_sdfgs_recursive():
-            result: Dict[str, Dict[SDFGState, Tuple[Set[nd.AccessNode], Set[nd.AccessNode]]]] = defaultdict(
-                lambda: defaultdict(lambda: [set(), set()]))
-            for state in sdfg.nodes():
-                for anode in state.data_nodes():
-                    if state.in_degree(anode) > 0:
-                        result[anode.data][state][1].add(anode)
-                    if state.out_degree(anode) > 0:
-                        result[anode.data][state][0].add(anode)
-            top_result[sdfg.sdfg_id] = result
-        return top_result
+        result: Dict[str,
+                     Dict[SDFGState,
+                          Tuple[Set[nd.AccessNode],
+                                Set[nd.AccessNode]]]] = defaultdict(lambda: defaultdict(lambda: [set(), set()]))
+        for state in sdfg.nodes():
+            for anode in state.data_nodes():
+                if state.in_degree(anode) > 0:
+                    result[anode.data][state][1].add(anode)
+                if state.out_degree(anode) > 0:
+                    result[anode.data][state][0].add(anode)
+        return result
 
 
 @properties.make_properties
-class SymbolWriteScopes(ppl.Pass):
+class SymbolWriteScopes(ppl.AnalysisPass):
     """
     For each symbol, create a dictionary mapping each writing interstate edge to that symbol to the set of interstate
     edges and states reading that symbol that are dominated by that write.
@@ -206,12 +178,9 @@ class SymbolWriteScopes(ppl.Pass):
 
     CATEGORY: str = 'Analysis'
 
-    def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nothing
-
     def should_reapply(self, modified: ppl.Modifies) -> bool:
         # If anything was modified, reapply
-        return modified & ppl.Modifies.Symbols | ppl.Modifies.States | ppl.Modifies.Edges | ppl.Modifies.Nodes
+        return modified & (ppl.Modifies.Symbols | ppl.Modifies.States | ppl.Modifies.Edges | ppl.Modifies.Nodes)
 
     def depends_on(self):
         return {SymbolAccessSets, StateReachability}
@@ -249,61 +218,56 @@ class SymbolWriteScopes(ppl.Pass):
             n_state = state_idom[n_state] if state_idom[n_state] != n_state else None
         return write_isedge
 
-    def apply_pass(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Dict[int, SymbolScopeDict]:
-        top_result: Dict[int, SymbolScopeDict] = dict()
-
-        for sdfg in sdfg.all_sdfgs_recursive():
-            result: SymbolScopeDict = defaultdict(lambda: defaultdict(lambda: set()))
-
-            idom = nx.immediate_dominators(sdfg.nx, sdfg.start_state)
-            all_doms = cfg.all_dominators(sdfg, idom)
-            symbol_access_sets: Dict[
-                Union[SDFGState, Edge[InterstateEdge]], Tuple[Set[str], Set[str]]
-            ] = pipeline_results[SymbolAccessSets.__name__][sdfg.sdfg_id]
-            state_reach: Dict[SDFGState, Set[SDFGState]] = pipeline_results[StateReachability.__name__][sdfg.sdfg_id]
-
-            for read_loc, (reads, _) in symbol_access_sets.items():
-                for sym in reads:
-                    dominating_write = self._find_dominating_write(sym, read_loc, idom)
-                    result[sym][dominating_write].add(read_loc if isinstance(read_loc, SDFGState) else read_loc)
-
-            # If any write A is dominated by another write B and any reads in B's scope are also reachable by A,
-            # then merge A and its scope into B's scope.
-            to_remove = set()
-            for sym in result.keys():
-                for write, accesses in result[sym].items():
-                    if write is None:
-                        continue
-                    dominators = all_doms[write.dst]
-                    reach = state_reach[write.dst]
-                    for dom in dominators:
-                        iedges = dom.parent.in_edges(dom)
-                        if len(iedges) == 1 and iedges[0] in result[sym]:
-                            other_accesses = result[sym][iedges[0]]
-                            coarsen = False
-                            for a_state_or_edge in other_accesses:
-                                if isinstance(a_state_or_edge, SDFGState):
-                                    if a_state_or_edge in reach:
-                                        coarsen = True
-                                        break
-                                else:
-                                    if a_state_or_edge.src in reach:
-                                        coarsen = True
-                                        break
-                            if coarsen:
-                                other_accesses.update(accesses)
-                                other_accesses.add(write)
-                                to_remove.add((sym, write))
-                                result[sym][write] = set()
-            for sym, write in to_remove:
-                del result[sym][write]
-
-            top_result[sdfg.sdfg_id] = result
-        return top_result
+    def apply(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> SymbolScopeDict:
+        result: SymbolScopeDict = defaultdict(lambda: defaultdict(lambda: set()))
+
+        idom = nx.immediate_dominators(sdfg.nx, sdfg.start_state)
+        all_doms = cfg.all_dominators(sdfg, idom)
+        symbol_access_sets: Dict[Union[SDFGState, Edge[InterstateEdge]],
+                                 Tuple[Set[str], Set[str]]] = pipeline_results[SymbolAccessSets.__name__][sdfg.sdfg_id]
+        state_reach: Dict[SDFGState, Set[SDFGState]] = pipeline_results[StateReachability.__name__][sdfg.sdfg_id]
+
+        for read_loc, (reads, _) in symbol_access_sets.items():
+            for sym in reads:
+                dominating_write = self._find_dominating_write(sym, read_loc, idom)
+                result[sym][dominating_write].add(read_loc if isinstance(read_loc, SDFGState) else read_loc)
+
+        # If any write A is dominated by another write B and any reads in B's scope are also reachable by A,
+        # then merge A and its scope into B's scope.
+        to_remove = set()
+        for sym in result.keys():
+            for write, accesses in result[sym].items():
+                if write is None:
+                    continue
+                dominators = all_doms[write.dst]
+                reach = state_reach[write.dst]
+                for dom in dominators:
+                    iedges = dom.parent.in_edges(dom)
+                    if len(iedges) == 1 and iedges[0] in result[sym]:
+                        other_accesses = result[sym][iedges[0]]
+                        coarsen = False
+                        for a_state_or_edge in other_accesses:
+                            if isinstance(a_state_or_edge, SDFGState):
+                                if a_state_or_edge in reach:
+                                    coarsen = True
+                                    break
+                            else:
+                                if a_state_or_edge.src in reach:
+                                    coarsen = True
+                                    break
+                        if coarsen:
+                            other_accesses.update(accesses)
+                            other_accesses.add(write)
+                            to_remove.add((sym, write))
+                            result[sym][write] = set()
+        for sym, write in to_remove:
+            del result[sym][write]
+
+        return result
 
 
 @properties.make_properties
-class ScalarWriteShadowScopes(ppl.Pass):
+class ScalarWriteShadowScopes(ppl.AnalysisPass):
     """
     For each scalar or array of size 1, create a dictionary mapping writes to that data container to the set of reads
     and writes that are dominated by that write.
@@ -311,12 +275,9 @@ class ScalarWriteShadowScopes(ppl.Pass):
 
     CATEGORY: str = 'Analysis'
 
-    def modifies(self) -> ppl.Modifies:
-        return ppl.Modifies.Nothing
-
     def should_reapply(self, modified: ppl.Modifies) -> bool:
-        # If anything was modified, reapply
-        return modified & ppl.Modifies.States
+        # Access nodes and the paths between them, as well as arrays read on inter-state edges
+        return modified & (ppl.Modifies.States | ppl.Modifies.Edges | ppl.Modifies.Nodes | ppl.Modifies.Descriptors)
 
     def depends_on(self):
         return {AccessSets, FindAccessNodes, StateReachability}
@@ -375,64 +336,60 @@ class ScalarWriteShadowScopes(ppl.Pass):
 
         return None
 
-    def apply_pass(self, top_sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Dict[int, WriteScopeDict]:
+    def apply(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> WriteScopeDict:
         """
         :return: A dictionary mapping each data descriptor name to a dictionary, where writes to that data descriptor
                  and the states they are contained in are mapped to the set of reads and writes (and their states) that
                  are dominated by that write.
         """
-        top_result: Dict[int, WriteScopeDict] = dict()
-
-        for sdfg in top_sdfg.all_sdfgs_recursive():
-            result: WriteScopeDict = defaultdict(lambda: defaultdict(lambda: set()))
-            idom = nx.immediate_dominators(sdfg.nx, sdfg.start_state)
-            all_doms = cfg.all_dominators(sdfg, idom)
-            access_sets: Dict[SDFGState, Tuple[Set[str],
-                                               Set[str]]] = pipeline_results[AccessSets.__name__][sdfg.sdfg_id]
-            access_nodes: Dict[str, Dict[SDFGState, Tuple[Set[nd.AccessNode], Set[nd.AccessNode]]]] = pipeline_results[
-                FindAccessNodes.__name__][sdfg.sdfg_id]
-            state_reach: Dict[SDFGState, Set[SDFGState]] = pipeline_results[StateReachability.__name__][sdfg.sdfg_id]
-
-            anames = sdfg.arrays.keys()
-            for desc in sdfg.arrays:
-                desc_states_with_nodes = set(access_nodes[desc].keys())
-                for state in desc_states_with_nodes:
-                    for read_node in access_nodes[desc][state][0]:
-                        write = self._find_dominating_write(desc, state, read_node, access_nodes, idom, access_sets)
-                        result[desc][write].add((state, read_node))
-                # Ensure accesses to interstate edges are also considered.
-                for state, accesses in access_sets.items():
-                    if desc in accesses[0]:
-                        out_edges = sdfg.out_edges(state)
-                        for oedge in out_edges:
-                            syms = oedge.data.free_symbols & anames
-                            if desc in syms:
-                                write = self._find_dominating_write(
-                                    desc, state, oedge.data, access_nodes, idom, access_sets
-                                )
-                                result[desc][write].add((state, oedge.data))
-
-                # If any write A is dominated by another write B and any reads in B's scope are also reachable by A,
-                # then merge A and its scope into B's scope.
-                to_remove = set()
-                for write, accesses in result[desc].items():
-                    if write is None:
+        result: WriteScopeDict = defaultdict(lambda: defaultdict(lambda: set()))
+        idom = nx.immediate_dominators(sdfg.nx, sdfg.start_state)
+        all_doms = cfg.all_dominators(sdfg, idom)
+        access_sets: Dict[SDFGState, Tuple[Set[str], Set[str]]] = pipeline_results[AccessSets.__name__][sdfg.sdfg_id]
+        access_nodes: Dict[str,
+                           Dict[SDFGState,
+                                Tuple[Set[nd.AccessNode],
+                                      Set[nd.AccessNode]]]] = pipeline_results[FindAccessNodes.__name__][sdfg.sdfg_id]
+        state_reach: Dict[SDFGState, Set[SDFGState]] = pipeline_results[StateReachability.__name__][sdfg.sdfg_id]
+
+        anames = sdfg.arrays.keys()
+        for desc in sdfg.arrays:
+            desc_states_with_nodes = set(access_nodes[desc].keys())
+            for state in desc_states_with_nodes:
+                for read_node in access_nodes[desc][state][0]:
+                    write = self._find_dominating_write(desc, state, read_node, access_nodes, idom, access_sets)
+                    result[desc][write].add((state, read_node))
+            # Ensure accesses to interstate edges are also considered.
+            for state, accesses in access_sets.items():
+                if desc in accesses[0]:
+                    out_edges = sdfg.out_edges(state)
+                    for oedge in out_edges:
+                        syms = oedge.data.free_symbols & anames
+                        if desc in syms:
+                            write = self._find_dominating_write(desc, state, oedge.data, access_nodes, idom,
+                                                                access_sets)
+                            result[desc][write].add((state, oedge.data))
+
+            # If any write A is dominated by another write B and any reads in B's scope are also reachable by A,
+            # then merge A and its scope into B's scope.
+            to_remove = set()
+            for write, accesses in result[desc].items():
+                if write is None:
+                    continue
+                write_state, write_node = write
+                dominators = all_doms[write_state]
+                reach = state_reach[write_state]
+                for other_write, other_accesses in result[desc].items():
+                    if other_write is not None and other_write[1] is write_node and other_write[0] is write_state:
                         continue
-                    write_state, write_node = write
-                    dominators = all_doms[write_state]
-                    reach = state_reach[write_state]
-                    for other_write, other_accesses in result[desc].items():
-                        if other_write is not None and other_write[1] is write_node and other_write[0] is write_state:
-                            continue
-                        if other_write is None or other_write[0] in dominators:
-                            noa = len(other_accesses)
-                            if noa > 0 and (noa > 1 or list(other_accesses)[0] != other_write):
-                                if any([a_state in reach for a_state, _ in other_accesses]):
-                                    other_accesses.update(accesses)
-                                    other_accesses.add(write)
-                                    to_remove.add(write)
-                                    result[desc][write] = set()
-                for write in to_remove:
-                    del result[desc][write]
-            top_result[sdfg.sdfg_id] = result
-        return top_result
+                    if other_write is None or other_write[0] in dominators:
+                        noa = len(other_accesses)
+                        if noa > 0 and (noa > 1 or list(other_accesses)[0] != other_write):
+                            if any([a_state in reach for a_state, _ in other_accesses]):
+                                other_accesses.update(accesses)
+                                other_accesses.add(write)
+                                to_remove.add(write)
+                                result[desc][write] = set()
+            for write in to_remove:
+                del result[desc][write]
+        return result
@@ -42,8 +42,11 @@ class ArrayElimination(ppl.Pass):
         """
         result: Set[str] = set()
         reachable: Dict[SDFGState, Set[SDFGState]] = pipeline_results[ap.StateReachability.__name__][sdfg.sdfg_id]
-        # Get access nodes and modify set as pass continues
-        access_sets: Dict[str, Set[SDFGState]] = pipeline_results[ap.FindAccessStates.__name__][sdfg.sdfg_id]
+        # Get access nodes and modify set as pass continues (on a copy, since analysis results may be cached)
+        access_sets: Dict[str, Set[SDFGState]] = {
+            k: set(v)
+            for k, v in pipeline_results[ap.FindAccessStates.__name__][sdfg.sdfg_id].items()
+        }
 
         # Traverse SDFG backwards
         try:
@@ -92,6 +95,13 @@ class ArrayElimination(ppl.Pass):
 
         return result or None
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: Set[str]) -> Set[SDFG]:
+        # Removing redundant arrays may modify the descriptors of connected nested SDFGs
+        result = {sdfg}
+        for state in sdfg.nodes():
+            result.update(node.sdfg for node in state.nodes_of_type(nodes.NestedSDFG))
+        return result
+
     def report(self, pass_retval: Set[str]) -> str:
         return f'Eliminated {len(pass_retval)} arrays: {pass_retval}.'
 
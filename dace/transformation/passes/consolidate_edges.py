@@ -3,7 +3,7 @@
 from dace.transformation import pass_pipeline as ppl
 from dace.sdfg import utils as sdutil
 from dace import SDFG, properties
-from typing import Optional
+from typing import Optional, Set
 
 
 @properties.make_properties
@@ -39,5 +39,8 @@ class ConsolidateEdges(ppl.Pass):
             return None
         return edges_removed
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: int) -> Set[SDFG]:
+        return {sdfg}
+
     def report(self, pass_retval: int) -> str:
         return f'Consolidated {pass_retval} edges.'
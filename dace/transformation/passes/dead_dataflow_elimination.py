@@ -57,7 +57,8 @@ class DeadDataflowElimination(ppl.Pass):
         #  * State reachability
         #  * Read/write access sets per state
         reachable: Dict[SDFGState, Set[SDFGState]] = pipeline_results['StateReachability'][sdfg.sdfg_id]
-        access_sets: Dict[SDFGState, Tuple[Set[str], Set[str]]] = pipeline_results['AccessSets'][sdfg.sdfg_id]
+        # Read sets are updated as the pass continues (on a copy, since analysis results may be cached)
+        access_sets: Dict[SDFGState, Tuple[Set[str], Set[str]]] = dict(pipeline_results['AccessSets'][sdfg.sdfg_id])
         result: Dict[SDFGState, Set[str]] = defaultdict(set)
 
         # Traverse SDFG backwards
@@ -182,6 +183,13 @@ class DeadDataflowElimination(ppl.Pass):
 
         return result or None
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: Dict[SDFGState, Set[str]]) -> Set[SDFG]:
+        # Outputs of nested SDFGs may become transient
+        result = {sdfg}
+        for state in pass_retval:
+            result.update(node.sdfg for node in state.nodes_of_type(nodes.NestedSDFG))
+        return result
+
     def report(self, pass_retval: Dict[SDFGState, Set[str]]) -> str:
         n = sum(len(v) for v in pass_retval.values())
         return f'Eliminated {n} nodes in {len(pass_retval)} states: {pass_retval}'
@@ -123,6 +123,9 @@ class DeadStateElimination(ppl.Pass):
         # Dead states are states that are not live (i.e., visited)
         return set(sdfg.nodes()) - visited, dead_edges, edges_annotated
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: Set[Union[SDFGState, Edge[InterstateEdge]]]) -> Set[SDFG]:
+        return {sdfg}
+
     def report(self, pass_retval: Set[Union[SDFGState, Edge[InterstateEdge]]]) -> str:
         if pass_retval is not None and not pass_retval:
             return 'DeadStateElimination annotated new unconditional edges.'
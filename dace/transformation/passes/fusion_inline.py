@@ -4,13 +4,21 @@ Contains implementations of SDFG inlining and state fusion passes.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, Optional, Set
 
 from dace import SDFG, properties
 from dace.sdfg.utils import fuse_states, inline_sdfgs
 from dace.transformation import pass_pipeline as ppl
 
 
+def _graph_version(sdfg: SDFG) -> Hashable:
+    """
+    Returns a value that changes whenever the states of an SDFG or their connectivity are modified, or when the SDFG
+    is moved to another parent SDFG.
+    """
+    return sdfg.parent_sdfg, sdfg._mutation_count, tuple(state._mutation_count for state in sdfg.nodes())
+
+
 @dataclass(unsafe_hash=True)
 @properties.make_properties
 class FuseStates(ppl.Pass):
@@ -40,9 +48,14 @@ class FuseStates(ppl.Pass):
     
         :return: The total number of states fused, or None if did not apply.
         """
+        versions = {sd: _graph_version(sd) for sd in sdfg.all_sdfgs_recursive()}
         fused = fuse_states(sdfg, self.permissive, self.progress)
+        self._modified_sdfgs = {sd for sd, version in versions.items() if _graph_version(sd) != version}
         return fused or None
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: int) -> Set[SDFG]:
+        return self._modified_sdfgs
+
     def report(self, pass_retval: int) -> str:
         return f'Fused {pass_retval} states.'
 
@@ -77,8 +90,13 @@ class InlineSDFGs(ppl.Pass):
     
         :return: The total number of states fused, or None if did not apply.
         """
+        versions = {sd: _graph_version(sd) for sd in sdfg.all_sdfgs_recursive()}
         inlined = inline_sdfgs(sdfg, self.permissive, self.progress, self.multistate)
+        self._modified_sdfgs = {sd for sd, version in versions.items() if _graph_version(sd) != version}
         return inlined or None
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: int) -> Set[SDFG]:
+        return self._modified_sdfgs
+
     def report(self, pass_retval: int) -> str:
         return f'Inlined {pass_retval} SDFGs.'
@@ -0,0 +1,257 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Liveness-based memory planning for transients. Computes the lifetime of every eligible heap-allocated transient across
+the states of an SDFG and its nested SDFGs, and packs them into a single arena buffer, such that transients that are
+never live at the same time share memory. The resulting plan is used by the code generator (see the
+``compiler.cpu.arena_allocation`` configuration entry) to replace individual allocations with pointers into the arena.
+"""
+from dataclasses import dataclass, field
+import numbers
+from typing import Dict, List, Optional, Set, Tuple
+
+import networkx as nx
+import sympy
+
+from dace import SDFG, SDFGState, data, dtypes, properties, symbolic
+from dace.sdfg import nodes
+from dace.transformation import pass_pipeline as ppl
+
+#: Key of a planned transient: (SDFG ID, data descriptor name)
+ArenaKey = Tuple[int, str]
+#: Lifetime interval of a transient, given as first and last state indices (inclusive)
+Interval = Tuple[int, int]
+
+
+@dataclass
+class ArenaPlan:
+    """
+    The result of memory planning: offsets of transients within one arena buffer. All sizes and offsets are given in
+    bytes, as symbolic expressions of the free symbols of the top-level SDFG.
+    """
+    size: symbolic.SymbolicType = 0  #: Total size of the arena
+    offsets: Dict[ArenaKey, symbolic.SymbolicType] = field(default_factory=dict)  #: Offset of each transient
+    sizes: Dict[ArenaKey, symbolic.SymbolicType] = field(default_factory=dict)  #: Aligned size of each transient
+    lifetimes: Dict[ArenaKey, Interval] = field(default_factory=dict)  #: First and last state of each transient
+
+    @property
+    def unplanned_size(self) -> symbolic.SymbolicType:
+        """ The total size of the planned transients if every one of them were allocated separately. """
+        return sum(self.sizes.values())
+
+    def __bool__(self) -> bool:
+        return len(self.offsets) > 0
+
+    def __contains__(self, key: ArenaKey) -> bool:
+        return key in self.offsets
+
+
+@dataclass
+class _Buffer:
+    key: ArenaKey
+    size: symbolic.SymbolicType
+    start: int
+    end: int
+
+    def overlaps(self, other: '_Buffer') -> bool:
+        return self.start <= other.end and other.start <= self.end
+
+
+@properties.make_properties
+class ArenaPlanner(ppl.Pass):
+    """
+    Plans the memory of heap-allocated transients into a single arena buffer using liveness analysis.
+
+    Each top-level state of the SDFG is a time step, in topological order. States that are part of a loop are
+    conservatively merged into one interval spanning the entire loop, and nested SDFGs count as part of the state that
+    contains them. Transients whose lifetime intervals are disjoint may share memory: constant-size transients are
+    packed into the arena by offset (greedy by size), and symbolic-size transients share slots whose size is the maximum
+    of their members.
+
+    Only transient arrays that are allocated on the CPU heap outside of any scope (e.g., a parallel map) are planned,
+    and their sizes must only depend on the free symbols of the top-level SDFG. The pass does not modify the SDFG.
+    """
+
+    CATEGORY: str = 'Memory Footprint Reduction'
+
+    alignment = properties.Property(dtype=int, default=64, desc='Alignment (in bytes) of every transient in the arena')
+
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Nothing
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return modified & (ppl.Modifies.Descriptors | ppl.Modifies.States | ppl.Modifies.Nodes
+                           | ppl.Modifies.InterstateEdges)
+
+    def apply_pass(self, sdfg: SDFG, _) -> ArenaPlan:
+        """
+        :return: The arena plan of the given SDFG. The plan is empty if no transient can be planned.
+        """
+        lifetimes: Dict[ArenaKey, Interval] = {}
+        ineligible: Set[ArenaKey] = set()
+        self._collect_lifetimes(sdfg, None, lifetimes, ineligible)
+
+        top_symbols = sdfg.free_symbols
+        buffers: List[_Buffer] = []
+        for key, (start, end) in lifetimes.items():
+            if key in ineligible:
+                continue
+            size = self._size_in_bytes(sdfg, top_symbols, key)
+            if size is None:
+                continue
+            buffers.append(_Buffer(key, size, start, end))
+
+        return self._pack(buffers)
+
+    def report(self, pass_retval: ArenaPlan) -> Optional[str]:
+        if not pass_retval:
+            return None
+        return (f'Planned {len(pass_retval.offsets)} transients into an arena of {pass_retval.size} bytes '
+                f'(instead of {pass_retval.unplanned_size} bytes).')
+
+    def _collect_lifetimes(self, sdfg: SDFG, outer: Optional[Interval], lifetimes: Dict[ArenaKey, Interval],
+                           ineligible: Set[ArenaKey]):
+        """
+        Collects the lifetime intervals of transients in an SDFG and, recursively, its nested SDFGs.
+
+        :param sdfg: The SDFG to collect.
+        :param outer: The interval of the state that contains the SDFG, or None for the top-level SDFG.
+        :param lifetimes: The resulting lifetime intervals (updated in place).
+        :param ineligible: The set of transients that cannot be planned (updated in place).
+        """
+        order: List[SDFGState] = list(sdfg.topological_sort())
+        visited = set(order)
+        order.extend(state for state in sdfg.nodes() if state not in visited)
+        index = {state: i for i, state in enumerate(order)}
+
+        # Every state maps to an interval. States in loops span the entire loop.
+        intervals: Dict[SDFGState, Interval] = {}
+        for component in nx.strongly_connected_components(sdfg.nx):
+            if outer is not None:
+                span = outer
+            elif len(component) > 1 or any(sdfg.edges_between(s, s) for s in component):
+                span = (min(index[s] for s in component), max(index[s] for s in component))
+            else:
+                span = (index[next(iter(component))], ) * 2
+            for state in component:
+                intervals[state] = span
+
+        def use(name: str, state: SDFGState):
+            key = (sdfg.sdfg_id, name)
+            start, end = intervals[state]
+            if key in lifetimes:
+                prev_start, prev_end = lifetimes[key]
+                start, end = min(start, prev_start), max(end, prev_end)
+            lifetimes[key] = (start, end)
+
+        for state in order:
+            sdict = state.scope_dict()
+            for node in state.nodes():
+                if isinstance(node, nodes.AccessNode):
+                    use(node.data, state)
+                    # Data used within scopes (or zero-initialized on allocation) is allocated in place
+                    if sdict[node] is not None or node.setzero:
+                        ineligible.add((sdfg.sdfg_id, node.data))
+                elif isinstance(node, nodes.NestedSDFG):
+                    if sdict[node] is None:
+                        self._collect_lifetimes(node.sdfg, intervals[state], lifetimes, ineligible)
+
+        for edge in sdfg.edges():
+            for name in edge.data.free_symbols & sdfg.arrays.keys():
+                use(name, edge.src)
+                use(name, edge.dst)
+
+        for name, desc in sdfg.arrays.items():
+            if not self._is_eligible(sdfg, name, desc):
+                ineligible.add((sdfg.sdfg_id, name))
+
+    @staticmethod
+    def _is_eligible(sdfg: SDFG, name: str, desc: data.Data) -> bool:
+        if not desc.transient or type(desc) is not data.Array:
+            return False
+        # Default storage outside of scopes is resolved to the CPU heap
+        if desc.storage not in (dtypes.StorageType.Default, dtypes.StorageType.CPU_Heap):
+            return False
+        if desc.lifetime not in (dtypes.AllocationLifetime.Scope, dtypes.AllocationLifetime.State,
+                                 dtypes.AllocationLifetime.SDFG):
+            return False
+        if desc.start_offset != 0 or isinstance(desc.dtype, dtypes.opaque):
+            return False
+        return name not in sdfg.constants_prop
+
+    def _size_in_bytes(self, top_sdfg: SDFG, top_symbols: Set[str], key: ArenaKey) -> Optional[symbolic.SymbolicType]:
+        """
+        Returns the aligned size of a transient in terms of the free symbols of the top-level SDFG, or None if the size
+        depends on other symbols.
+        """
+        sdfg = top_sdfg.sdfg_list[key[0]]
+        desc = sdfg.arrays[key[1]]
+        size = sympy.sympify(desc.total_size * desc.dtype.bytes)
+
+        # Translate symbols to the top-level SDFG
+        while True:
+            constants = {k: v for k, v in sdfg.constants.items() if isinstance(v, numbers.Number)}
+            size = size.subs({s: constants[str(s)] for s in size.free_symbols if str(s) in constants})
+            if sdfg is top_sdfg:
+                break
+            mapping = sdfg.parent_nsdfg_node.symbol_mapping
+            if any(str(s) not in mapping for s in size.free_symbols):
+                return None
+            size = size.subs({s: symbolic.pystr_to_symbolic(mapping[str(s)])
+                              for s in size.free_symbols},
+                             simultaneous=True)
+            sdfg = sdfg.parent_sdfg
+
+        if any(str(s) not in top_symbols for s in size.free_symbols):
+            return None
+
+        if size.is_Number:
+            return int(symbolic.int_ceil(int(size), self.alignment)) * self.alignment
+        return symbolic.int_ceil(size, self.alignment) * self.alignment
+
+    @staticmethod
+    def _pack(buffers: List[_Buffer]) -> ArenaPlan:
+        plan = ArenaPlan()
+        for buf in buffers:
+            plan.sizes[buf.key] = buf.size
+            plan.lifetimes[buf.key] = (buf.start, buf.end)
+
+        # Constant-size buffers: greedy by size, placing each buffer in the smallest gap between the buffers that are
+        # live at the same time
+        placed: List[Tuple[int, _Buffer]] = []
+        constant_size = 0
+        for buf in sorted((b for b in buffers if isinstance(b.size, int)), key=lambda b: (-b.size, b.start, b.key)):
+            best_offset, best_gap = None, None
+            offset = 0
+            for other_offset, other in sorted((p for p in placed if p[1].overlaps(buf)), key=lambda p: p[0]):
+                gap = other_offset - offset
+                if gap >= buf.size and (best_gap is None or gap < best_gap):
+                    best_offset, best_gap = offset, gap
+                offset = max(offset, other_offset + other.size)
+            if best_offset is None:
+                best_offset = offset
+            placed.append((best_offset, buf))
+            plan.offsets[buf.key] = best_offset
+            constant_size = max(constant_size, best_offset + buf.size)
+
+        # Symbolic-size buffers: greedy interval coloring into slots, preferring slots of the same size
+        slots: List[List[_Buffer]] = []
+        for buf in sorted((b for b in buffers if not isinstance(b.size, int)), key=lambda b: (b.start, b.key)):
+            candidates = [slot for slot in slots if not any(buf.overlaps(other) for other in slot)]
+            same_size = [slot for slot in candidates if any(other.size == buf.size for other in slot)]
+            if same_size:
+                same_size[0].append(buf)
+            elif candidates:
+                candidates[0].append(buf)
+            else:
+                slots.append([buf])
+
+        plan.size = constant_size
+        for slot in slots:
+            sizes = []
+            for buf in slot:
+                plan.offsets[buf.key] = plan.size
+                if buf.size not in sizes:
+                    sizes.append(buf.size)
+            plan.size = plan.size + (sympy.Max(*sizes) if len(sizes) > 1 else sizes[0])
+
+        return plan
@@ -117,5 +117,8 @@ class OptionalArrayInference(ppl.Pass):
         # Yield final state
         yield curstate
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: Set[Tuple[int, str]]) -> Set[SDFG]:
+        return {sdfg.sdfg_list[sdfg_id] for sdfg_id, _ in pass_retval}
+
     def report(self, pass_retval: Set[Tuple[int, str]]) -> str:
         return f'Inferred {len(pass_retval)} optional arrays.'
@@ -2,18 +2,93 @@
 """ Contains functions related to pattern matching in transformations. """
 
 import collections
+import concurrent.futures
+import copy
 from dataclasses import dataclass
+import io
+import multiprocessing
+import os
 import time
 
-from dace import properties
+from dace import properties, serialize
 from dace.config import Config
 from dace.sdfg import SDFG, SDFGState
 from dace.sdfg import graph as gr, nodes as nd
 import networkx as nx
 from networkx.algorithms import isomorphism as iso
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
-from dace.sdfg.validation import InvalidSDFGError
-from dace.transformation import transformation as xf, pass_pipeline as ppl
+from dace.sdfg.validation import InvalidSDFGError, validate_nodes
+from dace.transformation import transformation as xf, pass_pipeline as ppl, profiling
+
+
+class _ModifiedRegion:
+    """
+    Keeps track of the part of an SDFG state that a pattern-matching transformation is about to modify, such that
+    only that part has to be validated after applying it (see the ``optimizer.incremental_validation`` configuration
+    entry). The region consists of the nodes the transformation matched (see
+    ``dace.sdfg.analysis.cutout._transformation_determine_affected_nodes``), the nodes and edges it added, their
+    neighbors, and the entry and exit nodes of their scopes.
+    """
+
+    def __init__(self, match: xf.PatternTransformation, sdfg: SDFG) -> None:
+        # Avoid import loop
+        from dace.sdfg.analysis.cutout import _transformation_determine_affected_nodes
+
+        self.sdfg = sdfg
+        self.state: Optional[SDFGState] = None
+        if match.state_id < 0 or not Config.get_bool('optimizer', 'incremental_validation'):
+            return
+
+        self.state = sdfg.node(match.state_id)
+        self.nodes = set(self.state.nodes())
+        self.edges = set(self.state.edges())
+        matched = _transformation_determine_affected_nodes(sdfg, match)
+        self.affected = set(matched)
+        for node in matched:
+            for e in self.state.all_edges(node):
+                self.affected.add(e.src)
+                self.affected.add(e.dst)
+
+        # The rest of the SDFG is expected to remain unmodified
+        self.version = (sdfg._mutation_count, sdfg.start_state)
+        self.states = {state: state._mutation_count for state in sdfg.nodes() if state is not self.state}
+        self.arrays = set(sdfg.arrays.keys())
+
+    def _modified_elsewhere(self) -> bool:
+        return (self.version != (self.sdfg._mutation_count, self.sdfg.start_state)
+                or any(state._mutation_count != count for state, count in self.states.items())
+                or not self.arrays <= self.sdfg.arrays.keys())
+
+    def validate(self, sdfg: SDFG) -> None:
+        """
+        Validates the modified region after the transformation has been applied. Falls back to validating the entire
+        SDFG if the transformation is not local to a single state, or if it modified other parts of the SDFG.
+
+        :param sdfg: The top-level SDFG.
+        """
+        if self.state is None or self._modified_elsewhere():
+            sdfg.validate()
+            return
+
+        state = self.state
+        nodes = set(state.nodes())
+        affected = (self.affected & nodes) | (nodes - self.nodes)
+        for e in state.edges():
+            if e not in self.edges:
+                affected.add(e.src)
+                affected.add(e.dst)
+
+        # Add scope neighbors
+        sdict = state.scope_dict()
+        for node in list(affected):
+            entry = sdict[node]
+            if entry is not None:
+                affected.add(entry)
+                affected.add(state.exit_node(entry))
+            if isinstance(node, nd.EntryNode):
+                affected.add(state.exit_node(node))
+
+        validate_nodes(state, affected)
 
 
 @dataclass
@@ -109,12 +184,16 @@ class PatternMatchAndApply(ppl.Pass):
             # Set previous pipeline results
             match._pipeline_results = pipeline_results
 
-            result = match.apply(graph, tsdfg)
-            applied_transformations[type(match).__name__].append(result)
+            name = type(match).__name__
+            region = _ModifiedRegion(match, tsdfg) if self.validate_all else None
+            with profiling.measure(name, 'apply_time'):
+                result = match.apply(graph, tsdfg)
+            applied_transformations[name].append(result)
             if self.validate_all:
-                sdfg.validate()
+                with profiling.measure(name, 'validation_time'):
+                    region.validate(sdfg)
 
-        if self.validate:
+        if self.validate or self.validate_all:
             sdfg.validate()
 
         if (len(applied_transformations) > 0
@@ -164,15 +243,19 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
 
         if self.validate_all:
             match_name = match.print_match(tsdfg)
+            region = _ModifiedRegion(match, tsdfg)
 
-        applied_transformations[type(match).__name__].append(match.apply(graph, tsdfg))
+        name = type(match).__name__
+        with profiling.measure(name, 'apply_time'):
+            applied_transformations[name].append(match.apply(graph, tsdfg))
         if self.progress or (self.progress is None and (time.time() - start) > 5):
             print('Applied {}.\r'.format(', '.join(['%d %s' % (len(v), k)
                                                     for k, v in applied_transformations.items()])),
                   end='')
         if self.validate_all:
             try:
-                sdfg.validate()
+                with profiling.measure(name, 'validation_time'):
+                    region.validate(sdfg)
             except InvalidSDFGError as err:
                 raise InvalidSDFGError(
                     f'Validation failed after applying {match_name}. '
@@ -195,6 +278,37 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
         if len(xforms) != len(set(xforms)):
             raise ValueError('Transformation set must be unique')
 
+        # Keep pattern matching results between applications, such that only modified graphs are matched again
+        index = MatchIndex() if Config.get_bool('optimizer', 'incremental_matching') else None
+        verified = False
+
+        # Check all candidates in parallel before every full sweep over the SDFG
+        processes = Config.get('optimizer', 'match_processes') if index is not None else 1
+        prefetched = False
+
+        def find_match(patterns: List[xf.PatternTransformation]) -> Optional[xf.PatternTransformation]:
+            nonlocal verified, prefetched
+            if processes != 1 and not prefetched:
+                index.prefetch(sdfg, self._metadata, self.transformations, self.permissive, self.states, processes)
+                prefetched = True
+            for match in match_patterns(sdfg,
+                                        permissive=self.permissive,
+                                        patterns=patterns,
+                                        states=self.states,
+                                        metadata=self._metadata,
+                                        index=index):
+                verified = False
+                return match
+            if index is None or verified:
+                return None
+
+            # Candidates rejected in unmodified graphs may still become applicable through modifications elsewhere
+            # (e.g., of data descriptors). Check all candidates again before concluding that none match
+            index.forget_rejections()
+            verified = True
+            prefetched = False
+            return find_match(patterns)
+
         if self.order_by_transformation:
             applied_anything = True
             while applied_anything:
@@ -203,15 +317,11 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
                     applied = True
                     while applied:
                         applied = False
-                        for match in match_patterns(sdfg,
-                                                    permissive=self.permissive,
-                                                    patterns=[xform],
-                                                    states=self.states,
-                                                    metadata=self._metadata):
+                        match = find_match([xform])
+                        if match is not None:
                             self._apply_and_validate(match, sdfg, start, pipeline_results, applied_transformations)
                             applied = True
                             applied_anything = True
-                            break
                 if apply_once:
                     break
         else:
@@ -219,18 +329,15 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
             while applied:
                 applied = False
                 # Find and apply one of the chosen transformations
-                for match in match_patterns(sdfg,
-                                            permissive=self.permissive,
-                                            patterns=xforms,
-                                            states=self.states,
-                                            metadata=self._metadata):
+                match = find_match(xforms)
+                if match is not None:
                     self._apply_and_validate(match, sdfg, start, pipeline_results, applied_transformations)
                     applied = True
-                    break
                 if apply_once:
                     break
 
-        if self.validate:
+        # With ``validate_all``, the SDFG is only partially validated after each application. Validate it entirely
+        if self.validate or self.validate_all:
             try:
                 sdfg.validate()
             except InvalidSDFGError as err:
@@ -303,6 +410,9 @@ def collapse_multigraph_to_nx(graph: Union[gr.MultiDiGraph, gr.OrderedMultiDiGra
     result.add_nodes_from(digraph_nodes)
     result.add_edges_from(digraph_edges)
 
+    # Node numbers are equal to node IDs as long as the graph is not modified
+    result.graph['mutation_count'] = getattr(graph, '_mutation_count', None)
+
     return result
 
 
@@ -350,33 +460,58 @@ def type_or_class_match(node_a, node_b):
     return isinstance(node_a['node'], type(node_b['node']))
 
 
-def _try_to_match_transformation(graph: Union[SDFG, SDFGState], collapsed_graph: nx.DiGraph, subgraph: Dict[int, int],
-                                 sdfg: SDFG, xform: Union[xf.PatternTransformation, Type[xf.PatternTransformation]],
-                                 expr_idx: int, nxpattern: nx.DiGraph, state_id: int, permissive: bool,
-                                 options: Dict[str, Any]) -> Optional[xf.PatternTransformation]:
+def _transformation_name(xform: Union[xf.PatternTransformation, Type[xf.PatternTransformation]]) -> str:
+    return xform.__name__ if isinstance(xform, type) else type(xform).__name__
+
+
+def _instantiate_transformation(xform: Union[xf.PatternTransformation, Type[xf.PatternTransformation]],
+                                options: Optional[Dict[str, Any]]) -> xf.PatternTransformation:
+    """ Returns the given transformation object, or constructs one from a transformation type and options. """
+    if isinstance(xform, xf.PatternTransformation):
+        return xform
+
+    # Construct directly from type with options
+    opts = options or {}
+    try:
+        match = xform(**opts)
+    except TypeError:
+        # Backwards compatibility, transformation does not support ctor arguments
+        match = xform()
+        # Set manually
+        for oname, oval in opts.items():
+            setattr(match, oname, oval)
+    return match
+
+
+def _try_to_match_transformation(
+        graph: Union[SDFG, SDFGState],
+        collapsed_graph: nx.DiGraph,
+        subgraph: Dict[int, int],
+        sdfg: SDFG,
+        xform: Union[xf.PatternTransformation, Type[xf.PatternTransformation]],
+        expr_idx: int,
+        nxpattern: nx.DiGraph,
+        state_id: int,
+        permissive: bool,
+        options: Dict[str, Any],
+        profile: Optional[profiling.TransformationProfile] = None) -> Optional[xf.PatternTransformation]:
     """ 
     Helper function that tries to instantiate a pattern match into a 
     transformation object. 
     """
-    subgraph = {
-        nxpattern.nodes[j]['node']: graph.node_id(collapsed_graph.nodes[i]['node'])
-        for i, j in subgraph.items()
-    }
+    if profile is not None:
+        start = time.perf_counter()
+    if (collapsed_graph.graph.get('mutation_count') is not None
+            and collapsed_graph.graph['mutation_count'] == getattr(graph, '_mutation_count', None)):
+        subgraph = {nxpattern.nodes[j]['node']: i for i, j in subgraph.items()}
+    else:
+        subgraph = {
+            nxpattern.nodes[j]['node']: graph.node_id(collapsed_graph.nodes[i]['node'])
+            for i, j in subgraph.items()
+        }
 
     try:
-        if isinstance(xform, xf.PatternTransformation):
-            match = xform
-        else:  # Construct directly from type with options
-            opts = options or {}
-            try:
-                match = xform(**opts)
-            except TypeError:
-                # Backwards compatibility, transformation does not support ctor arguments
-                match = xform()
-                # Set manually
-                for oname, oval in opts.items():
-                    setattr(match, oname, oval)
-
+        match = _instantiate_transformation(xform, options)
         match.setup_match(sdfg, sdfg.sdfg_id, state_id, subgraph, expr_idx, options=options)
         match_found = match.can_be_applied(graph, expr_idx, sdfg, permissive=permissive)
     except Exception as e:
@@ -388,7 +523,14 @@ def _try_to_match_transformation(graph: Union[SDFG, SDFGState], collapsed_graph:
             xft = xform
         print('WARNING: {p}::can_be_applied triggered a {c} exception:'
               ' {e}'.format(p=xft.__name__, c=e.__class__.__name__, e=e))
-        return None
+        match_found = False
+
+    if profile is not None:
+        stats = profile[_transformation_name(xform)]
+        stats.can_be_applied_time += time.perf_counter() - start
+        stats.candidates += 1
+        if not match_found:
+            stats.rejected += 1
 
     if match_found:
         return match
@@ -475,6 +617,200 @@ def _edge_matcher(digraph, nxpattern, node_pred, edge_pred):
                 yield {u: pedge[0], v: pedge[1]}
 
 
+class _LazyList:
+    """ A list that is filled on demand from a generator, and can be iterated multiple times. """
+
+    def __init__(self, generator: Iterator[Any]):
+        self._items = []
+        self._generator = generator
+
+    def __iter__(self):
+        i = 0
+        while True:
+            if i == len(self._items):
+                if self._generator is None:
+                    return
+                try:
+                    self._items.append(next(self._generator))
+                except StopIteration:
+                    self._generator = None
+                    return
+            yield self._items[i]
+            i += 1
+
+
+class _GraphMatchIndex:
+    """ Pattern matching information of a single graph (SDFG or state), valid until the graph is modified. """
+
+    def __init__(self, graph: Union[SDFG, SDFGState]):
+        self.mutation_count = graph._mutation_count
+        self.digraph = collapse_multigraph_to_nx(graph)
+
+        # Node numbers by exact node type
+        self._nodes_by_type: Dict[type, List[int]] = collections.defaultdict(list)
+        for nid, ndata in self.digraph.nodes(data=True):
+            self._nodes_by_type[type(ndata['node'])].append(nid)
+        self._nodes_by_pattern_type: Dict[type, List[int]] = {}
+
+        # Candidate subgraphs, rejected candidates, and whether all candidates were rejected, per pattern
+        self.candidates: Dict[int, _LazyList] = {}
+        self.rejected: Dict[int, Dict[Tuple[Tuple[int, int], ...], Any]] = {}
+        self.exhausted: Dict[int, Any] = {}
+
+    def nodes_of_type(self, node_type: type) -> List[int]:
+        """ Returns the numbers of the nodes that are instances of the given type, in ascending order. """
+        result = self._nodes_by_pattern_type.get(node_type)
+        if result is None:
+            result = sorted(nid for t, nids in self._nodes_by_type.items() if issubclass(t, node_type) for nid in nids)
+            self._nodes_by_pattern_type[node_type] = result
+        return result
+
+    def match(self, nxpattern: nx.DiGraph, matcher: Callable) -> Iterator[Dict[int, int]]:
+        """ Equivalent to calling the matcher with ``type_match`` and no edge matching, using the node type index. """
+        pattern_types = {}
+        for pnid, pdata in nxpattern.nodes(data=True):
+            pnode = pdata['node']
+            pattern_types[pnid] = pnode.node if isinstance(pnode, xf.PatternNode) else type(pnode)
+            if len(self.nodes_of_type(pattern_types[pnid])) == 0:
+                return
+
+        if matcher is _node_matcher:
+            pnid = next(iter(nxpattern))
+            for nid in self.nodes_of_type(pattern_types[pnid]):
+                yield {nid: pnid}
+        elif matcher is _edge_matcher:
+            pu, pv = next(iter(nxpattern.edges))
+            destinations = set(self.nodes_of_type(pattern_types[pv]))
+            for u in self.nodes_of_type(pattern_types[pu]):
+                for v in self.digraph.adj[u]:
+                    if v in destinations and u != v:
+                        yield {u: pu, v: pv}
+        else:
+            yield from matcher(self.digraph, nxpattern, type_match, None)
+
+
+class MatchIndex:
+    """
+    An index of pattern matching results that persists across calls to ``match_patterns``, e.g., while transformations
+    are applied repeatedly. For every graph (SDFG or state), the index keeps the collapsed graph, its nodes by type,
+    the candidate subgraphs of each pattern, and the candidates that ``can_be_applied`` rejected. Information about a
+    graph is recomputed only after the graph is structurally modified, and graphs in which all candidates of a pattern
+    were rejected are skipped until then.
+
+    Since ``can_be_applied`` may inspect other parts of the SDFG, rejections can become outdated without the graph
+    itself being modified. Call ``forget_rejections`` and match again before concluding that no more matches exist.
+    """
+
+    def __init__(self):
+        self._graphs: Dict[Union[SDFG, SDFGState], _GraphMatchIndex] = {}
+        # Keeps the transformation metadata alive, since results are keyed by its object ID
+        self._patterns: Dict[int, Tuple] = {}
+
+    def graph(self, graph: Union[SDFG, SDFGState]) -> _GraphMatchIndex:
+        """ Returns the up-to-date pattern matching information of the given graph. """
+        result = self._graphs.get(graph)
+        if result is None or result.mutation_count != graph._mutation_count:
+            result = _GraphMatchIndex(graph)
+            self._graphs[graph] = result
+        return result
+
+    def register(self, xform_data: Tuple) -> int:
+        """ Returns the key under which results of the given transformation metadata entry are stored. """
+        self._patterns.setdefault(id(xform_data), xform_data)
+        return id(xform_data)
+
+    def forget_rejections(self):
+        """ Forgets which candidates were rejected, keeping the collapsed graphs and candidate subgraphs. """
+        for gindex in self._graphs.values():
+            gindex.rejected.clear()
+            gindex.exhausted.clear()
+
+    def prefetch(self,
+                 sdfg: SDFG,
+                 metadata: PatternMetadataType,
+                 patterns: List[xf.PatternTransformation],
+                 permissive: bool = False,
+                 states: Optional[List[SDFGState]] = None,
+                 processes: Optional[int] = None):
+        """
+        Checks all candidates of the given patterns in every graph in parallel (see ``match_patterns_parallel``), and
+        records the rejected candidates in the index. Subsequent calls to ``match_patterns`` with the same metadata
+        then only check the accepted candidates.
+
+        :param sdfg: The SDFG to match in.
+        :param metadata: Transformation metadata of the patterns, as used in later calls to ``match_patterns``.
+        :param patterns: The transformations from which the metadata was computed.
+        :param permissive: Match transformations in permissive mode.
+        :param states: If given, only matches single-state transformations in these states.
+        :param processes: Number of worker processes. If None or 0, uses the number of processors.
+        """
+        sdfgs = list(sdfg.all_sdfgs_recursive())
+        units = _matching_units(sdfgs, metadata, states)
+        results = _match_units_in_processes(sdfg, sdfgs, metadata, patterns, None, permissive, units, processes)
+        for (sdfg_index, state_id), unit_results in zip(units, results):
+            tsdfg = sdfgs[sdfg_index]
+            graph = tsdfg if state_id == -1 else tsdfg.node(state_id)
+            gindex = self.graph(graph)
+            for xform_data, (accepted, rejected) in zip(metadata[0] if state_id == -1 else metadata[1], unit_results):
+                key = self.register(xform_data)
+                if len(accepted) == 0:
+                    gindex.exhausted[key] = (tuple(state._mutation_count
+                                                   for state in graph.nodes()) if state_id == -1 else None)
+                if len(rejected) == 0:
+                    continue
+                if key not in gindex.candidates:
+                    gindex.candidates[key] = _LazyList(gindex.match(xform_data[2], xform_data[3]))
+                rejected = set(rejected)
+                rejections = gindex.rejected.setdefault(key, {})
+                for subgraph in gindex.candidates[key]:
+                    if tuple(sorted(subgraph.items())) in rejected:
+                        rejections[tuple(subgraph.items())] = (tuple(gindex.digraph.nodes[i]['node']._mutation_count
+                                                                     for i in subgraph) if state_id == -1 else None)
+
+
+def _match_indexed(index: MatchIndex,
+                   graph: Union[SDFG, SDFGState],
+                   sdfg: SDFG,
+                   xform_data: Tuple,
+                   state_id: int,
+                   permissive: bool,
+                   profile: Optional[profiling.TransformationProfile] = None) -> Iterator[xf.PatternTransformation]:
+    """ Matches one pattern expression in a graph, skipping candidates that were rejected before. """
+    xform, expr_idx, nxpattern, matcher, opts = xform_data
+    gindex = index.graph(graph)
+    key = index.register(xform_data)
+
+    # For inter-state patterns, rejections also depend on the contents of the states
+    if state_id == -1:
+        signature = tuple(state._mutation_count for state in graph.nodes())
+    else:
+        signature = None
+    if key in gindex.exhausted and gindex.exhausted[key] == signature:
+        return
+
+    if key not in gindex.candidates:
+        gindex.candidates[key] = _LazyList(gindex.match(nxpattern, matcher))
+    rejected = gindex.rejected.setdefault(key, {})
+
+    found = False
+    for subgraph in profiling.timed(gindex.candidates[key], profile, _transformation_name(xform)):
+        candidate = tuple(subgraph.items())
+        if state_id == -1:
+            signature = tuple(gindex.digraph.nodes[i]['node']._mutation_count for i in subgraph)
+        if candidate in rejected and rejected[candidate] == signature:
+            continue
+        match = _try_to_match_transformation(graph, gindex.digraph, subgraph, sdfg, xform, expr_idx, nxpattern,
+                                             state_id, permissive, opts, profile)
+        if match is None:
+            rejected[candidate] = signature
+        else:
+            found = True
+            yield match
+
+    if not found:
+        gindex.exhausted[key] = (tuple(state._mutation_count for state in graph.nodes()) if state_id == -1 else None)
+
+
 def match_patterns(sdfg: SDFG,
                    patterns: Union[Type[xf.PatternTransformation], List[Type[xf.PatternTransformation]]],
                    node_match: Callable[[Any, Any], bool] = type_match,
@@ -482,7 +818,8 @@ def match_patterns(sdfg: SDFG,
                    permissive: bool = False,
                    metadata: Optional[PatternMetadataType] = None,
                    states: Optional[List[SDFGState]] = None,
-                   options: Optional[List[Dict[str, Any]]] = None):
+                   options: Optional[List[Dict[str, Any]]] = None,
+                   index: Optional[MatchIndex] = None):
     """ Returns a generator of Transformations that match the input SDFG. 
         Ordered by SDFG ID.
 
@@ -496,6 +833,9 @@ def match_patterns(sdfg: SDFG,
                        transformations on this list.
         :param options: An optional iterable of transformation parameter
                         dictionaries.
+        :param index: An optional match index that keeps results between
+                      calls. Only used with the default node and edge
+                      matching functions.
         :return: A list of PatternTransformation objects that match.
     """
 
@@ -514,6 +854,21 @@ def match_patterns(sdfg: SDFG,
 
     # Collect SDFG and nested SDFGs
     sdfgs = sdfg.all_sdfgs_recursive()
+    profile = profiling.current_profile()
+
+    if index is not None and node_match is type_match and edge_match is None:
+        for tsdfg in sdfgs:
+            for xform_data in interstate_transformations:
+                yield from _match_indexed(index, tsdfg, tsdfg, xform_data, -1, permissive, profile)
+
+            if len(singlestate_transformations) == 0:
+                continue
+            for state_id, state in enumerate(tsdfg.nodes()):
+                if states is not None and state not in states:
+                    continue
+                for xform_data in singlestate_transformations:
+                    yield from _match_indexed(index, state, tsdfg, xform_data, state_id, permissive, profile)
+        return
 
     # Try to find transformations on each SDFG
     for tsdfg in sdfgs:
@@ -524,9 +879,10 @@ def match_patterns(sdfg: SDFG,
             digraph = collapse_multigraph_to_nx(tsdfg)
 
         for xform, expr_idx, nxpattern, matcher, opts in interstate_transformations:
-            for subgraph in matcher(digraph, nxpattern, node_match, edge_match):
+            for subgraph in profiling.timed(matcher(digraph, nxpattern, node_match, edge_match), profile,
+                                            _transformation_name(xform)):
                 match = _try_to_match_transformation(tsdfg, digraph, subgraph, tsdfg, xform, expr_idx, nxpattern, -1,
-                                                     permissive, opts)
+                                                     permissive, opts, profile)
                 if match is not None:
                     yield match
 
@@ -542,13 +898,166 @@ def match_patterns(sdfg: SDFG,
             digraph = collapse_multigraph_to_nx(state)
 
             for xform, expr_idx, nxpattern, matcher, opts in singlestate_transformations:
-                for subgraph in matcher(digraph, nxpattern, node_match, edge_match):
+                for subgraph in profiling.timed(matcher(digraph, nxpattern, node_match, edge_match), profile,
+                                                _transformation_name(xform)):
                     match = _try_to_match_transformation(state, digraph, subgraph, tsdfg, xform, expr_idx, nxpattern,
-                                                         state_id, permissive, opts)
+                                                         state_id, permissive, opts, profile)
                     if match is not None:
                         yield match
 
 
+# Per-process data of pattern matching worker processes: the snapshot SDFG and its nested SDFGs, the transformation
+# metadata, and whether to match in permissive mode
+_match_process_data: Optional[Tuple[List[SDFG], PatternMetadataType, bool]] = None
+
+
+def _matching_units(sdfgs: List[SDFG], metadata: PatternMetadataType,
+                    states: Optional[List[SDFGState]]) -> List[Tuple[int, int]]:
+    """
+    Returns the graphs in which patterns are matched, in the order of ``match_patterns``, as pairs of an index into
+    the list of SDFGs and a state ID (or -1 for inter-state transformations).
+    """
+    interstate_transformations, singlestate_transformations = metadata
+    units = []
+    for sdfg_index, tsdfg in enumerate(sdfgs):
+        if len(interstate_transformations) > 0:
+            units.append((sdfg_index, -1))
+        if len(singlestate_transformations) > 0:
+            units.extend((sdfg_index, state_id) for state_id, state in enumerate(tsdfg.nodes())
+                         if states is None or state in states)
+    return units
+
+
+def _match_unit(
+        data: Tuple[List[SDFG], PatternMetadataType, bool],
+        unit: Tuple[int, int]) -> List[Tuple[List[Tuple[Tuple[int, int], ...]], List[Tuple[Tuple[int, int], ...]]]]:
+    """
+    Checks all candidates of every pattern expression in one graph.
+
+    :return: For every transformation metadata entry, the lists of accepted and rejected candidates, each candidate
+             given as sorted pairs of collapsed graph node numbers and pattern node numbers.
+    """
+    sdfgs, (interstate_transformations, singlestate_transformations), permissive = data
+    sdfg_index, state_id = unit
+    tsdfg = sdfgs[sdfg_index]
+    graph = tsdfg if state_id == -1 else tsdfg.node(state_id)
+    gindex = _GraphMatchIndex(graph)
+
+    results = []
+    for xform, expr_idx, nxpattern, matcher, opts in (interstate_transformations
+                                                      if state_id == -1 else singlestate_transformations):
+        accepted, rejected = [], []
+        for subgraph in gindex.match(nxpattern, matcher):
+            match = _try_to_match_transformation(graph, gindex.digraph, subgraph, tsdfg, xform, expr_idx, nxpattern,
+                                                 state_id, permissive, opts)
+            (rejected if match is None else accepted).append(tuple(sorted(subgraph.items())))
+        results.append((accepted, rejected))
+    return results
+
+
+def _match_process_initializer(config: Dict[str, Any], snapshot: bytes, patterns: List[xf.PatternTransformation],
+                               options: Optional[List[Dict[str, Any]]], permissive: bool):
+    global _match_process_data
+    Config._config = config
+    tree, arrays = serialize.load_binary(io.BytesIO(snapshot))
+    with serialize.raw_arrays(arrays):
+        sdfg = SDFG.from_json(tree)
+    _match_process_data = (list(sdfg.all_sdfgs_recursive()), get_transformation_metadata(patterns, options), permissive)
+
+
+def _match_process_worker(unit: Tuple[int, int]):
+    return _match_unit(_match_process_data, unit)
+
+
+def _match_units_in_processes(sdfg: SDFG, sdfgs: List[SDFG], metadata: PatternMetadataType,
+                              patterns: List[xf.PatternTransformation], options: Optional[List[Dict[str, Any]]],
+                              permissive: bool, units: List[Tuple[int, int]], processes: Optional[int]):
+    """
+    Checks all candidates in the given graphs (see ``_match_unit``) in a pool of processes. Every process loads a
+    snapshot of the SDFG and computes the transformation metadata from the patterns, such that results can be
+    associated with the metadata entries of the calling process by their position.
+    """
+    if not processes:
+        processes = os.cpu_count() or 1
+    if processes == 1 or len(units) <= 1:
+        return [_match_unit((sdfgs, metadata, permissive), unit) for unit in units]
+
+    snapshot = io.BytesIO()
+    with serialize.raw_arrays():
+        serialize.dump_binary(sdfg.to_json(), snapshot)
+
+    context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(processes, len(units)),
+                                                mp_context=context,
+                                                initializer=_match_process_initializer,
+                                                initargs=(Config._config, snapshot.getvalue(), patterns, options,
+                                                          permissive)) as pool:
+        return list(pool.map(_match_process_worker, units, chunksize=max(1, len(units) // (4 * processes))))
+
+
+def match_patterns_parallel(sdfg: SDFG,
+                            patterns: Union[Type[xf.PatternTransformation], List[Type[xf.PatternTransformation]]],
+                            permissive: bool = False,
+                            states: Optional[List[SDFGState]] = None,
+                            options: Optional[List[Dict[str, Any]]] = None,
+                            processes: Optional[int] = None) -> List[xf.PatternTransformation]:
+    """ Returns a list of Transformations that match the input SDFG, in the
+        same order as ``match_patterns``. Patterns are matched (and checked
+        with ``can_be_applied``) in all states and nested SDFGs in a pool of
+        processes, each working on a read-only snapshot of the SDFG. The
+        transformations must therefore be importable in a new process.
+
+        :param sdfg: The SDFG to match in.
+        :param patterns: PatternTransformation type (or list thereof) to match.
+        :param permissive: Match transformations in permissive mode.
+        :param states: If given, only tries to match single-state
+                       transformations on this list.
+        :param options: An optional iterable of transformation parameter
+                        dictionaries.
+        :param processes: Number of worker processes. If None or 0, uses the
+                          number of processors. If 1, matches in the current
+                          process.
+        :return: A list of PatternTransformation objects that match.
+    """
+    if isinstance(patterns, (type, xf.PatternTransformation)):
+        patterns = [patterns]
+    if isinstance(options, dict):
+        options = [options]
+
+    metadata = get_transformation_metadata(patterns, options)
+    sdfgs = list(sdfg.all_sdfgs_recursive())
+    units = _matching_units(sdfgs, metadata, states)
+    results = _match_units_in_processes(sdfg, sdfgs, metadata, patterns, options, permissive, units, processes)
+
+    matches = []
+    for (sdfg_index, state_id), unit_results in zip(units, results):
+        tsdfg = sdfgs[sdfg_index]
+        graph = tsdfg if state_id == -1 else tsdfg.node(state_id)
+        gindex = None
+        for (xform, expr_idx, nxpattern, matcher,
+             opts), (accepted, _) in zip(metadata[0] if state_id == -1 else metadata[1], unit_results):
+            if len(accepted) == 0:
+                continue
+            # Enumerate the candidates again to return matches in the same order as ``match_patterns``
+            gindex = gindex or _GraphMatchIndex(graph)
+            accepted = set(accepted)
+            for subgraph in gindex.match(nxpattern, matcher):
+                if tuple(sorted(subgraph.items())) not in accepted:
+                    continue
+                match = _instantiate_transformation(
+                    copy.copy(xform) if isinstance(xform, xf.PatternTransformation) else xform, opts)
+                match.setup_match(tsdfg,
+                                  tsdfg.sdfg_id,
+                                  state_id, {
+                                      nxpattern.nodes[j]['node']: i
+                                      for i, j in subgraph.items()
+                                  },
+                                  expr_idx,
+                                  options=opts)
+                matches.append(match)
+    return matches
+
+
 def enumerate_matches(sdfg: SDFG,
                       pattern: gr.Graph,
                       node_match=type_or_class_match,
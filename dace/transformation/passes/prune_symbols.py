@@ -66,6 +66,11 @@ class RemoveUnusedSymbols(ppl.Pass):
         # Return result
         return result or None
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: Set[Tuple[int, str]]) -> Set[SDFG]:
+        if not self.recursive:
+            return {sdfg}
+        return {sdfg.sdfg_list[sdfg_id] for sdfg_id, _ in pass_retval}
+
     def report(self, pass_retval: Set[str]) -> str:
         return f'Removed {len(pass_retval)} unused symbols: {pass_retval}.'
 
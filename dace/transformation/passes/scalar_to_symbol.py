@@ -727,5 +727,9 @@ class ScalarToSymbolPromotion(passes.Pass):
 
         return to_promote or None
 
+    def modified_sdfgs(self, sdfg: SDFG, pass_retval: Set[str]) -> Set[SDFG]:
+        # Reads of promoted scalars are also replaced in nested SDFGs
+        return set(sdfg.all_sdfgs_recursive())
+
     def report(self, pass_retval: Set[str]) -> str:
         return f'Promoted {len(pass_retval)} scalars to symbols.'
@@ -1,6 +1,6 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterable, Optional, Set
 
 from dace import SDFG, config, properties
 from dace.transformation import helpers as xfh
@@ -60,6 +60,8 @@ class SimplifyPass(ppl.FixedPointPipeline):
             passes = [p() for p in SIMPLIFY_PASSES]
 
         super().__init__(passes=passes)
+        # SDFGs modified by the last pass that was applied to each SDFG separately, or None if unknown
+        self._nonrecursive_modified: Optional[Set[SDFG]] = None
         self.validate = validate
         self.validate_all = validate_all
         self.skip = skip or set()
@@ -74,13 +76,20 @@ class SimplifyPass(ppl.FixedPointPipeline):
         """
         if type(p) in _nonrecursive_passes:  # If pass needs to run recursively, do so and modify return value
             ret: Dict[int, Any] = {}
-            for sd in sdfg.all_sdfgs_recursive():
+            self._nonrecursive_modified = set()
+            for sd in self.pending_sdfgs(sdfg, p):
                 subret = p.apply_pass(sd, state)
                 if subret is not None:
                     ret[sd.sdfg_id] = subret
+                    if self._nonrecursive_modified is not None:
+                        modified = p.modified_sdfgs(sd, subret)
+                        if modified is None:
+                            self._nonrecursive_modified = None
+                        else:
+                            self._nonrecursive_modified |= modified
             ret = ret or None
         else:
-            ret = p.apply_pass(sdfg, state)
+            ret = super().apply_subpass(sdfg, p, state)
 
         if self.verbose:
             if ret is not None:
@@ -102,6 +111,12 @@ class SimplifyPass(ppl.FixedPointPipeline):
             sdfg.validate()
         return ret
 
+    def subpass_modified_sdfgs(self, sdfg: SDFG, p: ppl.Pass, retval: Any) -> Optional[Iterable[SDFG]]:
+        if type(p) in _nonrecursive_passes:
+            # Collected while applying the pass to each SDFG separately
+            return self._nonrecursive_modified
+        return super().subpass_modified_sdfgs(sdfg, p, retval)
+
     def apply_pass(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         result = super().apply_pass(sdfg, pipeline_results)
 
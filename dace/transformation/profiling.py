@@ -0,0 +1,226 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Profiling of pattern-matching transformations. Records, per transformation type, how many candidate matches were
+checked, rejected and applied, and how long matching, ``can_be_applied``, ``apply``, memlet propagation, and
+validation took. See ``dace.profile_transformations`` and the ``optimizer.profile_transformations`` configuration entry.
+"""
+import atexit
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+import json
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from dace.config import Config
+
+T = TypeVar('T')
+
+#: Report categories that are measured in seconds
+TIMES = ('match_time', 'can_be_applied_time', 'apply_time', 'propagation_time', 'validation_time')
+
+
+@dataclass
+class TransformationStatistics:
+    """
+    Profiling statistics of a single transformation type.
+    """
+    candidates: int = 0  #: Number of candidate matches that were checked with ``can_be_applied``
+    rejected: int = 0  #: Number of candidate matches that ``can_be_applied`` rejected
+    applied: int = 0  #: Number of times the transformation was applied
+    match_time: float = 0.0  #: Time spent enumerating candidate matches (in seconds)
+    can_be_applied_time: float = 0.0  #: Time spent in ``can_be_applied`` (in seconds)
+    apply_time: float = 0.0  #: Time spent in ``apply`` (in seconds)
+    propagation_time: float = 0.0  #: Time spent propagating memlets after applying (in seconds)
+    validation_time: float = 0.0  #: Time spent validating after applying (in seconds)
+
+    @property
+    def total_time(self) -> float:
+        return sum(getattr(self, t) for t in TIMES)
+
+
+class TransformationProfile:
+    """
+    A report of transformation profiling statistics, collected while pattern-matching transformations are matched and
+    applied. Reports are stored as JSON files.
+    """
+
+    def __init__(self, name: str = 'transformations') -> None:
+        self.name = name
+        self.statistics: Dict[str, TransformationStatistics] = {}
+        self.filepath: Optional[str] = None
+
+    def __getitem__(self, transformation: str) -> TransformationStatistics:
+        result = self.statistics.get(transformation)
+        if result is None:
+            result = TransformationStatistics()
+            self.statistics[transformation] = result
+        return result
+
+    def __contains__(self, transformation: str) -> bool:
+        return transformation in self.statistics
+
+    def __bool__(self) -> bool:
+        return len(self.statistics) > 0
+
+    def clear(self) -> None:
+        self.statistics.clear()
+
+    def merge(self, other: 'TransformationProfile') -> None:
+        """ Adds the statistics of another report to this report. """
+        for name, stats in other.statistics.items():
+            mine = self[name]
+            for field in fields(TransformationStatistics):
+                setattr(mine, field.name, getattr(mine, field.name) + getattr(stats, field.name))
+
+    def sorted_statistics(self, ascending: bool = False) -> List[Tuple[str, TransformationStatistics]]:
+        """ Returns pairs of transformation names and statistics, sorted by total time. """
+        return sorted(self.statistics.items(), key=lambda kv: kv[1].total_time, reverse=not ascending)
+
+    def __str__(self) -> str:
+        return self.table()
+
+    def table(self, ascending: bool = False) -> str:
+        """ Returns the report as a printable table, sorted by total time. """
+        columns = ('Candidates', 'Rejected', 'Applied', 'Match', 'Check', 'Apply', 'Propagate', 'Validate', 'Total')
+        namew = max([len('Transformation')] + [len(name) for name in self.statistics]) + 2
+        row_format = '{:<{namew}}' + '{:>12}' * len(columns) + '\n'
+
+        string = 'Transformation profile (times in ms)\n'
+        string += row_format.format('Transformation', *columns, namew=namew)
+        for name, stats in self.sorted_statistics(ascending):
+            times = ['%.3f' % (getattr(stats, t) * 1000) for t in TIMES]
+            string += row_format.format(name,
+                                        stats.candidates,
+                                        stats.rejected,
+                                        stats.applied,
+                                        *times,
+                                        '%.3f' % (stats.total_time * 1000),
+                                        namew=namew)
+        return string
+
+    def __repr__(self) -> str:
+        return 'TransformationProfile(name=%s)' % self.name
+
+    def as_csv(self) -> str:
+        """ Returns the report as a CSV string, with times in seconds. """
+        keys = [f.name for f in fields(TransformationStatistics)]
+        string = 'Transformation,' + ','.join(keys) + '\n'
+        for name, stats in self.sorted_statistics():
+            string += name + ',' + ','.join(str(getattr(stats, k)) for k in keys) + '\n'
+        return string
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            'type': 'TransformationProfile',
+            'name': self.name,
+            'transformations': {
+                name: asdict(stats)
+                for name, stats in self.statistics.items()
+            }
+        }
+
+    @staticmethod
+    def from_json(json_obj: Dict[str, object]) -> 'TransformationProfile':
+        result = TransformationProfile(json_obj.get('name', 'transformations'))
+        for name, stats in json_obj['transformations'].items():
+            result.statistics[name] = TransformationStatistics(**stats)
+        return result
+
+    def save(self, filename: str) -> None:
+        with open(filename, 'w') as fp:
+            json.dump(self.to_json(), fp, indent=2)
+        self.filepath = filename
+
+    @staticmethod
+    def load(filename: str) -> 'TransformationProfile':
+        with open(filename, 'r') as fp:
+            result = TransformationProfile.from_json(json.load(fp))
+        result.filepath = filename
+        return result
+
+    @staticmethod
+    def is_profile_file(filename: str) -> bool:
+        """ Returns True if the given JSON file contains a transformation profile. """
+        try:
+            with open(filename, 'r') as fp:
+                return json.load(fp).get('type') == 'TransformationProfile'
+        except (OSError, ValueError, AttributeError):
+            return False
+
+
+# Stack of active profiles (innermost last), see ``dace.profile_transformations``
+_ACTIVE_PROFILES: List[TransformationProfile] = []
+
+# Process-wide profile used if the ``optimizer.profile_transformations`` configuration entry is set
+_global_profile: Optional[TransformationProfile] = None
+
+
+def _print_global_profile() -> None:
+    if _global_profile:
+        print(_global_profile)
+
+
+def current_profile() -> Optional[TransformationProfile]:
+    """
+    Returns the transformation profile that statistics should be recorded to, or None if profiling is disabled.
+    This is the innermost active ``dace.profile_transformations`` context, or a process-wide profile (printed at exit)
+    if the ``optimizer.profile_transformations`` configuration entry is set.
+    """
+    global _global_profile
+    if _ACTIVE_PROFILES:
+        return _ACTIVE_PROFILES[-1]
+    if Config.get_bool('optimizer', 'profile_transformations'):
+        if _global_profile is None:
+            _global_profile = TransformationProfile()
+            atexit.register(_print_global_profile)
+        return _global_profile
+    return None
+
+
+def timed(iterable: Iterable[T], profile: Optional[TransformationProfile], name: str) -> Iterator[T]:
+    """
+    Iterates over candidate matches, adding the time spent producing each item to the matching time of the given
+    transformation.
+
+    :param iterable: The candidate matches.
+    :param profile: The profile to record to, or None to iterate without profiling.
+    :param name: The name of the transformation.
+    """
+    if profile is None:
+        yield from iterable
+        return
+
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            profile[name].match_time += time.perf_counter() - start
+            return
+        profile[name].match_time += time.perf_counter() - start
+        yield item
+
+
+@contextmanager
+def measure(name: str, category: str):
+    """
+    Context manager that adds the time spent in its body to a category of the current profile, if profiling is
+    enabled. Measuring ``apply_time`` also counts one application of the transformation.
+
+    :param name: The name of the transformation.
+    :param category: The statistics field to add the time to (one of ``TIMES``).
+    """
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats = profile[name]
+        setattr(stats, category, getattr(stats, category) + time.perf_counter() - start)
+        if category == 'apply_time':
+            stats.applied += 1
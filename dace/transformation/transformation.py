@@ -21,15 +21,22 @@ All transformations extend the ``TransformationBase`` class. There are three bui
 import abc
 import copy
 from dace import dtypes, serialize
+from dace.config import Config
 from dace.dtypes import ScheduleType
 from dace.sdfg import SDFG, SDFGState
-from dace.sdfg import nodes as nd, graph as gr, utils as sdutil, propagation, infer_types, state as st
+from dace.sdfg import nodes as nd, graph as gr, utils as sdutil, propagation, infer_types, state as st, hashing
 from dace.properties import make_properties, Property, DictProperty, SetProperty
-from dace.transformation import pass_pipeline as ppl
+from dace.transformation import pass_pipeline as ppl, profiling
 from typing import Any, Dict, Generic, List, Optional, Set, Type, TypeVar, Union
 import pydoc
 
 
+def _propagation_context(sdfg: SDFG) -> Any:
+    """ Returns a fingerprint of the data descriptors and symbols of an SDFG, which memlet propagation depends on. """
+    return (tuple((name, hashing.element_digest(desc)) for name, desc in sdfg.arrays.items()),
+            tuple((name, str(dtype)) for name, dtype in sdfg.symbols.items()), tuple(sdfg.constants_prop.keys()))
+
+
 class TransformationBase(ppl.Pass):
     """
     Base class for graph rewriting transformations. An instance of a TransformationBase object represents a match
@@ -226,9 +233,27 @@ class PatternTransformation(TransformationBase):
             self._sdfg.append_transformation(self)
         tsdfg: SDFG = self._sdfg.sdfg_list[self.sdfg_id]
         tgraph = tsdfg.node(self.state_id) if self.state_id >= 0 else tsdfg
-        retval = self.apply(tgraph, tsdfg)
-        if annotate and not self.annotates_memlets():
-            propagation.propagate_memlets_sdfg(tsdfg)
+        annotate = annotate and not self.annotates_memlets()
+        incremental = (annotate and self.state_id >= 0 and Config.get_bool('optimizer', 'incremental_propagation'))
+        if incremental:
+            state_versions = {state: state._mutation_count for state in tsdfg.nodes()}
+            context = _propagation_context(tsdfg)
+        with profiling.measure(type(self).__name__, 'apply_time'):
+            retval = self.apply(tgraph, tsdfg)
+        with profiling.measure(type(self).__name__, 'propagation_time'):
+            # Modified data descriptors or symbols may change the propagated memlets of any state
+            if incremental and _propagation_context(tsdfg) != context:
+                incremental = False
+            if incremental:
+                # Only propagate from the matched state and the states that were modified or added by the
+                # transformation
+                modified = [
+                    state for state in tsdfg.nodes()
+                    if state is tgraph or state_versions.get(state) != state._mutation_count
+                ]
+                propagation.propagate_memlets_incremental(tsdfg, modified, propagate_parents=False)
+            elif annotate:
+                propagation.propagate_memlets_sdfg(tsdfg)
         return retval
 
     def __lt__(self, other: 'PatternTransformation') -> bool:
@@ -0,0 +1,92 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Benchmark that compares the compilation latency of the CMake and Direct build backends
+    on the ``@dace.program``s defined in a folder of test files (by default, the Polybench tests). """
+
+import argparse
+import glob
+import importlib.util
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import dace
+from dace.codegen import codegen, compiler
+from dace.frontend.python.parser import DaceProgram
+
+DEFAULT_FOLDER = os.path.join(os.path.dirname(__file__), '..', '..', 'tests', 'npbench', 'polybench')
+
+
+def collect_programs(folder: str) -> List[Tuple[str, dace.SDFG]]:
+    """ Imports every test file in the folder and parses the DaCe programs it defines. """
+    programs = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_test.py'))):
+        modname = os.path.splitext(os.path.basename(path))[0]
+        try:
+            spec = importlib.util.spec_from_file_location(modname, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as ex:
+            print(f'Skipping {modname}: {ex}')
+            continue
+        for name, obj in vars(module).items():
+            if not isinstance(obj, DaceProgram):
+                continue
+            try:
+                sdfg = obj.to_sdfg()
+            except Exception as ex:
+                print(f'Skipping {modname}.{name}: {ex}')
+                continue
+            sdfg.name = f'{modname}_{name}'
+            programs.append((sdfg.name, sdfg))
+    return programs
+
+
+def measure(sdfg: dace.SDFG, folder: str, backend: str, object_cache: str) -> Tuple[float, float]:
+    """ Returns the time (in seconds) to build a freshly generated program folder, and to rebuild it
+        after its build folder has been removed. """
+    program_folder = os.path.join(folder, backend, sdfg.name)
+    program_objects = codegen.generate_code(sdfg)
+    compiler.generate_program_folder(sdfg, program_objects, program_folder)
+
+    with dace.config.set_temporary('compiler', 'build_backend', value=backend):
+        with dace.config.set_temporary('compiler', 'object_cache_folder', value=object_cache):
+            start = time.perf_counter()
+            compiler.configure_and_compile(program_folder, sdfg.name)
+            cold = time.perf_counter() - start
+
+            shutil.rmtree(os.path.join(program_folder, 'build'))
+            start = time.perf_counter()
+            compiler.configure_and_compile(program_folder, sdfg.name)
+            rebuild = time.perf_counter() - start
+    return cold, rebuild
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("folder", type=str, nargs="?", default=DEFAULT_FOLDER)
+    parser.add_argument("-n", "--max-programs", type=int, default=0)
+    args = parser.parse_args()
+
+    programs = collect_programs(args.folder)
+    if args.max_programs > 0:
+        programs = programs[:args.max_programs]
+
+    totals: Dict[str, List[float]] = {'CMake': [0.0, 0.0], 'Direct': [0.0, 0.0]}
+    with tempfile.TemporaryDirectory() as folder:
+        object_cache = os.path.join(folder, 'objcache')
+        print(f'{"Program":40s} {"CMake":>10s} {"(rebuild)":>10s} {"Direct":>10s} {"(rebuild)":>10s}')
+        for name, sdfg in programs:
+            times = []
+            for backend in ('CMake', 'Direct'):
+                cold, rebuild = measure(sdfg, folder, backend, object_cache)
+                totals[backend][0] += cold
+                totals[backend][1] += rebuild
+                times += [cold, rebuild]
+            print(f'{name:40s} ' + ' '.join(f'{t:9.2f}s' for t in times))
+
+    cmake, direct = totals['CMake'], totals['Direct']
+    print(f'{"Total":40s} ' + ' '.join(f'{t:9.2f}s' for t in cmake + direct))
+    if programs:
+        print(f'Speedup: {cmake[0] / direct[0]:.1f}x (cold), {cmake[1] / direct[1]:.1f}x (rebuild)')
@@ -0,0 +1,37 @@
+# Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
+""" Microbenchmark that measures the per-call Python overhead of calling a ``@dace.program``. """
+
+import argparse
+import timeit
+import dace
+import numpy as np
+
+
+@dace.program
+def scale(x, y):
+    y[:] = x * 2
+
+
+def measure(x: np.ndarray, y: np.ndarray, repetitions: int, fast_dispatch: bool) -> float:
+    """ Returns the mean time per call (in microseconds). """
+    with dace.config.set_temporary('frontend', 'fast_dispatch', value=fast_dispatch):
+        scale._cache.clear()
+        scale(x, y)  # Compile and warm up caches
+        scale(x, y)
+        return timeit.timeit(lambda: scale(x, y), number=repetitions) / repetitions * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("N", type=int, nargs="?", default=16)
+    parser.add_argument("-r", "--repetitions", type=int, default=10000)
+    args = parser.parse_args()
+
+    x = np.random.rand(args.N)
+    y = np.random.rand(args.N)
+
+    # The compiled program is the same in both cases, so the difference is dispatch overhead
+    full = measure(x, y, args.repetitions, fast_dispatch=False)
+    fast = measure(x, y, args.repetitions, fast_dispatch=True)
+    print(f'Full dispatch: {full:.2f} us/call')
+    print(f'Fast dispatch: {fast:.2f} us/call ({full / fast:.1f}x)')
@@ -0,0 +1,55 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Benchmark that measures the time it takes to run ``python -c "import dace"``, i.e., the startup overhead of
+    short-lived scripts and worker processes. """
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+
+def measure(statement: str, repetitions: int) -> List[float]:
+    """ Returns the wall-clock times (in seconds) of running the statement in a fresh interpreter. """
+    times = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def slowest_modules(statement: str, count: int) -> List[Tuple[str, int]]:
+    """ Returns the modules with the highest self import time (in microseconds), using ``-X importtime``. """
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            check=True,
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True).stderr
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, _, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_time)))
+    return sorted(modules, key=lambda m: m[1], reverse=True)[:count]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repetitions", type=int, default=10)
+    parser.add_argument("-m", "--modules", type=int, default=10, help="Number of slowest modules to print")
+    args = parser.parse_args()
+
+    interpreter = measure('pass', args.repetitions)
+    dace_times = measure('import dace', args.repetitions)
+    startup = statistics.median(interpreter)
+    print(f'Interpreter startup: {startup * 1000:.1f} ms')
+    print(f'import dace: {statistics.median(dace_times) * 1000:.1f} ms (median), '
+          f'{min(dace_times) * 1000:.1f} ms (min), '
+          f'{(statistics.median(dace_times) - startup) * 1000:.1f} ms over startup')
+
+    if args.modules > 0:
+        print('Slowest modules (self time):')
+        for name, self_time in slowest_modules('import dace', args.modules):
+            print(f'  {name:50s} {self_time / 1000:8.1f} ms')
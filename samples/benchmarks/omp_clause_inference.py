@@ -0,0 +1,71 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark that compares Polybench-style stencil and elementwise kernels with and without automatic inference of
+OpenMP ``collapse`` and ``simd`` clauses (see the ``compiler.cpu.infer_omp_clauses`` configuration entry).
+"""
+
+import argparse
+import timeit
+import dace
+import numpy as np
+
+N = dace.symbol('N')
+M = dace.symbol('M')
+
+
+@dace.program
+def jacobi_2d(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[1:N - 1, 1:N - 1]:
+        B[i, j] = 0.2 * (A[i, j] + A[i, j - 1] + A[i, j + 1] + A[i + 1, j] + A[i - 1, j])
+    for i, j in dace.map[1:N - 1, 1:N - 1]:
+        A[i, j] = 0.2 * (B[i, j] + B[i, j - 1] + B[i, j + 1] + B[i + 1, j] + B[i - 1, j])
+
+
+@dace.program
+def heat_3d(A: dace.float64[N, N, N], B: dace.float64[N, N, N]):
+    for i, j, k in dace.map[1:N - 1, 1:N - 1, 1:N - 1]:
+        B[i, j, k] = (0.125 * (A[i + 1, j, k] - 2.0 * A[i, j, k] + A[i - 1, j, k]) + 0.125 *
+                      (A[i, j + 1, k] - 2.0 * A[i, j, k] + A[i, j - 1, k]) + 0.125 *
+                      (A[i, j, k + 1] - 2.0 * A[i, j, k] + A[i, j, k - 1]) + A[i, j, k])
+
+
+@dace.program
+def short_outer(A: dace.float64[4, M, N], B: dace.float64[4, M, N], x: dace.float64[N]):
+    """ A short outermost dimension (fewer iterations than threads) and long contiguous inner dimensions. """
+    for r, q, p in dace.map[0:4, 0:M, 0:N]:
+        B[r, q, p] = A[r, q, p] * x[p] + 1.0
+
+
+def measure(program: dace.frontend.python.parser.DaceProgram, arguments: dict, infer: bool, repetitions: int) -> float:
+    """ Returns the median runtime of a program (in milliseconds). """
+    sdfg = program.to_sdfg(simplify=True)
+    sdfg.name = f'{sdfg.name}_{"inferred" if infer else "baseline"}'
+    with dace.config.set_temporary('compiler', 'cpu', 'infer_omp_clauses', value=infer):
+        csdfg = sdfg.compile()
+    csdfg(**arguments)  # Warm up
+    times = timeit.repeat(lambda: csdfg(**arguments), number=1, repeat=repetitions)
+    return np.median(times) * 1e3
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("N", type=int, nargs="?", default=256)
+    parser.add_argument("-r", "--repetitions", type=int, default=20)
+    args = parser.parse_args()
+    n = args.N
+
+    kernels = {
+        'jacobi_2d': (jacobi_2d, dict(A=np.random.rand(4 * n, 4 * n), B=np.random.rand(4 * n, 4 * n), N=4 * n)),
+        'heat_3d': (heat_3d, dict(A=np.random.rand(n, n, n), B=np.random.rand(n, n, n), N=n)),
+        'short_outer': (short_outer,
+                        dict(A=np.random.rand(4, n, 4 * n),
+                             B=np.random.rand(4, n, 4 * n),
+                             x=np.random.rand(4 * n),
+                             M=n,
+                             N=4 * n)),
+    }
+    for name, (program, arguments) in kernels.items():
+        baseline = measure(program, arguments, False, args.repetitions)
+        inferred = measure(program, arguments, True, args.repetitions)
+        print(f'{name:12s} baseline: {baseline:8.3f} ms, inferred clauses: {inferred:8.3f} ms '
+              f'({baseline / inferred:.2f}x)')
@@ -0,0 +1,82 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Benchmark that measures the time it takes to apply transformations repeatedly on synthetic SDFGs with many states,
+    with and without incremental pattern matching (the ``optimizer.incremental_matching`` configuration entry), and
+    optionally with parallel matching in a pool of processes (the ``optimizer.match_processes`` entry). """
+
+import argparse
+import time
+
+import dace
+from dace.transformation.dataflow import MapFusion, RedundantArray, RedundantSecondArray
+
+
+def make_sdfg(num_states: int) -> dace.SDFG:
+    """
+    Creates an SDFG with a chain of states. Every state contains a redundant copy (which is removed by the
+    transformations) and two maps that communicate through a global array (which cannot be fused).
+    """
+    sdfg = dace.SDFG(f'pattern_matching_{num_states}')
+    sdfg.add_array('A', [64], dace.float64)
+    sdfg.add_array('B', [64], dace.float64)
+    sdfg.add_array('C', [64], dace.float64)
+    prev = None
+    for i in range(num_states):
+        sdfg.add_transient(f'tmp{i}', [64], dace.float64)
+        state = sdfg.add_state(f'state{i}')
+        tmp = state.add_access(f'tmp{i}')
+        state.add_nedge(state.add_read('A'), tmp, dace.Memlet('A[0:64]'))
+        state.add_nedge(tmp, state.add_write('B'), dace.Memlet(f'tmp{i}[0:64]'))
+
+        c = state.add_access('C')
+        state.add_mapped_tasklet('first',
+                                 dict(i='0:64'),
+                                 dict(a=dace.Memlet('A[i]')),
+                                 'c = a',
+                                 dict(c=dace.Memlet('C[i]')),
+                                 output_nodes={'C': c},
+                                 external_edges=True)
+        state.add_mapped_tasklet('second',
+                                 dict(i='0:64'),
+                                 dict(c=dace.Memlet('C[63 - i]')),
+                                 'b = c',
+                                 dict(b=dace.Memlet('B[i]')),
+                                 input_nodes={'C': c},
+                                 external_edges=True)
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge())
+        prev = state
+    return sdfg
+
+
+def measure(num_states: int, incremental: bool, processes: int = 1) -> float:
+    """ Returns the time (in seconds) to apply the transformations repeatedly on a synthetic SDFG. """
+    sdfg = make_sdfg(num_states)
+    with dace.config.set_temporary('optimizer', 'incremental_matching', value=incremental), \
+            dace.config.set_temporary('optimizer', 'match_processes', value=processes):
+        start = time.perf_counter()
+        applied = sdfg.apply_transformations_repeated([RedundantArray, RedundantSecondArray, MapFusion],
+                                                      validate=False,
+                                                      progress=False)
+        elapsed = time.perf_counter() - start
+    assert applied == num_states
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-s", "--states", type=int, nargs='+', default=[25, 50, 100, 200])
+    parser.add_argument("-p", "--processes", type=int, default=1, help="Also measure parallel matching")
+    args = parser.parse_args()
+
+    header = f'{"States":>8} {"Full [s]":>10} {"Incremental [s]":>16} {"Speedup":>8}'
+    if args.processes != 1:
+        header += f' {"Parallel [s]":>13} {"Speedup":>8}'
+    print(header)
+    for num_states in args.states:
+        full = measure(num_states, False)
+        incremental = measure(num_states, True)
+        line = f'{num_states:8d} {full:10.2f} {incremental:16.2f} {full / incremental:7.1f}x'
+        if args.processes != 1:
+            parallel = measure(num_states, True, args.processes)
+            line += f' {parallel:13.2f} {full / parallel:7.1f}x'
+        print(line)
@@ -0,0 +1,77 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import io
+import json
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pytest
+
+import dace
+from dace import serialize
+
+
+def _make_sdfg():
+    sdfg = dace.SDFG('binary_serialization')
+    sdfg.add_constant('TABLE', np.random.rand(20, 30))
+    sdfg.add_constant('FTABLE', np.asfortranarray(np.random.rand(4, 5).astype(np.complex64)))
+    sdfg.add_constant('STRIDED', np.arange(10, dtype=np.int8)[::3])
+    sdfg.add_array('A', [20], dace.float64)
+    state = sdfg.add_state()
+    for i in range(3):
+        r = state.add_read('A')
+        w = state.add_write('A')
+        t = state.add_tasklet(f'tasklet{i}', {'a'}, {'b'}, 'b = a + TABLE[0, 1]')
+        state.add_edge(r, None, t, 'a', dace.Memlet(f'A[{i}]'))
+        state.add_edge(t, 'b', w, None, dace.Memlet(f'A[{i + 1}]'))
+    return sdfg
+
+
+@pytest.mark.parametrize('compress', (False, True))
+def test_binary_roundtrip(compress):
+    sdfg = _make_sdfg()
+    with tempfile.TemporaryDirectory() as folder:
+        json_file = os.path.join(folder, 'program.sdfg')
+        binary_file = os.path.join(folder, 'program.sdfgz' if compress else 'program.sdfgb')
+        assert sdfg.save(binary_file, hash=True, binary=True, compress=compress) == sdfg.save(json_file)
+
+        loaded = dace.SDFG.from_file(binary_file)
+        reference = dace.SDFG.from_file(json_file)
+        assert json.dumps(loaded.to_json()) == json.dumps(reference.to_json())
+
+        for name, (_, value) in sdfg.constants_prop.items():
+            assert loaded.constants[name].dtype == value.dtype
+            assert np.array_equal(loaded.constants[name], value)
+
+        # Loaded constants are writable
+        loaded.constants['TABLE'][0, 0] = 1.0
+
+        # The binary file is smaller than its JSON counterpart
+        assert os.path.getsize(binary_file) < os.path.getsize(json_file)
+
+
+def test_binary_strings_interned():
+    tree = {'key': ['some repeated string'] * 100}
+    fp = io.BytesIO()
+    serialize.dump_binary(tree, fp)
+    assert fp.getvalue().count(b'some repeated string') == 1
+    fp.seek(0)
+    loaded, arrays = serialize.load_binary(fp)
+    assert loaded == tree
+    assert arrays == []
+
+
+def test_binary_rejects_objects():
+    fp = io.BytesIO()
+    serialize.dump_binary({}, fp)
+    header = fp.getvalue()[:-len(pickle.dumps(({}, []), protocol=5))]
+    with pytest.raises(pickle.UnpicklingError):
+        serialize.load_binary(io.BytesIO(header + pickle.dumps((os.system, []), protocol=5)))
+
+
+if __name__ == '__main__':
+    test_binary_roundtrip(False)
+    test_binary_roundtrip(True)
+    test_binary_strings_interned()
+    test_binary_rejects_objects()
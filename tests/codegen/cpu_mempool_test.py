@@ -0,0 +1,74 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace
+import numpy as np
+
+
+@dace.program
+def tester(A: dace.float64[20], B: dace.float64[20]):
+    tmp = A + 1
+    tmp += B
+    B[:] = tmp
+    tmp2 = tmp + 2
+    B[:] = tmp2 + 5
+
+
+def _transients(sdfg: dace.SDFG):
+    return [arr for arr in sdfg.arrays.values() if arr.transient and isinstance(arr, dace.data.Array)]
+
+
+def test_memory_pool_policy():
+    sdfg = tester.to_sdfg()
+    num_transients = len(_transients(sdfg))
+
+    with dace.config.set_temporary('compiler', 'cpu', 'allocation_policy', value='pool'):
+        code = sdfg.generate_code()[0].clean_code
+        assert code.count('memory_pool.allocate') == num_transients
+        assert code.count('memory_pool.deallocate') == num_transients
+        assert 'new double' not in code
+
+        a = np.random.rand(20)
+        b = np.random.rand(20)
+        b_expected = np.copy(b)
+        tester.f(a, b_expected)
+        csdfg = sdfg.compile()
+        for _ in range(3):
+            b_result = np.copy(b)
+            csdfg(A=a, B=b_result)
+            assert np.allclose(b_result, b_expected)
+
+
+def test_memory_pool_property():
+    sdfg = tester.to_sdfg()
+    _transients(sdfg)[0].pool = True
+
+    code = sdfg.generate_code()[0].clean_code
+    assert code.count('memory_pool.allocate') == 1
+    assert 'dace::MemoryPool memory_pool;' in code
+
+
+def test_memory_pool_statistics():
+    sdfg = tester.to_sdfg()
+    sdfg.name = 'cpu_mempool_statistics'
+    sdfg.instrument = dace.InstrumentationType.Timer
+    num_transients = len(_transients(sdfg))
+
+    a = np.random.rand(20)
+    b = np.random.rand(20)
+    with dace.config.set_temporary('compiler', 'cpu', 'allocation_policy', value='pool'):
+        csdfg = sdfg.compile()
+        for _ in range(3):
+            csdfg(A=a, B=b)
+        del csdfg
+
+    report = sdfg.get_latest_report()
+    counters = report.counters[(0, -1, -1)]['Memory pool']
+    assert counters['allocations'][0][-1] == 3 * num_transients
+    # Blocks freed in the first call are reused in subsequent calls
+    assert counters['misses'][0][-1] <= num_transients
+    assert counters['hits'][0][-1] >= 2 * num_transients
+
+
+if __name__ == '__main__':
+    test_memory_pool_policy()
+    test_memory_pool_property()
+    test_memory_pool_statistics()
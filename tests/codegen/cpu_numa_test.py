@@ -0,0 +1,163 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import numpy as np
+import pytest
+
+import dace
+
+N = dace.symbol('N')
+PAGE_TEST_SIZE = 1 << 20
+
+
+def _make_sdfg(name: str, first_touch: bool = False) -> dace.SDFG:
+    """ A -> tmp (multicore map over rows) -> B """
+    sdfg = dace.SDFG(name)
+    sdfg.add_array('A', [N, 16], dace.float64)
+    sdfg.add_array('B', [N, 16], dace.float64)
+    sdfg.add_transient('tmp', [N, 16], dace.float64)
+    sdfg.arrays['tmp'].first_touch = first_touch
+    first = sdfg.add_state('first')
+    first.add_mapped_tasklet('produce',
+                             dict(i='0:N', j='0:16'), {'a': dace.Memlet('A[i, j]')},
+                             'b = 2 * a', {'b': dace.Memlet('tmp[i, j]')},
+                             external_edges=True)
+    second = sdfg.add_state_after(first, 'second')
+    second.add_mapped_tasklet('consume',
+                              dict(i='0:N', j='0:16'), {'a': dace.Memlet('tmp[i, j]')},
+                              'b = a + 1', {'b': dace.Memlet('B[i, j]')},
+                              external_edges=True)
+    return sdfg
+
+
+def test_proc_bind():
+    sdfg = _make_sdfg('numa_proc_bind')
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, dace.nodes.MapEntry):
+            node.map.omp_proc_bind = dace.OMPProcBindType.Spread
+    code = sdfg.generate_code()[0].clean_code
+    assert code.count('proc_bind(spread)') == 2
+
+
+def test_first_touch_codegen():
+    sdfg = _make_sdfg('numa_first_touch')
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, dace.nodes.MapEntry) and node.map.label == 'produce_map':
+            node.map.omp_schedule = dace.OMPScheduleType.Static
+            node.map.omp_chunk_size = 4
+
+    code = sdfg.generate_code()[0].clean_code
+    assert 'First-touch' not in code
+
+    with dace.config.set_temporary('compiler', 'cpu', 'allocation_policy', value='first_touch'):
+        code = sdfg.generate_code()[0].clean_code
+        # Initialization iterates over the rows of the array with the same schedule as the first writer
+        assert 'matching the schedule of map "produce_map"' in code
+        assert 'schedule(static, 4)' in code.split('First-touch')[1]
+        assert 'memset(tmp + (i) * (16)' in code
+
+        A = np.random.rand(20, 16)
+        B = np.zeros_like(A)
+        sdfg(A=A, B=B, N=20)
+        assert np.allclose(B, 2 * A + 1)
+
+
+def test_first_touch_setzero():
+    # The first writer does not cover the first row, which must still be zeroed
+    sdfg = dace.SDFG('numa_first_touch_setzero')
+    sdfg.add_array('A', [N, 16], dace.float64)
+    sdfg.add_array('B', [N, 16], dace.float64)
+    sdfg.add_transient('tmp', [N, 16], dace.float64)
+    sdfg.arrays['tmp'].first_touch = True
+    first = sdfg.add_state('first')
+    first.add_mapped_tasklet('produce',
+                             dict(i='1:N', j='0:16'), {'a': dace.Memlet('A[i, j]')},
+                             'b = 2 * a', {'b': dace.Memlet('tmp[i, j]')},
+                             external_edges=True)
+    first.data_nodes('tmp')[0].setzero = True
+    second = sdfg.add_state_after(first, 'second')
+    second.add_mapped_tasklet('consume',
+                              dict(i='0:N', j='0:16'), {'a': dace.Memlet('tmp[i, j]')},
+                              'b = a + 1', {'b': dace.Memlet('B[i, j]')},
+                              external_edges=True)
+    code = sdfg.generate_code()[0].clean_code
+    assert 'matching the schedule of map "produce_map"' in code
+    assert 'memset(tmp, 0' in code
+
+    A = np.random.rand(20, 16)
+    B = np.zeros_like(A)
+    sdfg(A=A, B=B, N=20)
+    assert np.allclose(B[0], 1)
+    assert np.allclose(B[1:], 2 * A[1:] + 1)
+
+
+def test_first_touch_fallback():
+    # Transposed writes cannot be matched to rows, so pages are distributed evenly instead
+    sdfg = dace.SDFG('numa_first_touch_fallback')
+    sdfg.add_array('A', [N, N], dace.float64)
+    sdfg.add_transient('tmp', [N, N], dace.float64)
+    sdfg.arrays['tmp'].first_touch = True
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('transpose',
+                             dict(i='0:N', j='0:N'), {'a': dace.Memlet('A[i, j]')},
+                             'b = a', {'b': dace.Memlet('tmp[j, i]')},
+                             external_edges=True)
+    state.add_nedge(state.sink_nodes()[0], state.add_write('A'), dace.Memlet('tmp[0:N, 0:N]'))
+    code = sdfg.generate_code()[0].clean_code
+    assert '__dace_ft_page' in code
+
+    A = np.random.rand(10, 10)
+    expected = A.T.copy()
+    sdfg(A=A, N=10)
+    assert np.allclose(A, expected)
+
+
+def _touched_pages_sdfg(name: str) -> dace.SDFG:
+    """ Counts the pages of a transient that were touched before the first map writes to it. """
+    sdfg = dace.SDFG(name)
+    sdfg.add_array('A', [PAGE_TEST_SIZE], dace.float64)
+    sdfg.add_array('pages', [1], dace.int64)
+    sdfg.add_transient('tmp', [PAGE_TEST_SIZE], dace.float64)
+    first = sdfg.add_state('count')
+    t = first.add_tasklet('count_pages', {}, {'out'},
+                          f'out = dace::numa::pages_on_node(tmp, {PAGE_TEST_SIZE} * sizeof(double));',
+                          language=dace.Language.CPP)
+    first.add_edge(t, 'out', first.add_write('pages'), None, dace.Memlet('pages[0]'))
+    second = sdfg.add_state_after(first, 'compute')
+    second.add_mapped_tasklet('produce',
+                              dict(i=f'0:{PAGE_TEST_SIZE}'), {'a': dace.Memlet('A[i]')},
+                              'b = a + 1', {'b': dace.Memlet('tmp[i]')},
+                              external_edges=True)
+    third = sdfg.add_state_after(second, 'consume')
+    third.add_mapped_tasklet('consume',
+                             dict(i=f'0:{PAGE_TEST_SIZE}'), {'b': dace.Memlet('tmp[i]')},
+                             'a = b', {'a': dace.Memlet('A[i]')},
+                             external_edges=True)
+    return sdfg
+
+
+def test_first_touch_page_placement():
+    A = np.random.rand(PAGE_TEST_SIZE)
+    total_pages = PAGE_TEST_SIZE * 8 // 4096
+
+    sdfg = _touched_pages_sdfg('numa_pages_untouched')
+    pages = np.zeros([1], dtype=np.int64)
+    sdfg(A=np.copy(A), pages=pages)
+    if pages[0] < 0:
+        pytest.skip('Querying page placement is not supported on this system')
+    # Without first-touch initialization, (most) pages of a fresh allocation are not mapped yet
+    assert pages[0] < total_pages // 2
+
+    sdfg = _touched_pages_sdfg('numa_pages_first_touch')
+    sdfg.arrays['tmp'].first_touch = True
+    pages = np.zeros([1], dtype=np.int64)
+    result = np.copy(A)
+    sdfg(A=result, pages=pages)
+    assert pages[0] >= total_pages
+    assert np.allclose(result, A + 1)
+
+
+if __name__ == '__main__':
+    test_proc_bind()
+    test_first_touch_codegen()
+    test_first_touch_setzero()
+    test_first_touch_fallback()
+    test_first_touch_page_placement()
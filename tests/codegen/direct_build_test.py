@@ -0,0 +1,62 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the direct (CMake-free) build backend. """
+import os
+import tempfile
+
+import dace
+from dace.codegen import compiler
+import numpy as np
+
+
+def _addone_sdfg(name: str) -> dace.SDFG:
+    sdfg = dace.SDFG(name)
+    sdfg.add_array('A', [20], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('addone',
+                             dict(i='0:20'),
+                             dict(a=dace.Memlet('A[i]')),
+                             'b = a + 1',
+                             dict(b=dace.Memlet('A[i]')),
+                             external_edges=True)
+    return sdfg
+
+
+def test_direct_build():
+    with tempfile.TemporaryDirectory() as cache_folder:
+        with dace.config.set_temporary('compiler', 'build_backend', value='Direct'):
+            with dace.config.set_temporary('compiler', 'object_cache_folder', value=cache_folder):
+                sdfg = _addone_sdfg('direct_build')
+                csdfg = sdfg.compile()
+                A = np.random.rand(20)
+                expected = A + 1
+                csdfg(A=A)
+                assert np.allclose(A, expected)
+
+                # Program and loader stub objects are cached
+                objects = sorted(f for f in os.listdir(cache_folder) if f.endswith('.o'))
+                assert len(objects) == 2
+                timestamps = [os.path.getmtime(os.path.join(cache_folder, f)) for f in objects]
+                del csdfg
+
+                # Recompiling the same code reuses the cached objects
+                csdfg = sdfg.compile()
+                assert sorted(f for f in os.listdir(cache_folder) if f.endswith('.o')) == objects
+                assert timestamps == [os.path.getmtime(os.path.join(cache_folder, f)) for f in objects]
+                csdfg(A=A)
+                assert np.allclose(A, expected + 1)
+
+
+def test_direct_build_fallback():
+    info = compiler.EnvironmentInfo([0], {}, set(), set(), set(), set(), set(), set())
+    assert compiler.direct_build_supported(['cpu/prog.cpp'], {'cpu': None}, info)
+
+    # Non-CPU targets, CMake packages, and CMake variable expansions require CMake
+    assert not compiler.direct_build_supported(['cpu/prog.cpp', 'cuda/prog.cu'], {'cpu': None, 'cuda': None}, info)
+    assert not compiler.direct_build_supported(['cpu/prog.cpp'], {'cpu': None}, info._replace(packages={'MPI'}))
+    assert not compiler.direct_build_supported(['cpu/prog.cpp'], {'cpu': None},
+                                               info._replace(libraries={'${MKL_LIBRARIES}'}))
+
+
+if __name__ == '__main__':
+    test_direct_build()
+    test_direct_build_fallback()
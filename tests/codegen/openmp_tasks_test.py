@@ -0,0 +1,79 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import numpy as np
+
+import dace
+
+
+def _add_map(state: dace.SDFGState, name: str, src: str, dst: str, code: str):
+    state.add_mapped_tasklet(name,
+                             dict(i='0:64'), {'x': dace.Memlet(f'{src}[i]')},
+                             f'y = {code}', {'y': dace.Memlet(f'{dst}[i]')},
+                             external_edges=True)
+
+
+def _make_sdfg(name: str) -> dace.SDFG:
+    """ Two independent components in the first state, and a second state that depends on one of them. """
+    sdfg = dace.SDFG(name)
+    for arr in 'ABCD':
+        sdfg.add_array(arr, [64], dace.float64)
+    sdfg.add_transient('tmp', [64], dace.float64)
+    first = sdfg.add_state('first')
+    _add_map(first, 'a', 'A', 'tmp', 'x + 1')
+    _add_map(first, 'b', 'C', 'D', 'x * 2')
+    second = sdfg.add_state_after(first, 'second')
+    _add_map(second, 'c', 'tmp', 'B', 'x * 3')
+    return sdfg
+
+
+def test_task_dependencies():
+    sdfg = _make_sdfg('omp_tasks_deps')
+    with dace.config.set_temporary('compiler', 'cpu', 'openmp_tasks', value=True):
+        code = sdfg.generate_code()[0].clean_code
+    assert code.count('#pragma omp task ') == 3
+    assert '#pragma omp task depend(in: A) depend(inout: tmp)' in code
+    assert '#pragma omp task depend(in: C) depend(inout: D)' in code
+    assert '#pragma omp task depend(in: tmp) depend(inout: B)' in code
+    # The second state follows unconditionally, so its tasks may start before the first state completes
+    assert code.count('#pragma omp taskwait') == 1
+    assert code.index('#pragma omp taskwait') > code.index('depend(inout: B)')
+
+    code = sdfg.generate_code()[0].clean_code
+    assert '#pragma omp task' not in code
+
+
+def test_tasks_correctness():
+    sdfg = _make_sdfg('omp_tasks_run')
+    A, C = np.random.rand(64), np.random.rand(64)
+    B, D = np.zeros(64), np.zeros(64)
+    with dace.config.set_temporary('compiler', 'cpu', 'openmp_tasks', value=True):
+        sdfg(A=A, B=B, C=C, D=D)
+    assert np.allclose(B, (A + 1) * 3)
+    assert np.allclose(D, C * 2)
+
+
+def test_tasks_loop():
+    sdfg = dace.SDFG('omp_tasks_loop')
+    sdfg.add_array('A', [64], dace.float64)
+    sdfg.add_array('B', [64], dace.float64)
+    init = sdfg.add_state('init')
+    body = sdfg.add_state('body')
+    _add_map(body, 'inc', 'A', 'B', 'x + 1')
+    body2 = sdfg.add_state_after(body, 'body2')
+    _add_map(body2, 'copy', 'B', 'A', 'x')
+    end = sdfg.add_state('end')
+    sdfg.add_loop(init, body, end, 'k', '0', 'k < 5', 'k + 1', body2)
+
+    A = np.random.rand(64)
+    expected = A + 5
+    with dace.config.set_temporary('compiler', 'cpu', 'openmp_tasks', value=True):
+        code = sdfg.generate_code()[0].clean_code
+        # Tasks complete before the loop variable is incremented
+        assert '#pragma omp taskwait' in code
+        sdfg(A=A, B=np.zeros(64))
+    assert np.allclose(A, expected)
+
+
+if __name__ == '__main__':
+    test_task_dependencies()
+    test_tasks_correctness()
+    test_tasks_loop()
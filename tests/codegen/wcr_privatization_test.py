@@ -0,0 +1,88 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import numpy as np
+
+import dace
+
+H = dace.symbol('H')
+W = dace.symbol('W')
+BINS = 64
+
+
+@dace.program
+def histogram(A: dace.float64[H, W], hist: dace.int32[BINS]):
+    for i, j in dace.map[0:H, 0:W]:
+        with dace.tasklet:
+            a << A[i, j]
+            out >> hist(1, lambda x, y: x + y)[:]
+            out[min(int(a * BINS), BINS - 1)] = 1
+
+
+@dace.program
+def rowmax(A: dace.float64[8, W], B: dace.float64[8]):
+    for i, j in dace.map[0:8, 0:W]:
+        with dace.tasklet:
+            a << A[i, j]
+            b >> B(1, lambda x, y: max(x, y))[i]
+            b = a
+
+
+@dace.program
+def column_sum(A: dace.float64[8, 8], B: dace.float64[8, 8]):
+    for i, j in dace.map[0:8, 0:8]:
+        with dace.tasklet:
+            a << A[i, j]
+            b >> B(1, lambda x, y: x + y)[j, 2]
+            b = a
+
+
+def test_privatized_histogram():
+    sdfg = histogram.to_sdfg()
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, dace.nodes.MapEntry):
+            # A thread count that is not a power of two exercises the tree reduction
+            node.map.omp_num_threads = 5
+
+    code = sdfg.generate_code()[0].clean_code
+    assert 'dace::privatized_wcr<dace::ReductionType::Sum, int> __dace_wcr_hist(64, 5);' in code
+    assert 'reduce_atomic' not in code
+
+    A = np.random.rand(50, 30)
+    hist = np.full([BINS], 3, dtype=np.int32)
+    sdfg(A=A, hist=hist, H=50, W=30)
+    assert np.array_equal(hist, np.histogram(A, bins=BINS, range=(0.0, 1.0))[0] + 3)
+
+    with dace.config.set_temporary('compiler', 'cpu', 'wcr_privatization_max_elements', value=0):
+        code = sdfg.generate_code()[0].clean_code
+        assert 'privatized_wcr' not in code and 'reduce_atomic' in code
+
+
+def test_privatized_max():
+    sdfg = rowmax.to_sdfg()
+    code = sdfg.generate_code()[0].clean_code
+    assert 'dace::privatized_wcr<dace::ReductionType::Max, double>' in code
+
+    A = np.random.rand(8, 100) - 0.5
+    B = np.full([8], -1.0)
+    sdfg(A=A, B=B, W=100)
+    assert np.allclose(B, np.max(A, axis=1))
+
+
+def test_atomics_heuristics():
+    # The written region is not contiguous
+    code = column_sum.to_sdfg().generate_code()[0].clean_code
+    assert 'privatized_wcr' not in code and 'reduce_atomic' in code
+
+    # Too few updates per element
+    with dace.config.set_temporary('compiler', 'cpu', 'wcr_privatization_min_updates', value=1000):
+        code = rowmax.to_sdfg().generate_code()[0].clean_code
+        assert 'privatized_wcr' in code
+        sdfg = rowmax.to_sdfg()
+        sdfg.specialize(dict(W=100))
+        code = sdfg.generate_code()[0].clean_code
+        assert 'privatized_wcr' not in code and 'reduce_atomic' in code
+
+
+if __name__ == '__main__':
+    test_privatized_histogram()
+    test_privatized_max()
+    test_atomics_heuristics()
@@ -56,6 +56,82 @@ def test_bad_cast_csdfg():
     assert result.item() == 1
 
 
+def test_fast_call_csdfg():
+
+    @dp.program
+    def tester(A: dp.float64[20], b: dp.float64):
+        A[:] = A + b
+
+    csdfg = tester.to_sdfg().compile()
+    A = np.random.rand(20)
+    expected = A + 3
+    callargs, initargs = csdfg.construct_arguments(A, 1.0)
+    for _ in range(3):
+        csdfg.fast_call(callargs, initargs)
+    assert np.allclose(A, expected)
+
+
+def test_marshaller_fallback_csdfg():
+
+    @dp.program
+    def tester(A: dp.float64[20], b: dp.int32):
+        A[:] = A + b
+
+    csdfg = tester.to_sdfg().compile()
+    A = np.random.rand(20)
+    expected = A + 2
+
+    csdfg(A, np.int32(1))
+    # Floating-point values do not match the specialized signature and are cast on the generic path
+    with pytest.warns(UserWarning, match='Casting'):
+        csdfg(A, 1.0)
+    assert np.allclose(A, expected)
+
+    # Argument errors are still raised on the generic path, and leave the initialized program usable
+    with pytest.raises(TypeError):
+        csdfg(A[::2], 1)
+    csdfg(A, np.int32(1))
+    assert np.allclose(A, expected + 1)
+
+
+def test_compile_many():
+    from dace.codegen.compiler import compile_many
+
+    def make_sdfg(value: int) -> SDFG:
+        sdfg = SDFG('compile_many')
+        sdfg.add_array('A', [20], dp.float64)
+        state = sdfg.add_state()
+        state.add_mapped_tasklet('add',
+                                 dict(i='0:20'),
+                                 dict(a=Memlet('A[i]')),
+                                 f'b = a + {value}',
+                                 dict(b=Memlet('A[i]')),
+                                 external_edges=True)
+        return sdfg
+
+    # Invalid SDFG (tasklet without memlets) reports an error in its position
+    invalid = make_sdfg(0)
+    invalid.node(0).add_tasklet('bad', {'inp'}, {}, '')
+
+    sdfgs = [make_sdfg(1), invalid, make_sdfg(2), make_sdfg(3)]
+    with pytest.warns(UserWarning, match='compiling under the name'):
+        results = compile_many(sdfgs, processes=2)
+
+    assert isinstance(results[1], Exception)
+    names = set()
+    for value, csdfg in zip([1, 2, 3], [results[0], results[2], results[3]]):
+        names.add(csdfg.sdfg.name)
+        A = np.zeros(20)
+        csdfg(A=A)
+        assert np.allclose(A, value)
+
+    # Clashing names are renamed
+    assert len(names) == 3
+
+
 if __name__ == "__main__":
     test()
     test_bad_cast_csdfg()
+    test_fast_call_csdfg()
+    test_marshaller_fallback_csdfg()
+    test_compile_many()
@@ -1,5 +1,7 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
-from dace.config import set_temporary, Config
+import pytest
+
+from dace.config import set_temporary, temporary_config, Config
 
 
 def test_set_temporary():
@@ -10,5 +12,21 @@ def test_set_temporary():
     assert Config.get(*path) == current_value
 
 
+def test_temporary_exception():
+    path = ["compiler", "build_type"]
+    current_value = Config.get(*path)
+    with pytest.raises(ValueError):
+        with set_temporary(*path, value="I'm not a build type"):
+            raise ValueError
+    assert Config.get(*path) == current_value
+
+    with pytest.raises(ValueError):
+        with temporary_config():
+            Config.set(*path, value="I'm not a build type")
+            raise ValueError
+    assert Config.get(*path) == current_value
+
+
 if __name__ == '__main__':
     test_set_temporary()
+    test_temporary_exception()
@@ -0,0 +1,143 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import math
+
+import dace
+from dace.optimization import cutout_tuner
+from dace.sdfg import nodes
+from dace.transformation.auto import auto_optimize as aopt
+from dace.transformation.estimator import cost_model
+from dace.transformation.subgraph import helpers
+
+N = dace.symbol('N')
+
+
+@dace.program
+def chain(A: dace.float64[N, N], B: dace.float64[N, N]):
+    tmp = A + 1
+    B[:] = tmp * 2
+
+
+@dace.program
+def siblings(A: dace.float64[N], B: dace.float64[N], C: dace.float64[N]):
+    B[:] = A + 1
+    C[:] = A * 2
+
+
+def _maps(state: dace.SDFGState):
+    return [n for n in state.nodes() if isinstance(n, nodes.MapEntry)]
+
+
+def test_estimate_state():
+    sdfg = chain.to_sdfg(simplify=True)
+    estimate = cost_model.estimate(sdfg, {'N': 100})
+    assert estimate.parallelism == 100 * 100
+    assert estimate.work >= 2 * 100 * 100
+    # Every container is read or written in full
+    assert all(size == 100 * 100 * 8 for size in estimate.data_footprint.values())
+    assert estimate.bytes >= estimate.footprint
+    assert estimate.reuse >= 1
+
+    # Unknown symbols use the default value
+    assert cost_model.estimate(sdfg).parallelism == cost_model.DEFAULT_SYMBOL_VALUE**2
+
+    # Sequential maps do not contribute parallelism
+    for me in _maps(sdfg.node(0)):
+        me.map.schedule = dace.ScheduleType.Sequential
+    assert cost_model.estimate(sdfg, {'N': 100}).parallelism == 1
+
+
+def test_estimate_reuse():
+    sdfg = dace.SDFG('cost_model_reuse')
+    sdfg.add_array('A', [64, 64], dace.float64)
+    sdfg.add_array('x', [64], dace.float64)
+    sdfg.add_array('y', [64], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('mv',
+                             dict(i='0:64', j='0:64'), {
+                                 'a': dace.Memlet('A[i, j]'),
+                                 'b': dace.Memlet('x[j]')
+                             },
+                             'c = a * b', {'c': dace.Memlet('y[i]', wcr='lambda a, b: a + b')},
+                             external_edges=True)
+    dace.propagate_memlets_sdfg(sdfg)
+    estimate = cost_model.estimate_map(state, _maps(state)[0])
+    assert estimate.work == 64 * 64
+    assert estimate.data_footprint['x'] == 64 * 8
+    # Vector x is reused by every row
+    assert estimate.reuse > 1
+
+
+def test_fusion_benefit():
+    sdfg = chain.to_sdfg(simplify=True)
+    state = sdfg.node(0)
+    subgraph = helpers.subgraph_from_maps(sdfg, state, _maps(state))
+    # Fusion removes the intermediate transient
+    assert cost_model.fusion_benefit(sdfg, state, subgraph, {'N': 1000}) > 0
+
+    # On a compute-bound machine, fusing with a sequential map loses parallelism
+    _maps(state)[0].map.schedule = dace.ScheduleType.Sequential
+    subgraph = helpers.subgraph_from_maps(sdfg, state, _maps(state))
+    machine = cost_model.MachineModel(cores=8, memory_bandwidth=1e15, cache_bandwidth=1e15)
+    assert cost_model.fusion_benefit(sdfg, state, subgraph, {'N': 1000}, machine) < 0
+
+
+def test_prune():
+    kept, pruned = cost_model.prune([5, 1, None, 3, 2], lambda c: c, 2, always_keep=[5])
+    assert kept == [5, 1, None, 2]
+    assert pruned == [3]
+
+
+class _CountingTuner(cutout_tuner.CutoutTuner):
+
+    def __init__(self, sdfg: dace.SDFG) -> None:
+        super().__init__('counting', sdfg)
+        self.evaluated = []
+
+    def space(self, **kwargs):
+        return [4, 1, 3, 2]
+
+    def pre_evaluate(self, cutout, measurements, **kwargs):
+        return {'space_kwargs': {}, 'key': str}
+
+    def estimate(self, config, cutout, **kwargs):
+        return float(config)
+
+    def evaluate(self, config, **kwargs):
+        self.evaluated.append(config)
+        return float(config)
+
+
+def test_tuner_pruning():
+    sdfg = chain.to_sdfg(simplify=True)
+    tuner = _CountingTuner(sdfg)
+    results = tuner.search(sdfg, 1, top_k=2)
+    assert sorted(tuner.evaluated) == [1, 2]
+    assert results['3'] == math.inf and results['4'] == math.inf
+
+    tuner.evaluated.clear()
+    tuner.search(sdfg, 1)
+    assert len(tuner.evaluated) == 4
+
+
+def test_greedy_fuse_pruning(monkeypatch):
+
+    def num_maps(fuse: bool, benefit=None) -> int:
+        sdfg = siblings.to_sdfg(simplify=True)
+        if benefit is not None:
+            monkeypatch.setattr(cost_model, 'fusion_benefit', lambda *args, **kwargs: benefit)
+        with dace.config.set_temporary('optimizer', 'cost_model_fusion', value=fuse):
+            aopt.greedy_fuse(sdfg, validate_all=True)
+        monkeypatch.undo()
+        return len(_maps(sdfg.node(0)))
+
+    assert num_maps(False) == 1
+    assert num_maps(True) == 1
+    assert num_maps(True, benefit=-1.0) == 2
+
+
+if __name__ == '__main__':
+    test_estimate_state()
+    test_estimate_reuse()
+    test_fusion_benefit()
+    test_prune()
+    test_tuner_pruning()
@@ -0,0 +1,169 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import copy
+
+import pytest
+
+import dace
+from dace import subsets
+from dace.sdfg import nodes, propagation, utils as sdutil
+from dace.transformation import transformation as xf
+from dace.transformation.dataflow import MapExpansion
+
+
+def _make_sdfg(depth: int, num_states: int = 2) -> dace.SDFG:
+    """ Creates an SDFG with ``num_states`` states per level, each with a 2D map around a nested SDFG. """
+    sdfg = dace.SDFG(f'incremental_propagation_{depth}')
+    sdfg.add_array('A', [16, 16], dace.float64)
+    sdfg.add_array('B', [16, 16], dace.float64)
+    prev = None
+    for k in range(num_states):
+        state = sdfg.add_state(f's{k}')
+        me, mx = state.add_map('m', dict(i='0:16', j='0:16'))
+        if depth == 0:
+            tasklet = state.add_tasklet('t', {'a'}, {'b'}, 'b = a + 1')
+            state.add_memlet_path(state.add_read('A'), me, tasklet, dst_conn='a', memlet=dace.Memlet('A[i, j]'))
+            state.add_memlet_path(tasklet, mx, state.add_write('B'), src_conn='b', memlet=dace.Memlet('B[i, j]'))
+        else:
+            nsdfg = state.add_nested_sdfg(_make_sdfg(depth - 1, num_states), sdfg, {'A'}, {'B'})
+            state.add_memlet_path(state.add_read('A'), me, nsdfg, dst_conn='A', memlet=dace.Memlet('A[0:16, 0:16]'))
+            state.add_memlet_path(nsdfg, mx, state.add_write('B'), src_conn='B', memlet=dace.Memlet('B[0:16, 0:16]'))
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge())
+        prev = state
+    propagation.propagate_memlets_sdfg(sdfg)
+    return sdfg
+
+
+def _expand_all_maps(sdfg: dace.SDFG, incremental: bool):
+    with dace.config.set_temporary('optimizer', 'incremental_propagation', value=incremental):
+        for sd in list(sdfg.all_sdfgs_recursive()):
+            for state in sd.nodes():
+                for me in [n for n in state.nodes() if isinstance(n, nodes.MapEntry)]:
+                    MapExpansion.apply_to(sd, map_entry=me, verify=False)
+
+
+def test_incremental_same_result():
+    full = _make_sdfg(2)
+    incremental = copy.deepcopy(full)
+    _expand_all_maps(full, False)
+    _expand_all_maps(incremental, True)
+    assert full.hash_sdfg() == incremental.hash_sdfg()
+
+
+def test_propagate_parents():
+    sdfg = _make_sdfg(2, 1)
+    inner = sdfg.sdfg_list[-1]
+    inner_state = inner.node(0)
+
+    # Only access the first row in the innermost SDFG
+    for e in inner_state.edges():
+        if isinstance(e.dst, nodes.Tasklet):
+            e.data = dace.Memlet('A[0, j]')
+
+    expected = copy.deepcopy(sdfg)
+    propagation.propagate_memlets_sdfg(expected)
+    propagation.propagate_memlets_incremental(inner, [inner_state])
+    assert sdfg.hash_sdfg() == expected.hash_sdfg()
+    outer_read = sdfg.node(0).out_edges(sdfg.node(0).source_nodes()[0])[0]
+    assert outer_read.data.subset == subsets.Range.from_string('0, 0:16')
+
+    # Without propagating to parent SDFGs, only the modified SDFG is updated
+    for e in inner_state.edges():
+        if isinstance(e.dst, nodes.Tasklet):
+            e.data = dace.Memlet('A[1, j]')
+    propagation.propagate_memlets_incremental(inner, [inner_state], propagate_parents=False)
+    assert outer_read.data.subset == subsets.Range.from_string('0, 0:16')
+    assert inner_state.out_edges(inner_state.source_nodes()[0])[0].data.subset == subsets.Range.from_string('1, 0:16')
+
+
+def test_modified_scopes():
+    sdfg = _make_sdfg(0, 1)
+    state = sdfg.node(0)
+    tasklet = next(n for n in state.nodes() if isinstance(n, nodes.Tasklet))
+    state.in_edges(tasklet)[0].data = dace.Memlet('A[i, 0]')
+
+    propagation.propagate_memlets_incremental(sdfg, scopes=[(state, state.entry_node(tasklet))])
+    assert state.out_edges(state.source_nodes()[0])[0].data.subset == subsets.Range.from_string('0:16, 0')
+
+
+def test_state_annotations_reused(monkeypatch):
+    sdfg = _make_sdfg(1)
+    calls = []
+    original = propagation.propagate_states
+
+    def counting_propagate_states(sd):
+        calls.append(sd)
+        return original(sd)
+
+    monkeypatch.setattr(propagation, 'propagate_states', counting_propagate_states)
+    propagation.propagate_memlets_incremental(sdfg, sdfg.nodes())
+    assert calls == []
+
+    # Modifying the state machine recomputes the annotations of the modified SDFG only
+    last = sdfg.sink_nodes()[0]
+    sdfg.add_edge(last, sdfg.add_state(), dace.InterstateEdge())
+    propagation.propagate_memlets_incremental(sdfg, sdfg.nodes())
+    assert calls == [sdfg]
+    assert all(state.executions == 1 for state in sdfg.nodes())
+
+    # Modifying interstate edges is detected as well
+    sdfg.in_edges(last)[0].data.assignments = {'k': '1'}
+    propagation.propagate_memlets_incremental(sdfg)
+    assert calls == [sdfg, sdfg]
+
+
+class _ModifySDFG(xf.SingleStateTransformation):
+    """ Test transformation that modifies data descriptors or symbols, which may be used in other states. """
+    tasklet = xf.PatternNode(nodes.Tasklet)
+
+    @classmethod
+    def expressions(cls):
+        return [sdutil.node_path_graph(cls.tasklet)]
+
+    def can_be_applied(self, graph, expr_index, sdfg, permissive=False):
+        return True
+
+    def apply(self, graph, sdfg):
+        if self.tasklet.label == 'resize':
+            sdfg.arrays['A'].set_shape((32, 16))
+        elif self.tasklet.label == 'symbol':
+            sdfg.add_symbol('N', dace.int32)
+
+
+def test_modified_descriptors(monkeypatch):
+    sdfg = _make_sdfg(0)
+    calls = []
+    original = propagation.propagate_memlets_sdfg
+
+    def counting_propagate_memlets_sdfg(sd):
+        calls.append(sd)
+        return original(sd)
+
+    monkeypatch.setattr(propagation, 'propagate_memlets_sdfg', counting_propagate_memlets_sdfg)
+    tasklet = next(n for n in sdfg.node(0).nodes() if isinstance(n, nodes.Tasklet))
+    with dace.config.set_temporary('optimizer', 'incremental_propagation', value=True):
+        # Modifications within the matched state are propagated incrementally
+        _ModifySDFG.apply_to(sdfg, tasklet=tasklet, verify=False)
+        assert calls == []
+
+        # Modified data descriptors and symbols may be used in other states, which are propagated again
+        tasklet.label = 'resize'
+        _ModifySDFG.apply_to(sdfg, tasklet=tasklet, verify=False)
+        assert calls == [sdfg]
+        tasklet.label = 'symbol'
+        _ModifySDFG.apply_to(sdfg, tasklet=tasklet, verify=False)
+        assert calls == [sdfg, sdfg]
+
+
+@pytest.mark.parametrize('incremental', (False, True))
+def test_propagate_subset_memoized(incremental):
+    arr = dace.data.Array(dace.float64, [16, 16])
+    memlet = dace.Memlet('A[i, j]')
+    rng = subsets.Range.from_string('0:16, 0:8')
+    with dace.config.set_temporary('optimizer', 'incremental_propagation', value=incremental):
+        first = propagation.propagate_subset([memlet], arr, ['i', 'j'], rng)
+        first.subset[0] = (0, 0, 1)
+        second = propagation.propagate_subset([memlet], arr, ['i', 'j'], rng)
+    assert second.subset == subsets.Range.from_string('0:16, 0:8')
+    assert second.volume == 128
+    assert second.data == 'A'
@@ -1,5 +1,6 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 import dace
+import numpy as np
 from dace import dtypes, nodes
 from typing import Any, Dict, List, Union
 
@@ -73,6 +74,70 @@ def test_omp_props():
     assert ("#pragma omp parallel for schedule(guided, 5) num_threads(10)" in code)
 
 
+@dace.program
+def nest3d(A: dace.float64[N, N, N], B: dace.float64[N, N, N]):
+    for i, j, k in dace.map[0:N, 0:N, 0:N]:
+        with dace.tasklet:
+            a << A[i, j, k]
+            b >> B[i, j, k]
+            b = 2 * a
+
+
+@dace.program
+def transposed(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[j, i]
+            b >> B[i, j]
+            b = a
+
+
+@dace.program
+def rowsum(A: dace.float64[N, N], B: dace.float64[N]):
+    for i, j in dace.map[0:N, 0:N]:
+        with dace.tasklet:
+            a << A[i, j]
+            b >> B(1, lambda x, y: x + y)[i]
+            b = a
+
+
+def _omp_lines(sdfg: dace.SDFG):
+    code = sdfg.generate_code()[0].clean_code
+    return [line.strip() for line in code.split('\n') if '#pragma omp' in line and 'section' not in line]
+
+
+def test_infer_collapse_and_simd():
+    sdfg = nest3d.to_sdfg(simplify=True)
+    assert _omp_lines(sdfg) == ['#pragma omp parallel for collapse(2)', '#pragma omp simd']
+
+    # Explicit collapse is kept
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, nodes.MapEntry):
+            node.map.collapse = 3
+    assert _omp_lines(sdfg) == ['#pragma omp parallel for collapse(3)']
+
+    with dace.config.set_temporary('compiler', 'cpu', 'infer_omp_clauses', value=False):
+        assert _omp_lines(nest3d.to_sdfg(simplify=True)) == ['#pragma omp parallel for']
+
+    A = np.random.rand(5, 5, 5)
+    B = np.zeros_like(A)
+    nest3d.to_sdfg(simplify=True)(A=A, B=B, N=5)
+    assert np.allclose(B, 2 * A)
+
+
+def test_infer_no_simd():
+    # Non-contiguous accesses and write-conflicts prevent vectorization, but not collapsing
+    assert _omp_lines(transposed.to_sdfg(simplify=True)) == ['#pragma omp parallel for collapse(2)']
+    assert _omp_lines(rowsum.to_sdfg(simplify=True)) == ['#pragma omp parallel for collapse(2)']
+
+    A = np.random.rand(6, 6)
+    B = np.zeros([6])
+    rowsum.to_sdfg(simplify=True)(A=A, B=B, N=6)
+    assert np.allclose(B, np.sum(A, axis=1))
+
+
 if __name__ == "__main__":
     test_lack_of_omp_props()
     test_omp_props()
+    test_infer_collapse_and_simd()
+    test_infer_no_simd()
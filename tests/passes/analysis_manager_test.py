@@ -0,0 +1,219 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+from typing import Any, Dict, Optional
+
+import dace
+from dace.transformation import pass_pipeline as ppl
+from dace.transformation.passes import analysis as ap
+from dace.transformation.passes.array_elimination import ArrayElimination
+from dace.transformation.passes.dead_dataflow_elimination import DeadDataflowElimination
+
+
+class CountingAccessSets(ap.AccessSets):
+    analyzed = []
+
+    def apply(self, sdfg, pipeline_results):
+        self.analyzed.append(sdfg)
+        return super().apply(sdfg, pipeline_results)
+
+
+class CountingSymbolAccessSets(ap.SymbolAccessSets):
+    analyzed = []
+
+    def apply(self, sdfg, pipeline_results):
+        self.analyzed.append(sdfg)
+        return super().apply(sdfg, pipeline_results)
+
+
+class ChangeTasklets(ppl.Pass):
+    """ Doubles the constant in every tasklet once. """
+
+    def depends_on(self):
+        return {CountingAccessSets, CountingSymbolAccessSets}
+
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Tasklets
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return False
+
+    def apply_pass(self, sdfg: dace.SDFG, pipeline_results: Dict[str, Any]) -> Optional[int]:
+        result = 0
+        for node, _ in sdfg.all_nodes_recursive():
+            if isinstance(node, dace.nodes.Tasklet) and '* 2' in node.code.as_string:
+                node.code = dace.properties.CodeBlock(node.code.as_string.replace('* 2', '* 4'))
+                result += 1
+        return result or None
+
+
+def _make_sdfg(name: str = 'analysis_manager_test') -> dace.SDFG:
+    sdfg = dace.SDFG(name)
+    sdfg.add_array('A', [20], dace.float64)
+    sdfg.add_array('B', [20], dace.float64)
+    prev = None
+    for i in range(3):
+        state = sdfg.add_state(f'state{i}')
+        state.add_mapped_tasklet('compute',
+                                 dict(i='0:20'),
+                                 dict(a=dace.Memlet('A[i]')),
+                                 'b = a * 2',
+                                 dict(b=dace.Memlet('B[i]')),
+                                 external_edges=True)
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge())
+        prev = state
+    return sdfg
+
+
+def _reset_counters():
+    CountingAccessSets.analyzed.clear()
+    CountingSymbolAccessSets.analyzed.clear()
+
+
+def test_cached_across_pipelines():
+    sdfg = _make_sdfg()
+    _reset_counters()
+    first = ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert CountingAccessSets.analyzed == [sdfg]
+    second = ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert CountingAccessSets.analyzed == [sdfg]
+    assert first == second
+
+    # Modifications outside of pipelines are detected
+    sdfg.add_edge(sdfg.sink_nodes()[0], sdfg.add_state(), dace.InterstateEdge())
+    third = ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert CountingAccessSets.analyzed == [sdfg, sdfg]
+    assert len(third['CountingAccessSets'][0]) == 4
+
+    # Modifications of elements the analysis does not depend on are ignored
+    sdfg.add_symbol('M', dace.int32)
+    ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert len(CountingAccessSets.analyzed) == 2
+
+    first_state = sdfg.nodes()[0]
+    first_state.data_nodes('B')[0].data = 'A'
+    fourth = ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert len(CountingAccessSets.analyzed) == 3
+    assert fourth['CountingAccessSets'][0][first_state] == ({'A'}, {'A'})
+
+
+def test_invalidate_modified():
+    sdfg = _make_sdfg()
+    _reset_counters()
+    assert ppl.Pipeline([ChangeTasklets()]).apply_pass(sdfg, {})['ChangeTasklets'] == 3
+    assert len(CountingAccessSets.analyzed) == 1
+    assert len(CountingSymbolAccessSets.analyzed) == 1
+
+    # Modifying tasklets does not change access sets, but may change symbol access sets
+    assert ppl.Pipeline([ChangeTasklets()]).apply_pass(sdfg, {}) == {
+        'CountingAccessSets': {
+            0: ap.AccessSets().apply(sdfg, {})
+        },
+        'CountingSymbolAccessSets': {
+            0: ap.SymbolAccessSets().apply(sdfg, {})
+        },
+    }
+    assert len(CountingAccessSets.analyzed) == 1
+    assert len(CountingSymbolAccessSets.analyzed) == 2
+
+
+def test_interstate_edge_reads():
+    sdfg = _make_sdfg()
+    sdfg.add_array('C', [1], dace.int32)
+    sdfg.add_array('D', [1], dace.int32)
+    first, second = sdfg.nodes()[:2]
+    edge = sdfg.edges_between(first, second)[0]
+    edge.data.assignments['i'] = 'C[0]'
+    _reset_counters()
+    result = ppl.Pipeline([CountingAccessSets(), ap.FindAccessStates()]).apply_pass(sdfg, {})
+    assert 'C' in result['CountingAccessSets'][0][second][0]
+    assert result['FindAccessStates'][0]['C'] == {first, second}
+
+    # Arrays read on inter-state edges are part of the analyses
+    edge.data.assignments['i'] = 'D[0]'
+    result = ppl.Pipeline([CountingAccessSets(), ap.FindAccessStates()]).apply_pass(sdfg, {})
+    assert len(CountingAccessSets.analyzed) == 2
+    assert result['CountingAccessSets'][0] == ap.AccessSets().apply(sdfg, {})
+    assert result['FindAccessStates'][0] == ap.FindAccessStates().apply(sdfg, {})
+    assert 'C' not in result['CountingAccessSets'][0][second][0]
+
+
+def test_results_not_modified():
+    sdfg = dace.SDFG('analysis_manager_test_copy')
+    sdfg.add_array('A', [20], dace.float64)
+    sdfg.add_array('B', [20], dace.float64)
+    sdfg.add_transient('tmp', [20], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('compute',
+                             dict(i='0:20'),
+                             dict(a=dace.Memlet('A[i]')),
+                             'b = a * 2',
+                             dict(b=dace.Memlet('tmp[i]')),
+                             external_edges=True)
+    state.add_nedge(state.data_nodes('tmp')[0], state.add_write('B'), dace.Memlet('tmp[0:20]'))
+
+    cached = ppl.Pipeline([ap.FindAccessStates()]).apply_pass(sdfg, {})['FindAccessStates'][0]
+    expected = {k: set(v) for k, v in cached.items()}
+    # Array elimination removes the redundant copy using the cached access states
+    assert ppl.Pipeline([ArrayElimination()]).apply_pass(sdfg, {})['ArrayElimination'] == {'tmp'}
+    assert 'tmp' not in sdfg.arrays
+    assert cached == expected
+
+    # Dead dataflow elimination removes the transients, whose contents are never used
+    sdfg = dace.SDFG('analysis_manager_test_dead_copy')
+    sdfg.add_array('A', [20], dace.float64)
+    sdfg.add_transient('tmp', [20], dace.float64)
+    sdfg.add_transient('unused', [20], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('compute',
+                             dict(i='0:20'),
+                             dict(a=dace.Memlet('A[i]')),
+                             'b = a * 2',
+                             dict(b=dace.Memlet('tmp[i]')),
+                             external_edges=True)
+    state.add_nedge(state.data_nodes('tmp')[0], state.add_write('unused'), dace.Memlet('tmp[0:20]'))
+
+    cached = ppl.Pipeline([ap.AccessSets()]).apply_pass(sdfg, {})['AccessSets'][0]
+    expected = {k: (set(r), set(w)) for k, (r, w) in cached.items()}
+    result = ppl.Pipeline([DeadDataflowElimination()]).apply_pass(sdfg, {})['DeadDataflowElimination']
+    assert {n.data for n in result[state] if isinstance(n, dace.nodes.AccessNode)} == {'tmp', 'unused'}
+    assert cached == expected
+
+
+def test_nested_sdfgs():
+    inner = _make_sdfg('inner')
+    sdfg = dace.SDFG('outer')
+    sdfg.add_array('A', [20], dace.float64)
+    sdfg.add_array('B', [20], dace.float64)
+    state = sdfg.add_state()
+    nsdfg = state.add_nested_sdfg(inner, sdfg, {'A'}, {'B'})
+    state.add_edge(state.add_read('A'), None, nsdfg, 'A', dace.Memlet('A[0:20]'))
+    state.add_edge(nsdfg, 'B', state.add_write('B'), None, dace.Memlet('B[0:20]'))
+
+    _reset_counters()
+    ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert CountingAccessSets.analyzed == [sdfg, inner]
+
+    # Only the modified nested SDFG is analyzed again
+    inner_state = inner.nodes()[1]
+    inner_state.remove_nodes_from(inner_state.data_nodes('A'))
+    result = ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert CountingAccessSets.analyzed == [sdfg, inner, inner]
+    assert result['CountingAccessSets'][inner.sdfg_id][inner_state] == (set(), {'B'})
+
+
+def test_cache_disabled():
+    sdfg = _make_sdfg()
+    _reset_counters()
+    with dace.config.set_temporary('optimizer', 'cache_analyses', value=False):
+        ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+        ppl.Pipeline([CountingAccessSets()]).apply_pass(sdfg, {})
+    assert len(CountingAccessSets.analyzed) == 2
+
+
+if __name__ == '__main__':
+    test_cached_across_pipelines()
+    test_invalidate_modified()
+    test_interstate_edge_reads()
+    test_results_not_modified()
+    test_nested_sdfgs()
+    test_cache_disabled()
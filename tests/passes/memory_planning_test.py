@@ -0,0 +1,159 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import itertools
+
+import numpy as np
+
+import dace
+from dace.transformation.passes.memory_planning import ArenaPlan, ArenaPlanner
+
+N = dace.symbol('N')
+
+
+def _add_copy_state(sdfg: dace.SDFG, src: str, dst: str, prev: dace.SDFGState = None) -> dace.SDFGState:
+    state = sdfg.add_state(f'{src}_to_{dst}')
+    shape = sdfg.arrays[dst].shape
+    state.add_mapped_tasklet('copy',
+                             dict(i=f'0:{shape[0]}'), {'a': dace.Memlet(f'{src}[i]')},
+                             'b = a + 1', {'b': dace.Memlet(f'{dst}[i]')},
+                             external_edges=True)
+    if prev is not None:
+        sdfg.add_edge(prev, state, dace.InterstateEdge())
+    return state
+
+
+def _make_chain(num_transients: int, size=64) -> dace.SDFG:
+    """ A -> tmp0 -> tmp1 -> ... -> B, where every copy is its own state. """
+    sdfg = dace.SDFG('arena_chain')
+    sdfg.add_array('A', [size], dace.float64)
+    sdfg.add_array('B', [size], dace.float64)
+    names = ['A'] + [f'tmp{i}' for i in range(num_transients)] + ['B']
+    for name in names[1:-1]:
+        sdfg.add_transient(name, [size], dace.float64)
+    state = None
+    for src, dst in zip(names, names[1:]):
+        state = _add_copy_state(sdfg, src, dst, state)
+    return sdfg
+
+
+def _assert_disjoint(plan: ArenaPlan):
+    """ Transients that are live at the same time must not share memory. """
+    for a, b in itertools.combinations(plan.offsets, 2):
+        (sa, ea), (sb, eb) = plan.lifetimes[a], plan.lifetimes[b]
+        if sa <= eb and sb <= ea:
+            assert (plan.offsets[a] + plan.sizes[a] <= plan.offsets[b]
+                    or plan.offsets[b] + plan.sizes[b] <= plan.offsets[a]), f'{a} and {b} overlap'
+
+
+def test_arena_chain():
+    sdfg = _make_chain(4)
+    plan = ArenaPlanner().apply_pass(sdfg, {})
+    assert len(plan.offsets) == 4
+    assert plan.lifetimes[(0, 'tmp1')] == (1, 2)
+    assert plan.unplanned_size == 4 * 512
+    # Only two consecutive transients are ever live at the same time
+    assert plan.size == 2 * 512
+    _assert_disjoint(plan)
+
+
+def test_arena_alignment():
+    sdfg = _make_chain(3, size=5)
+    planner = ArenaPlanner()
+    planner.alignment = 128
+    plan = planner.apply_pass(sdfg, {})
+    assert all(size == 128 for size in plan.sizes.values())
+    assert all(offset % 128 == 0 for offset in plan.offsets.values())
+    _assert_disjoint(plan)
+
+
+def test_arena_loop():
+    sdfg = _make_chain(4)
+    states = list(sdfg.topological_sort())
+    # Loop around the state that reads tmp1 and writes tmp2
+    after = sdfg.add_state('after')
+    sdfg.remove_edge(sdfg.edges_between(states[1], states[2])[0])
+    sdfg.remove_edge(sdfg.edges_between(states[2], states[3])[0])
+    sdfg.add_edge(after, states[3], dace.InterstateEdge())
+    sdfg.add_loop(states[1], states[2], after, 'i', '0', 'i < 4', 'i + 1')
+
+    order = list(sdfg.topological_sort())
+    loop_start = order.index(next(s for s in sdfg.nodes() if s.label == 'guard'))
+    loop_end = order.index(states[2])
+
+    plan = ArenaPlanner().apply_pass(sdfg, {})
+    # Data used in the loop must live throughout the loop
+    assert plan.lifetimes[(0, 'tmp1')] == (1, loop_end)
+    assert plan.lifetimes[(0, 'tmp2')][0] == loop_start
+    assert plan.offsets[(0, 'tmp1')] != plan.offsets[(0, 'tmp2')]
+    assert plan.size == 2 * 512
+    _assert_disjoint(plan)
+
+
+def test_arena_symbolic_and_nested():
+    sdfg = dace.SDFG('arena_symbolic')
+    sdfg.add_array('A', [N], dace.float64)
+    sdfg.add_array('B', [N], dace.float64)
+    sdfg.add_transient('small', [N], dace.float64)
+    sdfg.add_transient('large', [2 * N], dace.float64)
+    sdfg.add_transient('local', [N], dace.float64)
+    first = _add_copy_state(sdfg, 'A', 'small')
+    second = _add_copy_state(sdfg, 'small', 'B', first)
+    third = _add_copy_state(sdfg, 'A', 'large', second)
+
+    # A transient that is allocated inside a map is not planned
+    inner = next(n for n in third.nodes() if isinstance(n, dace.nodes.Tasklet))
+    local = third.add_access('local')
+    third.add_nedge(third.entry_node(inner), local, dace.Memlet())
+    third.add_nedge(local, inner, dace.Memlet())
+
+    # Transients of nested SDFGs are planned in the arena of the top-level SDFG
+    nsdfg = dace.SDFG('nested')
+    nsdfg.add_array('x', [N], dace.float64)
+    nsdfg.add_transient('ntmp', [N], dace.float64)
+    _add_copy_state(nsdfg, 'ntmp', 'x', _add_copy_state(nsdfg, 'x', 'ntmp'))
+    fourth = sdfg.add_state_after(third)
+    node = fourth.add_nested_sdfg(nsdfg, sdfg, {'x'}, {'x'}, symbol_mapping={'N': N})
+    fourth.add_edge(fourth.add_read('B'), None, node, 'x', dace.Memlet('B[0:N]'))
+    fourth.add_edge(node, 'x', fourth.add_write('B'), None, dace.Memlet('B[0:N]'))
+
+    plan = ArenaPlanner().apply_pass(sdfg, {})
+    assert (0, 'local') not in plan
+    assert (nsdfg.sdfg_id, 'ntmp') in plan
+    assert plan.lifetimes[(nsdfg.sdfg_id, 'ntmp')] == (3, 3)
+    # All planned transients have disjoint lifetimes and share one slot
+    assert all(offset == 0 for offset in plan.offsets.values())
+    assert plan.size.subs(N, 100) == 1600
+
+
+def test_arena_codegen():
+    sdfg = _make_chain(4)
+    sdfg.name = 'arena_codegen'
+    A = np.random.rand(64)
+    B = np.zeros(64)
+    with dace.config.set_temporary('compiler', 'cpu', 'arena_allocation', value=True):
+        code = sdfg.generate_code()[0].clean_code
+        assert '__dace_arena' in code and 'new double' not in code
+        sdfg(A=A, B=B)
+    assert np.allclose(B, A + 5)
+
+
+def test_arena_symbolic_growth():
+    sdfg = _make_chain(2, N)
+    sdfg.name = 'arena_symbolic_growth'
+    with dace.config.set_temporary('compiler', 'cpu', 'arena_allocation', value=True):
+        csdfg = sdfg.compile()
+
+    # The arena is allocated upon initialization, and must grow with the symbols in subsequent calls
+    for size in (16, 1000000):
+        A = np.random.rand(size)
+        B = np.zeros(size)
+        csdfg(A=A, B=B, N=size)
+        assert np.allclose(B, A + 3)
+
+
+if __name__ == '__main__':
+    test_arena_chain()
+    test_arena_alignment()
+    test_arena_loop()
+    test_arena_symbolic_and_nested()
+    test_arena_codegen()
+    test_arena_symbolic_growth()
@@ -0,0 +1,161 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import pytest
+
+import dace
+from dace.transformation.dataflow import MapFusion, RedundantArray
+from dace.transformation.interstate import StateFusion
+from dace.transformation.passes.pattern_matching import match_patterns, match_patterns_parallel
+
+
+def _make_sdfg(num_states: int = 8) -> dace.SDFG:
+    sdfg = dace.SDFG('pattern_matching_test')
+    sdfg.add_array('A', [64], dace.float64)
+    sdfg.add_array('B', [64], dace.float64)
+    prev = None
+    for i in range(num_states):
+        sdfg.add_transient(f'tmp{i}', [64], dace.float64)
+        state = sdfg.add_state(f'state{i}')
+        tmp = state.add_access(f'tmp{i}')
+        state.add_nedge(state.add_read('A'), tmp, dace.Memlet('A[0:64]'))
+        state.add_nedge(tmp, state.add_write('B'), dace.Memlet(f'tmp{i}[0:64]'))
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge())
+        prev = state
+    return sdfg
+
+
+def _make_map_sdfg(num_states: int = 4) -> dace.SDFG:
+    """ Creates an SDFG with chained maps (fusible with ``MapFusion``) and a redundant copy in every state. """
+    sdfg = dace.SDFG('pattern_matching_map_test')
+    sdfg.add_array('A', [64], dace.float64)
+    sdfg.add_array('B', [64], dace.float64)
+    prev = None
+    for i in range(num_states):
+        sdfg.add_transient(f'tmp{i}', [64], dace.float64)
+        sdfg.add_transient(f'copy{i}', [64], dace.float64)
+        state = sdfg.add_state(f'state{i}')
+        state.add_mapped_tasklet('a',
+                                 dict(j='0:64'), {'a': dace.Memlet('A[j]')},
+                                 'b = a + 1', {'b': dace.Memlet(f'tmp{i}[j]')},
+                                 external_edges=True)
+        tmp = state.data_nodes()[-1]
+        copy = state.add_access(f'copy{i}')
+        state.add_mapped_tasklet('b',
+                                 dict(j='0:64'), {'a': dace.Memlet(f'tmp{i}[j]')},
+                                 'b = a * 2', {'b': dace.Memlet(f'copy{i}[j]')},
+                                 external_edges=True,
+                                 input_nodes={f'tmp{i}': tmp},
+                                 output_nodes={f'copy{i}': copy})
+        state.add_nedge(copy, state.add_write('B'), dace.Memlet(f'copy{i}[0:64]'))
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge())
+        prev = state
+    return sdfg
+
+
+def _apply(sdfg: dace.SDFG, incremental: bool, xforms) -> int:
+    with dace.config.set_temporary('optimizer', 'incremental_matching', value=incremental):
+        return sdfg.apply_transformations_repeated(xforms)
+
+
+@pytest.mark.parametrize('order_by_transformation', (False, True))
+def test_incremental_same_result(order_by_transformation):
+    xforms = [RedundantArray, MapFusion, StateFusion]
+    full = _make_map_sdfg()
+    incremental = _make_map_sdfg()
+    with dace.config.set_temporary('optimizer', 'incremental_matching', value=False):
+        full_applied = full.apply_transformations_repeated(xforms, order_by_transformation=order_by_transformation)
+    with dace.config.set_temporary('optimizer', 'incremental_matching', value=True):
+        incremental_applied = incremental.apply_transformations_repeated(
+            xforms, order_by_transformation=order_by_transformation)
+
+    assert full_applied == incremental_applied
+    assert full.hash_sdfg() == incremental.hash_sdfg()
+    # Every pair of maps was fused
+    assert len([n for n, _ in incremental.all_nodes_recursive() if isinstance(n, dace.nodes.MapEntry)]) == 4
+
+
+def test_incremental_skips_rejected(monkeypatch):
+    calls = {False: 0, True: 0}
+    original = RedundantArray.can_be_applied
+
+    for incremental in (False, True):
+
+        def counting_can_be_applied(self, *args, **kwargs):
+            calls[incremental] += 1
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(RedundantArray, 'can_be_applied', counting_can_be_applied)
+        sdfg = _make_sdfg()
+        # Make the first state not match
+        first = sdfg.nodes()[0]
+        first.add_nedge(first.data_nodes('tmp0')[0], first.add_write('A'), dace.Memlet('tmp0[0:64]'))
+        assert _apply(sdfg, incremental, [RedundantArray]) == 7
+
+    # Without an index, the first state is matched after every application
+    assert calls[True] < calls[False]
+
+
+def test_incremental_outdated_rejection(monkeypatch):
+    """ Tests that candidates whose rejection was invalidated by modifications elsewhere are applied. """
+    sdfg = _make_sdfg()
+    first, last = sdfg.nodes()[0], sdfg.nodes()[-1]
+    original_can_be_applied = RedundantArray.can_be_applied
+    original_apply = RedundantArray.apply
+    last_applied = []
+
+    def can_be_applied(self, graph, expr_index, sdfg, permissive=False):
+        if graph is first and not last_applied:
+            return False
+        return original_can_be_applied(self, graph, expr_index, sdfg, permissive)
+
+    def apply(self, graph, sdfg):
+        if graph is last:
+            last_applied.append(True)
+        return original_apply(self, graph, sdfg)
+
+    monkeypatch.setattr(RedundantArray, 'can_be_applied', can_be_applied)
+    monkeypatch.setattr(RedundantArray, 'apply', apply)
+    assert _apply(sdfg, True, [RedundantArray]) == 8
+    assert all(len(state.nodes()) == 2 for state in sdfg.nodes())
+
+
+def _match_info(matches):
+    return [(type(m), m.sdfg_id, m.state_id, m.subgraph) for m in matches]
+
+
+@pytest.mark.parametrize('processes', (1, 2))
+def test_parallel_same_order(processes):
+    sdfg = _make_sdfg()
+    # Nested SDFG
+    outer = dace.SDFG('pattern_matching_outer')
+    outer.add_array('A', [64], dace.float64)
+    outer.add_array('B', [64], dace.float64)
+    state = outer.add_state()
+    nsdfg = state.add_nested_sdfg(sdfg, outer, {'A'}, {'B'})
+    state.add_edge(state.add_read('A'), None, nsdfg, 'A', dace.Memlet('A[0:64]'))
+    state.add_edge(nsdfg, 'B', state.add_write('B'), None, dace.Memlet('B[0:64]'))
+    # Rejected candidate
+    first = sdfg.nodes()[0]
+    first.add_nedge(first.data_nodes('tmp0')[0], first.add_write('A'), dace.Memlet('tmp0[0:64]'))
+
+    xforms = [RedundantArray, MapFusion, StateFusion]
+    expected = _match_info(match_patterns(outer, xforms))
+    assert len(expected) > 0
+    assert _match_info(match_patterns_parallel(outer, xforms, processes=processes)) == expected
+
+
+def test_parallel_apply_repeated():
+    full = _make_sdfg()
+    parallel = _make_sdfg()
+    xforms = [RedundantArray, MapFusion, StateFusion]
+    full_applied = _apply(full, True, xforms)
+    with dace.config.set_temporary('optimizer', 'match_processes', value=2):
+        parallel_applied = _apply(parallel, True, xforms)
+
+    assert full_applied == parallel_applied
+    assert full.hash_sdfg() == parallel.hash_sdfg()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
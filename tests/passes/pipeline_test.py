@@ -1,5 +1,7 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 
+import pytest
+
 import dace
 from dace.transformation import pass_pipeline as ppl
 
@@ -96,7 +98,99 @@ def test_pipeline_modification_rerun():
     assert result == {'MyAnalysis': 1, 'PassA': 1, 'PassB': 1, 'PassC': 1}
 
 
+class CountdownPass(MyPass):
+
+    def __init__(self, count: int):
+        super().__init__()
+        self.count = count
+
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Symbols
+
+    def apply_pass(self, sdfg, _):
+        self.applied += 1
+        if self.count == 0:
+            return None
+        self.count -= 1
+        return 1
+
+    def modified_sdfgs(self, sdfg, _):
+        return {sdfg}
+
+
+@pytest.mark.parametrize('incremental', (False, True))
+def test_fixed_point_pipeline_skip_unmodified(incremental):
+
+    class DescriptorPass(MyPass):
+
+        def should_reapply(self, modified: ppl.Modifies) -> bool:
+            return modified & ppl.Modifies.Descriptors
+
+        def apply_pass(self, sdfg, _):
+            self.applied += 1
+            return None
+
+    countdown, other = CountdownPass(3), DescriptorPass()
+    pipe = ppl.FixedPointPipeline([countdown, other])
+    sdfg = empty.to_sdfg()
+
+    with dace.config.set_temporary('optimizer', 'incremental_pipelines', value=incremental):
+        result = pipe.apply_pass(sdfg, {})
+    assert result == {'CountdownPass': 1}
+    assert countdown.applied == 4
+    # The other pass is skipped only in the last iteration, in which the SDFG was not modified since it was applied
+    assert other.applied == (3 if incremental else 4)
+
+
+def _nested_sdfg_chain(depth: int) -> dace.SDFG:
+    sdfg = dace.SDFG(f'pipeline_test_{depth}')
+    sdfg.add_array('A', [20], dace.float64)
+    sdfg.add_array('B', [20], dace.float64)
+    state = sdfg.add_state()
+    if depth == 0:
+        state.add_nedge(state.add_read('A'), state.add_write('B'), dace.Memlet('A[0:20]'))
+        return sdfg
+    for _ in range(2):
+        nsdfg = state.add_nested_sdfg(_nested_sdfg_chain(depth - 1), sdfg, {'A'}, {'B'})
+        state.add_edge(state.add_read('A'), None, nsdfg, 'A', dace.Memlet('A[0:20]'))
+        state.add_edge(nsdfg, 'B', state.add_write('B'), None, dace.Memlet('B[0:20]'))
+    return sdfg
+
+
+def test_fixed_point_pipeline_modified_sdfgs():
+    sdfg = _nested_sdfg_chain(2)
+    nested = list(sdfg.all_sdfgs_recursive())
+    modified = nested[-1]
+    applied = []
+
+    class ModifyNested(CountdownPass):
+
+        def apply_pass(self, sdfg, _):
+            return super().apply_pass(modified, _)
+
+        def modified_sdfgs(self, sdfg, _):
+            return {modified}
+
+    class PerSDFGPipeline(ppl.FixedPointPipeline):
+
+        def apply_subpass(self, sdfg, p, state):
+            if isinstance(p, ModifyNested):
+                return super().apply_subpass(sdfg, p, state)
+            for sd in self.pending_sdfgs(sdfg, p):
+                applied.append(sd)
+            return None
+
+    PerSDFGPipeline([ModifyNested(2), MyPass()]).apply_pass(sdfg, {})
+
+    # Only the SDFG modified in the second iteration and its parents are revisited
+    revisited = [modified, modified.parent_sdfg, sdfg]
+    assert applied == nested + sorted(revisited, key=nested.index)
+
+
 if __name__ == '__main__':
     test_simple_pipeline()
     test_pipeline_with_dependencies()
     test_pipeline_modification_rerun()
+    test_fixed_point_pipeline_skip_unmodified(False)
+    test_fixed_point_pipeline_skip_unmodified(True)
+    test_fixed_point_pipeline_modified_sdfgs()
@@ -0,0 +1,105 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import argparse
+import os
+
+import dace
+from dace.cli import daceprof
+from dace.sdfg import nodes
+from dace.transformation import profiling
+from dace.transformation.dataflow import MapExpansion, MapFusion, RedundantArray
+
+
+def _make_sdfg(num_states: int = 4) -> dace.SDFG:
+    sdfg = dace.SDFG('transformation_profiling_test')
+    sdfg.add_array('A', [64], dace.float64)
+    sdfg.add_array('B', [64], dace.float64)
+    prev = None
+    for i in range(num_states):
+        sdfg.add_transient(f'tmp{i}', [64], dace.float64)
+        state = sdfg.add_state(f'state{i}')
+        state.add_mapped_tasklet('a',
+                                 dict(j='0:64'), {'a': dace.Memlet('A[j]')},
+                                 'b = a + 1', {'b': dace.Memlet(f'tmp{i}[j]')},
+                                 external_edges=True)
+        tmp = next(n for n in state.data_nodes() if n.data == f'tmp{i}')
+        state.add_mapped_tasklet('b',
+                                 dict(j='0:64'), {'a': dace.Memlet(f'tmp{i}[j]')},
+                                 'b = a * 2', {'b': dace.Memlet('B[j]')},
+                                 external_edges=True,
+                                 input_nodes={f'tmp{i}': tmp})
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge())
+        prev = state
+    return sdfg
+
+
+def test_profile_pattern_matching():
+    sdfg = _make_sdfg()
+    with dace.profile_transformations() as profile:
+        sdfg.apply_transformations_repeated([MapFusion, RedundantArray], validate_all=True)
+
+    stats = profile['MapFusion']
+    assert stats.applied == 4
+    assert stats.candidates == stats.applied + stats.rejected
+    assert stats.apply_time > 0 and stats.can_be_applied_time > 0 and stats.validation_time > 0
+    assert profile['RedundantArray'].applied == 0
+
+    # Profiling stops after the context
+    _make_sdfg().apply_transformations_repeated(MapFusion)
+    assert profile['MapFusion'].applied == 4
+
+
+def test_profile_propagation():
+    sdfg = dace.SDFG('transformation_profiling_propagation')
+    sdfg.add_array('A', [16, 16], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('m',
+                             dict(i='0:16', j='0:16'), {'a': dace.Memlet('A[i, j]')},
+                             'b = a', {'b': dace.Memlet('A[i, j]')},
+                             external_edges=True)
+    map_entry = next(n for n in state.nodes() if isinstance(n, nodes.MapEntry))
+
+    with dace.profile_transformations() as outer:
+        with dace.profile_transformations() as inner:
+            MapExpansion.apply_to(sdfg, map_entry=map_entry)
+    assert not outer
+    assert inner['MapExpansion'].applied == 1
+    assert inner['MapExpansion'].propagation_time > 0
+
+
+def test_profile_report(tmp_path, capsys):
+    sdfg = _make_sdfg()
+    filename = os.path.join(tmp_path, 'profile.json')
+    with dace.profile_transformations(filename) as profile:
+        sdfg.apply_transformations_repeated(MapFusion)
+
+    assert profiling.TransformationProfile.is_profile_file(filename)
+    loaded = profiling.TransformationProfile.load(filename)
+    assert loaded.statistics == profile.statistics
+    assert 'MapFusion' in str(loaded)
+    assert loaded.as_csv().splitlines()[1].startswith('MapFusion,')
+
+    loaded.merge(profile)
+    assert loaded['MapFusion'].applied == 2 * profile['MapFusion'].applied
+
+    # Print through daceprof
+    args = argparse.Namespace(input=filename, output=None, csv=False, sort=None, ascending=False)
+    daceprof.print_report(args, filename)
+    assert 'MapFusion' in capsys.readouterr().out
+
+
+def test_profile_config():
+    old_profile = profiling._global_profile
+    profiling._global_profile = profiling.TransformationProfile()
+    try:
+        with dace.config.set_temporary('optimizer', 'profile_transformations', value=True):
+            _make_sdfg().apply_transformations_repeated(MapFusion)
+        assert profiling._global_profile['MapFusion'].applied == 4
+    finally:
+        profiling._global_profile = old_profile
+
+
+if __name__ == '__main__':
+    test_profile_pattern_matching()
+    test_profile_propagation()
+    test_profile_config()
@@ -1,6 +1,10 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import dace
+from dace.frontend.python import cached_program
 import numpy as np
+import os
+import pytest
+import tempfile
 
 
 def test_cache_same_args():
@@ -65,8 +69,176 @@ def test_cache_argument_names():
     assert np.allclose(a, rega) and np.allclose(c, regc)
 
 
+def test_cache_fast_dispatch():
+    """
+    Tests that repeated calls with the same argument signature are dispatched
+    through the fast-dispatch cache, and that changing argument shapes or
+    closure constants falls back to the full dispatch path.
+    """
+    scale = 2
+
+    @dace.program
+    def test(x, y):
+        y[:] = x * scale
+
+    a = np.random.rand(20)
+    b = np.random.rand(20)
+    test(a, b)
+    test(a, b)
+    assert len(test._cache.cache) == 1
+    assert len(test._cache.fast_dispatch) == 1
+    assert np.allclose(b, a * 2)
+
+    # Different shape
+    c = np.random.rand(21)
+    d = np.random.rand(21)
+    test(c, d)
+    assert len(test._cache.cache) == 2
+    assert len(test._cache.fast_dispatch) == 2
+
+    # Changed closure constant must not use the stale fast-dispatch entry
+    scale = 3
+    test(a, b)
+    assert len(test._cache.cache) == 3
+    assert np.allclose(b, a * 3)
+
+
+def test_cache_fast_dispatch_disabled():
+
+    @dace.program
+    def test(x):
+        return x * x
+
+    with dace.config.set_temporary('frontend', 'fast_dispatch', value=False):
+        test(5)
+        test(6)
+    assert len(test._cache.cache) == 1
+    assert len(test._cache.fast_dispatch) == 0
+
+
+def test_persistent_cache():
+    """
+    Tests that a program compiled by one process (simulated by clearing the
+    in-memory cache) is loaded from the persistent cache by another.
+    """
+
+    @dace.program
+    def test(x: dace.float64[20]):
+        return x + 1
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with dace.config.set_temporary('frontend', 'persistent_cache', value=True):
+            with dace.config.set_temporary('frontend', 'persistent_cache_folder', value=tmpdir):
+                a = np.random.rand(20)
+                assert np.allclose(test(a), a + 1)
+                # Lock files are removed after use
+                entries = os.listdir(tmpdir)
+                assert len(entries) == 1 and os.path.isdir(os.path.join(tmpdir, entries[0]))
+                contents = sorted(os.listdir(os.path.join(tmpdir, entries[0], 'build')))
+
+                test._cache.clear()
+                assert np.allclose(test(a), a + 1)
+                # The loaded program is copied out of the cache entry, which remains unmodified
+                csdfg = test._cache.cache[next(iter(test._cache.cache))].compiled_sdfg
+                assert not os.path.realpath(csdfg.filename).startswith(os.path.realpath(tmpdir))
+                assert os.listdir(tmpdir) == entries
+                assert sorted(os.listdir(os.path.join(tmpdir, entries[0], 'build'))) == contents
+                del csdfg
+                test._cache.clear()
+
+
+def test_persistent_cache_eviction():
+
+    @dace.program
+    def test(x):
+        return x + 1
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pcache = cached_program.PersistentProgramCache(tmpdir, size_limit=0)
+        key = test.get_program_hash(np.random.rand(20))
+        digest = pcache.make_digest(test, key)
+        assert digest == pcache.make_digest(test, test.get_program_hash(np.random.rand(20)))
+        assert digest != pcache.make_digest(test, test.get_program_hash(np.random.rand(21)))
+
+        csdfg = test.to_sdfg(np.random.rand(20)).compile()
+        pcache.store(digest, csdfg)
+        assert pcache.load(digest) is not None
+
+        # Storing another entry evicts the least recently used one
+        other = pcache.make_digest(test, test.get_program_hash(np.random.rand(21)))
+        pcache.store(other, csdfg)
+        assert not os.path.isdir(os.path.join(tmpdir, digest))
+        assert os.path.isdir(os.path.join(tmpdir, other))
+
+        # Temporary folders are removed if storing fails
+        def fail(*args, **kwargs):
+            raise ValueError
+
+        csdfg.sdfg.save = fail
+        with pytest.raises(ValueError):
+            pcache.store(digest, csdfg)
+        assert os.listdir(tmpdir) == [other]
+
+
+def test_tiered_execution():
+
+    @dace.program
+    def test(a, b):
+        b[:] = a * 2
+
+    a = np.random.rand(20)
+    b = np.zeros(20)
+    with dace.config.set_temporary('frontend', 'tiered_execution', value=True):
+        # First call runs in Python while compiling in the background
+        test(a, b)
+        assert np.allclose(b, a * 2)
+        assert len(test._tiered_jobs) == 1
+        jobs = list(test._tiered_jobs.values())
+
+    for job in jobs:
+        job.result()
+    assert len(test._tiered_jobs) == 0
+    assert len(test._cache.cache) == 1
+
+    # Subsequent calls dispatch to the compiled program
+    with dace.config.set_temporary('frontend', 'tiered_execution', value=True):
+        b[:] = 0
+        test(a, b)
+        assert np.allclose(b, a * 2)
+    entry = next(iter(test._cache.cache.values()))
+    assert entry.compiled_sdfg is not None
+
+
+def test_tiered_execution_explicit_dataflow():
+    """ Programs with explicit dataflow cannot run in Python, and are compiled before the first call. """
+    N = dace.symbol('N')
+
+    @dace.program
+    def test(a: dace.float64[N], b: dace.float64[N]):
+        for i in dace.map[0:N]:
+            with dace.tasklet:
+                inp << a[i]
+                out >> b[i]
+                out = inp * 2
+
+    a = np.random.rand(20)
+    b = np.zeros(20)
+    with dace.config.set_temporary('frontend', 'tiered_execution', value=True):
+        test(a, b)
+    assert np.allclose(b, a * 2)
+    assert not test._is_python_compatible()
+    assert len(test._tiered_jobs) == 0
+    assert next(iter(test._cache.cache.values())).compiled_sdfg is not None
+
+
 if __name__ == '__main__':
     test_cache_same_args()
     test_cache_different_args()
     test_cache_return_values()
     test_cache_argument_names()
+    test_cache_fast_dispatch()
+    test_cache_fast_dispatch_disabled()
+    test_persistent_cache()
+    test_persistent_cache_eviction()
+    test_tiered_execution()
+    test_tiered_execution_explicit_dataflow()
@@ -1,4 +1,7 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
+import os
+import sys
+import tempfile
 import unittest
 from aenum import Enum, auto
 from dace import registry
@@ -55,6 +58,31 @@ class RegistryTests(unittest.TestCase):
             class Extension4(object):
                 pass
 
+    def test_lazy_registry(self):
+        with tempfile.TemporaryDirectory() as folder:
+            with open(os.path.join(folder, 'lazy_registry_extension.py'), 'w') as fp:
+                fp.write('from dace import registry\n'
+                         f'from {ExtensibleClass.__module__} import ExtensibleClass\n'
+                         '@registry.autoregister\n'
+                         'class LazyExtension(ExtensibleClass):\n'
+                         '    pass\n')
+            sys.path.insert(0, folder)
+            try:
+                ExtensibleClass.register_lazy('lazy_registry_extension')
+                self.assertNotIn('lazy_registry_extension', sys.modules)
+                extensions = [ext.__name__ for ext in ExtensibleClass.extensions()]
+                self.assertIn('lazy_registry_extension', sys.modules)
+                # Lazily-registered extensions come first
+                self.assertEqual(extensions[0], 'LazyExtension')
+            finally:
+                # Remove the extension, its module, and its registration
+                sys.path.remove(folder)
+                module = sys.modules.pop('lazy_registry_extension', None)
+                if module is not None:
+                    ExtensibleClass.unregister(module.LazyExtension)
+                ExtensibleClass._lazy_modules_.remove('lazy_registry_extension')
+                ExtensibleClass._loaded_modules_.discard('lazy_registry_extension')
+
     def test_enum_registry(self):
         ExtensibleEnumeration.register('c')
         self.assertTrue(ExtensibleEnumeration.c in ExtensibleEnumeration)
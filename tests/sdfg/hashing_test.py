@@ -0,0 +1,126 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import copy
+
+import pytest
+
+import dace
+from dace import subsets
+from dace.frontend.python.astutils import ASTFindReplace
+from dace.sdfg import hashing
+
+
+def _make_sdfg():
+    sdfg = dace.SDFG('hashing_test')
+    sdfg.add_array('A', ['N'], dace.float64)
+    sdfg.add_array('B', ['N'], dace.float64)
+    prev = None
+    for i in range(3):
+        state = sdfg.add_state(f'state{i}')
+        state.add_mapped_tasklet('compute',
+                                 dict(i='0:N'),
+                                 dict(a=dace.Memlet('A[i]')),
+                                 'b = a * 2',
+                                 dict(b=dace.Memlet('B[i]')),
+                                 external_edges=True)
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge(assignments=dict(k=str(i))))
+        prev = state
+    return sdfg
+
+
+def _first(state, nodetype):
+    return next(n for n in state.nodes() if isinstance(n, nodetype))
+
+
+def test_hash_stable():
+    sdfg = _make_sdfg()
+    first = sdfg.hash_sdfg()
+    assert sdfg.hash_sdfg() == first
+    assert copy.deepcopy(sdfg).hash_sdfg() == first
+    assert dace.SDFG.from_json(sdfg.to_json()).hash_sdfg() == first
+    assert _make_sdfg().hash_sdfg() == first
+
+
+def test_hash_property_change():
+    sdfg = _make_sdfg()
+    first = sdfg.hash_sdfg()
+    me = _first(sdfg.nodes()[1], dace.nodes.MapEntry)
+    me.map.range = subsets.Range.from_string('0:N:2')
+    second = sdfg.hash_sdfg()
+    assert second != first
+
+    sdfg.arrays['B'].shape = (20, )
+    assert sdfg.hash_sdfg() != second
+
+
+def test_hash_inplace_change():
+    sdfg = _make_sdfg()
+    first = sdfg.hash_sdfg()
+
+    # Subsets and dictionaries are modified in place
+    state = sdfg.nodes()[2]
+    state.edges()[0].data.subset.offset([1], False)
+    second = sdfg.hash_sdfg()
+    assert second != first
+
+    sdfg.edges()[0].data.assignments['k'] = '5'
+    third = sdfg.hash_sdfg()
+    assert third != second
+
+    # Python code is modified in place by symbol replacement
+    tasklet = _first(state, dace.nodes.Tasklet)
+    for stmt in tasklet.code.code:
+        ASTFindReplace({'a': 'c'}).visit(stmt)
+    assert sdfg.hash_sdfg() != third
+
+
+def test_hash_serializes_changes_only(monkeypatch):
+    sdfg = _make_sdfg()
+    sdfg.hash_sdfg()
+
+    serialized = []
+    json_digest = hashing._json_digest
+    monkeypatch.setattr(hashing, '_json_digest', lambda *args: serialized.append(args[0]) or json_digest(*args))
+    first = sdfg.hash_sdfg()
+    assert serialized == []
+
+    # Reassigning one property only serializes the modified element
+    me = _first(sdfg.nodes()[1], dace.nodes.MapEntry)
+    me.map.schedule = dace.ScheduleType.Sequential
+    assert sdfg.hash_sdfg() != first
+    assert serialized == ['dace.sdfg.nodes.MapEntry']
+
+
+def test_hash_nested_sdfg():
+    inner = _make_sdfg()
+    sdfg = dace.SDFG('outer')
+    sdfg.add_array('A', ['N'], dace.float64)
+    sdfg.add_array('B', ['N'], dace.float64)
+    state = sdfg.add_state()
+    nsdfg = state.add_nested_sdfg(inner, sdfg, {'A'}, {'B'})
+    state.add_edge(state.add_read('A'), None, nsdfg, 'A', dace.Memlet('A[0:N]'))
+    state.add_edge(nsdfg, 'B', state.add_write('B'), None, dace.Memlet('B[0:N]'))
+
+    first = sdfg.hash_sdfg()
+    _first(inner.nodes()[0], dace.nodes.Tasklet).code = dace.properties.CodeBlock('b = a * 3')
+    assert sdfg.hash_sdfg() != first
+
+
+def test_hash_ignored_properties():
+    sdfg = _make_sdfg()
+    first = sdfg.hash_sdfg()
+    exact = hashing.hash_sdfg(sdfg, ignored=hashing.ALWAYS_IGNORED)
+
+    sdfg.name = 'renamed'
+    _first(sdfg.nodes()[0], dace.nodes.Tasklet).instrument = dace.InstrumentationType.Timer
+    assert sdfg.hash_sdfg() == first
+    assert hashing.hash_sdfg(sdfg, ignored=hashing.ALWAYS_IGNORED) != exact
+
+
+if __name__ == '__main__':
+    test_hash_stable()
+    test_hash_property_change()
+    test_hash_inplace_change()
+    test_hash_serializes_changes_only(pytest.MonkeyPatch())
+    test_hash_nested_sdfg()
+    test_hash_ignored_properties()
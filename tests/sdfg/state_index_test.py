@@ -0,0 +1,134 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import copy
+
+import dace
+from dace.sdfg import nodes
+from dace.transformation.dataflow import MapExpansion, MapTiling
+
+
+def _check_indexes(state: dace.SDFGState):
+    """ Compares the incrementally-maintained indexes of a state with indexes computed from scratch. """
+    parents = state.scope_dict()
+    children = state.scope_children()
+    access_nodes = {n.data: state.data_nodes(n.data) for n in state.data_nodes()}
+    tasklets = state.nodes_of_type(nodes.Tasklet)
+    entries = state.nodes_of_type((nodes.MapEntry, nodes.ConsumeEntry))
+
+    state._clear_scopedict_cache()
+    assert parents == state.scope_dict()
+    assert {k: set(v) for k, v in children.items()} == {k: set(v) for k, v in state.scope_children().items()}
+    for data, anodes in access_nodes.items():
+        assert anodes == [n for n in state.nodes() if isinstance(n, nodes.AccessNode) and n.data == data]
+    assert tasklets == [n for n in state.nodes() if isinstance(n, nodes.Tasklet)]
+    assert entries == [n for n in state.nodes() if isinstance(n, nodes.EntryNode)]
+
+
+def _make_sdfg():
+    sdfg = dace.SDFG('state_index_test')
+    sdfg.add_array('A', [20, 20], dace.float64)
+    sdfg.add_array('B', [20, 20], dace.float64)
+    sdfg.add_transient('tmp', [1], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('compute',
+                             dict(i='0:20', j='0:20'),
+                             dict(a=dace.Memlet('A[i, j]')),
+                             'b = a * 2',
+                             dict(b=dace.Memlet('B[i, j]')),
+                             external_edges=True)
+    return sdfg, state
+
+
+def test_index_add_nodes():
+    sdfg, state = _make_sdfg()
+    _check_indexes(state)
+    me = state.nodes_of_type(nodes.MapEntry)[0]
+    mx = state.exit_node(me)
+    tasklet = state.nodes_of_type(nodes.Tasklet)[0]
+    assert state.entry_node(tasklet) is me
+    assert state.entry_node(me) is None
+
+    # Add a nested scope with a transient between the tasklet and the map exit
+    edge = state.out_edges(tasklet)[0]
+    tmp = state.add_access('tmp')
+    state.add_edge(tasklet, 'b', tmp, None, dace.Memlet('tmp[0]'))
+    assert state.entry_node(tmp) is me
+
+    ime, imx = state.add_map('inner', dict(k='0:1'))
+    copy = state.add_tasklet('copy', {'inp'}, {'out'}, 'out = inp')
+    state.add_memlet_path(tmp, ime, copy, dst_conn='inp', memlet=dace.Memlet('tmp[0]'))
+    state.add_memlet_path(copy, imx, mx, src_conn='out', memlet=dace.Memlet('B[i, j]'), dst_conn=edge.dst_conn)
+    state.remove_edge(edge)
+    assert state.entry_node(copy) is ime
+    assert state.entry_node(imx) is ime
+    assert state.entry_node(ime) is me
+    assert state.exit_node(ime) is imx
+    _check_indexes(state)
+    sdfg.validate()
+
+
+def test_index_remove_nodes():
+    sdfg, state = _make_sdfg()
+    _check_indexes(state)
+    me = state.nodes_of_type(nodes.MapEntry)[0]
+    mx = state.exit_node(me)
+    tasklet = state.nodes_of_type(nodes.Tasklet)[0]
+
+    # Remove the tasklet and connect the map entry and exit directly
+    state.remove_node(tasklet)
+    state.add_nedge(me, mx, dace.Memlet())
+    _check_indexes(state)
+    state.remove_nodes_from([me, mx])
+    _check_indexes(state)
+    for node in state.data_nodes():
+        state.remove_node(node)
+        _check_indexes(state)
+    assert state.data_nodes('A') == []
+
+
+def test_index_rename_access_node():
+    sdfg, state = _make_sdfg()
+    anode = state.data_nodes('A')[0]
+    assert state.data_nodes('B') != [anode]
+    anode.data = 'B'
+    assert anode in state.data_nodes('B')
+    assert state.data_nodes('A') == []
+    _check_indexes(state)
+
+
+def test_index_rename_other_state():
+    sdfg, state = _make_sdfg()
+    other = sdfg.add_state_after(state)
+    anode = other.add_read('A')
+    other.add_nedge(anode, other.add_write('B'), dace.Memlet('A[0:20, 0:20]'))
+    index = state._access_node_index()
+
+    # Renaming data in one state keeps the indexes of other states
+    anode.data = 'tmp'
+    assert state._access_node_index() is index
+    assert other.data_nodes('tmp') == [anode]
+    assert other.data_nodes('A') == []
+
+    # Access nodes of copied states are renamed in the copy only
+    copied = copy.deepcopy(other)
+    copied.data_nodes('tmp')[0].data = 'A'
+    assert len(copied.data_nodes('A')) == 1
+    assert other.data_nodes('A') == []
+    _check_indexes(copied)
+
+
+def test_index_transformations():
+    sdfg, state = _make_sdfg()
+    _check_indexes(state)
+    sdfg.apply_transformations(MapTiling, options=dict(tile_sizes=(4, 4)))
+    _check_indexes(state)
+    sdfg.apply_transformations_repeated(MapExpansion)
+    _check_indexes(state)
+    sdfg.validate()
+
+
+if __name__ == '__main__':
+    test_index_add_nodes()
+    test_index_remove_nodes()
+    test_index_rename_access_node()
+    test_index_rename_other_state()
+    test_index_transformations()
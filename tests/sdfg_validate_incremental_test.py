@@ -0,0 +1,103 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import pytest
+
+import dace
+from dace.sdfg import nodes, utils as sdutil
+from dace.sdfg.validation import InvalidSDFGError, validate_nodes
+from dace.transformation import transformation as xf
+from dace.transformation.dataflow import MapFusion, RedundantArray
+from dace.transformation.passes.pattern_matching import PatternMatchAndApplyRepeated
+
+
+def _make_sdfg(num_states: int = 4) -> dace.SDFG:
+    sdfg = dace.SDFG('incremental_validation_test')
+    sdfg.add_array('A', [64], dace.float64)
+    sdfg.add_array('B', [64], dace.float64)
+    prev = None
+    for i in range(num_states):
+        sdfg.add_transient(f'tmp{i}', [64], dace.float64)
+        state = sdfg.add_state(f'state{i}')
+        state.add_mapped_tasklet('a',
+                                 dict(j='0:64'), {'a': dace.Memlet('A[j]')},
+                                 'b = a + 1', {'b': dace.Memlet(f'tmp{i}[j]')},
+                                 external_edges=True)
+        tmp = next(n for n in state.data_nodes() if n.data == f'tmp{i}')
+        state.add_mapped_tasklet('b',
+                                 dict(j='0:64'), {'a': dace.Memlet(f'tmp{i}[j]')},
+                                 'b = a * 2', {'b': dace.Memlet('B[j]')},
+                                 external_edges=True,
+                                 input_nodes={f'tmp{i}': tmp})
+        if prev is not None:
+            sdfg.add_edge(prev, state, dace.InterstateEdge())
+        prev = state
+    return sdfg
+
+
+class _BreakAccessNode(xf.SingleStateTransformation):
+    """ Test transformation that makes an access node refer to nonexistent data. """
+    access = xf.PatternNode(nodes.AccessNode)
+
+    @classmethod
+    def expressions(cls):
+        return [sdutil.node_path_graph(cls.access)]
+
+    def can_be_applied(self, graph, expr_index, sdfg, permissive=False):
+        return self.access.data == 'tmp2'
+
+    def apply(self, graph, sdfg):
+        self.access.data = 'nonexistent'
+
+
+def test_validate_nodes():
+    sdfg = _make_sdfg(1)
+    state = sdfg.node(0)
+    tasklet = next(n for n in state.nodes() if isinstance(n, nodes.Tasklet) and n.label == 'a')
+    tasklet.add_in_connector('unused')
+    other = next(n for n in state.nodes() if isinstance(n, nodes.Tasklet) and n.label == 'b')
+
+    validate_nodes(state, [other])
+    with pytest.raises(InvalidSDFGError):
+        validate_nodes(state, [tasklet])
+
+    # Data descriptors accessed by the nodes are validated as well
+    sdfg.arrays['tmp0'].lifetime = dace.AllocationLifetime.Persistent
+    sdfg.arrays['tmp0'].storage = dace.StorageType.Register
+    with pytest.raises(InvalidSDFGError):
+        validate_nodes(state, [other])
+
+
+@pytest.mark.parametrize('incremental', (False, True))
+def test_validate_all(monkeypatch, incremental):
+    reference = _make_sdfg()
+    reference.apply_transformations_repeated([MapFusion, RedundantArray])
+
+    calls = []
+    original = dace.SDFG.validate
+
+    def counting_validate(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(dace.SDFG, 'validate', counting_validate)
+    sdfg = _make_sdfg()
+    with dace.config.set_temporary('optimizer', 'incremental_validation', value=incremental):
+        applied = sdfg.apply_transformations_repeated([MapFusion, RedundantArray], validate_all=True)
+    assert applied == 4
+    assert sdfg.hash_sdfg() == reference.hash_sdfg()
+
+    # Only the final validation checks the entire SDFG
+    assert len(calls) == (1 if incremental else applied + 1)
+
+
+def test_validate_all_fails():
+    sdfg = _make_sdfg()
+    xform = PatternMatchAndApplyRepeated([_BreakAccessNode()], validate=False, validate_all=True)
+    with pytest.raises(InvalidSDFGError, match='Validation failed after applying'):
+        xform.apply_pass(sdfg, {})
+
+
+if __name__ == '__main__':
+    test_validate_nodes()
+    test_validate_all(pytest.MonkeyPatch(), False)
+    test_validate_all(pytest.MonkeyPatch(), True)
+    test_validate_all_fails()
@@ -0,0 +1,82 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import sympy
+
+import dace
+from dace import symbolic
+
+
+def test_memoization_counters():
+    symbolic.clear_symbolic_cache()
+    assert symbolic.symbolic_cache_info() == (0, 0, dace.Config.get('symbolic_cache_size'), 0)
+
+    first = symbolic.pystr_to_symbolic('N * 2 + M')
+    second = symbolic.pystr_to_symbolic('N * 2 + M')
+    assert first is second
+    info = symbolic.symbolic_cache_info('pystr_to_symbolic')
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    symbolic.simplify(first - first / 2)
+    assert symbolic.symbolic_cache_info('simplify').misses == 1
+    assert symbolic.symbolic_cache_info().currsize == 2
+
+    symbolic.clear_symbolic_cache()
+    assert symbolic.symbolic_cache_info() == (0, 0, dace.Config.get('symbolic_cache_size'), 0)
+
+
+def test_memoization_bounded():
+    symbolic.clear_symbolic_cache()
+    with dace.config.set_temporary('symbolic_cache_size', value=4):
+        for i in range(10):
+            symbolic.pystr_to_symbolic(f'N + {i}')
+        assert symbolic.symbolic_cache_info().currsize == 4
+
+        # Least recently used entries are evicted first
+        symbolic.pystr_to_symbolic('N + 9')
+        symbolic.pystr_to_symbolic('N + 0')
+        info = symbolic.symbolic_cache_info()
+        assert (info.hits, info.misses) == (1, 11)
+
+    with dace.config.set_temporary('symbolic_cache_size', value=0):
+        symbolic.clear_symbolic_cache()
+        symbolic.pystr_to_symbolic('N + 1')
+        assert symbolic.symbolic_cache_info().currsize == 0
+
+
+def test_memoization_types():
+    symbolic.clear_symbolic_cache()
+    assert isinstance(symbolic.pystr_to_symbolic(1), sympy.Integer)
+    assert isinstance(symbolic.pystr_to_symbolic(1.0), sympy.Float)
+    assert isinstance(symbolic.pystr_to_symbolic(True), sympy.logic.boolalg.BooleanTrue)
+
+
+def test_memoization_symbol_dtypes():
+    symbolic.clear_symbolic_cache()
+    n32 = dace.symbol('N', dace.int32)
+    n64 = dace.symbol('N', dace.int64)
+    assert n32 == n64
+
+    simplified = symbolic.simplify(n32 * 2 + 2 * n32)
+    assert simplified.free_symbols.pop().dtype == dace.int32
+    # Clear the construction cache of SymPy, which also compares symbols regardless of their type
+    sympy.core.cache.clear_cache()
+    expr = n64 * 2 + 2 * n64
+    assert expr.free_symbols.pop().dtype == dace.int64
+    simplified = symbolic.simplify(expr)
+    assert simplified.free_symbols.pop().dtype == dace.int64
+    assert symbolic.symbolic_cache_info('simplify').misses == 2
+
+
+def test_memoization_assumptions():
+    symbolic.clear_symbolic_cache()
+    positive = sympy.Symbol('x', positive=True)
+    general = sympy.Symbol('x')
+    assert symbolic.simplify(sympy.sqrt(positive**2)) == positive
+    assert symbolic.simplify(sympy.sqrt(general**2)) == sympy.sqrt(general**2)
+
+
+if __name__ == '__main__':
+    test_memoization_counters()
+    test_memoization_bounded()
+    test_memoization_types()
+    test_memoization_symbol_dtypes()
+    test_memoization_assumptions()